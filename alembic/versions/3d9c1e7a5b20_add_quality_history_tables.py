@@ -0,0 +1,62 @@
+"""add_quality_history_tables
+
+Revision ID: 3d9c1e7a5b20
+Revises: f56283a43d46
+Create Date: 2026-10-18 09:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9c1e7a5b20'
+down_revision: Union[str, Sequence[str], None] = 'f56283a43d46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Compact per-validation quality results (replaces in-memory history)
+    op.create_table('quality_result',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('overall_score', sa.Float(), nullable=False),
+        sa.Column('passes_gate', sa.Boolean(), nullable=False),
+        sa.Column('syntax_score', sa.Float(), nullable=True),
+        sa.Column('requirements_score', sa.Float(), nullable=True),
+        sa.Column('quality_score', sa.Float(), nullable=True),
+        sa.Column('testing_score', sa.Float(), nullable=True),
+        sa.Column('structured_mode', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_quality_result_project_time', 'quality_result', ['project_id', 'timestamp'], unique=False)
+
+    # Per-project improvement suggestion counters
+    op.create_table('quality_issue_stat',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('issue', sa.String(length=500), nullable=False),
+        sa.Column('occurrences', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_seen', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_quality_issue_project_issue', 'quality_issue_stat', ['project_id', 'issue'], unique=True)
+    op.create_index('idx_quality_issue_project_occurrences', 'quality_issue_stat', ['project_id', 'occurrences'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Drop indexes
+    op.drop_index('idx_quality_issue_project_occurrences', table_name='quality_issue_stat')
+    op.drop_index('idx_quality_issue_project_issue', table_name='quality_issue_stat')
+    op.drop_index('idx_quality_result_project_time', table_name='quality_result')
+
+    # Drop tables
+    op.drop_table('quality_issue_stat')
+    op.drop_table('quality_result')
@@ -0,0 +1,94 @@
+"""add_task_dependency_table
+
+Revision ID: 8b2f4c6d1e93
+Revises: 3d9c1e7a5b20
+Create Date: 2026-10-18 11:47:05.218334
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2f4c6d1e93'
+down_revision: Union[str, Sequence[str], None] = '3d9c1e7a5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _decode_ids(value) -> list:
+    """Decode a task.dependencies JSON value into a list of unique ints."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    ids = []
+    for item in value or []:
+        try:
+            task_id = int(item)
+        except (TypeError, ValueError):
+            continue
+        if task_id not in ids:
+            ids.append(task_id)
+    return ids
+
+
+def upgrade() -> None:
+    """Upgrade schema - move task.dependencies JSON into an edge table."""
+    # Read the JSON column, dropping dependencies on deleted tasks (they
+    # would violate the foreign key)
+    bind = op.get_bind()
+    task = sa.table('task', sa.column('id', sa.Integer), sa.column('dependencies', sa.JSON))
+    rows = bind.execute(sa.select(task.c.id, task.c.dependencies)).all()
+    task_ids = {task_id for task_id, _ in rows}
+    edges = [
+        {'task_id': task_id, 'depends_on_id': depends_on_id}
+        for task_id, dependencies in rows
+        for depends_on_id in _decode_ids(dependencies)
+        if depends_on_id in task_ids
+    ]
+
+    # SQLite requires batch mode to drop columns. It rebuilds the task
+    # table, which with foreign keys enforced would cascade-delete edges
+    # referencing it, so drop the column before the edge table exists.
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_column('dependencies')
+
+    edge_table = op.create_table('task_dependency',
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('depends_on_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['task_id'], ['task.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['depends_on_id'], ['task.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('task_id', 'depends_on_id')
+    )
+    op.create_index('idx_task_dependency_reverse', 'task_dependency', ['depends_on_id', 'task_id'], unique=False)
+
+    if edges:
+        op.bulk_insert(edge_table, edges)
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore task.dependencies JSON from edges."""
+    # Read the edges first: rebuilding the task table in batch mode would
+    # cascade-delete them when foreign keys are enforced
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        'SELECT task_id, depends_on_id FROM task_dependency ORDER BY task_id, depends_on_id'
+    ))
+    dependencies = {}
+    for task_id, depends_on_id in rows:
+        dependencies.setdefault(task_id, []).append(depends_on_id)
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('dependencies', sa.JSON(), nullable=True))
+
+    task = sa.table('task', sa.column('id', sa.Integer), sa.column('dependencies', sa.JSON))
+    for task_id, ids in dependencies.items():
+        bind.execute(task.update().where(task.c.id == task_id).values(dependencies=ids))
+
+    op.drop_index('idx_task_dependency_reverse', table_name='task_dependency')
+    op.drop_table('task_dependency')
@@ -30,7 +30,13 @@ setup(
             "mypy>=1.5.0",
             "black>=23.7.0",
             "isort>=5.12.0",
-        ]
+        ],
+        "async": [
+            "httpx>=0.24.0",  # Native async Ollama requests (LocalLLMInterface.agenerate)
+        ],
+        "compression": [
+            "zstandard>=0.21.0",  # zstd codec for ArtifactStore (gzip fallback)
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -8,10 +8,28 @@ This module contains concrete implementations of agent plugins:
 - (Future) AiderAgent: Aider integration
 
 All agents implement the AgentPlugin interface defined in src.plugins.base.
+
+Importing this package registers the built-in agents (and any advertised
+through the ``obra.agents`` entry point group) lazily: an agent's module,
+e.g. paramiko for SSH, is only imported when AgentRegistry.get() asks for it.
 """
 
-from src.agents.claude_code_local import ClaudeCodeLocalAgent
-from src.agents.claude_code_ssh import ClaudeCodeSSHAgent
-from src.agents.mock_agent import MockAgent
+from src.plugins.registry import AgentRegistry
+from src.utils.lazy_import import lazy_exports
+
+# Registry name -> 'module:Class'
+BUILTIN_AGENTS = {
+    'claude-code-local': 'src.agents.claude_code_local:ClaudeCodeLocalAgent',
+    'claude-code-ssh': 'src.agents.claude_code_ssh:ClaudeCodeSSHAgent',
+    'mock': 'src.agents.mock_agent:MockAgent',
+}
+
+for _name, _target in BUILTIN_AGENTS.items():
+    AgentRegistry.register_lazy(_name, _target)
+AgentRegistry.discover()
 
 __all__ = ['ClaudeCodeLocalAgent', 'ClaudeCodeSSHAgent', 'MockAgent']
+
+__getattr__ = lazy_exports(__name__, {
+    target.split(':')[1]: target.split(':')[0] for target in BUILTIN_AGENTS.values()
+})
@@ -4,6 +4,7 @@ This module provides ClaudeCodeLocalAgent, which manages Claude Code CLI
 using headless --print mode for reliable, stateless operation.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -12,8 +13,9 @@ import subprocess
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.llm.prompt_segments import PrefixCacheStats
 from src.plugins.base import AgentPlugin
 from src.plugins.exceptions import AgentException
 from src.plugins.registry import register_agent
@@ -46,6 +48,9 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         environment_vars: Environment variables for Claude subprocess
         bypass_permissions: Enable dangerous mode (default: True for automation)
         use_session_persistence: Reuse session ID (default: False, fresh per call)
+        cache_prompt_prefix: Send the stable prefix of segmented prompts as
+            appended system prompt, which Claude caches across calls
+        prefix_cache_stats: Cache reads per prompt prefix
     """
 
     def __init__(self):
@@ -70,6 +75,10 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         # Dangerous mode (bypass permissions for automated orchestration)
         self.bypass_permissions: bool = True  # Enabled by default for Obra
 
+        # Prompt prefix caching (segmented prompts)
+        self.cache_prompt_prefix: bool = True
+        self.prefix_cache_stats = PrefixCacheStats()
+
         # JSON metadata from last response (Phase 1, Task 1.3)
         self.last_metadata: Optional[Dict[str, Any]] = None
 
@@ -85,6 +94,8 @@ class ClaudeCodeLocalAgent(AgentPlugin):
                 - response_timeout or timeout_response: Seconds to wait (default: 7200 = 2 hours)
                 - use_session_persistence: Reuse session ID (default: False)
                 - bypass_permissions: Enable dangerous mode (default: True)
+                - cache_prompt_prefix: Send segmented prompt prefixes as
+                  system prompt for caching (default: True)
                 Can also accept nested 'local' dict with these keys.
 
         Raises:
@@ -121,6 +132,9 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         # Extract bypass permissions preference (default: True for Obra)
         self.bypass_permissions = config.get('bypass_permissions', True)
 
+        # Extract prompt prefix caching preference
+        self.cache_prompt_prefix = config.get('cache_prompt_prefix', True)
+
         # Generate unique session ID for context persistence (if enabled)
         if self.use_session_persistence:
             self.session_id = str(uuid.uuid4())
@@ -148,11 +162,12 @@ class ClaudeCodeLocalAgent(AgentPlugin):
             f'session={self.session_id}'
         )
 
-    def _run_claude(self, args: List[str]) -> subprocess.CompletedProcess:
+    def _run_claude(self, args: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess:
         """Run claude command with timeout and error handling.
 
         Args:
             args: Arguments to pass to claude command
+            cwd: Working directory (default: workspace_path)
 
         Returns:
             CompletedProcess object with stdout, stderr, returncode
@@ -173,7 +188,7 @@ class ClaudeCodeLocalAgent(AgentPlugin):
             # Run subprocess
             result = subprocess.run(
                 command,
-                cwd=str(self.workspace_path),
+                cwd=cwd or str(self.workspace_path),
                 capture_output=True,
                 text=True,
                 timeout=self.response_timeout,
@@ -206,6 +221,85 @@ class ClaudeCodeLocalAgent(AgentPlugin):
                 context={'command': command, 'error': str(e)}
             )
 
+    async def _arun_claude(self, args: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Async counterpart of _run_claude() using create_subprocess_exec.
+
+        The process is killed if it times out or the awaiting task is
+        cancelled, so an abandoned prompt never leaves a CLI running.
+
+        Args:
+            args: Arguments to pass to claude command
+            cwd: Working directory (default: workspace_path)
+
+        Returns:
+            CompletedProcess object with stdout, stderr, returncode
+
+        Raises:
+            AgentException: If command fails or times out
+        """
+        command = [self.claude_command] + args
+
+        env = os.environ.copy()
+        env.update(self.environment_vars)
+
+        logger.debug(f'Running command (async): {" ".join(command)}')
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd or str(self.workspace_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env
+            )
+        except FileNotFoundError:
+            raise AgentException(
+                f'Claude command not found: {self.claude_command}',
+                context={'command': self.claude_command},
+                recovery='Install Claude Code CLI or specify correct path'
+            )
+        except Exception as e:
+            raise AgentException(
+                f'Failed to run claude: {e}',
+                context={'command': command, 'error': str(e)}
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(),
+                timeout=self.response_timeout
+            )
+        except asyncio.TimeoutError:
+            await self._akill(process)
+            raise AgentException(
+                f'Timeout after {self.response_timeout}s',
+                context={
+                    'timeout': self.response_timeout,
+                    'command': command
+                },
+                recovery='Increase response_timeout in config'
+            )
+        except asyncio.CancelledError:
+            await self._akill(process)
+            raise
+
+        return subprocess.CompletedProcess(
+            command,
+            process.returncode,
+            stdout.decode(errors='replace'),
+            stderr.decode(errors='replace')
+        )
+
+    @staticmethod
+    async def _akill(process: asyncio.subprocess.Process) -> None:
+        """Kill a CLI process and reap it."""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
     def send_prompt(self, prompt: str, context: Optional[Dict] = None) -> str:
         """Send prompt to Claude Code and return response.
 
@@ -214,7 +308,48 @@ class ClaudeCodeLocalAgent(AgentPlugin):
 
         Args:
             prompt: The prompt text to send
-            context: Optional context dict (unused in headless mode)
+            context: Optional context dict ('max_turns', 'session_id', and
+                'workspace_path' to run this call in another directory)
+
+        Returns:
+            Complete response from Claude Code
+
+        Raises:
+            AgentException: If Claude fails or returns error
+        """
+        session_id, args = self._prepare_send(prompt, context)
+        cwd = (context or {}).get('workspace_path')
+
+        # Retry logic for session-in-use errors
+        retry_delay = self.retry_initial_delay
+
+        for attempt in range(self.max_retries):
+            # Execute command
+            result = self._run_claude(args, cwd=cwd)
+
+            response = self._handle_result(
+                result, session_id, context, attempt, retry_delay,
+                prefix_hash=getattr(prompt, 'prefix_hash', None)
+            )
+            if response is not None:
+                return response
+
+            time.sleep(retry_delay)
+            retry_delay *= self.retry_backoff  # Exponential backoff
+
+        # Should never reach here, but just in case
+        raise AgentException('Unexpected error in send_prompt retry loop')
+
+    async def asend_prompt(self, prompt: str, context: Optional[Dict] = None) -> str:
+        """Send prompt to Claude Code without blocking the event loop.
+
+        Same behaviour as send_prompt(), but the CLI runs under
+        asyncio.create_subprocess_exec and session-in-use backoff uses
+        asyncio.sleep. Cancelling the awaiting task kills the CLI process.
+
+        Args:
+            prompt: The prompt text to send
+            context: Optional context dict (see send_prompt())
 
         Returns:
             Complete response from Claude Code
@@ -222,6 +357,38 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         Raises:
             AgentException: If Claude fails or returns error
         """
+        session_id, args = self._prepare_send(prompt, context)
+        cwd = (context or {}).get('workspace_path')
+        retry_delay = self.retry_initial_delay
+
+        for attempt in range(self.max_retries):
+            result = await self._arun_claude(args, cwd=cwd)
+
+            response = self._handle_result(
+                result, session_id, context, attempt, retry_delay,
+                prefix_hash=getattr(prompt, 'prefix_hash', None)
+            )
+            if response is not None:
+                return response
+
+            await asyncio.sleep(retry_delay)
+            retry_delay *= self.retry_backoff
+
+        raise AgentException('Unexpected error in asend_prompt retry loop')
+
+    def _prepare_send(self, prompt: str, context: Optional[Dict]) -> Tuple[str, List[str]]:
+        """Pick the session and build CLI arguments for a prompt.
+
+        Args:
+            prompt: The prompt text to send
+            context: Optional context dict (reads 'max_turns' and 'session_id')
+
+        Returns:
+            Tuple of (session_id, claude arguments)
+
+        Raises:
+            AgentException: If the agent is not initialized
+        """
         if self.workspace_path is None:
             raise AgentException(
                 'Agent not initialized',
@@ -230,7 +397,11 @@ class ClaudeCodeLocalAgent(AgentPlugin):
 
         # Generate session ID (prefer explicitly set, otherwise fresh)
         # BUG-PHASE4-005 FIX: Always use session_id if explicitly set (by orchestrator)
-        if self.session_id:
+        if context and context.get('session_id'):
+            # Per-call session (e.g., a speculative turn running alongside another)
+            session_id = context['session_id']
+            logger.debug(f'SESSION ASSIGNED: session_id={session_id[:8]}... (per call)')
+        elif self.session_id:
             # Explicitly set session_id (e.g., by orchestrator for tracking)
             session_id = self.session_id
             logger.debug(f'SESSION ASSIGNED: session_id={session_id[:8]}... (externally set)')
@@ -262,8 +433,14 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         if self.bypass_permissions:
             args.append('--dangerously-skip-permissions')
 
-        # Add prompt as final argument
-        args.append(prompt)
+        # Add prompt as final argument. The stable prefix of a segmented
+        # prompt goes in the system prompt, which Claude caches across calls
+        prefix_length = getattr(prompt, 'prefix_length', 0)
+        if self.cache_prompt_prefix and 0 < prefix_length < len(prompt):
+            args.extend(['--append-system-prompt', prompt.prefix])
+            args.append(prompt.suffix)
+        else:
+            args.append(prompt)
 
         logger.info(
             f'CLAUDE_SEND: prompt_chars={len(prompt):,}, '
@@ -271,140 +448,173 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         )
         logger.debug(f'CLAUDE_PROMPT: {prompt[:100]}...')
 
-        # Retry logic for session-in-use errors
-        retry_delay = self.retry_initial_delay
+        return session_id, args
 
-        for attempt in range(self.max_retries):
-            # Execute command
-            result = self._run_claude(args)
+    def _handle_result(
+        self,
+        result: subprocess.CompletedProcess,
+        session_id: str,
+        context: Optional[Dict],
+        attempt: int,
+        retry_delay: float,
+        prefix_hash: Optional[str] = None
+    ) -> Optional[str]:
+        """Turn one claude invocation into a response, a retry, or an error.
 
-            # Check result
-            if result.returncode == 0:
-                # Success! Parse JSON response (Phase 1, Task 1.3)
-                raw_response = result.stdout.strip()
+        Shared by send_prompt() and asend_prompt().
 
-                try:
-                    # Parse JSON response
-                    json_response = json.loads(raw_response)
-
-                    # Extract the actual result text
-                    result_text = json_response.get('result', '')
-
-                    # Extract and store metadata
-                    self.last_metadata = self._extract_metadata(json_response)
-
-                    # Phase 4, Task 4.2: Check for error_max_turns
-                    if self.last_metadata.get('subtype') == 'error_max_turns':
-                        num_turns = self.last_metadata.get('num_turns', 0)
-                        max_turns_limit = context.get('max_turns') if context else None
-
-                        logger.error(
-                            f'CLAUDE_ERROR_MAX_TURNS: session_id={session_id[:8]}..., '
-                            f'turns_used={num_turns}, max_turns_limit={max_turns_limit}'
-                        )
-
-                        raise AgentException(
-                            f'Task exceeded max_turns limit ({num_turns}/{max_turns_limit})',
-                            context={
-                                'subtype': 'error_max_turns',
-                                'num_turns': num_turns,
-                                'max_turns': max_turns_limit,
-                                'session_id': session_id,
-                                'result_text': result_text[:500]  # Truncated error message
-                            },
-                            recovery='Retry with increased max_turns or break task into smaller pieces'
-                        )
-
-                    # Log detailed metadata
-                    total_tokens = self.last_metadata.get("total_tokens", 0)
-                    num_turns = self.last_metadata.get("num_turns", 0)
-                    duration_ms = self.last_metadata.get("duration_ms", 0)
-                    cache_hit_rate = self.last_metadata.get("cache_hit_rate", 0.0)
-                    input_tokens = self.last_metadata.get("input_tokens", 0)
-                    cache_read_tokens = self.last_metadata.get("cache_read_tokens", 0)
-                    output_tokens = self.last_metadata.get("output_tokens", 0)
+        Args:
+            result: Completed claude process
+            session_id: Session the prompt was sent on
+            context: Context dict passed to send_prompt()
+            attempt: Zero-based attempt number
+            retry_delay: Delay before the next attempt (for logging)
+            prefix_hash: Prefix hash of a segmented prompt (for cache stats)
 
-                    logger.info(
-                        f'CLAUDE_RESPONSE: session_id={session_id[:8]}..., '
-                        f'result_chars={len(result_text):,}, '
-                        f'attempt={attempt + 1}/{self.max_retries}'
-                    )
+        Returns:
+            Response text, or None if the session was busy and the caller
+            should retry after retry_delay
 
-                    logger.info(
-                        f'CLAUDE_JSON_METADATA: '
-                        f'tokens={total_tokens:,} '
-                        f'(input={input_tokens:,}, cache_read={cache_read_tokens:,}, output={output_tokens:,}), '
-                        f'turns={num_turns}, duration={duration_ms}ms, '
-                        f'cache_efficiency={cache_hit_rate:.1%}'
-                    )
+        Raises:
+            AgentException: If Claude failed or retries are exhausted
+        """
+        # Check result
+        if result.returncode == 0:
+            # Success! Parse JSON response (Phase 1, Task 1.3)
+            raw_response = result.stdout.strip()
+
+            try:
+                # Parse JSON response
+                json_response = json.loads(raw_response)
+
+                # Extract the actual result text
+                result_text = json_response.get('result', '')
+
+                # Extract and store metadata
+                self.last_metadata = self._extract_metadata(json_response, prefix_hash)
+
+                # Phase 4, Task 4.2: Check for error_max_turns
+                if self.last_metadata.get('subtype') == 'error_max_turns':
+                    num_turns = self.last_metadata.get('num_turns', 0)
+                    max_turns_limit = context.get('max_turns') if context else None
 
-                    logger.debug(f'CLAUDE_RESPONSE_TEXT: {result_text[:100]}...')
-                    logger.debug(f'CLAUDE_FULL_METADATA: {self.last_metadata}')
-
-                    return result_text
-
-                except json.JSONDecodeError as e:
-                    # JSON parsing failed - log warning but don't fail
-                    # (fallback to plain text for backward compatibility)
-                    logger.warning(f'CLAUDE_JSON_PARSE_FAILED: {e}')
-                    logger.warning(f'CLAUDE_RAW_RESPONSE: {raw_response[:200]}...')
-                    self.last_metadata = None
-                    return raw_response
-
-            # Check if it's a session-in-use error
-            if 'already in use' in result.stderr.lower():
-                if attempt < self.max_retries - 1:
-                    logger.warning(
-                        f'CLAUDE_SESSION_IN_USE: session_id={session_id[:8]}..., '
-                        f'attempt={attempt + 1}/{self.max_retries}, '
-                        f'retry_delay={retry_delay:.1f}s'
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= self.retry_backoff  # Exponential backoff
-                    continue
-                else:
-                    total_wait_time = sum(
-                        self.retry_initial_delay * (self.retry_backoff ** i)
-                        for i in range(self.max_retries - 1)
-                    )
                     logger.error(
-                        f'CLAUDE_SESSION_LOCKED: session_id={session_id[:8]}..., '
-                        f'max_retries={self.max_retries} exhausted, '
-                        f'total_wait_time={total_wait_time:.1f}s'
+                        f'CLAUDE_ERROR_MAX_TURNS: session_id={session_id[:8]}..., '
+                        f'turns_used={num_turns}, max_turns_limit={max_turns_limit}'
                     )
+
                     raise AgentException(
-                        f'Session still in use after {self.max_retries} retries',
+                        f'Task exceeded max_turns limit ({num_turns}/{max_turns_limit})',
                         context={
-                            'session_id': self.session_id,
-                            'stderr': result.stderr,
-                            'total_wait_time': total_wait_time
+                            'subtype': 'error_max_turns',
+                            'num_turns': num_turns,
+                            'max_turns': max_turns_limit,
+                            'session_id': session_id,
+                            'result_text': result_text[:500]  # Truncated error message
                         },
-                        recovery='Wait longer between calls or use fresh sessions'
+                        recovery='Retry with increased max_turns or break task into smaller pieces'
                     )
 
-            # Other error - fail immediately
-            logger.error(
-                f'CLAUDE_COMMAND_FAILED: exit_code={result.returncode}, '
-                f'session_id={session_id[:8]}..., stderr={result.stderr[:200]}'
-            )
-            raise AgentException(
-                f'Claude failed with exit code {result.returncode}',
-                context={
-                    'exit_code': result.returncode,
-                    'stderr': result.stderr,
-                    'stdout': result.stdout[:500] if result.stdout else None
-                },
-                recovery='Check Claude Code logs and ensure API key is set'
-            )
+                # Log detailed metadata
+                total_tokens = self.last_metadata.get("total_tokens", 0)
+                num_turns = self.last_metadata.get("num_turns", 0)
+                duration_ms = self.last_metadata.get("duration_ms", 0)
+                cache_hit_rate = self.last_metadata.get("cache_hit_rate", 0.0)
+                input_tokens = self.last_metadata.get("input_tokens", 0)
+                cache_read_tokens = self.last_metadata.get("cache_read_tokens", 0)
+                output_tokens = self.last_metadata.get("output_tokens", 0)
+
+                logger.info(
+                    f'CLAUDE_RESPONSE: session_id={session_id[:8]}..., '
+                    f'result_chars={len(result_text):,}, '
+                    f'attempt={attempt + 1}/{self.max_retries}'
+                )
 
-        # Should never reach here, but just in case
-        raise AgentException('Unexpected error in send_prompt retry loop')
+                logger.info(
+                    f'CLAUDE_JSON_METADATA: '
+                    f'tokens={total_tokens:,} '
+                    f'(input={input_tokens:,}, cache_read={cache_read_tokens:,}, output={output_tokens:,}), '
+                    f'turns={num_turns}, duration={duration_ms}ms, '
+                    f'cache_efficiency={cache_hit_rate:.1%}'
+                )
+                if prefix_hash:
+                    logger.info(
+                        f'CLAUDE_PROMPT_PREFIX: prefix={prefix_hash}, '
+                        f'reused={self.last_metadata["prefix_reused"]}, '
+                        f'prefix_cache_read={self.last_metadata["prefix_cache_read_ratio"]:.1%}'
+                    )
 
-    def _extract_metadata(self, response: Dict[str, Any]) -> Dict[str, Any]:
+                logger.debug(f'CLAUDE_RESPONSE_TEXT: {result_text[:100]}...')
+                logger.debug(f'CLAUDE_FULL_METADATA: {self.last_metadata}')
+
+                return result_text
+
+            except json.JSONDecodeError as e:
+                # JSON parsing failed - log warning but don't fail
+                # (fallback to plain text for backward compatibility)
+                logger.warning(f'CLAUDE_JSON_PARSE_FAILED: {e}')
+                logger.warning(f'CLAUDE_RAW_RESPONSE: {raw_response[:200]}...')
+                self.last_metadata = None
+                return raw_response
+
+        # Check if it's a session-in-use error
+        if 'already in use' in result.stderr.lower():
+            if attempt < self.max_retries - 1:
+                logger.warning(
+                    f'CLAUDE_SESSION_IN_USE: session_id={session_id[:8]}..., '
+                    f'attempt={attempt + 1}/{self.max_retries}, '
+                    f'retry_delay={retry_delay:.1f}s'
+                )
+                return None
+            else:
+                total_wait_time = sum(
+                    self.retry_initial_delay * (self.retry_backoff ** i)
+                    for i in range(self.max_retries - 1)
+                )
+                logger.error(
+                    f'CLAUDE_SESSION_LOCKED: session_id={session_id[:8]}..., '
+                    f'max_retries={self.max_retries} exhausted, '
+                    f'total_wait_time={total_wait_time:.1f}s'
+                )
+                raise AgentException(
+                    f'Session still in use after {self.max_retries} retries',
+                    context={
+                        'session_id': self.session_id,
+                        'stderr': result.stderr,
+                        'total_wait_time': total_wait_time
+                    },
+                    recovery='Wait longer between calls or use fresh sessions'
+                )
+
+        # Other error - fail immediately
+        logger.error(
+            f'CLAUDE_COMMAND_FAILED: exit_code={result.returncode}, '
+            f'session_id={session_id[:8]}..., stderr={result.stderr[:200]}'
+        )
+        raise AgentException(
+            f'Claude failed with exit code {result.returncode}',
+            context={
+                'exit_code': result.returncode,
+                'stderr': result.stderr,
+                'stdout': result.stdout[:500] if result.stdout else None
+            },
+            recovery='Check Claude Code logs and ensure API key is set'
+        )
+
+
+    def _extract_metadata(
+        self,
+        response: Dict[str, Any],
+        prefix_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Extract metadata from Claude Code JSON response.
 
+        For segmented prompts the usage is also recorded against the
+        prompt prefix, so cache reads can be compared per prefix.
+
         Args:
             response: JSON response from Claude Code
+            prefix_hash: Prefix hash of the prompt, if it was segmented
 
         Returns:
             Dict with normalized metadata fields
@@ -435,6 +645,15 @@ class ClaudeCodeLocalAgent(AgentPlugin):
             if cache_denominator > 0 else 0.0
         )
 
+        # Cache reads for this prompt prefix across calls
+        prefix_usage = None
+        if prefix_hash:
+            prefix_usage = self.prefix_cache_stats.record(
+                prefix_hash,
+                input_tokens=cache_denominator,
+                cache_read_tokens=usage.get('cache_read_input_tokens', 0)
+            )
+
         return {
             # Response status
             'type': response.get('type'),  # "result"
@@ -453,6 +672,11 @@ class ClaudeCodeLocalAgent(AgentPlugin):
             'total_tokens': total_tokens,
             'cache_hit_rate': cache_hit_rate,
 
+            # Prompt prefix reuse (segmented prompts only)
+            'prefix_hash': prefix_hash,
+            'prefix_reused': prefix_usage['reused'] if prefix_usage else None,
+            'prefix_cache_read_ratio': prefix_usage['cache_read_ratio'] if prefix_usage else None,
+
             # Performance metrics
             'duration_ms': response.get('duration_ms', 0),
             'duration_api_ms': response.get('duration_api_ms', 0),
@@ -484,6 +708,14 @@ class ClaudeCodeLocalAgent(AgentPlugin):
         """
         return self.last_metadata
 
+    def get_prefix_cache_stats(self) -> Dict[str, Any]:
+        """Get cache reads per prompt prefix.
+
+        Returns:
+            PrefixCacheStats.report() for prompts sent by this agent
+        """
+        return self.prefix_cache_stats.report()
+
     def is_healthy(self) -> bool:
         """Check if Claude Code is available and responsive.
 
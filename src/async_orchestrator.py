@@ -0,0 +1,685 @@
+"""asyncio variant of the Orchestrator iteration loop.
+
+AsyncOrchestrator keeps the synchronous Orchestrator API and adds
+``aexecute_task``, whose iteration loop runs on the caller's event loop:
+
+- the agent turn is awaited via ``AgentPlugin.asend_prompt`` (a real
+  subprocess for claude-code-local, a worker thread for other agents)
+- quality validation and confidence scoring (both may call the LLM) run
+  concurrently instead of back to back
+- session usage and interaction records are written while validation and
+  the decision are still in flight
+- orchestrator-LLM feedback uses ``LLMPlugin.agenerate``
+- optionally (``orchestration.pipelining.enabled``), the next agent turn
+  starts speculatively with the RETRY prompt as soon as a response passes
+  format validation; it runs in a forked git worktree of the agent
+  workspace, whose edits are applied on RETRY and discarded otherwise
+
+Task setup and teardown (temporary sessions, complexity estimation, the
+max_turns retry loop) are the synchronous ``execute_task`` code, run on a
+dedicated worker thread per orchestrator, so both APIs behave identically
+around the loop. One orchestrator executes one task at a time; serve
+several sessions concurrently with one AsyncOrchestrator each on the same
+event loop.
+
+Example:
+    >>> orchestrator = AsyncOrchestrator(config=config)
+    >>> orchestrator.initialize()
+    >>> result = asyncio.run(orchestrator.aexecute_task(task_id=1))
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core.models import Task
+from src.monitoring.tracing import get_tracer, traced
+from src.orchestration.complexity_estimate import ComplexityEstimate
+from src.orchestration.decision_engine import DecisionEngine
+from src.orchestrator import Orchestrator
+from src.plugins.base import AgentPlugin
+from src.plugins.exceptions import AgentException
+from src.utils.git_manager import GitConfig, GitException, GitManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOrchestrator(Orchestrator):
+    """Orchestrator whose iteration loop is driven by asyncio.
+
+    Example:
+        >>> async def main():
+        ...     orchestrator = AsyncOrchestrator(config=config)
+        ...     orchestrator.initialize()
+        ...     try:
+        ...         return await orchestrator.aexecute_task(task_id=1)
+        ...     finally:
+        ...         await orchestrator.aclose()
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize orchestrator (see Orchestrator.__init__)."""
+        super().__init__(*args, **kwargs)
+        # execute_task() runs here while the iteration loop runs on the event loop
+        self._task_executor: Optional[ThreadPoolExecutor] = None
+        self._bridge = threading.local()
+        self._active_loop_future: Optional[Future] = None
+        self.last_pipeline_stats: Optional[PipelineStats] = None
+        # Forks the agent workspace for speculative turns (pipelining only)
+        self._speculation_git: Optional[GitManager] = None
+
+    # ========================================================================
+    # Public async API
+    # ========================================================================
+
+    async def aexecute_task(
+        self,
+        task_id: int,
+        max_iterations: int = 10,
+        context: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        interactive: bool = False
+    ) -> Dict[str, Any]:
+        """Execute a task with the iteration loop on the running event loop.
+
+        Args:
+            task_id: Task ID to execute
+            max_iterations: Maximum iterations before giving up
+            context: Optional execution context
+            stream: Enable real-time streaming output
+            interactive: Enable interactive mode with command injection
+
+        Returns:
+            Same result dictionary as execute_task()
+
+        Raises:
+            OrchestratorException: If execution fails
+        """
+        loop = asyncio.get_running_loop()
+        if self._task_executor is None:
+            self._task_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='obra-async-task'
+            )
+
+        try:
+            return await loop.run_in_executor(
+                self._task_executor,
+                self._execute_task_bridged,
+                loop, task_id, max_iterations, context, stream, interactive
+            )
+        except asyncio.CancelledError:
+            # Stop the in-flight iteration loop (kills the agent subprocess)
+            if self._active_loop_future is not None:
+                self._active_loop_future.cancel()
+            raise
+
+    async def aclose(self) -> None:
+        """Release async resources (LLM HTTP client, task thread).
+
+        Example:
+            >>> await orchestrator.aclose()
+        """
+        aclose = getattr(self.llm_interface, 'aclose', None)
+        if aclose is not None and asyncio.iscoroutinefunction(aclose):
+            await aclose()
+        if self._task_executor is not None:
+            self._task_executor.shutdown(wait=False)
+            self._task_executor = None
+
+    def shutdown(self) -> None:
+        """Gracefully shutdown orchestrator and its task thread."""
+        if self._task_executor is not None:
+            self._task_executor.shutdown(wait=False)
+            self._task_executor = None
+        super().shutdown()
+
+    # ========================================================================
+    # Sync/async bridge
+    # ========================================================================
+
+    def _execute_task_bridged(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        task_id: int,
+        max_iterations: int,
+        context: Optional[Dict[str, Any]],
+        stream: bool,
+        interactive: bool
+    ) -> Dict[str, Any]:
+        """Run execute_task() on the task thread, routing the loop to ``loop``."""
+        self._bridge.loop = loop
+        try:
+            return self.execute_task(
+                task_id,
+                max_iterations=max_iterations,
+                context=context,
+                stream=stream,
+                interactive=interactive
+            )
+        finally:
+            self._bridge.loop = None
+
+    def _execute_single_task(
+        self,
+        task: Task,
+        max_iterations: int,
+        context: Optional[Dict[str, Any]] = None,
+        complexity_estimate: Optional[ComplexityEstimate] = None
+    ) -> Dict[str, Any]:
+        """Run the iteration loop on the event loop when called via aexecute_task().
+
+        Plain execute_task() calls use the synchronous loop unchanged.
+        """
+        loop = getattr(self._bridge, 'loop', None)
+        if loop is None:
+            return super()._execute_single_task(
+                task, max_iterations, context, complexity_estimate
+            )
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._aexecute_in_span(
+                get_tracer().current_span(),
+                task, max_iterations, context, complexity_estimate
+            ),
+            loop
+        )
+        self._active_loop_future = future
+        try:
+            return future.result()
+        finally:
+            self._active_loop_future = None
+
+    async def _aexecute_in_span(self, parent_span: Any, *args: Any) -> Dict[str, Any]:
+        """Run the loop under the task thread's span (context doesn't cross threads)."""
+        with get_tracer().use_span(parent_span):
+            return await self._aexecute_single_task(*args)
+
+    # ========================================================================
+    # Iteration loop
+    # ========================================================================
+
+    async def _aexecute_single_task(
+        self,
+        task: Task,
+        max_iterations: int,
+        context: Optional[Dict[str, Any]] = None,
+        complexity_estimate: Optional[ComplexityEstimate] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of Orchestrator._execute_single_task.
+
+        Uses the same step helpers; blocking steps (database, prompt
+        rendering, validators) run in worker threads so independent ones
+        can overlap. With pipelining enabled, the next agent turn starts
+        speculatively while the current response is being evaluated.
+
+        Args:
+            task: Task to execute
+            max_iterations: Maximum iterations
+            context: Optional execution context
+            complexity_estimate: Optional complexity estimate to include in prompt
+
+        Returns:
+            Execution results including parallel_metadata (and pipeline_stats
+            when pipelining is enabled)
+        """
+        iteration = 0
+        accumulated_context: List[Dict[str, Any]] = []
+        stats = PipelineStats() if self._pipelining_enabled() else None
+        speculative: Optional[_SpeculativeTurn] = None
+        tracer = get_tracer()
+
+        while iteration < max_iterations:
+            iteration += 1
+            self._iteration_count += 1
+
+            logger.debug(f"ITERATION START (async): task_id={task.id}, iteration={iteration}/{max_iterations}")
+            self._print_obra(f"Starting iteration {iteration}/{max_iterations}")
+
+            adopted, speculative = speculative, None
+            old_agent_session_id = getattr(self.agent, 'session_id', None)
+            if adopted is not None:
+                # Session record was created when the turn was started
+                iteration_session_id = adopted.session_id
+                session_created = adopted.session_created
+            else:
+                iteration_session_id = str(uuid.uuid4())
+                session_created = False
+
+            iteration_span = tracer.start_span('iteration', {'iteration': iteration})
+            keep_speculative = False
+            try:
+                if adopted is not None:
+                    prompt = adopted.prompt
+                    response, agent_metadata = await self._adopt_speculative_turn(adopted)
+                    logger.info(f"PIPELINE: adopted speculative turn for iteration {iteration}")
+                else:
+                    await asyncio.to_thread(
+                        self._start_iteration_session,
+                        task, iteration, max_iterations, iteration_session_id
+                    )
+                    session_created = True
+
+                    prompt = await asyncio.to_thread(
+                        self._build_iteration_prompt,
+                        task, iteration, accumulated_context, complexity_estimate
+                    )
+
+                    if self.interactive_mode:
+                        prompt = await asyncio.to_thread(
+                            self._interactive_checkpoint, task, iteration, prompt, context
+                        )
+
+                    agent_context = self._log_agent_send(prompt, iteration, max_iterations, context)
+                    with tracer.span('agent.send_prompt', prompt_chars=len(prompt)) as agent_span:
+                        response = await self.agent.asend_prompt(prompt, context=agent_context)
+                        agent_span.set_attribute('response_chars', len(response))
+                    agent_metadata = self._last_agent_metadata()
+                logger.info(f"[CLAUDE→OBRA] Response received | {len(response):,} chars")
+                self._print_obra(f"Response received ({len(response)} chars)")
+
+                def start_speculation() -> None:
+                    nonlocal speculative
+                    if stats is not None and iteration < max_iterations:
+                        speculative = self._start_speculative_turn(
+                            task, iteration + 1, max_iterations, response,
+                            accumulated_context, complexity_estimate, context
+                        )
+                        stats.speculated += 1
+
+                # Usage bookkeeping doesn't feed the decision; let it run alongside
+                usage_tracked = asyncio.create_task(
+                    asyncio.to_thread(self._track_agent_usage, task, iteration, agent_metadata)
+                )
+                evaluation_started = time.perf_counter()
+                try:
+                    action, result = await self._aevaluate_response(
+                        task, prompt, response, iteration, accumulated_context,
+                        agent_metadata=agent_metadata,
+                        on_valid=start_speculation
+                    )
+                finally:
+                    await usage_tracked
+
+                if action is not None:
+                    iteration_span.set_attribute('action', action.type)
+
+                if stats is not None:
+                    decided = time.perf_counter()
+                    stats.evaluation_seconds += decided - evaluation_started
+                    if speculative is not None:
+                        if result is None and action is not None and action.type == DecisionEngine.ACTION_RETRY:
+                            # The speculative prompt is exactly the RETRY prompt
+                            stats.adopted += 1
+                            stats.saved_seconds += speculative.overlap(decided)
+                            keep_speculative = True
+                        else:
+                            await self._cancel_speculative_turn(speculative, stats)
+                            speculative = None
+
+                if result is not None:
+                    return self._with_pipeline_stats(result, stats)
+
+            except AgentException as e:
+                if e.context_data.get('subtype') == 'error_max_turns':
+                    logger.debug("Propagating error_max_turns exception to retry loop")
+                    raise
+                self._note_iteration_error(iteration, e, accumulated_context)
+            except Exception as e:
+                self._note_iteration_error(iteration, e, accumulated_context)
+            finally:
+                # Evaluation failed or was cancelled before a decision
+                if speculative is not None and not keep_speculative:
+                    await self._cancel_speculative_turn(speculative, stats)
+                    speculative = None
+                await asyncio.to_thread(
+                    self._end_iteration_session,
+                    iteration_session_id, session_created, old_agent_session_id
+                )
+                tracer.end_span(iteration_span)
+
+        if speculative is not None:
+            await self._cancel_speculative_turn(speculative, stats)
+
+        logger.warning(f"Max iterations ({max_iterations}) reached")
+        return self._with_pipeline_stats({
+            'status': 'max_iterations',
+            'iterations': iteration,
+            'message': 'Task did not complete within iteration limit'
+        }, stats)
+
+    async def _aevaluate_response(
+        self,
+        task: Task,
+        prompt: str,
+        response: str,
+        iteration: int,
+        accumulated_context: List[Dict[str, Any]],
+        agent_metadata: Optional[Dict[str, Any]] = None,
+        on_valid: Optional[Callable[[], None]] = None
+    ) -> Tuple[Optional[Any], Optional[Dict[str, Any]]]:
+        """Validate, score and decide on one agent response.
+
+        Args:
+            task: Task being executed
+            prompt: Prompt that produced the response
+            response: Agent response
+            iteration: Current iteration (1-based)
+            accumulated_context: Iteration context (updated in place)
+            agent_metadata: Metadata of this response (for usage records)
+            on_valid: Called once the response passes format validation
+
+        Returns:
+            Tuple of (decided action or None, final task result or None to
+            continue iterating)
+        """
+        with get_tracer().span('validation.format'):
+            is_valid = self.response_validator.validate_format(
+                response,
+                expected_format='markdown'
+            )
+        self._print_obra(f"Validation: {'✓' if is_valid else '✗'}")
+
+        if not is_valid:
+            self._note_invalid_format(accumulated_context)
+            return None, None
+
+        if on_valid is not None:
+            on_valid()
+
+        # Quality and confidence are independent reads of the response
+        self._print_orch("Validating response...")
+        quality_result, confidence = await asyncio.gather(
+            asyncio.to_thread(
+                traced('validation.quality')(self.quality_controller.validate_output),
+                response, self.current_task, {'language': 'python'}
+            ),
+            asyncio.to_thread(
+                traced('validation.confidence')(self.confidence_scorer.score_response),
+                response, self.current_task, {'validation': is_valid}
+            )
+        )
+        self._report_quality(quality_result)
+        self._report_confidence(confidence, quality_result)
+
+        interaction_recorded = asyncio.create_task(asyncio.to_thread(
+            self._record_iteration_interaction,
+            prompt, response, iteration, is_valid, quality_result, confidence,
+            agent_metadata
+        ))
+        try:
+            if self._check_no_work(response, iteration, accumulated_context):
+                return None, None
+
+            action = await asyncio.to_thread(
+                self._decide_iteration_action,
+                response, is_valid, quality_result, confidence
+            )
+
+            feedback_prompt = self._feedback_request_prompt(response)
+            if feedback_prompt:
+                try:
+                    with get_tracer().span('llm.feedback'):
+                        feedback = await self.llm_interface.agenerate(
+                            feedback_prompt,
+                            max_tokens=500,
+                            temperature=0.3
+                        )
+                    self._inject_orch_feedback(feedback)
+                except Exception as e:
+                    logger.error(f"[ORCH_FEEDBACK] Failed to generate feedback: {e}")
+                    self._print_orch(f"  Error generating feedback: {str(e)}")
+        finally:
+            await interaction_recorded
+
+        result = await asyncio.to_thread(
+            self._handle_iteration_action,
+            action, response, iteration, quality_result, confidence,
+            accumulated_context
+        )
+        return action, result
+
+    # ========================================================================
+    # Pipelining (speculative next turn)
+    # ========================================================================
+
+    def _pipelining_enabled(self) -> bool:
+        """Whether the next agent turn may start before the decision is made.
+
+        Requires ``orchestration.pipelining.enabled``, a non-interactive run
+        (injected commands shape the next prompt), an agent with a native
+        asend_prompt (a thread-offloaded turn cannot be cancelled) and an
+        agent workspace that is a git repository (speculative edits happen in
+        a forked worktree so a cancelled turn leaves no trace).
+        """
+        if not self.config.get('orchestration.pipelining.enabled', False):
+            return False
+        if self.interactive_mode:
+            logger.debug("PIPELINE: disabled in interactive mode")
+            return False
+        agent_asend = getattr(type(self.agent), 'asend_prompt', None)
+        if agent_asend is None or agent_asend is AgentPlugin.asend_prompt:
+            logger.warning(
+                f"PIPELINE: disabled, agent {type(self.agent).__name__} has no "
+                f"native asend_prompt (speculative turns could not be cancelled)"
+            )
+            return False
+        if self._workspace_git_manager() is None:
+            logger.warning(
+                "PIPELINE: disabled, agent workspace is not a git repository with "
+                "a commit (speculative edits could not be isolated)"
+            )
+            return False
+        return True
+
+    def _workspace_git_manager(self) -> Optional[GitManager]:
+        """GitManager for the agent workspace, used to fork speculative turns.
+
+        Returns:
+            GitManager, or None if the workspace is not a git repository
+            with at least one commit
+        """
+        workspace = getattr(self.agent, 'workspace_path', None)
+        if workspace is None:
+            return None
+        git = self._speculation_git
+        if git is None or git.project_dir != Path(workspace).resolve():
+            git = GitManager(GitConfig(enabled=False), None, self.state_manager)
+            git.initialize(str(workspace))
+            if not git.is_git_repository():
+                return None
+            try:
+                git.get_commit()
+            except GitException:
+                return None
+            self._speculation_git = git
+        return git
+
+    def _start_speculative_turn(
+        self,
+        task: Task,
+        iteration: int,
+        max_iterations: int,
+        previous_response: str,
+        accumulated_context: List[Dict[str, Any]],
+        complexity_estimate: Optional[ComplexityEstimate],
+        context: Optional[Dict[str, Any]]
+    ) -> '_SpeculativeTurn':
+        """Start ``iteration`` with the prompt a RETRY of the current response would build.
+
+        The turn runs in a fork of the agent workspace under its own session;
+        the agent's session_id and the shared workspace are left untouched
+        until the turn is adopted.
+        """
+        retry_context = accumulated_context + [{
+            'type': 'previous_attempt',
+            'content': previous_response,
+            'timestamp': datetime.now(UTC)
+        }]
+        turn = _SpeculativeTurn(
+            iteration=iteration,
+            session_id=str(uuid.uuid4()),
+            started=time.perf_counter(),
+            agent_session_id=getattr(self.agent, 'session_id', None)
+        )
+        git = self._speculation_git
+
+        def fork_workspace() -> None:
+            turn.workspace, turn.base_commit = git.fork_worktree(prefix='obra-speculative-')
+
+        async def run() -> Tuple[str, Optional[Dict[str, Any]]]:
+            # Shielded so a fork still being created on cancel completes
+            # and can be removed
+            turn.forking = asyncio.ensure_future(asyncio.to_thread(fork_workspace))
+            await asyncio.shield(turn.forking)
+            await asyncio.to_thread(
+                self._start_iteration_session,
+                task, iteration, max_iterations, turn.session_id, False
+            )
+            turn.session_created = True
+            turn.prompt = await asyncio.to_thread(
+                self._build_iteration_prompt,
+                task, iteration, retry_context, complexity_estimate
+            )
+            logger.debug(f"PIPELINE: speculative turn started for iteration {iteration}")
+            agent_context = self._log_agent_send(turn.prompt, iteration, max_iterations, context)
+            # Own session and workspace: the current iteration's are still in use
+            agent_context['session_id'] = turn.session_id
+            agent_context['workspace_path'] = str(turn.workspace)
+            try:
+                with get_tracer().span(
+                    'agent.send_prompt',
+                    prompt_chars=len(turn.prompt), speculative=True, for_iteration=iteration
+                ):
+                    response = await self.agent.asend_prompt(turn.prompt, context=agent_context)
+                return response, self._last_agent_metadata()
+            finally:
+                turn.finished = time.perf_counter()
+
+        turn.task = asyncio.create_task(run())
+        return turn
+
+    async def _cancel_speculative_turn(
+        self,
+        turn: '_SpeculativeTurn',
+        stats: Optional['PipelineStats']
+    ) -> None:
+        """Cancel a speculative turn the decision did not need.
+
+        Its worktree (and any partial edits) is discarded, its session
+        closed and the agent's session_id restored.
+        """
+        turn.task.cancel()
+        try:
+            await turn.task
+        except (asyncio.CancelledError, Exception):
+            pass
+        await self._discard_speculative_workspace(turn)
+        cancelled = time.perf_counter()
+        if stats is not None:
+            stats.cancelled += 1
+            stats.wasted_seconds += (turn.finished or cancelled) - turn.started
+        logger.info(f"PIPELINE: cancelled speculative turn for iteration {turn.iteration}")
+        await asyncio.to_thread(
+            self._end_iteration_session,
+            turn.session_id, turn.session_created, turn.agent_session_id
+        )
+
+    async def _adopt_speculative_turn(
+        self,
+        turn: '_SpeculativeTurn'
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Wait for an adopted speculative turn and apply its edits to the workspace.
+
+        Returns:
+            Tuple of (agent response, agent metadata)
+
+        Raises:
+            GitException: If the turn's edits do not apply to the workspace
+        """
+        try:
+            result = await turn.task
+            await asyncio.to_thread(
+                self._speculation_git.apply_worktree_changes, turn.workspace, turn.base_commit
+            )
+            return result
+        finally:
+            await self._discard_speculative_workspace(turn)
+
+    async def _discard_speculative_workspace(self, turn: '_SpeculativeTurn') -> None:
+        """Remove a speculative turn's worktree, waiting for a fork in progress."""
+        if turn.forking is not None:
+            await asyncio.wait([turn.forking])
+        if turn.workspace is not None:
+            workspace, turn.workspace = turn.workspace, None
+            await asyncio.to_thread(self._speculation_git.remove_worktree, workspace)
+
+    def _with_pipeline_stats(
+        self,
+        result: Dict[str, Any],
+        stats: Optional['PipelineStats']
+    ) -> Dict[str, Any]:
+        """Attach and log pipelining stats for the finished loop."""
+        if stats is None:
+            return result
+        self.last_pipeline_stats = stats
+        logger.info(
+            f"PIPELINE: task_id={self.current_task.id}, speculated={stats.speculated}, "
+            f"adopted={stats.adopted}, cancelled={stats.cancelled}, "
+            f"saved={stats.saved_seconds:.2f}s, wasted={stats.wasted_seconds:.2f}s"
+        )
+        result['pipeline_stats'] = stats.to_dict()
+        return result
+
+
+@dataclass
+class PipelineStats:
+    """Critical-path accounting for pipelined iteration loops.
+
+    Attributes:
+        speculated: Speculative turns started
+        adopted: Speculative turns used as the next iteration (RETRY)
+        cancelled: Speculative turns discarded (any other decision)
+        saved_seconds: Agent time that overlapped evaluation in adopted turns,
+            i.e. time taken off the critical path
+        wasted_seconds: Agent time spent on cancelled turns
+        evaluation_seconds: Total time spent validating and deciding
+    """
+    speculated: int = 0
+    adopted: int = 0
+    cancelled: int = 0
+    saved_seconds: float = 0.0
+    wasted_seconds: float = 0.0
+    evaluation_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for results and logging."""
+        return asdict(self)
+
+
+@dataclass
+class _SpeculativeTurn:
+    """Agent turn started before the previous iteration's decision."""
+    iteration: int
+    session_id: str
+    started: float
+    agent_session_id: Optional[str] = None
+    prompt: str = ''
+    session_created: bool = False
+    finished: Optional[float] = None
+    workspace: Optional[Path] = None
+    base_commit: Optional[str] = None
+    forking: Optional['asyncio.Future'] = field(default=None, repr=False)
+    task: Optional['asyncio.Task'] = field(default=None, repr=False)
+
+    def overlap(self, decided: float) -> float:
+        """Seconds of this turn that ran before the decision at ``decided``."""
+        end = min(decided, self.finished) if self.finished is not None else decided
+        return max(0.0, end - self.started)
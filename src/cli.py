@@ -10,6 +10,7 @@ Usage:
     $ python -m src.cli interactive
 """
 
+import os
 import sys
 import logging
 import time
@@ -18,15 +19,38 @@ from typing import Optional
 
 import click
 
-from src.orchestrator import Orchestrator, OrchestratorState
 from src.core.config import Config
-from src.core.state import StateManager
 from src.core.exceptions import OrchestratorException
+from src.daemon import DaemonClient
 from src.monitoring.production_logger import initialize_production_logger, generate_session_id
+from src.monitoring.tracing import initialize_tracing
+from src.utils.lazy_import import lazy_import
+
+# Heavy imports (SQLAlchemy, agent/LLM plugins) are deferred to first use so
+# `obra --help`, `obra config ...` etc. start fast. Startup time is guarded
+# by tests/test_cli_startup.py.
+Orchestrator = lazy_import('src.orchestrator', 'Orchestrator')
+OrchestratorState = lazy_import('src.orchestrator', 'OrchestratorState')
+StateManager = lazy_import('src.core.state', 'StateManager')
 
 logger = logging.getLogger(__name__)
 
 
+def _connect_daemon(config: Config) -> Optional[DaemonClient]:
+    """Return a client for the `obra serve` daemon if one is running.
+
+    Only a daemon serving this config's database is used. Disabled with
+    ``daemon.auto_connect: false``.
+    """
+    if not config.get('daemon.auto_connect', True):
+        return None
+    client = DaemonClient.from_config(config)
+    if client.serves_database():
+        logger.debug(f"Using orchestrator daemon at {client.socket_path}")
+        return client
+    return None
+
+
 @click.group()
 @click.option('--config', '-c', type=click.Path(exists=True), help='Path to config file')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -49,6 +73,7 @@ def cli(ctx, config: Optional[str], verbose: bool):
     # Initialize production logger (Issue #3 - v1.8.1)
     # Extract the config dict from Config object
     prod_logger = initialize_production_logger(config_mgr._config)
+    initialize_tracing(config_mgr._config)
 
     # Generate CLI session ID for logging
     session_id = generate_session_id()
@@ -402,9 +427,15 @@ def task_list(ctx, project: Optional[int], status: Optional[str]):
 @click.option('--stream', is_flag=True, help='Enable real-time streaming output')
 @click.option('--interactive', is_flag=True, help='Enable interactive mode with command injection')
 @click.option('--confirm-destructive', is_flag=True, help='Auto-confirm destructive operations (use with caution)')
+@click.option('--no-daemon', is_flag=True, help='Run in this process even if `obra serve` is running')
 @click.pass_context
-def task_execute(ctx, task_id: int, max_iterations: int, stream: bool, interactive: bool, confirm_destructive: bool):
-    """Execute a single task."""
+def task_execute(ctx, task_id: int, max_iterations: int, stream: bool, interactive: bool,
+                 confirm_destructive: bool, no_daemon: bool):
+    """Execute a single task.
+
+    Runs in the `obra serve` daemon when one is running, unless --no-daemon,
+    --stream, --interactive or --confirm-destructive is given.
+    """
     # Get production logger and session ID (Issue #3 - v1.8.1)
     prod_logger = ctx.obj.get('production_logger')
     session_id = ctx.obj.get('session_id', 'cli-session')
@@ -428,19 +459,29 @@ def task_execute(ctx, task_id: int, max_iterations: int, stream: bool, interacti
             config.set('nl_commands.auto_confirm_destructive', True)
             click.echo("⚠️  Auto-confirming destructive operations (override enabled)")
 
-        # Initialize orchestrator
-        orchestrator = Orchestrator(config=config)
-        orchestrator.initialize()
-
-        click.echo(f"Executing task #{task_id}...")
+        # Terminal I/O and per-command config overrides need a local orchestrator
+        daemon = None
+        if not (no_daemon or stream or interactive or confirm_destructive):
+            daemon = _connect_daemon(config)
 
-        # Execute task (Phase 2: added interactive parameter)
-        result = orchestrator.execute_task(
-            task_id,
-            max_iterations=max_iterations,
-            stream=stream,
-            interactive=interactive
-        )
+        if daemon:
+            orchestrator = None
+            click.echo(f"Executing task #{task_id} (daemon)...")
+            result = daemon.execute_task(task_id, max_iterations=max_iterations)
+        else:
+            # Initialize orchestrator
+            orchestrator = Orchestrator(config=config)
+            orchestrator.initialize()
+
+            click.echo(f"Executing task #{task_id}...")
+
+            # Execute task (Phase 2: added interactive parameter)
+            result = orchestrator.execute_task(
+                task_id,
+                max_iterations=max_iterations,
+                stream=stream,
+                interactive=interactive
+            )
 
         # Display results
         click.echo("\n" + "=" * 80)
@@ -518,7 +559,8 @@ def task_execute(ctx, task_id: int, max_iterations: int, stream: bool, interacti
             prod_logger.log_execution_result(session_id, log_result, duration_ms)
 
         # Cleanup
-        orchestrator.shutdown()
+        if orchestrator:
+            orchestrator.shutdown()
 
     except OrchestratorException as e:
         # Log error (Issue #3 - v1.8.1)
@@ -623,29 +665,39 @@ def epic_create(ctx, title: str, project: int, description: str, priority: int):
 
 @epic.command('execute')
 @click.argument('epic_id', type=int)
+@click.option('--no-daemon', is_flag=True, help='Run in this process even if `obra serve` is running')
 @click.pass_context
-def epic_execute(ctx, epic_id: int):
-    """Execute all stories in an epic."""
+def epic_execute(ctx, epic_id: int, no_daemon: bool):
+    """Execute all stories in an epic.
+
+    Runs in the `obra serve` daemon when one is running, unless --no-daemon.
+    """
     try:
         config = ctx.obj['config']
-        orchestrator = Orchestrator(config=config)
-        orchestrator.initialize()
+        daemon = None if no_daemon else _connect_daemon(config)
 
-        # Get epic to find project_id
-        db_url = config.get('database.url', 'sqlite:///orchestrator.db')
-        state_manager = StateManager.get_instance(db_url)
-        epic = state_manager.get_task(epic_id)
+        if daemon:
+            click.echo(f"Executing epic #{epic_id} (daemon)...")
+            result = daemon.execute_epic(epic_id)
+        else:
+            orchestrator = Orchestrator(config=config)
+            orchestrator.initialize()
 
-        if not epic:
-            click.echo(f"✗ Epic {epic_id} not found", err=True)
-            sys.exit(1)
+            # Get epic to find project_id
+            db_url = config.get('database.url', 'sqlite:///orchestrator.db')
+            state_manager = StateManager.get_instance(db_url)
+            epic = state_manager.get_task(epic_id)
 
-        click.echo(f"Executing epic #{epic_id}: {epic.title}")
+            if not epic:
+                click.echo(f"✗ Epic {epic_id} not found", err=True)
+                sys.exit(1)
 
-        result = orchestrator.execute_epic(
-            project_id=epic.project_id,
-            epic_id=epic_id
-        )
+            click.echo(f"Executing epic #{epic_id}: {epic.title}")
+
+            result = orchestrator.execute_epic(
+                project_id=epic.project_id,
+                epic_id=epic_id
+            )
 
         click.echo(f"✓ Epic execution complete:")
         click.echo(f"  Stories completed: {result['stories_completed']}/{result['total_stories']}")
@@ -1441,6 +1493,95 @@ def interactive(ctx):
         sys.exit(1)
 
 
+# ============================================================================
+# Daemon Commands
+# ============================================================================
+
+@cli.command()
+@click.option('--socket', 'socket_path', type=click.Path(), help='Socket path (default: daemon.socket_path)')
+@click.pass_context
+def serve(ctx, socket_path: Optional[str]):
+    """Keep an initialized orchestrator running for other commands.
+
+    While it runs, `task execute` and `epic execute` are sent to it instead
+    of initializing their own orchestrator (config, database, LLM warmup).
+    """
+    import signal
+
+    from src.daemon import OrchestratorDaemon
+    from src.monitoring.profiler import install_profile_signal
+
+    try:
+        config = ctx.obj['config']
+        daemon = OrchestratorDaemon(config, socket_path=Path(socket_path) if socket_path else None)
+
+        click.echo("Initializing orchestrator...")
+        daemon.start()
+        signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+        install_profile_signal(config)
+
+        click.echo(f"✓ Orchestrator daemon listening on {daemon.socket_path} (pid {os.getpid()})")
+        click.echo("Press Ctrl+C to stop")
+
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            click.echo("\nStopping orchestrator daemon...")
+        finally:
+            daemon.close()
+        click.echo("✓ Orchestrator daemon stopped")
+
+    except OrchestratorException as e:
+        click.echo(f"✗ {e}", err=True)
+        if e.recovery_suggestion:
+            click.echo(f"  Recovery: {e.recovery_suggestion}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"✗ Failed to start orchestrator daemon: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.group()
+def daemon():
+    """Inspect or stop the `obra serve` daemon."""
+    pass
+
+
+@daemon.command('status')
+@click.pass_context
+def daemon_status(ctx):
+    """Show whether the daemon is running and what it is doing."""
+    client = DaemonClient.from_config(ctx.obj['config'])
+    try:
+        status = client.status()
+    except OrchestratorException:
+        click.echo(f"Orchestrator daemon not running ({client.socket_path})")
+        sys.exit(1)
+
+    orchestrator_status = status.get('orchestrator', {})
+    click.echo("\nOrchestrator Daemon")
+    click.echo("=" * 80)
+    click.echo(f"Socket: {client.socket_path}")
+    click.echo(f"PID: {status['pid']}")
+    click.echo(f"Uptime: {status['uptime_seconds']:.0f}s")
+    click.echo(f"Commands served: {status['commands_served']}")
+    click.echo(f"Busy with: {status['busy'] or '-'}")
+    click.echo(f"Orchestrator state: {orchestrator_status.get('state', 'unknown')}")
+
+
+@daemon.command('stop')
+@click.pass_context
+def daemon_stop(ctx):
+    """Stop the daemon once its current command finishes."""
+    client = DaemonClient.from_config(ctx.obj['config'])
+    try:
+        result = client.shutdown()
+    except OrchestratorException:
+        click.echo(f"Orchestrator daemon not running ({client.socket_path})")
+        return
+    click.echo(f"✓ Stopping orchestrator daemon (pid {result['pid']})")
+
+
 # ============================================================================
 # Configuration Commands
 # ============================================================================
@@ -1527,6 +1668,7 @@ def llm_status(ctx):
 
         # Try to check if LLM is available
         try:
+            import src.llm  # noqa: F401 - registers LLM plugins (lazily)
             from src.plugins.registry import LLMRegistry
 
             llm_class = LLMRegistry.get(llm_type)
@@ -1569,6 +1711,7 @@ def llm_status(ctx):
 def llm_list(ctx):
     """List available LLM providers."""
     try:
+        import src.llm  # noqa: F401 - registers LLM plugins (lazily)
         from src.plugins.registry import LLMRegistry
 
         available_llms = LLMRegistry.list()
@@ -2017,8 +2160,10 @@ def health(ctx):
 
 @cli.command()
 @click.option('--window', default='1h', help='Time window (e.g., 1h, 30m, 5m)')
+@click.option('--format', 'output_format', type=click.Choice(['text', 'prometheus']),
+              default='text', help='Output format (prometheus: text exposition format)')
 @click.pass_context
-def metrics(ctx, window: str):
+def metrics(ctx, window: str, output_format: str):
     """Display detailed system metrics.
 
     Shows:
@@ -2030,10 +2175,15 @@ def metrics(ctx, window: str):
         $ obra metrics
         $ obra metrics --window=30m
         $ obra metrics --window=2h
+        $ obra metrics --format=prometheus
     """
     try:
         from src.core.metrics import get_metrics_collector
 
+        if output_format == 'prometheus':
+            click.echo(get_metrics_collector().to_prometheus(), nl=False)
+            return
+
         click.echo()
         click.secho(f"OBRA SYSTEM METRICS (last {window})", bold=True)
         click.echo("="*70 + "\n")
@@ -2194,5 +2344,91 @@ def logs(ctx, event: Optional[str], level: Optional[str], correlation_id: Option
         sys.exit(1)
 
 
+@cli.group()
+def trace():
+    """Inspect per-task latency traces (monitoring.tracing)."""
+    pass
+
+
+@trace.command('show')
+@click.argument('task_id', type=int)
+@click.option('--run', 'run_index', type=int, default=0,
+              help='Run to show (1 = oldest, default: latest)')
+@click.option('--folded', is_flag=True, help='Print folded stacks for flamegraph tools')
+@click.option('--path', 'trace_path', type=click.Path(), help='Trace directory (default: from config)')
+@click.pass_context
+def trace_show(ctx, task_id: int, run_index: int, folded: bool, trace_path: Optional[str]):
+    """Show where a task's iterations spent their time.
+
+    Examples:
+        $ obra trace show 42
+        $ obra trace show 42 --run 1
+        $ obra trace show 42 --folded | flamegraph.pl > task42.svg
+    """
+    from src.monitoring.tracing import (
+        DEFAULT_TRACE_PATH, folded_stacks, load_task_traces, stage_breakdown
+    )
+
+    directory = trace_path or ctx.obj['config'].get('monitoring.tracing.path', DEFAULT_TRACE_PATH)
+    try:
+        runs = load_task_traces(directory, task_id)
+    except FileNotFoundError:
+        click.echo(f"No trace recorded for task {task_id} in {directory}")
+        click.echo("Enable tracing with monitoring.tracing.enabled: true")
+        sys.exit(1)
+
+    if not runs or not 0 <= run_index <= len(runs):
+        click.echo(f"✗ Run {run_index} not found (task {task_id} has {len(runs)} runs)", err=True)
+        sys.exit(1)
+    spans = runs[run_index - 1] if run_index else runs[-1]
+
+    if folded:
+        for line in folded_stacks(spans):
+            click.echo(line)
+        return
+
+    root = next((s for s in spans if not s.get('parentSpanId')), spans[0])
+    root_ms = root.get('durationMs') or 0.0
+    root_attrs = root.get('attributes', {})
+    click.echo(
+        f"\nTrace: task {task_id} (run {run_index or len(runs)} of {len(runs)}, "
+        f"trace {root['traceId'][:8]}...)"
+    )
+    click.echo(
+        f"Status: {root_attrs.get('status', root['status']['code'])}, "
+        f"{root_attrs.get('iterations', '?')} iterations, {root_ms / 1000:.2f}s"
+    )
+    click.echo("=" * 80)
+
+    children = {}
+    for span in spans:
+        children.setdefault(span.get('parentSpanId'), []).append(span)
+
+    def show_span(span, depth):
+        attrs = span.get('attributes', {})
+        label = span['name']
+        if 'iteration' in attrs:
+            label += f" [{attrs['iteration']}]"
+        details = [f"{key}={attrs[key]}" for key in ('action', 'for_iteration') if key in attrs]
+        if span['status']['code'] == 'ERROR':
+            details.append('ERROR')
+        line = f"{'  ' * depth}{label} {' '.join(details)}".rstrip()
+        click.echo(f"{line:<60} {span.get('durationMs') or 0.0:>12.1f} ms")
+        for child in sorted(children.get(span['spanId'], []), key=lambda s: s['startTimeUnixNano']):
+            show_span(child, depth + 1)
+
+    show_span(root, 0)
+
+    click.echo("\nStage breakdown (self time):")
+    click.echo(f"  {'Stage':<30} {'Count':>6} {'Total ms':>12} {'Self ms':>12} {'% task':>8}")
+    for stage in stage_breakdown(spans):
+        share = (stage['self_ms'] / root_ms * 100) if root_ms else 0.0
+        click.echo(
+            f"  {stage['name']:<30} {stage['count']:>6} {stage['total_ms']:>12.1f} "
+            f"{stage['self_ms']:>12.1f} {share:>7.1f}%"
+        )
+    click.echo()
+
+
 if __name__ == '__main__':
     cli()
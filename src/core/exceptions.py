@@ -540,6 +540,22 @@ class TaskStoppedException(OrchestrationException):
     pass
 
 
+class DaemonException(OrchestrationException):
+    """Raised when the orchestrator daemon is unreachable or a request fails.
+
+    Errors raised inside the daemon are re-raised in the client as
+    DaemonException, with the remote exception type in the context.
+
+    Example:
+        >>> raise DaemonException(
+        ...     'Orchestrator daemon not running',
+        ...     context={'socket_path': '~/obra-runtime/obra.sock'},
+        ...     recovery='Start it with: obra serve'
+        ... )
+    """
+    pass
+
+
 # Monitoring Exceptions
 
 class MonitoringException(OrchestratorException):
@@ -7,6 +7,14 @@ Metrics:
 - agent_executions: Count, success rate, avg duration, files modified
 - nl_commands: Count, success rate, avg latency, by operation type
 
+Storage:
+- Each recording thread writes to its own shard, so writers never contend
+  with each other
+- Shards pre-aggregate samples into per-second buckets (count, successes,
+  sums, per-label counters and a latency sketch)
+- Reads merge at most ``window_seconds`` buckets per shard, independent of
+  the request rate, and are cached until the next write or second boundary
+
 Health Check:
 - Status: healthy | degraded | unhealthy
 - LLM availability and success rate
@@ -25,12 +33,15 @@ Usage:
 
     health = metrics.get_health_status()
     print(health['status'])  # 'healthy'
+
+    print(metrics.to_prometheus())  # Prometheus text exposition
 """
 
+import math
 import time
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from datetime import datetime
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 import threading
@@ -52,6 +63,15 @@ ALERTING_THRESHOLDS = {
     }
 }
 
+# Relative accuracy of latency percentiles (0.01 = within 1% of true value)
+SKETCH_RELATIVE_ACCURACY = 0.01
+
+# Metric families tracked by MetricsCollector
+METRIC_FAMILIES = ('llm', 'agent', 'nl')
+
+# Quantiles exported by percentile summaries
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
 
 class HealthStatus(Enum):
     """System health status."""
@@ -70,51 +90,277 @@ class Trend:
     message: str
 
 
-class MetricsCollector:
-    """Collects and aggregates system metrics."""
+class LatencySketch:
+    """Mergeable quantile sketch with bounded relative error.
 
-    def __init__(self, window_minutes: int = 5):
-        """Initialize metrics collector.
+    Values are counted in logarithmically sized buckets (DDSketch style), so
+    a quantile estimate is within ``relative_accuracy`` of the true value and
+    memory grows with the value range rather than the number of samples.
+    Sketches from different seconds or threads combine with ``merge()``.
+
+    Example:
+        >>> sketch = LatencySketch()
+        >>> for latency in (100, 200, 300):
+        ...     sketch.add(latency)
+        >>> round(sketch.quantile(0.5))
+        200
+    """
+
+    __slots__ = ('relative_accuracy', '_log_gamma', '_midpoint', 'buckets',
+                 'zero_count', 'count', 'total', 'min', 'max')
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        """Initialize an empty sketch.
 
         Args:
-            window_minutes: Rolling window for metrics (default: 5 minutes)
+            relative_accuracy: Maximum relative error of quantile estimates
         """
-        self.window_minutes = window_minutes
-        self.window_seconds = window_minutes * 60
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log(gamma)
+        self._midpoint = 2 / (gamma + 1)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single value to the sketch.
+
+        Args:
+            value: Observed value (values <= 0 are counted as zero)
+        """
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: 'LatencySketch') -> None:
+        """Fold another sketch with the same accuracy into this one.
+
+        Args:
+            other: Sketch to merge
+        """
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q``.
+
+        Uses the same nearest-rank convention as indexing a sorted list at
+        ``int(count * q)``. Estimates are clamped to the observed min/max.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or 0.0 for an empty sketch
+        """
+        if not self.count:
+            return 0.0
 
-        # Thread-safe locks
-        self.lock = threading.RLock()
+        rank = min(int(self.count * q), self.count - 1)
+        if rank < self.zero_count:
+            return min(max(0.0, self.min), self.max)
 
-        # LLM metrics
-        self.llm_requests = deque()  # (timestamp, provider, latency_ms, success)
+        cumulative = self.zero_count
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if cumulative > rank:
+                estimate = math.exp(index * self._log_gamma) * self._midpoint
+                return min(max(estimate, self.min), self.max)
 
-        # Agent metrics
-        self.agent_executions = deque()  # (timestamp, agent_type, duration_s, success, file_count)
+        return self.max
 
-        # NL command metrics
-        self.nl_commands = deque()  # (timestamp, operation, latency_ms, success)
 
-        # Aggregated counters (since startup)
-        self.total_llm_requests = 0
-        self.total_agent_executions = 0
-        self.total_nl_commands = 0
+class _Aggregate:
+    """Pre-aggregated samples for one metric family.
+
+    Used both for a single second in a shard and for a merged window.
+    """
+
+    __slots__ = ('second', 'count', 'success', 'value_sum', 'extra_sum',
+                 'by_label', 'sketch')
+
+    def __init__(self, second: int = 0):
+        self.second = second
+        self.count = 0
+        self.success = 0
+        self.value_sum = 0.0
+        self.extra_sum = 0
+        self.by_label: Dict[str, List[int]] = {}  # label -> [count, success]
+        self.sketch = LatencySketch()
+
+    def add(self, label: str, value: float, success: bool, extra: int) -> None:
+        """Add one sample."""
+        self.count += 1
+        self.value_sum += value
+        self.extra_sum += extra
+        counts = self.by_label.get(label)
+        if counts is None:
+            counts = self.by_label[label] = [0, 0]
+        counts[0] += 1
+        if success:
+            self.success += 1
+            counts[1] += 1
+        self.sketch.add(value)
+
+    def merge(self, other: '_Aggregate') -> None:
+        """Fold another aggregate into this one."""
+        self.count += other.count
+        self.success += other.success
+        self.value_sum += other.value_sum
+        self.extra_sum += other.extra_sum
+        for label, (count, success) in other.by_label.items():
+            counts = self.by_label.get(label)
+            if counts is None:
+                counts = self.by_label[label] = [0, 0]
+            counts[0] += count
+            counts[1] += success
+        self.sketch.merge(other.sketch)
+
+
+class _Series:
+    """Per-second buckets and since-startup totals for one family in one shard."""
+
+    __slots__ = ('buckets', 'totals')
+
+    def __init__(self):
+        self.buckets: deque = deque()
+        self.totals: Dict[Tuple[str, bool], int] = {}  # (label, success) -> count
+
+    def record(
+        self,
+        second: int,
+        horizon: int,
+        label: str,
+        value: float,
+        success: bool,
+        extra: int
+    ) -> None:
+        """Add a sample to the bucket for ``second``."""
+        buckets = self.buckets
+        if not buckets or buckets[-1].second < second:
+            buckets.append(_Aggregate(second))
+            self.trim(second - horizon)
+        # A clock step backwards lands in the newest bucket
+        buckets[-1].add(label, value, success, extra)
+        key = (label, success)
+        self.totals[key] = self.totals.get(key, 0) + 1
+
+    def trim(self, oldest_expired: int) -> None:
+        """Drop buckets at or before ``oldest_expired``."""
+        buckets = self.buckets
+        while buckets and buckets[0].second <= oldest_expired:
+            buckets.popleft()
+
+
+class _Shard:
+    """Recording state owned by a single thread.
+
+    Only the owning thread writes; readers take the shard lock briefly while
+    merging, so writers on different threads never wait on each other.
+    """
+
+    __slots__ = ('thread', 'lock', 'series', 'writes')
+
+    def __init__(self, thread: threading.Thread):
+        self.thread = thread
+        self.lock = threading.Lock()
+        self.series: Dict[str, _Series] = {
+            family: _Series() for family in METRIC_FAMILIES
+        }
+        self.writes = 0
 
-    def _cleanup_old_metrics(self):
-        """Remove metrics outside rolling window."""
-        cutoff_time = time.time() - self.window_seconds
 
-        with self.lock:
-            # Cleanup LLM requests
-            while self.llm_requests and self.llm_requests[0][0] < cutoff_time:
-                self.llm_requests.popleft()
+class MetricsCollector:
+    """Collects and aggregates system metrics.
+
+    Samples are pre-aggregated into per-second buckets held in per-thread
+    shards; see the module docstring for the storage layout. Read methods
+    return the same dictionaries as before, but percentiles come from a
+    ``LatencySketch`` and are accurate to ``SKETCH_RELATIVE_ACCURACY``.
+
+    Example:
+        >>> collector = MetricsCollector(window_minutes=5)
+        >>> collector.record_llm_request('ollama', latency_ms=250, success=True)
+        >>> collector.get_llm_metrics()['count']
+        1
+    """
 
-            # Cleanup agent executions
-            while self.agent_executions and self.agent_executions[0][0] < cutoff_time:
-                self.agent_executions.popleft()
+    def __init__(
+        self,
+        window_minutes: int = 5,
+        clock: Callable[[], float] = time.time
+    ):
+        """Initialize metrics collector.
 
-            # Cleanup NL commands
-            while self.nl_commands and self.nl_commands[0][0] < cutoff_time:
-                self.nl_commands.popleft()
+        Args:
+            window_minutes: Rolling window for metrics (default: 5 minutes)
+            clock: Time source returning epoch seconds (injectable for tests)
+        """
+        self.window_minutes = window_minutes
+        self.window_seconds = window_minutes * 60
+        self._clock = clock
+
+        self._registry_lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded metrics and since-startup totals."""
+        with self._registry_lock:
+            self._local = threading.local()
+            self._shards: List[_Shard] = []
+            # Totals folded in from shards of threads that have exited
+            self._retired_totals: Dict[str, Dict[Tuple[str, bool], int]] = {
+                family: {} for family in METRIC_FAMILIES
+            }
+            self._window_cache: Dict[str, Tuple[Any, _Aggregate]] = {}
+
+    # ========================================================================
+    # Recording
+    # ========================================================================
+
+    def _shard(self) -> _Shard:
+        """Get (or register) the calling thread's shard."""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._registry_lock:
+                self._local.shard = shard
+                self._shards.append(shard)
+        return shard
+
+    def _record(
+        self,
+        family: str,
+        label: str,
+        value: float,
+        success: bool,
+        extra: int = 0
+    ) -> None:
+        """Record one sample into the calling thread's shard."""
+        shard = self._shard()
+        second = int(self._clock())
+        with shard.lock:
+            shard.series[family].record(
+                second, self.window_seconds, label, value, bool(success), extra
+            )
+            shard.writes += 1
 
     def record_llm_request(
         self,
@@ -129,15 +375,9 @@ class MetricsCollector:
             provider: LLM provider (ollama, openai-codex)
             latency_ms: Request latency in milliseconds
             success: Whether request succeeded
-            model: Model name (optional)
+            model: Model name (optional, not aggregated)
         """
-        with self.lock:
-            timestamp = time.time()
-            self.llm_requests.append((timestamp, provider, latency_ms, success, model))
-            self.total_llm_requests += 1
-
-        # Cleanup old metrics
-        self._cleanup_old_metrics()
+        self._record('llm', provider, latency_ms, success)
 
     def record_agent_execution(
         self,
@@ -154,14 +394,7 @@ class MetricsCollector:
             success: Whether execution succeeded
             files_modified: Number of files modified
         """
-        with self.lock:
-            timestamp = time.time()
-            self.agent_executions.append(
-                (timestamp, agent_type, duration_s, success, files_modified)
-            )
-            self.total_agent_executions += 1
-
-        self._cleanup_old_metrics()
+        self._record('agent', agent_type, duration_s, success, files_modified)
 
     def record_nl_command(
         self,
@@ -176,12 +409,106 @@ class MetricsCollector:
             latency_ms: Processing latency in milliseconds
             success: Whether command succeeded
         """
-        with self.lock:
-            timestamp = time.time()
-            self.nl_commands.append((timestamp, operation, latency_ms, success))
-            self.total_nl_commands += 1
+        self._record('nl', operation, latency_ms, success)
+
+    # ========================================================================
+    # Aggregation
+    # ========================================================================
+
+    def _live_shards(self) -> List[_Shard]:
+        """Return registered shards, retiring empty shards of exited threads."""
+        with self._registry_lock:
+            shards = list(self._shards)
+
+        cutoff = int(self._clock()) - self.window_seconds
+        retired = []
+        for shard in shards:
+            if shard.thread.is_alive():
+                continue
+            with shard.lock:
+                for series in shard.series.values():
+                    series.trim(cutoff)
+                if not any(series.buckets for series in shard.series.values()):
+                    retired.append(shard)
+
+        if retired:
+            with self._registry_lock:
+                for shard in retired:
+                    if shard not in self._shards:
+                        continue
+                    self._shards.remove(shard)
+                    for family, series in shard.series.items():
+                        totals = self._retired_totals[family]
+                        for key, count in series.totals.items():
+                            totals[key] = totals.get(key, 0) + count
+            shards = [shard for shard in shards if shard not in retired]
+
+        return shards
+
+    def _window(self, family: str) -> _Aggregate:
+        """Merge the rolling window for ``family`` across all shards.
+
+        Cost is bounded by shards x window seconds, not by sample count.
+        The merged result is reused until a shard records or the second
+        changes.
+        """
+        now = int(self._clock())
+        shards = self._live_shards()
+        key = (now, tuple((id(shard), shard.writes) for shard in shards))
+
+        cached = self._window_cache.get(family)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        cutoff = now - self.window_seconds
+        window = _Aggregate(now)
+        for shard in shards:
+            with shard.lock:
+                series = shard.series[family]
+                series.trim(cutoff)
+                for bucket in series.buckets:
+                    window.merge(bucket)
+
+        self._window_cache[family] = (key, window)
+        return window
+
+    def _totals(self, family: str) -> Dict[Tuple[str, bool], int]:
+        """Since-startup counts for ``family`` keyed by (label, success)."""
+        with self._registry_lock:
+            totals = dict(self._retired_totals[family])
+            shards = list(self._shards)
+        for shard in shards:
+            with shard.lock:
+                for key, count in shard.series[family].totals.items():
+                    totals[key] = totals.get(key, 0) + count
+        return totals
+
+    @property
+    def total_llm_requests(self) -> int:
+        """LLM requests recorded since startup."""
+        return sum(self._totals('llm').values())
+
+    @property
+    def total_agent_executions(self) -> int:
+        """Agent executions recorded since startup."""
+        return sum(self._totals('agent').values())
+
+    @property
+    def total_nl_commands(self) -> int:
+        """NL commands recorded since startup."""
+        return sum(self._totals('nl').values())
+
+    @staticmethod
+    def _by_label(window: _Aggregate) -> Dict[str, Dict[str, Any]]:
+        """Per-label count and success rate."""
+        return {
+            label: {'count': count, 'success_rate': success / count}
+            for label, (count, success) in window.by_label.items()
+        }
 
-        self._cleanup_old_metrics()
+    # ========================================================================
+    # Read API
+    # ========================================================================
 
     def get_llm_metrics(self) -> Dict[str, Any]:
         """Get LLM metrics for rolling window.
@@ -196,59 +523,29 @@ class MetricsCollector:
             - avg_latency: Average latency (ms)
             - by_provider: Metrics grouped by provider
         """
-        self._cleanup_old_metrics()
-
-        with self.lock:
-            if not self.llm_requests:
-                return {
-                    'count': 0,
-                    'success_rate': 0.0,
-                    'latency_p50': 0.0,
-                    'latency_p95': 0.0,
-                    'latency_p99': 0.0,
-                    'avg_latency': 0.0,
-                    'by_provider': {}
-                }
-
-            # Extract data
-            successes = sum(1 for _, _, _, success, _ in self.llm_requests if success)
-            latencies = [latency for _, _, latency, _, _ in self.llm_requests]
-
-            # Calculate metrics
-            count = len(self.llm_requests)
-            success_rate = successes / count if count > 0 else 0.0
-
-            sorted_latencies = sorted(latencies)
-            latency_p50 = sorted_latencies[int(len(sorted_latencies) * 0.50)]
-            latency_p95 = sorted_latencies[int(len(sorted_latencies) * 0.95)]
-            latency_p99 = sorted_latencies[int(len(sorted_latencies) * 0.99)]
-            avg_latency = sum(latencies) / len(latencies)
-
-            # Group by provider
-            by_provider = defaultdict(lambda: {'count': 0, 'success': 0})
-            for _, provider, _, success, _ in self.llm_requests:
-                by_provider[provider]['count'] += 1
-                if success:
-                    by_provider[provider]['success'] += 1
-
-            # Calculate provider success rates
-            provider_metrics = {}
-            for provider, data in by_provider.items():
-                provider_metrics[provider] = {
-                    'count': data['count'],
-                    'success_rate': data['success'] / data['count']
-                }
+        window = self._window('llm')
 
+        if not window.count:
             return {
-                'count': count,
-                'success_rate': success_rate,
-                'latency_p50': latency_p50,
-                'latency_p95': latency_p95,
-                'latency_p99': latency_p99,
-                'avg_latency': avg_latency,
-                'by_provider': provider_metrics
+                'count': 0,
+                'success_rate': 0.0,
+                'latency_p50': 0.0,
+                'latency_p95': 0.0,
+                'latency_p99': 0.0,
+                'avg_latency': 0.0,
+                'by_provider': {}
             }
 
+        return {
+            'count': window.count,
+            'success_rate': window.success / window.count,
+            'latency_p50': window.sketch.quantile(0.50),
+            'latency_p95': window.sketch.quantile(0.95),
+            'latency_p99': window.sketch.quantile(0.99),
+            'avg_latency': window.value_sum / window.count,
+            'by_provider': self._by_label(window)
+        }
+
     def get_agent_metrics(self) -> Dict[str, Any]:
         """Get agent execution metrics for rolling window.
 
@@ -259,33 +556,23 @@ class MetricsCollector:
             - avg_duration: Average duration (seconds)
             - total_files_modified: Total files modified
         """
-        self._cleanup_old_metrics()
-
-        with self.lock:
-            if not self.agent_executions:
-                return {
-                    'count': 0,
-                    'success_rate': 0.0,
-                    'avg_duration': 0.0,
-                    'total_files_modified': 0
-                }
-
-            # Extract data
-            successes = sum(1 for _, _, _, success, _ in self.agent_executions if success)
-            durations = [duration for _, _, duration, _, _ in self.agent_executions]
-            files_modified = sum(files for _, _, _, _, files in self.agent_executions)
-
-            count = len(self.agent_executions)
-            success_rate = successes / count if count > 0 else 0.0
-            avg_duration = sum(durations) / len(durations) if durations else 0.0
+        window = self._window('agent')
 
+        if not window.count:
             return {
-                'count': count,
-                'success_rate': success_rate,
-                'avg_duration': avg_duration,
-                'total_files_modified': files_modified
+                'count': 0,
+                'success_rate': 0.0,
+                'avg_duration': 0.0,
+                'total_files_modified': 0
             }
 
+        return {
+            'count': window.count,
+            'success_rate': window.success / window.count,
+            'avg_duration': window.value_sum / window.count,
+            'total_files_modified': window.extra_sum
+        }
+
     def get_nl_command_metrics(self) -> Dict[str, Any]:
         """Get NL command metrics for rolling window.
 
@@ -296,47 +583,23 @@ class MetricsCollector:
             - avg_latency: Average latency (ms)
             - by_operation: Metrics grouped by operation type
         """
-        self._cleanup_old_metrics()
-
-        with self.lock:
-            if not self.nl_commands:
-                return {
-                    'count': 0,
-                    'success_rate': 0.0,
-                    'avg_latency': 0.0,
-                    'by_operation': {}
-                }
-
-            # Extract data
-            successes = sum(1 for _, _, _, success in self.nl_commands if success)
-            latencies = [latency for _, _, latency, _ in self.nl_commands]
-
-            count = len(self.nl_commands)
-            success_rate = successes / count if count > 0 else 0.0
-            avg_latency = sum(latencies) / len(latencies) if latencies else 0.0
-
-            # Group by operation
-            by_operation = defaultdict(lambda: {'count': 0, 'success': 0})
-            for _, operation, _, success in self.nl_commands:
-                by_operation[operation]['count'] += 1
-                if success:
-                    by_operation[operation]['success'] += 1
-
-            # Calculate operation success rates
-            operation_metrics = {}
-            for operation, data in by_operation.items():
-                operation_metrics[operation] = {
-                    'count': data['count'],
-                    'success_rate': data['success'] / data['count']
-                }
+        window = self._window('nl')
 
+        if not window.count:
             return {
-                'count': count,
-                'success_rate': success_rate,
-                'avg_latency': avg_latency,
-                'by_operation': operation_metrics
+                'count': 0,
+                'success_rate': 0.0,
+                'avg_latency': 0.0,
+                'by_operation': {}
             }
 
+        return {
+            'count': window.count,
+            'success_rate': window.success / window.count,
+            'avg_latency': window.value_sum / window.count,
+            'by_operation': self._by_label(window)
+        }
+
     def detect_trends(self, metric: str = 'llm_latency_p95', window: str = '15m') -> List[Trend]:
         """Detect trends in metrics over time.
 
@@ -508,6 +771,87 @@ class MetricsCollector:
             'window_minutes': self.window_minutes
         }
 
+    def to_prometheus(self, namespace: str = 'obra') -> str:
+        """Render metrics in the Prometheus text exposition format.
+
+        Counters are since-startup totals; summaries and gauges describe the
+        rolling window, using the same data as the ``get_*_metrics`` methods.
+
+        Args:
+            namespace: Prefix for metric names
+
+        Returns:
+            Exposition text (version 0.0.4), newline-terminated
+        """
+        lines: List[str] = []
+
+        def family(name: str, metric_type: str, help_text: str) -> str:
+            full_name = f"{namespace}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            return full_name
+
+        def counter(name: str, label_name: str, source: str, help_text: str) -> None:
+            full_name = family(name, 'counter', help_text)
+            for (label, success), count in sorted(self._totals(source).items()):
+                outcome = 'success' if success else 'failure'
+                lines.append(
+                    f'{full_name}{{{label_name}="{_escape_label(label)}",'
+                    f'outcome="{outcome}"}} {count}'
+                )
+
+        def summary(name: str, window: _Aggregate, help_text: str) -> None:
+            full_name = family(name, 'summary', help_text)
+            for q in SUMMARY_QUANTILES:
+                value = window.sketch.quantile(q) if window.count else float('nan')
+                lines.append(f'{full_name}{{quantile="{q}"}} {_format_value(value)}')
+            lines.append(f"{full_name}_sum {_format_value(window.value_sum)}")
+            lines.append(f"{full_name}_count {window.count}")
+
+        counter('llm_requests_total', 'provider', 'llm',
+                'LLM requests since startup.')
+        summary('llm_latency_ms', self._window('llm'),
+                'LLM request latency over the rolling window.')
+
+        counter('agent_executions_total', 'agent_type', 'agent',
+                'Agent executions since startup.')
+        agent_window = self._window('agent')
+        summary('agent_duration_seconds', agent_window,
+                'Agent execution duration over the rolling window.')
+        name = family('agent_files_modified', 'gauge',
+                      'Files modified by agents over the rolling window.')
+        lines.append(f"{name} {agent_window.extra_sum}")
+
+        counter('nl_commands_total', 'operation', 'nl',
+                'NL commands since startup.')
+        summary('nl_latency_ms', self._window('nl'),
+                'NL command latency over the rolling window.')
+
+        status = self.get_health_status()['status']
+        name = family('health_status', 'gauge',
+                      'Current health status (1 for the active status).')
+        for candidate in HealthStatus:
+            active = 1 if candidate.value == status else 0
+            lines.append(f'{name}{{status="{candidate.value}"}} {active}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for Prometheus exposition."""
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
 
 # Global metrics collector instance
 _metrics_collector: Optional[MetricsCollector] = None
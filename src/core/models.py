@@ -191,9 +191,6 @@ class Task(Base):
     epic_id = Column(Integer, ForeignKey('task.id'), nullable=True, index=True)
     story_id = Column(Integer, ForeignKey('task.id'), nullable=True, index=True)
 
-    # Task dependencies (stored as JSON list of task IDs)
-    dependencies = Column(JSON, default=list)
-
     # Task context and results
     context = Column(JSON, default=dict)
     result = Column(JSON, default=dict)
@@ -235,10 +232,36 @@ class Task(Base):
     interactions = relationship('Interaction', back_populates='task', cascade='all, delete-orphan')
     breakpoint_events = relationship('BreakpointEvent', back_populates='task', cascade='all, delete-orphan')
     file_states = relationship('FileState', back_populates='task')
+    # Dependency edges (M9), loaded with one IN query per batch of tasks
+    dependency_edges = relationship(
+        'TaskDependency',
+        foreign_keys='TaskDependency.task_id',
+        order_by='TaskDependency.depends_on_id',
+        cascade='all, delete-orphan',
+        lazy='selectin'
+    )
 
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title[:30]}...', status='{self.status.value}')>"
 
+    @property
+    def dependencies(self) -> List[int]:
+        """IDs of tasks this task depends on, backed by ``task_dependency`` rows."""
+        return [edge.depends_on_id for edge in self.dependency_edges]
+
+    @dependencies.setter
+    def dependencies(self, task_ids: Optional[List[int]]) -> None:
+        """Replace dependency edges, keeping rows for IDs that remain."""
+        existing = {edge.depends_on_id: edge for edge in self.dependency_edges}
+        edges = []
+        for task_id in task_ids or []:
+            task_id = int(task_id)
+            if task_id in existing:
+                edges.append(existing.pop(task_id))
+            elif all(edge.depends_on_id != task_id for edge in edges):
+                edges.append(TaskDependency(depends_on_id=task_id))
+        self.dependency_edges = edges
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -281,10 +304,8 @@ class Task(Base):
         Example:
             >>> task.add_dependency(5)  # Task depends on task #5
         """
-        if self.dependencies is None:
-            self.dependencies = []
         if task_id not in self.dependencies:
-            self.dependencies.append(task_id)
+            self.dependency_edges.append(TaskDependency(depends_on_id=task_id))
 
     def remove_dependency(self, task_id: int) -> None:
         """Remove a task dependency (M9).
@@ -295,8 +316,10 @@ class Task(Base):
         Example:
             >>> task.remove_dependency(5)
         """
-        if self.dependencies and task_id in self.dependencies:
-            self.dependencies.remove(task_id)
+        for edge in self.dependency_edges:
+            if edge.depends_on_id == task_id:
+                self.dependency_edges.remove(edge)
+                break
 
     def get_dependencies(self) -> List[int]:
         """Get list of task IDs this task depends on (M9).
@@ -308,7 +331,7 @@ class Task(Base):
             >>> deps = task.get_dependencies()
             >>> print(f"Depends on tasks: {deps}")
         """
-        return self.dependencies if self.dependencies else []
+        return self.dependencies
 
     def has_dependencies(self) -> bool:
         """Check if task has any dependencies (M9).
@@ -320,7 +343,39 @@ class Task(Base):
             >>> if task.has_dependencies():
             ...     print("Task is waiting on dependencies")
         """
-        return bool(self.dependencies)
+        return bool(self.dependency_edges)
+
+
+class TaskDependency(Base):
+    """Dependency edge between two tasks (M9).
+
+    One row per "task_id depends on depends_on_id" edge. The primary key
+    serves forward lookups and ``idx_task_dependency_reverse`` serves
+    "who depends on this task", so readiness checks are joins rather than
+    JSON decoding in Python.
+
+    Attributes:
+        task_id: Dependent task
+        depends_on_id: Task that must complete first
+    """
+    __tablename__ = 'task_dependency'
+
+    task_id = Column(Integer, ForeignKey('task.id', ondelete='CASCADE'), primary_key=True)
+    depends_on_id = Column(Integer, ForeignKey('task.id', ondelete='CASCADE'), primary_key=True)
+
+    __table_args__ = (
+        Index('idx_task_dependency_reverse', 'depends_on_id', 'task_id'),
+    )
+
+    def __repr__(self):
+        return f"<TaskDependency(task_id={self.task_id}, depends_on_id={self.depends_on_id})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            'task_id': self.task_id,
+            'depends_on_id': self.depends_on_id
+        }
 
 
 class Milestone(Base):
@@ -1191,6 +1246,113 @@ class ParallelAgentAttempt(Base):
         }
 
 
+class QualityResultRecord(Base):
+    """Compact persisted record of a QualityController validation result.
+
+    One row per validation. Only the values needed for trends and reports are
+    stored (scores and gate outcome); full improvement lists are folded into
+    QualityIssueStat counters instead of being kept per row.
+
+    Attributes:
+        id: Primary key
+        project_id: Project validated (0 when validated without a task)
+        task_id: Task validated (optional)
+        timestamp: When validation was performed (UTC)
+        overall_score: Overall quality score (0.0-1.0)
+        passes_gate: Whether the quality gate passed
+        syntax_score: Syntax stage score (None if stage not run)
+        requirements_score: Requirements stage score (None if stage not run)
+        quality_score: Code quality stage score (None if stage not run)
+        testing_score: Testing stage score (None if stage not run)
+        structured_mode: Whether structured validation was used
+    """
+    __tablename__ = 'quality_result'
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, nullable=False)
+    task_id = Column(Integer, nullable=True)
+    timestamp = Column(DateTime, nullable=False)
+
+    overall_score = Column(Float, nullable=False)
+    passes_gate = Column(Boolean, nullable=False)
+
+    # Per-stage scores (unstructured validation stages)
+    syntax_score = Column(Float, nullable=True)
+    requirements_score = Column(Float, nullable=True)
+    quality_score = Column(Float, nullable=True)
+    testing_score = Column(Float, nullable=True)
+
+    structured_mode = Column(Boolean, default=False, nullable=False)
+
+    # Composite index for per-project time-range queries
+    __table_args__ = (
+        Index('idx_quality_result_project_time', 'project_id', 'timestamp'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<QualityResultRecord(project_id={self.project_id}, "
+            f"score={self.overall_score:.2f}, passes_gate={self.passes_gate})>"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            'id': self.id,
+            'project_id': self.project_id,
+            'task_id': self.task_id,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            'overall_score': self.overall_score,
+            'passes_gate': self.passes_gate,
+            'syntax_score': self.syntax_score,
+            'requirements_score': self.requirements_score,
+            'quality_score': self.quality_score,
+            'testing_score': self.testing_score,
+            'structured_mode': self.structured_mode
+        }
+
+
+class QualityIssueStat(Base):
+    """Running count of an improvement suggestion per project.
+
+    Incremented each time a validation result suggests the improvement, so
+    "most common issues" is an indexed top-N query instead of a scan over
+    every stored result.
+
+    Attributes:
+        id: Primary key
+        project_id: Project the issue was reported for
+        issue: Improvement suggestion text
+        occurrences: Number of validations that reported it
+        last_seen: When it was last reported
+    """
+    __tablename__ = 'quality_issue_stat'
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, nullable=False)
+    issue = Column(String(500), nullable=False)
+    occurrences = Column(Integer, default=0, nullable=False)
+    last_seen = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_quality_issue_project_issue', 'project_id', 'issue', unique=True),
+        Index('idx_quality_issue_project_occurrences', 'project_id', 'occurrences'),
+    )
+
+    def __repr__(self):
+        return f"<QualityIssueStat(project_id={self.project_id}, occurrences={self.occurrences})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            'id': self.id,
+            'project_id': self.project_id,
+            'issue': self.issue,
+            'occurrences': self.occurrences,
+            'last_seen': self.last_seen.isoformat() if self.last_seen else None
+        }
+
+
 # Helper function to create all tables
 def create_tables(engine):
     """Create all database tables.
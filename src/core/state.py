@@ -11,14 +11,18 @@ Critical Design Principles:
 5. Auditable - every change is logged
 """
 
+import json
 import logging
 from contextlib import contextmanager
 from threading import RLock
 from typing import Optional, List, Dict, Any
 from datetime import datetime, UTC, timedelta
 
-from sqlalchemy import create_engine, desc, func, case
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import (
+    create_engine, desc, func, case, exists, and_, inspect, select, null,
+    table, column, Integer, JSON
+)
+from sqlalchemy.orm import sessionmaker, Session, aliased
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.models import (
@@ -26,7 +30,7 @@ from src.core.models import (
     BreakpointEvent, UsageTracking, FileState, PatternLearning,
     ParameterEffectiveness, PromptRuleViolation, ComplexityEstimate,
     ParallelAgentAttempt, SessionRecord, ContextWindowUsage, Milestone,
-    TaskStatus, TaskAssignee, InteractionSource, BreakpointSeverity,
+    QualityResultRecord, QualityIssueStat, TaskDependency, TaskStatus, TaskAssignee, InteractionSource, BreakpointSeverity,
     ProjectStatus, TaskType
 )
 from src.core.exceptions import (
@@ -37,6 +41,26 @@ from src.core.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def _decode_dependency_ids(value: Any) -> List[int]:
+    """Decode a legacy task.dependencies JSON value into unique task IDs."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    if not isinstance(value, list):
+        return []
+    ids: List[int] = []
+    for item in value:
+        try:
+            task_id = int(item)
+        except (TypeError, ValueError):
+            continue
+        if task_id not in ids:
+            ids.append(task_id)
+    return ids
+
+
 class StateManager:
     """Thread-safe singleton for all state management operations.
 
@@ -112,6 +136,7 @@ class StateManager:
 
         # Create tables
         Base.metadata.create_all(self._engine)
+        self._migrate_legacy_dependencies()
 
         logger.info(f"StateManager initialized with database: {database_url}")
 
@@ -169,6 +194,67 @@ class StateManager:
         self._config = config
         logger.debug("Config reference set in StateManager")
 
+    def _migrate_legacy_dependencies(self) -> None:
+        """Copy dependency edges from the legacy task.dependencies column.
+
+        Databases created before the task_dependency table and never
+        upgraded with Alembic still store dependencies as JSON, while
+        create_all() adds the edge table empty. Copy the edges over (skipping
+        existing edges and missing tasks) and clear the column, so existing
+        dependencies are kept and later startups find nothing to copy.
+
+        Raises:
+            DatabaseException: If the edges cannot be copied
+        """
+        columns = {col['name'] for col in inspect(self._engine).get_columns('task')}
+        if 'dependencies' not in columns:
+            return
+
+        legacy_task = table('task', column('id', Integer), column('dependencies', JSON))
+        edge_table = TaskDependency.__table__
+
+        try:
+            with self._engine.begin() as conn:
+                rows = conn.execute(
+                    select(legacy_task.c.id, legacy_task.c.dependencies)
+                    .where(legacy_task.c.dependencies.isnot(None))
+                ).all()
+                if not rows:
+                    return
+
+                task_ids = set(conn.execute(select(legacy_task.c.id)).scalars())
+                existing = {
+                    tuple(edge) for edge in conn.execute(
+                        select(edge_table.c.task_id, edge_table.c.depends_on_id)
+                    )
+                }
+                edges = []
+                for task_id, dependencies in rows:
+                    for depends_on_id in _decode_dependency_ids(dependencies):
+                        key = (task_id, depends_on_id)
+                        if depends_on_id in task_ids and key not in existing:
+                            existing.add(key)
+                            edges.append({'task_id': task_id, 'depends_on_id': depends_on_id})
+
+                if edges:
+                    conn.execute(edge_table.insert(), edges)
+                conn.execute(
+                    legacy_task.update()
+                    .where(legacy_task.c.dependencies.isnot(None))
+                    .values(dependencies=null())
+                )
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                operation='migrate_legacy_dependencies',
+                details=f"{e} (run 'alembic upgrade head' to migrate the database)"
+            ) from e
+
+        if edges:
+            logger.info(
+                f"Migrated {len(edges)} task dependency edges from legacy "
+                f"task.dependencies column"
+            )
+
     def _get_session(self) -> Session:
         """Get or create session for current thread.
 
@@ -498,6 +584,28 @@ class StateManager:
                 Task.is_deleted == False
             ).first()
 
+    def get_tasks_by_ids(self, task_ids: List[int]) -> Dict[int, Task]:
+        """Get several tasks by ID with one query.
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            Dictionary mapping task ID to Task (missing or deleted tasks omitted)
+
+        Example:
+            >>> tasks = state_manager.get_tasks_by_ids([1, 2, 3])
+        """
+        if not task_ids:
+            return {}
+        with self._lock:
+            session = self._get_session()
+            tasks = session.query(Task).filter(
+                Task.id.in_(set(task_ids)),
+                Task.is_deleted == False
+            ).all()
+            return {task.id: task for task in tasks}
+
     def update_task_status(
         self,
         task_id: int,
@@ -1040,17 +1148,12 @@ class StateManager:
             >>> print(f"Task 5 depends on {len(deps)} tasks")
         """
         with self._lock:
-            task = self.get_task(task_id)
-            if not task:
-                return []
-
-            dep_ids = task.get_dependencies()
-            if not dep_ids:
-                return []
-
-            # Fetch all dependency tasks
             session = self._get_session()
-            return session.query(Task).filter(Task.id.in_(dep_ids)).all()
+            return session.query(Task).join(
+                TaskDependency, TaskDependency.depends_on_id == Task.id
+            ).filter(
+                TaskDependency.task_id == task_id
+            ).order_by(Task.id).all()
 
     def get_dependent_tasks(
         self,
@@ -1069,23 +1172,94 @@ class StateManager:
             >>> print(f"{len(dependents)} tasks depend on task 3")
         """
         with self._lock:
-            task = self.get_task(task_id)
-            if not task:
-                return []
-
-            # Find all tasks in same project that have this task in their dependencies
+            # Reverse edge lookup (idx_task_dependency_reverse)
             session = self._get_session()
-            all_tasks = session.query(Task).filter(
-                Task.project_id == task.project_id,
+            return session.query(Task).join(
+                TaskDependency, TaskDependency.task_id == Task.id
+            ).filter(
+                TaskDependency.depends_on_id == task_id,
                 Task.is_deleted == False  # noqa: E712
-            ).all()
+            ).order_by(Task.id).all()
+
+    def get_dependency_statuses(
+        self,
+        task_id: int
+    ) -> Dict[int, Optional[TaskStatus]]:
+        """Get the status of each task a task depends on, in one query (M9).
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Dict mapping dependency task ID to its status, or None if the
+            dependency no longer exists (missing or soft-deleted)
+
+        Example:
+            >>> statuses = state_manager.get_dependency_statuses(5)
+            >>> all(s == TaskStatus.COMPLETED for s in statuses.values())
+            True
+        """
+        with self._lock:
+            session = self._get_session()
+            rows = session.query(
+                TaskDependency.depends_on_id, Task.status
+            ).outerjoin(
+                Task, and_(
+                    Task.id == TaskDependency.depends_on_id,
+                    Task.is_deleted == False  # noqa: E712
+                )
+            ).filter(
+                TaskDependency.task_id == task_id
+            ).order_by(TaskDependency.depends_on_id).all()
+
+            return {dep_id: status for dep_id, status in rows}
+
+    def get_task_readiness(
+        self,
+        project_id: int,
+        statuses: Optional[List[TaskStatus]] = None
+    ) -> Dict[int, bool]:
+        """Compute dependency readiness for every task in a project (M9).
+
+        A task is ready when every task it depends on exists and is
+        COMPLETED. Readiness for the whole project comes from a single
+        query with a correlated NOT EXISTS over ``task_dependency``.
 
-            dependents = []
-            for t in all_tasks:
-                if task_id in t.get_dependencies():
-                    dependents.append(t)
+        Args:
+            project_id: Project ID
+            statuses: Only include tasks in these statuses (None = all)
 
-            return dependents
+        Returns:
+            Dict mapping task ID to True (ready) or False (blocked)
+
+        Example:
+            >>> readiness = state_manager.get_task_readiness(
+            ...     1, statuses=[TaskStatus.PENDING, TaskStatus.READY]
+            ... )
+            >>> blocked = [tid for tid, ready in readiness.items() if not ready]
+        """
+        with self._lock:
+            session = self._get_session()
+            dependency = aliased(Task)
+
+            unmet = exists().where(
+                TaskDependency.task_id == Task.id
+            ).where(
+                ~exists().where(and_(
+                    dependency.id == TaskDependency.depends_on_id,
+                    dependency.is_deleted == False,  # noqa: E712
+                    dependency.status == TaskStatus.COMPLETED
+                ))
+            )
+
+            query = session.query(Task.id, unmet.label('blocked')).filter(
+                Task.project_id == project_id,
+                Task.is_deleted == False  # noqa: E712
+            )
+            if statuses:
+                query = query.filter(Task.status.in_(statuses))
+
+            return {tid: not blocked for tid, blocked in query.order_by(Task.id).all()}
 
     def get_tasks_by_project(
         self,
@@ -2302,6 +2476,37 @@ class StateManager:
                     details=str(e)
                 ) from e
 
+    def get_project_complexity_estimates(self, project_id: int) -> Dict[int, ComplexityEstimate]:
+        """Get complexity estimates for all tasks in a project.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Dict mapping task ID to its ComplexityEstimate (tasks without an
+            estimate are omitted)
+
+        Example:
+            >>> estimates = state_manager.get_project_complexity_estimates(1)
+            >>> total = sum(e.estimated_duration_minutes for e in estimates.values())
+        """
+        with self._lock:
+            try:
+                session = self._get_session()
+                estimates = session.query(ComplexityEstimate).join(
+                    Task, Task.id == ComplexityEstimate.task_id
+                ).filter(
+                    Task.project_id == project_id,
+                    Task.is_deleted == False  # noqa: E712
+                ).all()
+                return {estimate.task_id: estimate for estimate in estimates}
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to get complexity estimates for project {project_id}: {e}")
+                raise DatabaseException(
+                    operation='get_project_complexity_estimates',
+                    details=str(e)
+                ) from e
+
     # ========================================================================
     # Parallel Agent Attempt Methods (LLM-First Framework)
     # ========================================================================
@@ -2436,6 +2641,244 @@ class StateManager:
                     details=str(e)
                 ) from e
 
+    # ========================================================================
+    # Quality History Methods
+    # ========================================================================
+
+    def record_quality_result(
+        self,
+        project_id: int,
+        result_data: Dict[str, Any]
+    ) -> QualityResultRecord:
+        """Persist a quality validation result.
+
+        Stores a compact row in quality_result and increments the per-project
+        counter of every improvement suggested by the result.
+
+        Args:
+            project_id: Project ID (0 when validated without a task)
+            result_data: Result data with keys:
+                - overall_score (required): float
+                - passes_gate (required): bool
+                - stage_scores (optional): dict of stage name -> score
+                - improvements (optional): list of str
+                - task_id (optional): int
+                - timestamp (optional): datetime (default: now, UTC)
+                - structured_mode (optional): bool (default False)
+
+        Returns:
+            Created QualityResultRecord
+
+        Raises:
+            DatabaseException: If database operation fails
+
+        Example:
+            >>> state_manager.record_quality_result(
+            ...     project_id=1,
+            ...     result_data={
+            ...         'overall_score': 0.82,
+            ...         'passes_gate': True,
+            ...         'stage_scores': {'syntax': 1.0, 'testing': 0.5},
+            ...         'improvements': ['Create test file with unit tests']
+            ...     }
+            ... )
+        """
+        timestamp = result_data.get('timestamp') or datetime.now(UTC)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+        stage_scores = result_data.get('stage_scores') or {}
+
+        with self._lock:
+            try:
+                with self.transaction():
+                    session = self._get_session()
+                    record = QualityResultRecord(
+                        project_id=project_id,
+                        task_id=result_data.get('task_id'),
+                        timestamp=timestamp,
+                        overall_score=result_data['overall_score'],
+                        passes_gate=result_data['passes_gate'],
+                        syntax_score=stage_scores.get('syntax'),
+                        requirements_score=stage_scores.get('requirements'),
+                        quality_score=stage_scores.get('quality'),
+                        testing_score=stage_scores.get('testing'),
+                        structured_mode=result_data.get('structured_mode', False)
+                    )
+                    session.add(record)
+
+                    # Truncate before deduplicating: the column holds 500 chars
+                    issues = dict.fromkeys(
+                        issue[:500] for issue in result_data.get('improvements') or []
+                    )
+                    for issue in issues:
+                        stat = session.query(QualityIssueStat).filter(
+                            QualityIssueStat.project_id == project_id,
+                            QualityIssueStat.issue == issue
+                        ).first()
+                        if stat is None:
+                            stat = QualityIssueStat(
+                                project_id=project_id,
+                                issue=issue,
+                                occurrences=0,
+                                last_seen=timestamp
+                            )
+                            session.add(stat)
+                        stat.occurrences += 1
+                        stat.last_seen = timestamp
+
+                    session.flush()
+                    return record
+            except SQLAlchemyError as e:
+                raise DatabaseException(
+                    operation='record_quality_result',
+                    details=str(e)
+                ) from e
+
+    def get_quality_trend_stats(
+        self,
+        project_id: int,
+        since: datetime,
+        recent_limit: int = 10
+    ) -> Dict[str, Any]:
+        """Aggregate quality results for a project since a point in time.
+
+        All aggregation runs in the database over the
+        (project_id, timestamp) index; no result rows are loaded except the
+        ``recent_limit`` most recent scores.
+
+        Args:
+            project_id: Project ID
+            since: Only include results at or after this time
+            recent_limit: Number of most recent scores to return
+
+        Returns:
+            Dictionary with count, average_score, min_score, max_score,
+            first_half_average and second_half_average (chronological halves,
+            split at count // 2) and recent_scores (oldest first)
+
+        Example:
+            >>> stats = state_manager.get_quality_trend_stats(
+            ...     project_id=1,
+            ...     since=datetime.now(UTC) - timedelta(days=7)
+            ... )
+        """
+        if since.tzinfo is not None:
+            since = since.astimezone(UTC).replace(tzinfo=None)
+
+        with self._lock:
+            try:
+                session = self._get_session()
+                window = (
+                    QualityResultRecord.project_id == project_id,
+                    QualityResultRecord.timestamp >= since
+                )
+
+                count, average, minimum, maximum = session.query(
+                    func.count(QualityResultRecord.id),
+                    func.avg(QualityResultRecord.overall_score),
+                    func.min(QualityResultRecord.overall_score),
+                    func.max(QualityResultRecord.overall_score)
+                ).filter(*window).one()
+
+                if not count:
+                    return {'count': 0}
+
+                # Chronological halves via a row_number() window
+                half = count // 2
+                ranked = session.query(
+                    QualityResultRecord.overall_score.label('score'),
+                    func.row_number().over(
+                        order_by=(QualityResultRecord.timestamp, QualityResultRecord.id)
+                    ).label('rn')
+                ).filter(*window).subquery()
+                first_half, second_half = session.query(
+                    func.avg(case((ranked.c.rn <= half, ranked.c.score))),
+                    func.avg(case((ranked.c.rn > half, ranked.c.score)))
+                ).one()
+
+                recent = session.query(QualityResultRecord.overall_score).filter(
+                    *window
+                ).order_by(
+                    desc(QualityResultRecord.timestamp), desc(QualityResultRecord.id)
+                ).limit(recent_limit).all()
+
+                return {
+                    'count': count,
+                    'average_score': average,
+                    'min_score': minimum,
+                    'max_score': maximum,
+                    'first_half_average': first_half,
+                    'second_half_average': second_half,
+                    'recent_scores': [row[0] for row in reversed(recent)]
+                }
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to get quality trend stats: {e}")
+                raise DatabaseException(
+                    operation='get_quality_trend_stats',
+                    details=str(e)
+                ) from e
+
+    def get_quality_report_stats(
+        self,
+        project_id: int,
+        top_issues: int = 5
+    ) -> Dict[str, Any]:
+        """Aggregate all quality results for a project.
+
+        Args:
+            project_id: Project ID
+            top_issues: Number of most common improvement suggestions to return
+
+        Returns:
+            Dictionary with total, passed, overall_average, stage_averages
+            (missing stage scores count as 0.0) and common_issues (most
+            frequent first, ties in first-seen order)
+
+        Example:
+            >>> stats = state_manager.get_quality_report_stats(project_id=1)
+            >>> print(stats['passed'] / stats['total'])
+        """
+        stage_columns = {
+            'syntax': QualityResultRecord.syntax_score,
+            'requirements': QualityResultRecord.requirements_score,
+            'quality': QualityResultRecord.quality_score,
+            'testing': QualityResultRecord.testing_score
+        }
+
+        with self._lock:
+            try:
+                session = self._get_session()
+                row = session.query(
+                    func.count(QualityResultRecord.id),
+                    func.sum(case((QualityResultRecord.passes_gate.is_(True), 1), else_=0)),
+                    func.avg(QualityResultRecord.overall_score),
+                    *[func.avg(func.coalesce(column, 0.0)) for column in stage_columns.values()]
+                ).filter(QualityResultRecord.project_id == project_id).one()
+
+                total, passed, overall_average = row[0], row[1] or 0, row[2]
+                if not total:
+                    return {'total': 0, 'passed': 0, 'common_issues': []}
+
+                issues = session.query(QualityIssueStat.issue).filter(
+                    QualityIssueStat.project_id == project_id
+                ).order_by(
+                    desc(QualityIssueStat.occurrences), QualityIssueStat.id
+                ).limit(top_issues).all()
+
+                return {
+                    'total': total,
+                    'passed': passed,
+                    'overall_average': overall_average,
+                    'stage_averages': dict(zip(stage_columns, row[3:])),
+                    'common_issues': [issue for (issue,) in issues]
+                }
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to get quality report stats: {e}")
+                raise DatabaseException(
+                    operation='get_quality_report_stats',
+                    details=str(e)
+                ) from e
+
     # ========================================================================
     # Session Management Methods (Iterative Orchestration)
     # ========================================================================
@@ -0,0 +1,492 @@
+"""Long-lived orchestrator daemon and its thin client.
+
+Every ``obra task execute`` otherwise pays for loading config, creating the
+StateManager engine, connecting and warming up the LLM, compiling prompt
+templates and building the NL components before any work starts. ``obra
+serve`` does that once and keeps an initialized Orchestrator warm; the CLI
+then forwards execute commands over a Unix socket, so each command costs
+only the work itself and the orchestrator's caches (LLM, query, prompt,
+token counts) survive between commands.
+
+Protocol: one JSON object per line in each direction. A request is
+``{"command": ..., "args": {...}}``; the response is ``{"ok": true,
+"result": ...}`` or ``{"ok": false, "error": {type, message, context,
+recovery}}``. The orchestrator runs one task at a time, so concurrent
+execute requests queue; ``ping`` and ``status`` answer while a task runs.
+Execute requests carry the client's database URL and are refused by a
+daemon serving a different database, so a CLI pointed at another config
+never runs its task against the daemon's state.
+
+This module is imported by the CLI for every execute command and must stay
+light: the orchestrator is only imported inside the daemon process.
+
+Example:
+    >>> daemon = OrchestratorDaemon(config)
+    >>> daemon.start()
+    >>> daemon.serve_forever()  # in `obra serve`
+    ...
+    >>> client = DaemonClient.from_config(config)
+    >>> if client.is_running():
+    ...     result = client.execute_task(task_id=1)
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from src.core.exceptions import DaemonException, OrchestrationException, OrchestratorException
+from src.utils.lazy_import import lazy_import
+
+Orchestrator = lazy_import('src.orchestrator', 'Orchestrator')
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = '~/obra-runtime/obra.sock'
+DEFAULT_DATABASE_URL = 'sqlite:///orchestrator.db'
+
+# Responses can carry full task results; requests are small
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def socket_path_from_config(config: Any) -> Path:
+    """Resolve the daemon socket path from ``daemon.socket_path``.
+
+    Args:
+        config: Config instance
+
+    Returns:
+        Absolute socket path
+    """
+    return Path(config.get('daemon.socket_path', DEFAULT_SOCKET_PATH) or DEFAULT_SOCKET_PATH).expanduser()
+
+
+def database_url_from_config(config: Any) -> str:
+    """Resolve ``database.url`` to the database it names from this process.
+
+    Relative SQLite paths are made absolute (they depend on the working
+    directory), so a client and the daemon compare the actual file.
+
+    Args:
+        config: Config instance
+
+    Returns:
+        Database URL
+    """
+    url = config.get('database.url', DEFAULT_DATABASE_URL) or DEFAULT_DATABASE_URL
+    prefix = 'sqlite:///'
+    if url.startswith(prefix) and url[len(prefix):] not in ('', ':memory:'):
+        return prefix + str(Path(url[len(prefix):]).expanduser().resolve())
+    return url
+
+
+def _error_payload(error: Exception) -> Dict[str, Any]:
+    """Serialize an exception raised while handling a request."""
+    if isinstance(error, OrchestratorException):
+        return error.to_dict()
+    return {'type': type(error).__name__, 'message': str(error), 'context': {}, 'recovery': None}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one request line, answers with one response line."""
+
+    def handle(self) -> None:
+        daemon: 'OrchestratorDaemon' = self.server.daemon
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+            command = request.get('command')
+            response = daemon.handle_request(command, request.get('args') or {})
+        except json.JSONDecodeError as e:
+            command = None
+            response = {'ok': False, 'error': _error_payload(ValueError(f"Malformed request: {e}"))}
+
+        try:
+            self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+            self.wfile.flush()
+        except OSError as e:
+            # Client gave up (e.g. Ctrl+C); the work itself already finished
+            logger.warning(f"Daemon could not send {command} response: {e}")
+
+        if command == 'shutdown':
+            # shutdown() waits for serve_forever() to return; don't block this handler on it
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: 'OrchestratorDaemon'):
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class OrchestratorDaemon:
+    """Keeps one initialized Orchestrator and serves CLI commands over a socket.
+
+    Thread-safe: each connection is handled on its own thread; execute
+    commands are serialized on a work lock.
+
+    Example:
+        >>> daemon = OrchestratorDaemon(config)
+        >>> daemon.start()
+        >>> try:
+        ...     daemon.serve_forever()
+        ... finally:
+        ...     daemon.close()
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        socket_path: Optional[Path] = None,
+        orchestrator: Optional[Any] = None
+    ):
+        """Initialize daemon.
+
+        Args:
+            config: Config instance
+            socket_path: Socket to listen on (default: daemon.socket_path)
+            orchestrator: Already initialized orchestrator (default: built in start())
+        """
+        self.config = config
+        self.socket_path = Path(socket_path) if socket_path else socket_path_from_config(config)
+        self.database_url = database_url_from_config(config)
+        self.orchestrator = orchestrator
+        self._server: Optional[_UnixServer] = None
+        self._work_lock = threading.Lock()
+        self._busy_with: Optional[str] = None
+        self._commands_served = 0
+        self._started_at: Optional[float] = None
+        self._closing = False
+        self._commands: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'ping': self._ping,
+            'status': self._status,
+            'execute_task': self._execute_task,
+            'execute_epic': self._execute_epic,
+            'shutdown': self._shutdown,
+        }
+
+    def start(self) -> None:
+        """Initialize the orchestrator (if needed) and bind the socket.
+
+        Raises:
+            DaemonException: If another daemon already listens on the socket
+        """
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).is_running():
+                raise DaemonException(
+                    f"Orchestrator daemon already running on {self.socket_path}",
+                    context={'socket_path': str(self.socket_path)},
+                    recovery='Stop it with: obra daemon stop'
+                )
+            logger.info(f"Removing stale daemon socket {self.socket_path}")
+            self.socket_path.unlink()
+
+        if self.orchestrator is None:
+            started = time.perf_counter()
+            self.orchestrator = Orchestrator(config=self.config)
+            self.orchestrator.initialize()
+            logger.info(f"Daemon orchestrator initialized in {time.perf_counter() - started:.2f}s")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _UnixServer(str(self.socket_path), self)
+        # Commands run agents with the user's privileges: owner only
+        os.chmod(self.socket_path, 0o600)
+        self._started_at = time.time()
+        logger.info(f"Orchestrator daemon listening on {self.socket_path}")
+
+    def serve_forever(self) -> None:
+        """Serve requests until a shutdown request or stop()."""
+        if self._server is None:
+            raise DaemonException('Daemon not started', recovery='Call start() first')
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving (safe from other threads and signal handlers)."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self) -> None:
+        """Close the socket and shut the orchestrator down.
+
+        Waits for the command in progress; queued commands are rejected.
+        """
+        self._closing = True
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        if self._busy_with:
+            logger.info(f"Waiting for {self._busy_with} to finish before shutdown")
+        with self._work_lock:
+            if self.orchestrator is not None:
+                self.orchestrator.shutdown()
+        logger.info("Orchestrator daemon stopped")
+
+    def handle_request(self, command: Optional[str], args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one command and build its response.
+
+        Args:
+            command: Command name
+            args: Command arguments
+
+        Returns:
+            Response dictionary (``ok`` plus ``result`` or ``error``)
+        """
+        handler = self._commands.get(command)
+        if handler is None:
+            error = ValueError(f"Unknown daemon command: {command!r}")
+            return {'ok': False, 'error': _error_payload(error)}
+
+        try:
+            result = handler(args)
+        except Exception as e:
+            logger.error(f"Daemon command {command} failed: {e}", exc_info=not isinstance(e, OrchestratorException))
+            return {'ok': False, 'error': _error_payload(e)}
+
+        self._commands_served += 1
+        return {'ok': True, 'result': result}
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def _ping(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': time.time() - self._started_at if self._started_at else 0.0,
+            'busy': self._busy_with,
+            'commands_served': self._commands_served,
+            'database_url': self.database_url,
+        }
+
+    def _status(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        status = self._ping(args)
+        status['orchestrator'] = self.orchestrator.get_status()
+        return status
+
+    def _execute_task(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        task_id = int(args['task_id'])
+        self._check_database(args)
+        with self._work(f"task {task_id}"):
+            return self.orchestrator.execute_task(
+                task_id,
+                max_iterations=int(args.get('max_iterations', 10))
+            )
+
+    def _execute_epic(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        epic_id = int(args['epic_id'])
+        self._check_database(args)
+        with self._work(f"epic {epic_id}"):
+            epic = self.orchestrator.state_manager.get_task(epic_id)
+            if not epic:
+                raise OrchestrationException(
+                    f"Epic {epic_id} not found",
+                    context={'epic_id': epic_id},
+                    recovery='List epics with: obra epic list'
+                )
+            result = self.orchestrator.execute_epic(
+                project_id=epic.project_id,
+                epic_id=epic_id,
+                max_iterations_per_story=int(args.get('max_iterations_per_story', 10))
+            )
+            return {**result, 'epic_title': epic.title}
+
+    def _shutdown(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return {'pid': os.getpid()}
+
+    def _check_database(self, args: Dict[str, Any]) -> None:
+        """Refuse work from a client configured for another database.
+
+        Raises:
+            DaemonException: If the request's database_url differs
+        """
+        requested = args.get('database_url')
+        if requested != self.database_url:
+            raise DaemonException(
+                f"Orchestrator daemon serves {self.database_url}, not {requested}",
+                context={'daemon_database_url': self.database_url, 'database_url': requested},
+                recovery='Run with --no-daemon, or start `obra serve` with the same config'
+            )
+
+    @contextmanager
+    def _work(self, label: str) -> Iterator[None]:
+        """Hold the work lock, recording what the daemon is busy with."""
+        if self._busy_with:
+            logger.info(f"Daemon busy with {self._busy_with}; {label} queued")
+        with self._work_lock:
+            if self._closing:
+                raise DaemonException(
+                    f"Orchestrator daemon is shutting down; {label} not started",
+                    recovery='Run the command again without the daemon'
+                )
+            self._busy_with = label
+            try:
+                yield
+            finally:
+                self._busy_with = None
+
+
+class DaemonClient:
+    """Thin client for a running OrchestratorDaemon.
+
+    Each call opens one connection, sends one request and waits for the
+    response; execute calls wait for the whole task.
+
+    Example:
+        >>> client = DaemonClient.from_config(config)
+        >>> client.execute_task(task_id=1, max_iterations=5)['status']
+        'completed'
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        connect_timeout: float = 1.0,
+        database_url: Optional[str] = None
+    ):
+        """Initialize client.
+
+        Args:
+            socket_path: Daemon socket path
+            connect_timeout: Seconds to wait for connecting and for ping/status
+            database_url: Database execute requests are meant for (the daemon
+                refuses them if it serves another one)
+        """
+        self.socket_path = Path(socket_path)
+        self.connect_timeout = connect_timeout
+        self.database_url = database_url
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'DaemonClient':
+        """Create a client for the socket and database configured in ``config``."""
+        return cls(socket_path_from_config(config), database_url=database_url_from_config(config))
+
+    def serves_database(self) -> bool:
+        """Whether a daemon answers on the socket and serves this client's database."""
+        if not self.socket_path.exists():
+            return False
+        try:
+            daemon_url = self.ping().get('database_url')
+        except DaemonException:
+            return False
+        if daemon_url != self.database_url:
+            logger.warning(
+                f"Orchestrator daemon at {self.socket_path} serves {daemon_url}, "
+                f"not {self.database_url}; not using it"
+            )
+            return False
+        return True
+
+    def is_running(self) -> bool:
+        """Whether a daemon answers on the socket."""
+        if not self.socket_path.exists():
+            return False
+        try:
+            self.request('ping')
+            return True
+        except DaemonException:
+            return False
+
+    def ping(self) -> Dict[str, Any]:
+        """Daemon pid, uptime and current work."""
+        return self.request('ping')
+
+    def status(self) -> Dict[str, Any]:
+        """ping() plus the orchestrator's get_status()."""
+        return self.request('status')
+
+    def execute_task(self, task_id: int, max_iterations: int = 10) -> Dict[str, Any]:
+        """Execute a task in the daemon (see Orchestrator.execute_task)."""
+        return self.request(
+            'execute_task',
+            {'task_id': task_id, 'max_iterations': max_iterations, 'database_url': self.database_url},
+            wait=True
+        )
+
+    def execute_epic(self, epic_id: int, max_iterations_per_story: int = 10) -> Dict[str, Any]:
+        """Execute an epic in the daemon (see Orchestrator.execute_epic)."""
+        return self.request(
+            'execute_epic',
+            {
+                'epic_id': epic_id,
+                'max_iterations_per_story': max_iterations_per_story,
+                'database_url': self.database_url,
+            },
+            wait=True
+        )
+
+    def shutdown(self) -> Dict[str, Any]:
+        """Ask the daemon to exit once in-flight requests finish."""
+        return self.request('shutdown')
+
+    def request(self, command: str, args: Optional[Dict[str, Any]] = None, wait: bool = False) -> Any:
+        """Send one command and return its result.
+
+        Args:
+            command: Command name
+            args: Command arguments
+            wait: Wait without timeout for the response (long-running commands)
+
+        Returns:
+            The command's result
+
+        Raises:
+            DaemonException: If the daemon is unreachable or the command failed
+        """
+        context = {'socket_path': str(self.socket_path), 'command': command}
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.connect_timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError as e:
+                raise DaemonException(
+                    f"Orchestrator daemon not reachable: {e}",
+                    context=context,
+                    recovery='Start it with: obra serve'
+                ) from e
+
+            if wait:
+                sock.settimeout(None)
+            payload = json.dumps({'command': command, 'args': args or {}}).encode('utf-8')
+            with sock.makefile('rwb') as stream:
+                stream.write(payload + b'\n')
+                stream.flush()
+                line = stream.readline()
+        except socket.timeout as e:
+            raise DaemonException(
+                f"Orchestrator daemon did not answer {command}", context=context
+            ) from e
+        finally:
+            sock.close()
+
+        if not line:
+            raise DaemonException(
+                f"Orchestrator daemon closed the connection during {command}",
+                context=context,
+                recovery='Check the daemon log'
+            )
+
+        response = json.loads(line)
+        if not response.get('ok'):
+            error = response.get('error') or {}
+            raise DaemonException(
+                error.get('message', 'Daemon request failed'),
+                context={**context, 'remote_type': error.get('type'), **(error.get('context') or {})},
+                recovery=error.get('recovery')
+            )
+        return response.get('result')
@@ -20,6 +20,7 @@ from src.core.config import Config
 from src.core.state import StateManager
 from src.core.exceptions import OrchestratorException
 from src.monitoring.production_logger import ProductionLogger, generate_session_id
+from src.monitoring.profiler import get_profiler, install_profile_signal
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,7 @@ class InteractiveMode:
             '/to-impl': self.cmd_to_impl,
             '/to-claude': self.cmd_to_impl,  # Alias
             '/llm': self.cmd_llm,
+            '/profile': self.cmd_profile,
             # Exception: exit/quit work without slash (UX convention)
             'exit': self.cmd_exit,
             'quit': self.cmd_exit,
@@ -97,6 +99,9 @@ class InteractiveMode:
         """Run the interactive REPL loop."""
         self.running = True
 
+        # Optional: toggle the sampling profiler with a signal
+        install_profile_signal(self.config)
+
         # Initialize components
         try:
             db_url = self.config.get('database.url', 'sqlite:///orchestrator.db')
@@ -148,6 +153,9 @@ class InteractiveMode:
                 print(f"✗ Error: {e}")
 
         # Cleanup
+        if get_profiler(self.config).is_running:
+            self.cmd_profile(['stop'])
+
         if self.orchestrator:
             self.orchestrator.shutdown()
 
@@ -301,6 +309,7 @@ class InteractiveMode:
         print("    /help                 - Show this help message")
         print("    /history              - Show command history")
         print("    /clear                - Clear screen")
+        print("    /profile start|stop   - Sample this process's stacks (writes to logs)")
         print()
 
         print("  Orchestrator Communication:")
@@ -374,6 +383,41 @@ class InteractiveMode:
         import os
         os.system('clear' if os.name != 'nt' else 'cls')
 
+    def cmd_profile(self, args: List[str]) -> None:
+        """Start/stop the in-process sampling profiler.
+
+        Args:
+            args: ['start'], ['stop'] or ['status']
+        """
+        profiler = get_profiler(self.config)
+        action = args[0].lower() if args else 'status'
+
+        if action == 'start':
+            if profiler.start():
+                print(f"✓ Profiling started (every {profiler.interval_ms}ms). Use /profile stop to finish.")
+            else:
+                print("Profiler already running")
+
+        elif action == 'stop':
+            report = profiler.stop()
+            if report is None:
+                print("Profiler is not running")
+                return
+            print(f"\n✓ Profiled {report.duration_seconds:.1f}s ({report.samples} samples)")
+            print("Top functions by self time:")
+            for func, count in report.top_self[:10]:
+                print(f"  {count / max(report.samples, 1) * 100:5.1f}%  {func}")
+            if report.summary_path:
+                print(f"\nSummary: {report.summary_path}")
+                print(f"Collapsed stacks: {report.collapsed_path}")
+
+        elif action == 'status':
+            state = "running" if profiler.is_running else "stopped"
+            print(f"Profiler: {state} (output: {profiler.output_dir})")
+
+        else:
+            print("Usage: /profile start|stop|status")
+
     # ========================================================================
     # Project Commands
     # ========================================================================
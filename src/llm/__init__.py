@@ -7,12 +7,24 @@ This package provides:
 - Response validation and quality checks
 - Structured response parsing with schema validation
 - Token counting and context management
+
+Importing this package registers the built-in LLM plugins (and any
+advertised through the ``obra.llms`` entry point group) lazily; exports are
+resolved on first access.
 """
 
-from src.llm.local_interface import LocalLLMInterface
-from src.llm.openai_codex_interface import OpenAICodexLLMPlugin
-from src.llm.response_validator import ResponseValidator
-from src.llm.structured_response_parser import StructuredResponseParser
+from src.plugins.registry import LLMRegistry
+from src.utils.lazy_import import lazy_exports
+
+# Registry name -> 'module:Class'
+BUILTIN_LLMS = {
+    'ollama': 'src.llm.local_interface:LocalLLMInterface',
+    'openai-codex': 'src.llm.openai_codex_interface:OpenAICodexLLMPlugin',
+}
+
+for _name, _target in BUILTIN_LLMS.items():
+    LLMRegistry.register_lazy(_name, _target)
+LLMRegistry.discover()
 
 __all__ = [
     'LocalLLMInterface',
@@ -20,3 +32,10 @@ __all__ = [
     'ResponseValidator',
     'StructuredResponseParser'
 ]
+
+__getattr__ = lazy_exports(__name__, {
+    'LocalLLMInterface': 'src.llm.local_interface',
+    'OpenAICodexLLMPlugin': 'src.llm.openai_codex_interface',
+    'ResponseValidator': 'src.llm.response_validator',
+    'StructuredResponseParser': 'src.llm.structured_response_parser',
+})
@@ -7,19 +7,39 @@ to detect:
 - Missing docstrings
 - Missing test coverage
 
+All validators are implemented as rules for a single-pass analysis engine
+(CodeAnalyzer): each file is parsed once, parse trees are cached by content
+hash, and every rule is dispatched from one traversal of the tree, so adding
+rules does not add parses or walks. validate_code_files() validates a batch of
+files (e.g. everything a task touched) in a process pool.
+
 Used by PromptRuleEngine to validate code generated by LLMs.
 
 Part of the LLM-first prompt engineering framework (PHASE_2, TASK_2.4).
 """
 
 import ast
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterable
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Violation categories returned by validate_code_file()
+VALIDATION_CATEGORIES = ('stubs', 'hardcoded', 'docstrings', 'tests')
+
+# Default numbers that are never reported as magic numbers
+DEFAULT_IGNORED_NUMBERS = frozenset({0, 1, 2, -1, 100, 1000})
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_MIN_FILES = 4
+
 
 class CodeViolation:
     """Represents a single code quality violation."""
@@ -69,6 +89,520 @@ class CodeViolation:
         return f"<CodeViolation({self.file_path}:{self.line} - {self.violation_type})>"
 
 
+# ============================================================================
+# Parse cache
+# ============================================================================
+
+class _ParseFailure:
+    """Details of a cached syntax error; a fresh exception is raised per hit."""
+
+    __slots__ = ('error_type', 'args')
+
+    def __init__(self, error: SyntaxError):
+        self.error_type = type(error)
+        self.args = error.args
+
+    def exception(self) -> SyntaxError:
+        return self.error_type(*self.args)
+
+
+class ParseCache:
+    """Bounded LRU cache of parse trees keyed by source content hash.
+
+    Identical source (the same file validated across iterations, or a test
+    file shared by several sources) is parsed only once. Syntax errors are
+    cached too, so broken files are not re-parsed on every check; each hit
+    raises a new SyntaxError with the cached message and location.
+
+    Cached trees are shared between callers and must be treated as read-only.
+
+    Attributes:
+        max_entries: Maximum number of cached trees (LRU eviction)
+        hit_count: Cache hits (metrics)
+        miss_count: Cache misses (metrics)
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize parse cache.
+
+        Args:
+            max_entries: Maximum number of cached trees (default: 128)
+        """
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @staticmethod
+    def content_hash(code: str) -> str:
+        """Return the cache key for a source string."""
+        return hashlib.sha256(code.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def parse(self, code: str) -> ast.Module:
+        """Parse source code, reusing a cached tree when available.
+
+        Args:
+            code: Python source code
+
+        Returns:
+            Parsed module tree
+
+        Raises:
+            SyntaxError: If the source is not valid Python
+        """
+        key = self.content_hash(code)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hit_count += 1
+            else:
+                self.miss_count += 1
+
+        if entry is None:
+            try:
+                entry = ast.parse(code)
+            except SyntaxError as e:
+                entry = _ParseFailure(e)
+            except ValueError as e:
+                # e.g. source containing null bytes
+                entry = _ParseFailure(SyntaxError(str(e)))
+
+            with self._lock:
+                self._cache[key] = entry
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+
+        if isinstance(entry, _ParseFailure):
+            raise entry.exception()
+        return entry
+
+    def clear(self) -> None:
+        """Remove all cached trees and reset metrics."""
+        with self._lock:
+            self._cache.clear()
+            self.hit_count = 0
+            self.miss_count = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with size, max_entries, hit_count, miss_count, hit_rate
+        """
+        with self._lock:
+            total = self.hit_count + self.miss_count
+            return {
+                'size': len(self._cache),
+                'max_entries': self.max_entries,
+                'hit_count': self.hit_count,
+                'miss_count': self.miss_count,
+                'hit_rate': self.hit_count / total if total else 0.0
+            }
+
+
+# Process-wide parse cache shared by all validators
+_parse_cache = ParseCache()
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide parse cache used by the validators."""
+    return _parse_cache
+
+
+# ============================================================================
+# Analysis engine
+# ============================================================================
+
+class CodeRule:
+    """Base class for rules run by CodeAnalyzer.
+
+    A rule declares the AST node types it inspects in ``node_types`` and the
+    result category it reports under in ``category``. The analyzer calls
+    ``check()`` for every matching node during its single traversal and
+    ``finish()`` once the traversal is complete.
+
+    Attributes:
+        category: Result category (key in analyze_code() output)
+        node_types: AST node classes dispatched to check()
+        file_path: Path reported in violations
+        violations: Violations collected so far
+    """
+
+    category: str = ''
+    node_types: Tuple[type, ...] = ()
+
+    def __init__(self, file_path: str = '<string>'):
+        """Initialize rule.
+
+        Args:
+            file_path: Path to file (for reporting)
+        """
+        self.file_path = file_path
+        self.violations: List[CodeViolation] = []
+
+    def check(self, node: ast.AST) -> None:
+        """Inspect a single node of one of ``node_types``."""
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        """Called once after the traversal; override for whole-file checks."""
+
+    def report(self, node_or_line: Any, violation_type: str, message: str,
+               severity: str = 'medium', suggestion: Optional[str] = None) -> None:
+        """Record a violation at a node (or an explicit line number)."""
+        if isinstance(node_or_line, ast.AST):
+            line, column = node_or_line.lineno, node_or_line.col_offset
+        else:
+            line, column = node_or_line, 0
+        self.violations.append(CodeViolation(
+            file_path=self.file_path,
+            line=line,
+            column=column,
+            violation_type=violation_type,
+            message=message,
+            severity=severity,
+            suggestion=suggestion
+        ))
+
+
+def _has_docstring(node: ast.AST) -> bool:
+    """Check whether a function/class body starts with a string literal."""
+    return bool(
+        node.body and
+        isinstance(node.body[0], ast.Expr) and
+        isinstance(node.body[0].value, ast.Constant) and
+        isinstance(node.body[0].value.value, str)
+    )
+
+
+class StubRule(CodeRule):
+    """Detect stub functions (pass, NotImplementedError, TODO markers)."""
+
+    category = 'stubs'
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    def check(self, node: ast.AST) -> None:
+        func_name = node.name
+
+        # Skip private/dunder methods (they can be stubs)
+        if func_name.startswith('_') and not func_name.startswith('__test'):
+            return
+
+        # Check function body
+        if not node.body:
+            self.report(
+                node, 'empty_function',
+                f"Function '{func_name}' has empty body",
+                severity='critical',
+                suggestion="Implement the function logic or remove if not needed"
+            )
+            return
+
+        # Check for single 'pass' statement
+        if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
+            self.report(
+                node, 'stub_function',
+                f"Function '{func_name}' contains only 'pass' statement",
+                severity='critical',
+                suggestion="Implement the function logic"
+            )
+
+        # Check for NotImplementedError
+        for stmt in node.body:
+            if isinstance(stmt, ast.Raise) and isinstance(stmt.exc, ast.Call):
+                if getattr(stmt.exc.func, 'id', None) == 'NotImplementedError':
+                    self.report(
+                        stmt, 'not_implemented',
+                        f"Function '{func_name}' raises NotImplementedError",
+                        severity='high',
+                        suggestion="Implement the function logic or remove the placeholder"
+                    )
+
+        # Check for TODO/FIXME comments in docstring
+        if _has_docstring(node):
+            docstring = node.body[0].value.value
+            if re.search(r'\b(TODO|FIXME|XXX|HACK)\b', docstring, re.IGNORECASE):
+                self.report(
+                    node, 'todo_marker',
+                    f"Function '{func_name}' contains TODO/FIXME marker",
+                    severity='medium',
+                    suggestion="Complete the implementation and remove TODO marker"
+                )
+
+
+class HardcodedValueRule(CodeRule):
+    """Detect magic numbers, hardcoded URLs and hardcoded paths."""
+
+    category = 'hardcoded'
+    node_types = (ast.Constant,)
+
+    def __init__(self, file_path: str = '<string>',
+                 ignore_numbers: Optional[Set[int]] = None):
+        """Initialize rule.
+
+        Args:
+            file_path: Path to file (for reporting)
+            ignore_numbers: Set of numbers to ignore (default: DEFAULT_IGNORED_NUMBERS)
+        """
+        super().__init__(file_path)
+        self.ignore_numbers = (
+            DEFAULT_IGNORED_NUMBERS if ignore_numbers is None else ignore_numbers
+        )
+
+    def check(self, node: ast.AST) -> None:
+        value = node.value
+
+        # Check for magic numbers (bool is an int subclass but never magic)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if value in self.ignore_numbers:
+                return
+            self.report(
+                node, 'magic_number',
+                f"Magic number detected: {value}",
+                severity='medium',
+                suggestion="Extract to a named constant or configuration"
+            )
+            return
+
+        if not isinstance(value, str):
+            return
+
+        # Skip docstrings and type annotations
+        if len(value) > 50 or '\n' in value:
+            return
+
+        # Check for URLs
+        if re.match(r'https?://', value):
+            self.report(
+                node, 'hardcoded_url',
+                f"Hardcoded URL detected: {value[:50]}",
+                severity='high',
+                suggestion="Move URL to configuration file or environment variable"
+            )
+
+        # Check for file paths, skipping things that look like URL routes
+        elif '/' in value and len(value) > 5:
+            if not value.startswith('/api') and not value.startswith('/v'):
+                self.report(
+                    node, 'hardcoded_path',
+                    f"Hardcoded path detected: {value[:50]}",
+                    severity='medium',
+                    suggestion="Use pathlib or configuration for file paths"
+                )
+
+
+class DocstringRule(CodeRule):
+    """Detect public functions and classes without docstrings."""
+
+    category = 'docstrings'
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+    def check(self, node: ast.AST) -> None:
+        if isinstance(node, ast.ClassDef):
+            # Skip private classes
+            if node.name.startswith('_') or _has_docstring(node):
+                return
+            self.report(
+                node, 'missing_class_docstring',
+                f"Class '{node.name}' missing docstring",
+                severity='medium',
+                suggestion="Add class docstring describing purpose and usage"
+            )
+            return
+
+        # Skip private functions/methods
+        if node.name.startswith('_') and not node.name.startswith('__'):
+            return
+        if not _has_docstring(node):
+            self.report(
+                node, 'missing_docstring',
+                f"Function '{node.name}' missing docstring",
+                severity='medium',
+                suggestion="Add Google-style docstring with Args, Returns, and description"
+            )
+
+
+class TestCoverageRule(CodeRule):
+    """Check that public functions have tests in the matching test file.
+
+    Public function names are collected during the shared traversal; the
+    test file (tests/test_<module>.py) is read and checked in finish().
+    """
+
+    __test__ = False  # Not a pytest test class
+    category = 'tests'
+    node_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    def __init__(self, file_path: str = '<string>', test_directory: str = 'tests'):
+        """Initialize rule.
+
+        Args:
+            file_path: Path to the source file being analyzed
+            test_directory: Directory containing test files
+        """
+        super().__init__(file_path)
+        self.test_directory = test_directory
+        self.public_functions: List[str] = []
+
+    def check(self, node: ast.AST) -> None:
+        if not node.name.startswith('_'):
+            self.public_functions.append(node.name)
+
+    def finish(self) -> None:
+        if not self.public_functions:
+            # No public functions to test
+            return
+
+        source_path = Path(self.file_path)
+        test_path = Path(self.test_directory) / f"test_{source_path.stem}.py"
+
+        if not test_path.exists():
+            self.report(
+                1, 'missing_test_file',
+                f"Test file not found: {test_path}",
+                severity='high',
+                suggestion=(
+                    f"Create {test_path} with tests for "
+                    f"{len(self.public_functions)} functions"
+                )
+            )
+            return
+
+        try:
+            test_tree = _parse_cache.parse(test_path.read_text())
+        except (OSError, SyntaxError) as e:
+            logger.error(f"Failed to parse test file: {e}")
+            return
+
+        test_functions = {
+            node.name for node in ast.walk(test_tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name.startswith('test_')
+        }
+
+        # Check if each public function has a corresponding test
+        for func_name in self.public_functions:
+            expected_test_names = (
+                f"test_{func_name}",
+                f"test_{func_name}_success",
+                f"test_{func_name}_basic",
+            )
+            if not any(name in test_functions for name in expected_test_names):
+                self.report(
+                    1, 'missing_test',
+                    f"No test found for function '{func_name}'",
+                    severity='medium',
+                    suggestion=f"Add test_{func_name}() to {test_path}"
+                )
+
+
+class CodeAnalyzer(ast.NodeVisitor):
+    """Single-pass AST analysis engine.
+
+    Builds a dispatch table from node type to the rules interested in it and
+    visits the tree once, so the cost of a traversal is independent of the
+    number of rules and each rule only sees the nodes it asked for.
+
+    Example:
+        >>> rules = [StubRule('x.py'), DocstringRule('x.py')]
+        >>> CodeAnalyzer(rules).run(get_parse_cache().parse(code))
+        >>> violations = rules[0].violations
+    """
+
+    def __init__(self, rules: Iterable[CodeRule]):
+        """Initialize analyzer.
+
+        Args:
+            rules: Rule instances to run (fresh instances per analysis)
+        """
+        self.rules = list(rules)
+        self._dispatch: Dict[type, List[CodeRule]] = {}
+        for rule in self.rules:
+            for node_type in rule.node_types:
+                self._dispatch.setdefault(node_type, []).append(rule)
+
+    def visit(self, node: ast.AST) -> None:
+        """Dispatch node to interested rules, then visit its children."""
+        for rule in self._dispatch.get(type(node), ()):
+            rule.check(node)
+        self.generic_visit(node)
+
+    def run(self, tree: ast.AST) -> Dict[str, List[CodeViolation]]:
+        """Traverse tree once and finalize all rules.
+
+        Args:
+            tree: Parsed module tree
+
+        Returns:
+            Dictionary mapping rule category to violations
+        """
+        self.visit(tree)
+        results: Dict[str, List[CodeViolation]] = {}
+        for rule in self.rules:
+            rule.finish()
+            results.setdefault(rule.category, []).extend(rule.violations)
+        return results
+
+
+def default_rules(
+    file_path: str = '<string>',
+    test_directory: Optional[str] = 'tests'
+) -> List[CodeRule]:
+    """Build the standard rule set used by validate_code_file().
+
+    Args:
+        file_path: Path to file (for reporting)
+        test_directory: Test directory for TestCoverageRule, or None to skip it
+
+    Returns:
+        Fresh rule instances
+    """
+    rules: List[CodeRule] = [
+        StubRule(file_path),
+        HardcodedValueRule(file_path),
+        DocstringRule(file_path),
+    ]
+    if test_directory is not None:
+        rules.append(TestCoverageRule(file_path, test_directory))
+    return rules
+
+
+def analyze_code(
+    code: str,
+    file_path: str = '<string>',
+    rules: Optional[List[CodeRule]] = None
+) -> Dict[str, List[CodeViolation]]:
+    """Run rules over source code with one (cached) parse and one traversal.
+
+    Args:
+        code: Python source code to analyze
+        file_path: Path to file (for reporting)
+        rules: Rule instances to run (default: default_rules without tests)
+
+    Returns:
+        Dictionary mapping rule category to violations. On a syntax error
+        every category is present with an empty list.
+    """
+    if rules is None:
+        rules = default_rules(file_path, test_directory=None)
+
+    try:
+        tree = _parse_cache.parse(code)
+    except SyntaxError as e:
+        logger.error(f"Syntax error in {file_path}: {e}")
+        return {rule.category: [] for rule in rules}
+
+    return CodeAnalyzer(rules).run(tree)
+
+
+# ============================================================================
+# Individual validators
+# ============================================================================
+
 def detect_stubs(code: str, file_path: str = '<string>') -> List[CodeViolation]:
     """Detect stub functions containing pass, TODO, or NotImplemented.
 
@@ -97,81 +631,7 @@ def detect_stubs(code: str, file_path: str = '<string>') -> List[CodeViolation]:
         >>> violations = detect_stubs(code)
         >>> assert len(violations) == 2
     """
-    violations = []
-
-    try:
-        tree = ast.parse(code)
-    except SyntaxError as e:
-        logger.error(f"Syntax error in {file_path}: {e}")
-        return violations
-
-    for node in ast.walk(tree):
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            continue
-
-        func_name = node.name
-        func_line = node.lineno
-
-        # Skip private/dunder methods (they can be stubs)
-        if func_name.startswith('_') and not func_name.startswith('__test'):
-            continue
-
-        # Check function body
-        if not node.body:
-            violations.append(CodeViolation(
-                file_path=file_path,
-                line=func_line,
-                column=node.col_offset,
-                violation_type='empty_function',
-                message=f"Function '{func_name}' has empty body",
-                severity='critical',
-                suggestion="Implement the function logic or remove if not needed"
-            ))
-            continue
-
-        # Check for single 'pass' statement
-        if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
-            violations.append(CodeViolation(
-                file_path=file_path,
-                line=func_line,
-                column=node.col_offset,
-                violation_type='stub_function',
-                message=f"Function '{func_name}' contains only 'pass' statement",
-                severity='critical',
-                suggestion="Implement the function logic"
-            ))
-
-        # Check for NotImplementedError
-        for stmt in node.body:
-            if isinstance(stmt, ast.Raise):
-                if isinstance(stmt.exc, ast.Call):
-                    if hasattr(stmt.exc.func, 'id') and stmt.exc.func.id == 'NotImplementedError':
-                        violations.append(CodeViolation(
-                            file_path=file_path,
-                            line=stmt.lineno,
-                            column=stmt.col_offset,
-                            violation_type='not_implemented',
-                            message=f"Function '{func_name}' raises NotImplementedError",
-                            severity='high',
-                            suggestion="Implement the function logic or remove the placeholder"
-                        ))
-
-        # Check for TODO/FIXME comments in docstring or body
-        if node.body and isinstance(node.body[0], ast.Expr) and isinstance(node.body[0].value, ast.Constant):
-            docstring = node.body[0].value.value
-            if isinstance(docstring, str):
-                if re.search(r'\b(TODO|FIXME|XXX|HACK)\b', docstring, re.IGNORECASE):
-                    violations.append(CodeViolation(
-                        file_path=file_path,
-                        line=func_line,
-                        column=node.col_offset,
-                        violation_type='todo_marker',
-                        message=f"Function '{func_name}' contains TODO/FIXME marker",
-                        severity='medium',
-                        suggestion="Complete the implementation and remove TODO marker"
-                    ))
-
-    return violations
+    return analyze_code(code, file_path, [StubRule(file_path)])['stubs']
 
 
 def detect_hardcoded_values(
@@ -205,72 +665,8 @@ def detect_hardcoded_values(
         >>> violations = detect_hardcoded_values(code)
         >>> assert any(v.violation_type == 'magic_number' for v in violations)
     """
-    if ignore_numbers is None:
-        ignore_numbers = {0, 1, 2, -1, 100, 1000}  # Common safe numbers
-
-    violations = []
-
-    try:
-        tree = ast.parse(code)
-    except SyntaxError:
-        return violations
-
-    for node in ast.walk(tree):
-        # Check for magic numbers
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, (int, float)):
-                # Skip if in ignore list
-                if node.value in ignore_numbers:
-                    continue
-
-                # Skip if it's a default argument value or return value
-                parent = getattr(node, 'parent', None)
-                if isinstance(parent, (ast.Return, ast.Assign)):
-                    continue
-
-                violations.append(CodeViolation(
-                    file_path=file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    violation_type='magic_number',
-                    message=f"Magic number detected: {node.value}",
-                    severity='medium',
-                    suggestion="Extract to a named constant or configuration"
-                ))
-
-            # Check for hardcoded URLs/paths in strings
-            elif isinstance(node.value, str):
-                # Skip docstrings and type annotations
-                if len(node.value) > 50 or '\n' in node.value:
-                    continue
-
-                # Check for URLs
-                if re.match(r'https?://', node.value):
-                    violations.append(CodeViolation(
-                        file_path=file_path,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        violation_type='hardcoded_url',
-                        message=f"Hardcoded URL detected: {node.value[:50]}",
-                        severity='high',
-                        suggestion="Move URL to configuration file or environment variable"
-                    ))
-
-                # Check for file paths
-                elif '/' in node.value and len(node.value) > 5:
-                    # Skip if it looks like a URL path (starts with /)
-                    if not node.value.startswith('/api') and not node.value.startswith('/v'):
-                        violations.append(CodeViolation(
-                            file_path=file_path,
-                            line=node.lineno,
-                            column=node.col_offset,
-                            violation_type='hardcoded_path',
-                            message=f"Hardcoded path detected: {node.value[:50]}",
-                            severity='medium',
-                            suggestion="Use pathlib or configuration for file paths"
-                        ))
-
-    return violations
+    rule = HardcodedValueRule(file_path, ignore_numbers)
+    return analyze_code(code, file_path, [rule])['hardcoded']
 
 
 def check_docstring_coverage(code: str, file_path: str = '<string>') -> List[CodeViolation]:
@@ -297,69 +693,7 @@ def check_docstring_coverage(code: str, file_path: str = '<string>') -> List[Cod
         >>> violations = check_docstring_coverage(code)
         >>> assert len(violations) == 1
     """
-    violations = []
-
-    try:
-        tree = ast.parse(code)
-    except SyntaxError:
-        return violations
-
-    for node in ast.walk(tree):
-        # Check functions and methods
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_name = node.name
-
-            # Skip private functions/methods
-            if func_name.startswith('_') and not func_name.startswith('__'):
-                continue
-
-            # Check for docstring
-            has_docstring = (
-                node.body and
-                isinstance(node.body[0], ast.Expr) and
-                isinstance(node.body[0].value, ast.Constant) and
-                isinstance(node.body[0].value.value, str)
-            )
-
-            if not has_docstring:
-                violations.append(CodeViolation(
-                    file_path=file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    violation_type='missing_docstring',
-                    message=f"Function '{func_name}' missing docstring",
-                    severity='medium',
-                    suggestion="Add Google-style docstring with Args, Returns, and description"
-                ))
-
-        # Check classes
-        elif isinstance(node, ast.ClassDef):
-            class_name = node.name
-
-            # Skip private classes
-            if class_name.startswith('_'):
-                continue
-
-            # Check for docstring
-            has_docstring = (
-                node.body and
-                isinstance(node.body[0], ast.Expr) and
-                isinstance(node.body[0].value, ast.Constant) and
-                isinstance(node.body[0].value.value, str)
-            )
-
-            if not has_docstring:
-                violations.append(CodeViolation(
-                    file_path=file_path,
-                    line=node.lineno,
-                    column=node.col_offset,
-                    violation_type='missing_class_docstring',
-                    message=f"Class '{class_name}' missing docstring",
-                    severity='medium',
-                    suggestion="Add class docstring describing purpose and usage"
-                ))
-
-    return violations
+    return analyze_code(code, file_path, [DocstringRule(file_path)])['docstrings']
 
 
 def check_test_coverage(
@@ -382,103 +716,43 @@ def check_test_coverage(
         >>> violations = check_test_coverage('src/core/models.py')
         >>> # Checks if tests/test_models.py exists with tests for public functions
     """
-    violations = []
     source_path = Path(source_file_path)
 
     if not source_path.exists():
         logger.warning(f"Source file not found: {source_file_path}")
-        return violations
+        return []
 
-    # Determine expected test file name
-    source_name = source_path.stem
-    test_file_name = f"test_{source_name}.py"
-    test_path = Path(test_directory) / test_file_name
-
-    # Read source file and find public functions
     try:
-        with open(source_path, 'r') as f:
-            source_code = f.read()
-
-        source_tree = ast.parse(source_code)
-    except (OSError, SyntaxError) as e:
+        source_code = source_path.read_text()
+    except OSError as e:
         logger.error(f"Failed to parse source file: {e}")
-        return violations
-
-    # Collect public functions from source
-    public_functions = []
-    for node in ast.walk(source_tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_name = node.name
-            # Only check top-level public functions
-            if not func_name.startswith('_'):
-                public_functions.append(func_name)
-
-    if not public_functions:
-        # No public functions to test
-        return violations
-
-    # Check if test file exists
-    if not test_path.exists():
-        violations.append(CodeViolation(
-            file_path=str(source_path),
-            line=1,
-            column=0,
-            violation_type='missing_test_file',
-            message=f"Test file not found: {test_path}",
-            severity='high',
-            suggestion=f"Create {test_path} with tests for {len(public_functions)} functions"
-        ))
-        return violations
+        return []
+
+    rule = TestCoverageRule(str(source_path), test_directory)
+    return analyze_code(source_code, str(source_path), [rule])['tests']
 
-    # Read test file and find test functions
-    try:
-        with open(test_path, 'r') as f:
-            test_code = f.read()
-
-        test_tree = ast.parse(test_code)
-    except (OSError, SyntaxError) as e:
-        logger.error(f"Failed to parse test file: {e}")
-        return violations
-
-    # Collect test function names
-    test_functions = set()
-    for node in ast.walk(test_tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if node.name.startswith('test_'):
-                test_functions.add(node.name)
-
-    # Check if each public function has a corresponding test
-    for func_name in public_functions:
-        expected_test_names = [
-            f"test_{func_name}",
-            f"test_{func_name}_success",
-            f"test_{func_name}_basic",
-        ]
-
-        has_test = any(test_name in test_functions for test_name in expected_test_names)
-
-        if not has_test:
-            violations.append(CodeViolation(
-                file_path=str(source_path),
-                line=1,
-                column=0,
-                violation_type='missing_test',
-                message=f"No test found for function '{func_name}'",
-                severity='medium',
-                suggestion=f"Add test_{func_name}() to {test_path}"
-            ))
 
-    return violations
+# ============================================================================
+# File-level validation
+# ============================================================================
 
+def _empty_results() -> Dict[str, List[CodeViolation]]:
+    """Return a result dict with every category present and empty."""
+    return {category: [] for category in VALIDATION_CATEGORIES}
 
-def validate_code_file(file_path: str) -> Dict[str, List[CodeViolation]]:
+
+def validate_code_file(
+    file_path: str,
+    test_directory: str = 'tests'
+) -> Dict[str, List[CodeViolation]]:
     """Run all validators on a code file.
 
-    Convenience function that runs all available validators on a file
-    and returns categorized results.
+    Reads the file once and runs every rule in a single traversal of its
+    (cached) parse tree.
 
     Args:
         file_path: Path to Python source file
+        test_directory: Directory containing test files
 
     Returns:
         Dictionary with violation categories:
@@ -496,30 +770,58 @@ def validate_code_file(file_path: str) -> Dict[str, List[CodeViolation]]:
 
     if not path.exists():
         logger.error(f"File not found: {file_path}")
-        return {
-            'stubs': [],
-            'hardcoded': [],
-            'docstrings': [],
-            'tests': []
-        }
+        return _empty_results()
 
     # Read file
     try:
-        with open(path, 'r') as f:
-            code = f.read()
+        code = path.read_text()
     except OSError as e:
         logger.error(f"Failed to read file: {e}")
-        return {
-            'stubs': [],
-            'hardcoded': [],
-            'docstrings': [],
-            'tests': []
-        }
+        return _empty_results()
+
+    results = _empty_results()
+    results.update(analyze_code(code, str(path), default_rules(str(path), test_directory)))
+    return results
+
+
+def _validate_code_file_worker(args: Tuple[str, str]) -> Dict[str, List[CodeViolation]]:
+    """Process pool entry point for validate_code_files()."""
+    file_path, test_directory = args
+    return validate_code_file(file_path, test_directory)
+
+
+def validate_code_files(
+    file_paths: Iterable[str],
+    test_directory: str = 'tests',
+    parallel: bool = True,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, List[CodeViolation]]]:
+    """Run all validators on a batch of files (e.g. every file a task touched).
 
-    # Run validators
-    return {
-        'stubs': detect_stubs(code, str(path)),
-        'hardcoded': detect_hardcoded_values(code, str(path)),
-        'docstrings': check_docstring_coverage(code, str(path)),
-        'tests': check_test_coverage(str(path))
-    }
+    Files are validated in a process pool when ``parallel`` is set and the
+    batch is large enough to amortize worker startup; otherwise (or if the
+    pool cannot be used) they are validated serially in this process.
+
+    Args:
+        file_paths: Paths to Python source files
+        test_directory: Directory containing test files
+        parallel: Use a process pool for large batches
+        max_workers: Pool size (default: ProcessPoolExecutor default)
+
+    Returns:
+        Dictionary mapping each file path to its validate_code_file() results
+    """
+    paths = list(dict.fromkeys(str(p) for p in file_paths))
+
+    if parallel and len(paths) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = pool.map(
+                    _validate_code_file_worker,
+                    [(p, test_directory) for p in paths]
+                )
+                return dict(zip(paths, results))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Parallel validation unavailable, falling back to serial: {e}")
+
+    return {p: validate_code_file(p, test_directory) for p in paths}
@@ -10,8 +10,10 @@ Features:
 - Token counting approximation using tiktoken
 - Performance metrics tracking
 - Health checking
+- Async generation via httpx (optional) for the asyncio orchestrator
 """
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -26,6 +28,13 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from src.llm.prompt_segments import PrefixCacheStats
 from src.plugins.base import LLMPlugin
 from src.plugins.registry import register_llm
 from src.plugins.exceptions import (
@@ -91,6 +100,10 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
         # M9: Retry manager (initialized in initialize())
         self.retry_manager: Optional[RetryManager] = None
 
+        # Async HTTP client, bound to the event loop that created it
+        self._async_client = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Performance metrics
         self.metrics = {
             'calls': 0,
@@ -102,6 +115,12 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
             'timeouts': 0
         }
 
+        # Prompt prefix reuse. Ollama reuses the KV state of the previous
+        # request's common prefix while the model stays loaded (keep_alive),
+        # so a segmented prompt whose prefix matches the last one skips
+        # re-evaluating it.
+        self.prefix_cache_stats = PrefixCacheStats()
+
         # Token encoder (use tiktoken if available, fallback to approximation)
         self._encoder = None
         if TIKTOKEN_AVAILABLE:
@@ -360,7 +379,27 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
             LLMException: If generation fails
             LLMTimeoutException: If generation times out
         """
-        # Build request payload
+        payload = self._build_generate_payload(prompt, kwargs)
+
+        # Make request with retry logic
+        response_text = self._make_request_with_retry(
+            endpoint='/api/generate',
+            payload=payload
+        )
+
+        return response_text
+
+    def _build_generate_payload(self, prompt: str, kwargs: dict) -> dict:
+        """Build an /api/generate request body.
+
+        Args:
+            prompt: Input prompt
+            kwargs: Generation parameters
+
+        Returns:
+            Request payload dict
+        """
+        self._track_prompt_prefix(prompt)
         payload = {
             'model': self.model,
             'prompt': prompt,
@@ -384,14 +423,155 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
         # Log payload for debugging
         logger.debug(f"LLM request payload: model={payload['model']}, temp={payload['options'].get('temperature')}, max_tokens={payload['options'].get('num_predict')}, stop={payload['options'].get('stop', 'none')}")
 
-        # Make request with retry logic
-        response_text = self._make_request_with_retry(
-            endpoint='/api/generate',
-            payload=payload
-        )
+        return payload
+
+    def _track_prompt_prefix(self, prompt: str) -> None:
+        """Record the prefix of a segmented prompt about to be sent."""
+        prefix_hash = getattr(prompt, 'prefix_hash', None)
+        if prefix_hash:
+            self.prefix_cache_stats.record(prefix_hash)
+
+    def _parse_generate_response(self, data: dict) -> str:
+        """Extract the generated text from an /api/generate response body.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Generated text
+
+        Raises:
+            LLMResponseException: If the response is missing or malformed
+        """
+        if 'response' not in data:
+            raise LLMResponseException(
+                provider='ollama',
+                details=f"Missing 'response' field in response: {data}"
+            )
+
+        response_text = data['response']
+
+        # Log response details for debugging
+        logger.info(f"LLM response length: {len(response_text)} chars")
+        logger.info(f"LLM done_reason: {data.get('done_reason', 'unknown')}")
+        if len(response_text) < 300:
+            logger.warning(f"Short LLM response ({len(response_text)} chars): {response_text}")
+
+        if not response_text or not isinstance(response_text, str):
+            raise LLMResponseException(
+                provider='ollama',
+                details=f"Invalid response text: {response_text}"
+            )
 
         return response_text
 
+    async def agenerate(
+        self,
+        prompt: str,
+        **kwargs
+    ) -> str:
+        """Generate text completion without blocking the event loop.
+
+        Uses an httpx.AsyncClient when httpx is installed; otherwise falls
+        back to running generate() in a worker thread. Async requests share
+        the retry policy and metrics with generate() but bypass the response
+        cache, as generate_stream() does.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Same as generate()
+
+        Returns:
+            Generated text as string
+
+        Raises:
+            LLMException: If generation fails
+            LLMTimeoutException: If generation times out
+            LLMResponseException: If response invalid
+
+        Example:
+            >>> response = await llm.agenerate("Explain this code:", max_tokens=500)
+        """
+        if not HTTPX_AVAILABLE:
+            return await super().agenerate(prompt, **kwargs)
+
+        start_time = time.time()
+        self.metrics['calls'] += 1
+        self.metrics['cache_misses'] += 1
+        payload = self._build_generate_payload(prompt, kwargs)
+
+        try:
+            if self.retry_manager:
+                response = await self.retry_manager.aexecute(self._apost_generate, payload)
+            else:
+                response = await self._apost_generate(payload)
+        except Exception as e:
+            self.metrics['errors'] += 1
+            logger.error(f"Async generation failed: {e}")
+            raise
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        self.metrics['total_latency_ms'] += elapsed_ms
+        tokens = self.estimate_tokens(response)
+        self.metrics['total_tokens'] += tokens
+
+        logger.debug(f"Generated {tokens} tokens in {elapsed_ms:.1f}ms (async)")
+        return response
+
+    async def _apost_generate(self, payload: dict) -> str:
+        """Single async /api/generate request (for retry manager)."""
+        url = f"{self.endpoint}/api/generate"
+        try:
+            response = await self._get_async_client().post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+
+        except httpx.TimeoutException as e:
+            self.metrics['timeouts'] += 1
+            raise LLMTimeoutException(
+                provider='ollama',
+                model=self.model,
+                timeout_seconds=self.timeout
+            ) from e
+
+        except httpx.HTTPError as e:
+            raise LLMException(
+                f"Request failed: {e}",
+                context={'endpoint': url},
+                recovery='Check Ollama service status'
+            ) from e
+
+        except json.JSONDecodeError as e:
+            raise LLMResponseException(
+                provider='ollama',
+                details=f"Failed to parse response: {e}"
+            ) from e
+
+        return self._parse_generate_response(data)
+
+    def _get_async_client(self):
+        """Get the httpx.AsyncClient for the running event loop.
+
+        httpx connection pools are bound to the loop they were created on, so
+        a new client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout)
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created.
+
+        Example:
+            >>> await llm.aclose()
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
     def generate_stream(
         self,
         prompt: str,
@@ -420,6 +600,7 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
         self.metrics['calls'] += 1
 
         # Build request payload
+        self._track_prompt_prefix(prompt)
         payload = {
             'model': self.model,
             'prompt': prompt,
@@ -529,28 +710,7 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
 
                 # Parse response
                 data = response.json()
-
-                if 'response' not in data:
-                    raise LLMResponseException(
-                        provider='ollama',
-                        details=f"Missing 'response' field in response: {data}"
-                    )
-
-                response_text = data['response']
-
-                # Log response details for debugging
-                logger.info(f"LLM response length: {len(response_text)} chars")
-                logger.info(f"LLM done_reason: {data.get('done_reason', 'unknown')}")
-                if len(response_text) < 300:
-                    logger.warning(f"Short LLM response ({len(response_text)} chars): {response_text}")
-
-                if not response_text or not isinstance(response_text, str):
-                    raise LLMResponseException(
-                        provider='ollama',
-                        details=f"Invalid response text: {response_text}"
-                    )
-
-                return response_text
+                return self._parse_generate_response(data)
 
             except requests.exceptions.Timeout as e:
                 self.metrics['timeouts'] += 1
@@ -782,6 +942,9 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
                 - avg_latency_ms: Average latency per call
                 - tokens_per_second: Average generation speed
                 - cache_hit_rate: Cache hit rate (0.0-1.0)
+                - prefix_reuses: Segmented prompts sent with the same prefix
+                  as the previous one (KV state reusable)
+                - prefix_reuse_rate: prefix_reuses per segmented prompt
 
         Example:
             >>> metrics = llm.get_metrics()
@@ -808,4 +971,8 @@ class LocalLLMInterface(LLMPlugin):  # pylint: disable=too-many-instance-attribu
         else:
             metrics['cache_hit_rate'] = 0.0
 
+        prefix_report = self.prefix_cache_stats.report()
+        metrics['prefix_reuses'] = prefix_report['prefix_reuses']
+        metrics['prefix_reuse_rate'] = prefix_report['prefix_reuse_rate']
+
         return metrics
@@ -10,14 +10,17 @@ Key Features:
 - Token budget awareness with automatic truncation
 - Prompt optimization to reduce token count
 - Few-shot example injection from pattern learning
-- Template validation and caching
+- Template validation and caching (bounded LRU prompt cache, optional
+  on-disk bytecode cache for compiled templates)
+- Segmented templates rendered stable-prefix first (see prompt_segments)
 - Preview functionality for debugging
 """
 
-import hashlib
 import logging
 import re
+import threading
 import yaml
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
@@ -28,6 +31,7 @@ from jinja2 import Environment, FileSystemLoader, Template, TemplateError
 from jinja2.exceptions import TemplateNotFound, UndefinedError
 
 from src.core.exceptions import StateManagerException
+from src.llm.prompt_segments import SEGMENT_ORDER, SEGMENT_SEPARATOR, SegmentedPrompt
 # Note: StructuredPromptBuilder is being created in parallel (TASK_3.2)
 from src.llm.structured_prompt_builder import StructuredPromptBuilder
 
@@ -37,6 +41,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _fingerprint(value: Any) -> Any:
+    """Build a hashable, cheap-to-compare cache key component for a value.
+
+    Every component is tagged with its type, so values that compare equal
+    but render differently (True, 1 and 1.0; {1: ...} and {'1': ...};
+    [1] and (1,)) get different keys. Strings are used as they are, however
+    long: str objects cache their hash, and a dict lookup only compares
+    contents when hashes match and the objects differ, so repeatedly passing
+    the same context string costs O(1) after the first call while a hash
+    collision can never return another prompt. Containers are fingerprinted
+    recursively, other objects by their repr().
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return (type(value).__name__, value)
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted(
+            ((_fingerprint(k), _fingerprint(v)) for k, v in value.items()),
+            key=lambda item: repr(item[0])
+        )))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_fingerprint(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value).__name__, tuple(sorted(
+            (_fingerprint(v) for v in value), key=repr
+        )))
+    return ('repr', type(value).__name__, repr(value))
+
+
 class PromptGeneratorException(Exception):
     """Base exception for PromptGenerator errors."""
 
@@ -154,6 +186,7 @@ class PromptGenerator:
         'max_context_tokens': 100000,
         'summarization_threshold': 50000,
         'cache_size': 100,
+        'bytecode_cache_dir': None,  # Directory for compiled templates (None = memory only)
         'optimization_target': 0.20,  # 20% reduction target
         'context_priority_order': [
             'current_task_description',
@@ -197,6 +230,9 @@ class PromptGenerator:
         # Load templates from YAML
         self.templates_yaml_path = self.template_dir / 'prompt_templates.yaml'
         self.templates: Dict[str, str] = {}
+        # Segmented templates: name -> segment names, sources under 'name/segment'
+        self.segmented_templates: Dict[str, Tuple[str, ...]] = {}
+        self._segment_sources: Dict[str, str] = {}
         self._load_templates_from_yaml()
 
         # Load hybrid prompt templates configuration (PHASE_6 TASK_6.1)
@@ -205,25 +241,34 @@ class PromptGenerator:
         self.template_modes: Dict[str, str] = {}
         self._load_hybrid_templates_config()
 
-        # Create Jinja2 environment with custom filters
+        # Create Jinja2 environment with custom filters. Compiled templates
+        # are kept in the environment; with bytecode_cache_dir set they are
+        # also written to disk so later processes skip compilation.
         self.env = Environment(
-            loader=jinja2.DictLoader(self.templates),
+            loader=jinja2.ChoiceLoader([
+                jinja2.DictLoader(self.templates),
+                jinja2.DictLoader(self._segment_sources)
+            ]),
             autoescape=False,  # Don't escape for text prompts
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            cache_size=max(400, len(self.templates) + len(self._segment_sources)),
+            bytecode_cache=self._create_bytecode_cache()
         )
 
         # Register custom filters
         self._register_custom_filters()
 
-        # Cache for rendered prompts
-        self._prompt_cache: Dict[str, str] = {}
+        # Bounded LRU cache for rendered prompts
+        self._prompt_cache: 'OrderedDict[Tuple, str]' = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         # Statistics
         self.stats = {
             'prompts_generated': 0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'cache_evictions': 0,
             'optimizations_applied': 0,
             'total_tokens_saved': 0
         }
@@ -256,9 +301,15 @@ class PromptGenerator:
                     context={'path': str(self.templates_yaml_path)}
                 )
 
+            for name, source in data.items():
+                if isinstance(source, dict):
+                    data[name] = self._register_segmented_template(name, source)
+
             self.templates = data
             logger.info(f"Loaded {len(self.templates)} templates from YAML")
 
+        except PromptGeneratorException:
+            raise
         except yaml.YAMLError as e:
             raise PromptGeneratorException(
                 f"Failed to parse template YAML: {e}",
@@ -270,6 +321,37 @@ class PromptGenerator:
                 context={'path': str(self.templates_yaml_path)}
             ) from e
 
+    def _register_segmented_template(self, name: str, segments: Dict[str, str]) -> str:
+        """Register a template defined as a mapping of prompt segments.
+
+        Each segment is compiled as its own template ('name/segment') and
+        rendered in SEGMENT_ORDER, so the stable segments form a prefix
+        that doesn't change when only the task or context does.
+
+        Args:
+            name: Template name
+            segments: Segment name -> template source
+
+        Returns:
+            Combined source of all segments (for validation and preview)
+
+        Raises:
+            PromptGeneratorException: If a segment name is unknown
+        """
+        unknown = set(segments) - set(SEGMENT_ORDER)
+        if unknown:
+            raise PromptGeneratorException(
+                f"Template '{name}' has unknown segments: {', '.join(sorted(unknown))} "
+                f"(expected: {', '.join(SEGMENT_ORDER)})",
+                context={'template': name, 'path': str(self.templates_yaml_path)}
+            )
+
+        order = tuple(segment for segment in SEGMENT_ORDER if segment in segments)
+        self.segmented_templates[name] = order
+        for segment in order:
+            self._segment_sources[f'{name}/{segment}'] = segments[segment] or ''
+        return SEGMENT_SEPARATOR.join(segments[segment] or '' for segment in order)
+
     def _load_hybrid_templates_config(self) -> None:
         """Load hybrid prompt templates configuration (PHASE_6 TASK_6.1).
 
@@ -320,6 +402,26 @@ class PromptGenerator:
                 f"Failed to load hybrid templates config: {e}. Using defaults."
             )
 
+    def _create_bytecode_cache(self) -> Optional[jinja2.FileSystemBytecodeCache]:
+        """Create the on-disk bytecode cache if bytecode_cache_dir is set.
+
+        Entries are validated against a checksum of the template source, so
+        edited templates are recompiled automatically.
+
+        Returns:
+            FileSystemBytecodeCache, or None if disabled or not writable
+        """
+        cache_dir = self.config.get('bytecode_cache_dir')
+        if not cache_dir:
+            return None
+        try:
+            path = Path(cache_dir).expanduser()
+            path.mkdir(parents=True, exist_ok=True)
+            return jinja2.FileSystemBytecodeCache(str(path))
+        except OSError as e:
+            logger.warning(f"Template bytecode cache disabled ({cache_dir}): {e}")
+            return None
+
     def _register_custom_filters(self) -> None:
         """Register custom Jinja2 filters."""
         self.env.filters['truncate'] = self._filter_truncate
@@ -568,7 +670,8 @@ class PromptGenerator:
             **kwargs: Additional options (passed to template rendering)
 
         Returns:
-            Generated prompt string
+            Generated prompt string; a SegmentedPrompt (with prefix_hash)
+            for templates defined as segments
 
         Raises:
             TemplateNotFound: If template doesn't exist
@@ -582,14 +685,21 @@ class PromptGenerator:
         """
         self.stats['prompts_generated'] += 1
 
-        # Create cache key
-        cache_key = self._make_cache_key(template_name, variables, kwargs)
-
         # Check cache
-        if enable_caching and cache_key in self._prompt_cache:
-            self.stats['cache_hits'] += 1
-            logger.debug(f"Cache hit for template '{template_name}'")
-            return self._prompt_cache[cache_key]
+        cache_key = None
+        if enable_caching:
+            cache_key = self._make_cache_key(
+                template_name, variables, kwargs,
+                max_tokens if enable_optimization else None
+            )
+            with self._cache_lock:
+                cached = self._prompt_cache.get(cache_key)
+                if cached is not None:
+                    self._prompt_cache.move_to_end(cache_key)
+                    self.stats['cache_hits'] += 1
+            if cached is not None:
+                logger.debug(f"Cache hit for template '{template_name}'")
+                return cached
 
         self.stats['cache_misses'] += 1
 
@@ -600,8 +710,14 @@ class PromptGenerator:
             # Merge variables with kwargs
             all_vars = {**variables, **kwargs}
 
-            # Render template
-            prompt = template.render(**all_vars)
+            # Render template (segment by segment, stable prefix first)
+            if template_name in self.segmented_templates:
+                prompt = SegmentedPrompt({
+                    segment: self.env.get_template(f'{template_name}/{segment}').render(**all_vars)
+                    for segment in self.segmented_templates[template_name]
+                })
+            else:
+                prompt = template.render(**all_vars)
 
             # Apply optimization if requested
             if enable_optimization and max_tokens:
@@ -609,12 +725,14 @@ class PromptGenerator:
 
             # Cache result
             if enable_caching:
-                self._prompt_cache[cache_key] = prompt
+                self._cache_prompt(cache_key, prompt)
 
-            logger.debug(
-                f"Generated prompt from template '{template_name}' "
-                f"({self.llm_interface.estimate_tokens(prompt)} tokens)"
-            )
+            # Token counting can be expensive; only do it for the debug log
+            if logger.isEnabledFor(logging.DEBUG) and self.llm_interface:
+                logger.debug(
+                    f"Generated prompt from template '{template_name}' "
+                    f"({self.llm_interface.estimate_tokens(prompt)} tokens)"
+                )
 
             return prompt
 
@@ -633,28 +751,45 @@ class PromptGenerator:
         self,
         template_name: str,
         variables: Dict[str, Any],
-        kwargs: Dict[str, Any]
-    ) -> str:
+        kwargs: Dict[str, Any],
+        max_tokens: Optional[int] = None
+    ) -> Tuple:
         """Create cache key from template and variables.
 
+        Large string variables are part of the key as they are instead of
+        being serialized, so the cost doesn't grow with the context size.
+
         Args:
             template_name: Template name
             variables: Variables dict
             kwargs: Additional kwargs
+            max_tokens: Token budget the prompt is optimized for (if any)
 
         Returns:
-            Hash string for caching
+            Hashable key tuple for caching
         """
-        # Create deterministic string from inputs
-        key_data = {
-            'template': template_name,
-            'variables': variables,
-            'kwargs': kwargs
-        }
+        return (
+            template_name,
+            max_tokens,
+            _fingerprint({**variables, **kwargs})
+        )
 
-        # Convert to JSON-like string and hash
-        key_str = str(sorted(key_data.items()))
-        return hashlib.sha256(key_str.encode()).hexdigest()
+    def _cache_prompt(self, cache_key: Tuple, prompt: str) -> None:
+        """Store a rendered prompt, evicting the least recently used entry.
+
+        Args:
+            cache_key: Key from _make_cache_key()
+            prompt: Rendered prompt
+        """
+        max_entries = self.config['cache_size']
+        if max_entries <= 0:
+            return
+        with self._cache_lock:
+            self._prompt_cache[cache_key] = prompt
+            self._prompt_cache.move_to_end(cache_key)
+            while len(self._prompt_cache) > max_entries:
+                self._prompt_cache.popitem(last=False)
+                self.stats['cache_evictions'] += 1
 
     def optimize_for_tokens(self, prompt: str, max_tokens: int) -> str:
         """Optimize prompt to fit within token budget.
@@ -967,7 +1102,8 @@ class PromptGenerator:
         Example:
             >>> generator.clear_cache()
         """
-        self._prompt_cache.clear()
+        with self._cache_lock:
+            self._prompt_cache.clear()
         logger.info("Prompt cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -979,11 +1115,14 @@ class PromptGenerator:
                 - cache_hits: Number of cache hits
                 - cache_misses: Number of cache misses
                 - cache_hit_rate: Cache hit rate (0.0-1.0)
+                - cache_evictions: Prompts dropped from the bounded cache
+                - cache_entries: Prompts currently cached
                 - optimizations_applied: Number of optimizations
                 - total_tokens_saved: Total tokens saved by optimization
                 - avg_tokens_saved: Average tokens saved per optimization
         """
         stats = self.stats.copy()
+        stats['cache_entries'] = len(self._prompt_cache)
 
         # Calculate derived metrics
         total_requests = stats['cache_hits'] + stats['cache_misses']
@@ -7,14 +7,21 @@ This module provides the PromptRuleEngine class which manages prompt engineering
 - Validates responses against rules
 - Logs violations to StateManager
 
+Loaded rules are kept in an immutable snapshot that also holds precomputed
+RulePayloads (serialized rules and pre-rendered JSON) for single domains and
+the default domain combinations of each prompt type. Reads never lock;
+(re)loading builds a new snapshot and swaps it in with one assignment.
+
 Part of the LLM-first prompt engineering framework (PHASE_2).
 """
 
+import json
 import logging
 import yaml
+from dataclasses import dataclass, field
 from pathlib import Path
 from threading import RLock
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
 
 from src.llm.prompt_rule import PromptRule
 from src.llm.rule_validation_result import RuleValidationResult
@@ -22,6 +29,92 @@ from src.core.exceptions import StateManagerException
 
 logger = logging.getLogger(__name__)
 
+# Validator signature: (rule, response, result) -> None
+RuleValidator = Callable[[PromptRule, Dict[str, Any], RuleValidationResult], None]
+
+
+@dataclass(frozen=True, eq=False)
+class RulePayload:
+    """Precomputed rules for a combination of domains.
+
+    Built once per rules load and shared by every reader, so treat the
+    entries as read-only.
+
+    Attributes:
+        domains: Domains in request order
+        rules: Rules of those domains, in domain order
+        entries: Serialized rules (id, name, description, severity,
+            validation_type, domain) ready for prompt metadata
+        text: Pre-rendered JSON of the entries (indent=2, sorted keys)
+        by_validation_type: validation_type -> rules of that type
+    """
+
+    domains: Tuple[str, ...]
+    rules: Tuple[PromptRule, ...]
+    entries: Tuple[Dict[str, Any], ...]
+    text: str
+    by_validation_type: Dict[str, Tuple[PromptRule, ...]] = field(repr=False)
+
+    @classmethod
+    def build(cls, domains: Tuple[str, ...], rules: Iterable[PromptRule]) -> 'RulePayload':
+        """Serialize and index rules for the given domains."""
+        rules = tuple(rules)
+        entries = tuple(
+            {
+                'id': rule.id,
+                'name': rule.name,
+                'description': rule.description,
+                'severity': rule.severity,
+                'validation_type': rule.validation_type,
+                'domain': rule.domain
+            }
+            for rule in rules
+        )
+        by_type: Dict[str, List[PromptRule]] = {}
+        for rule in rules:
+            by_type.setdefault(rule.validation_type, []).append(rule)
+        return cls(
+            domains=domains,
+            rules=rules,
+            entries=entries,
+            text=json.dumps(list(entries), indent=2, ensure_ascii=False, sort_keys=True),
+            by_validation_type={key: tuple(value) for key, value in by_type.items()}
+        )
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+class _RuleSnapshot:
+    """Immutable view of one rules load (payloads for new combinations are memoized)."""
+
+    __slots__ = ('rules', 'rules_by_domain', 'payloads', 'loaded')
+
+    def __init__(
+        self,
+        rules: Dict[str, PromptRule],
+        rules_by_domain: Dict[str, Tuple[PromptRule, ...]],
+        loaded: bool
+    ):
+        self.rules = rules
+        self.rules_by_domain = rules_by_domain
+        self.payloads: Dict[Tuple[str, ...], RulePayload] = {}
+        self.loaded = loaded
+
+    def payload(self, domains: Tuple[str, ...]) -> RulePayload:
+        payload = self.payloads.get(domains)
+        if payload is None:
+            payload = RulePayload.build(
+                domains,
+                (rule for domain in domains for rule in self.rules_by_domain.get(domain, ()))
+            )
+            # Concurrent builders produce equal payloads; last write wins
+            self.payloads[domains] = payload
+        return payload
+
+
+_EMPTY_SNAPSHOT = _RuleSnapshot({}, {}, loaded=False)
+
 
 class PromptRuleEngine:
     """Manages loading, filtering, and validation of prompt engineering rules.
@@ -33,7 +126,8 @@ class PromptRuleEngine:
     - Validates LLM responses against applicable rules
     - Logs rule violations to StateManager for learning
 
-    Thread-safe with internal locking for concurrent access.
+    Thread-safe: readers use the current immutable snapshot without locking;
+    loads are serialized and publish a new snapshot atomically.
 
     Example:
         >>> engine = PromptRuleEngine(rules_file_path='config/prompt_rules.yaml')
@@ -56,6 +150,16 @@ class PromptRuleEngine:
         ... )
     """
 
+    # Domains whose rules apply to each prompt type (payloads precomputed at load)
+    DEFAULT_DOMAINS: Dict[str, Tuple[str, ...]] = {
+        'task_execution': ('code_generation', 'testing', 'documentation', 'security'),
+        'validation': ('code_generation', 'testing'),
+        'error_analysis': ('error_handling', 'performance'),
+        'decision': (),  # No specific rules for decision prompts
+        'planning': ('code_generation', 'parallel_agents'),
+        'code_review': ('code_generation', 'security', 'performance')
+    }
+
     def __init__(
         self,
         rules_file_path: str = 'config/prompt_rules.yaml',
@@ -73,20 +177,39 @@ class PromptRuleEngine:
         """
         self.rules_file_path = Path(rules_file_path)
         self.state_manager = state_manager
-        self._lock = RLock()
+        self._lock = RLock()  # Serializes loads only; reads use the snapshot
 
-        # Internal storage
-        self._rules: Dict[str, PromptRule] = {}  # rule_id -> PromptRule
-        self._rules_by_domain: Dict[str, List[PromptRule]] = {}  # domain -> [rules]
-        self._rules_loaded = False
+        # Current rules; replaced as a whole on (re)load
+        self._snapshot = _EMPTY_SNAPSHOT
+
+        # validation_type -> validator
+        self._validators: Dict[str, RuleValidator] = {
+            'basic_check': self._basic_validation
+        }
 
         logger.info(f"PromptRuleEngine initialized with rules file: {rules_file_path}")
 
+    @property
+    def _rules(self) -> Dict[str, PromptRule]:
+        """rule_id -> PromptRule of the current snapshot."""
+        return self._snapshot.rules
+
+    @property
+    def _rules_by_domain(self) -> Dict[str, Tuple[PromptRule, ...]]:
+        """domain -> rules of the current snapshot."""
+        return self._snapshot.rules_by_domain
+
+    @property
+    def _rules_loaded(self) -> bool:
+        return self._snapshot.loaded
+
     def load_rules_from_yaml(self) -> int:
         """Load rules from YAML configuration file.
 
-        Parses the YAML file, creates PromptRule objects, and organizes them
-        by domain for efficient filtering.
+        Parses the YAML file, creates PromptRule objects, organizes them by
+        domain and precomputes payloads for each domain and for the default
+        domains of each prompt type. The new rules replace the old ones only
+        once fully loaded, so concurrent readers see either set, never a mix.
 
         Returns:
             Number of rules loaded
@@ -117,10 +240,8 @@ class PromptRuleEngine:
 
             rules_data = data['rules']
             rule_count = 0
-
-            # Clear existing rules
-            self._rules.clear()
-            self._rules_by_domain.clear()
+            rules: Dict[str, PromptRule] = {}
+            rules_by_domain: Dict[str, Tuple[PromptRule, ...]] = {}
 
             # Load rules from each domain
             for domain, rule_list in rules_data.items():
@@ -146,7 +267,7 @@ class PromptRuleEngine:
                             continue
 
                         # Store rule
-                        self._rules[rule.id] = rule
+                        rules[rule.id] = rule
                         domain_rules.append(rule)
                         rule_count += 1
 
@@ -156,12 +277,19 @@ class PromptRuleEngine:
 
                 # Store domain rules
                 if domain_rules:
-                    self._rules_by_domain[domain] = domain_rules
+                    rules_by_domain[domain] = tuple(domain_rules)
 
-            self._rules_loaded = True
+            snapshot = _RuleSnapshot(rules, rules_by_domain, loaded=True)
+            for domain in rules_by_domain:
+                snapshot.payload((domain,))
+            for domains in self.DEFAULT_DOMAINS.values():
+                snapshot.payload(domains)
+
+            # Publish atomically
+            self._snapshot = snapshot
             logger.info(
                 f"Successfully loaded {rule_count} rules across "
-                f"{len(self._rules_by_domain)} domains"
+                f"{len(rules_by_domain)} domains"
             )
 
             return rule_count
@@ -188,20 +316,42 @@ class PromptRuleEngine:
             ...     severity_filter=['critical']
             ... )
         """
-        with self._lock:
-            if not self._rules_loaded:
-                logger.warning("Rules not loaded yet, call load_rules_from_yaml() first")
-                return []
+        snapshot = self._snapshot
+        if not snapshot.loaded:
+            logger.warning("Rules not loaded yet, call load_rules_from_yaml() first")
+            return []
 
-            domain_rules = self._rules_by_domain.get(domain, [])
+        domain_rules = snapshot.rules_by_domain.get(domain, ())
+
+        if severity_filter:
+            return [
+                rule for rule in domain_rules
+                if rule.severity in severity_filter
+            ]
 
-            if severity_filter:
-                domain_rules = [
-                    rule for rule in domain_rules
-                    if rule.severity in severity_filter
-                ]
+        return list(domain_rules)
 
-            return domain_rules
+    def get_rule_payload(self, domains: Iterable[str]) -> RulePayload:
+        """Get the precomputed rules for a combination of domains.
+
+        Payloads for single domains and for DEFAULT_DOMAINS combinations
+        are built at load time; other combinations are built on first use
+        and reused until the next load.
+
+        Args:
+            domains: Domain names, in the order rules should appear
+
+        Returns:
+            RulePayload (empty if rules aren't loaded)
+
+        Example:
+            >>> payload = engine.get_rule_payload(['code_generation', 'security'])
+            >>> metadata['rules'] = list(payload.entries)
+        """
+        snapshot = self._snapshot
+        if not snapshot.loaded:
+            logger.warning("Rules not loaded yet, call load_rules_from_yaml() first")
+        return snapshot.payload(tuple(domains))
 
     def get_rule_by_id(self, rule_id: str) -> Optional[PromptRule]:
         """Get a specific rule by ID.
@@ -217,8 +367,7 @@ class PromptRuleEngine:
             >>> if rule:
             ...     print(rule.name)
         """
-        with self._lock:
-            return self._rules.get(rule_id)
+        return self._snapshot.rules.get(rule_id)
 
     def get_all_rules(self) -> List[PromptRule]:
         """Get all loaded rules.
@@ -230,8 +379,7 @@ class PromptRuleEngine:
             >>> all_rules = engine.get_all_rules()
             >>> print(f"Total rules: {len(all_rules)}")
         """
-        with self._lock:
-            return list(self._rules.values())
+        return list(self._snapshot.rules.values())
 
     def apply_rules_to_prompt(
         self,
@@ -265,56 +413,54 @@ class PromptRuleEngine:
             ... )
             >>> assert 'rules' in prompt_with_rules
         """
-        with self._lock:
-            if not self._rules_loaded:
-                logger.warning("Rules not loaded, skipping rule injection")
-                return prompt
-
-            # Determine domains if not specified
-            if domains is None:
-                domains = self._get_default_domains_for_prompt_type(prompt_type)
-
-            # Collect applicable rules
-            applicable_rules = []
-            for domain in domains:
-                domain_rules = self.get_rules_for_domain(domain)
-                applicable_rules.extend(domain_rules)
-
-            # Inject rules into prompt
-            prompt_copy = prompt.copy()
-            prompt_copy['rules'] = [
-                {
-                    'id': rule.id,
-                    'name': rule.name,
-                    'description': rule.description,
-                    'severity': rule.severity,
-                    'validation_type': rule.validation_type
-                }
-                for rule in applicable_rules
-            ]
+        if not self._snapshot.loaded:
+            logger.warning("Rules not loaded, skipping rule injection")
+            return prompt
+
+        # Determine domains if not specified
+        if domains is None:
+            domains = self._get_default_domains_for_prompt_type(prompt_type)
+
+        # Inject precomputed rules into prompt
+        payload = self.get_rule_payload(domains)
+        prompt_copy = prompt.copy()
+        prompt_copy['rules'] = list(payload.entries)
+
+        logger.debug(
+            f"Injected {len(payload)} rules into {prompt_type} prompt "
+            f"from domains: {domains}"
+        )
 
-            logger.debug(
-                f"Injected {len(applicable_rules)} rules into {prompt_type} prompt "
-                f"from domains: {domains}"
-            )
+        return prompt_copy
 
-            return prompt_copy
+    def register_validator(self, validation_type: str, validator: RuleValidator) -> None:
+        """Register the validator for rules of a validation type.
+
+        Args:
+            validation_type: PromptRule.validation_type to handle (e.g. 'regex')
+            validator: Callable (rule, response, result) that adds violations
+                to the RuleValidationResult
+        """
+        self._validators = {**self._validators, validation_type: validator}
 
     def validate_response_against_rules(
         self,
         response: Dict[str, Any],
-        applicable_rules: List[PromptRule],
+        applicable_rules: Union[RulePayload, List[PromptRule]],
         context: Optional[Dict[str, Any]] = None
     ) -> RuleValidationResult:
         """Validate LLM response against applicable rules.
 
-        Checks the response for violations of the provided rules.
-        Currently performs basic validation; advanced validation (AST checks, etc.)
-        requires code_validators module (TASK_2.4).
+        Checks the response for violations of the provided rules. Rules are
+        grouped by validation_type (precomputed for a RulePayload) and each
+        group is dispatched to its registered validator; types without a
+        validator are only marked as checked. Currently performs basic
+        validation; advanced validation (AST checks, etc.) requires
+        code_validators module (TASK_2.4).
 
         Args:
             response: LLM response dictionary
-            applicable_rules: List of rules to validate against
+            applicable_rules: RulePayload or list of rules to validate against
             context: Optional context with task_id, file_paths, etc.
 
         Returns:
@@ -330,31 +476,43 @@ class PromptRuleEngine:
             >>> if result.has_violations():
             ...     print(result.get_summary())
         """
-        with self._lock:
-            result = RuleValidationResult(
-                metadata=context or {}
-            )
-
-            for rule in applicable_rules:
-                # Mark rule as checked
-                result.mark_rule_checked(rule.id)
-
-                # Perform validation based on type
-                # Note: Advanced validation (AST, regex, etc.) will be added in TASK_2.4
-                if rule.validation_type == 'basic_check':
-                    # Basic validation - check if response has expected structure
-                    self._basic_validation(rule, response, result)
+        result = RuleValidationResult(
+            metadata=context or {}
+        )
 
-            # Log violations to StateManager if configured
-            if self.state_manager and result.has_violations() and context:
-                task_id = context.get('task_id')
-                if task_id:
-                    self._log_violations_to_state_manager(
-                        task_id=task_id,
-                        violations=result.violations
-                    )
+        if isinstance(applicable_rules, RulePayload):
+            rules = applicable_rules.rules
+            by_validation_type = applicable_rules.by_validation_type
+        else:
+            rules = applicable_rules
+            grouped: Dict[str, List[PromptRule]] = {}
+            for rule in rules:
+                grouped.setdefault(rule.validation_type, []).append(rule)
+            by_validation_type = grouped
+
+        for rule in rules:
+            result.mark_rule_checked(rule.id)
+
+        # Dispatch each validation type to its validator
+        # Note: Advanced validation (AST, regex, etc.) will be added in TASK_2.4
+        validators = self._validators
+        for validation_type, typed_rules in by_validation_type.items():
+            validator = validators.get(validation_type)
+            if validator is None:
+                continue
+            for rule in typed_rules:
+                validator(rule, response, result)
+
+        # Log violations to StateManager if configured
+        if self.state_manager and result.has_violations() and context:
+            task_id = context.get('task_id')
+            if task_id:
+                self._log_violations_to_state_manager(
+                    task_id=task_id,
+                    violations=result.violations
+                )
 
-            return result
+        return result
 
     def _basic_validation(
         self,
@@ -389,17 +547,7 @@ class PromptRuleEngine:
             >>> domains = engine._get_default_domains_for_prompt_type('task_execution')
             >>> assert 'code_generation' in domains
         """
-        # Map prompt types to relevant domains
-        domain_map = {
-            'task_execution': ['code_generation', 'testing', 'documentation', 'security'],
-            'validation': ['code_generation', 'testing'],
-            'error_analysis': ['error_handling', 'performance'],
-            'decision': [],  # No specific rules for decision prompts
-            'planning': ['code_generation', 'parallel_agents'],
-            'code_review': ['code_generation', 'security', 'performance']
-        }
-
-        return domain_map.get(prompt_type, [])
+        return list(self.DEFAULT_DOMAINS.get(prompt_type, ()))
 
     def _log_violations_to_state_manager(
         self,
@@ -449,30 +597,32 @@ class PromptRuleEngine:
             >>> print(f"Total rules: {stats['total_rules']}")
             >>> print(f"Domains: {stats['domains']}")
         """
-        with self._lock:
-            severity_counts = {
-                'critical': 0,
-                'high': 0,
-                'medium': 0,
-                'low': 0
-            }
-
-            for rule in self._rules.values():
-                if rule.severity in severity_counts:
-                    severity_counts[rule.severity] += 1
+        snapshot = self._snapshot
+        severity_counts = {
+            'critical': 0,
+            'high': 0,
+            'medium': 0,
+            'low': 0
+        }
 
-            return {
-                'total_rules': len(self._rules),
-                'domains': list(self._rules_by_domain.keys()),
-                'domain_count': len(self._rules_by_domain),
-                'severity_breakdown': severity_counts,
-                'rules_loaded': self._rules_loaded
-            }
+        for rule in snapshot.rules.values():
+            if rule.severity in severity_counts:
+                severity_counts[rule.severity] += 1
+
+        return {
+            'total_rules': len(snapshot.rules),
+            'domains': list(snapshot.rules_by_domain.keys()),
+            'domain_count': len(snapshot.rules_by_domain),
+            'severity_breakdown': severity_counts,
+            'rules_loaded': snapshot.loaded,
+            'precomputed_payloads': len(snapshot.payloads)
+        }
 
     def reload_rules(self) -> int:
         """Reload rules from YAML file.
 
         Useful for picking up configuration changes without restarting.
+        Readers keep using the previous rules until the new ones are loaded.
 
         Returns:
             Number of rules loaded
@@ -486,8 +636,9 @@ class PromptRuleEngine:
 
     def __repr__(self) -> str:
         """String representation of engine state."""
+        snapshot = self._snapshot
         return (
-            f"<PromptRuleEngine(rules_loaded={self._rules_loaded}, "
-            f"total_rules={len(self._rules)}, "
-            f"domains={len(self._rules_by_domain)})>"
+            f"<PromptRuleEngine(rules_loaded={snapshot.loaded}, "
+            f"total_rules={len(snapshot.rules)}, "
+            f"domains={len(snapshot.rules_by_domain)})>"
         )
@@ -0,0 +1,215 @@
+"""Segmented prompts with a stable, hashable prefix.
+
+Prompts are assembled from ordered segments, most stable first:
+
+    system   Static instructions
+    rules    Rules injected from PromptRuleEngine
+    project  Project information (changes between projects)
+    task     Task details (changes between tasks)
+    context  Volatile iteration context (changes every iteration)
+
+LLM servers reuse cached attention (KV) state for the longest prompt prefix
+they have already processed: Ollama keeps it while the model stays loaded
+(keep_alive), Claude reports it as cache reads. Keeping the volatile context
+last makes the system/rules/project prefix byte-identical across iterations;
+its hash identifies the prefix so reuse can be tracked per prefix.
+
+Classes:
+    SegmentedPrompt: Prompt string that remembers its segments and prefix
+    PrefixCacheStats: Per-prefix prompt cache reuse counters
+
+Example:
+    >>> prompt = SegmentedPrompt({'system': 'Be brief.', 'task': 'Fix bug #12'})
+    >>> prompt
+    'Be brief.\\n\\nFix bug #12'
+    >>> prompt.prefix
+    'Be brief.'
+    >>> len(prompt.prefix_hash)
+    16
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Assembly order; earlier segments change less often
+SEGMENT_ORDER: Tuple[str, ...] = ('system', 'rules', 'project', 'task', 'context')
+
+# Segments that form the cacheable prefix
+PREFIX_SEGMENTS = frozenset({'system', 'rules', 'project'})
+
+SEGMENT_SEPARATOR = '\n\n'
+
+
+class SegmentedPrompt(str):
+    """Prompt text assembled from ordered segments.
+
+    Subclasses str so it can be passed anywhere a prompt string is
+    expected. String operations (concatenation, formatting) return plain
+    str and drop the segment information; use with_segment() to add text.
+
+    Attributes:
+        segments: Non-empty (name, text) pairs in SEGMENT_ORDER
+        prefix_length: Characters of the prompt covered by PREFIX_SEGMENTS
+        prefix_hash: Short SHA-256 of the prefix ('' if there is no prefix)
+    """
+
+    segments: Tuple[Tuple[str, str], ...]
+    prefix_length: int
+    prefix_hash: str
+
+    def __new__(cls, segments: Mapping[str, Optional[str]]) -> 'SegmentedPrompt':
+        """Assemble a prompt from segment texts.
+
+        Args:
+            segments: Segment name -> text; empty or missing segments are skipped
+
+        Raises:
+            ValueError: If a segment name is not in SEGMENT_ORDER
+        """
+        unknown = set(segments) - set(SEGMENT_ORDER)
+        if unknown:
+            raise ValueError(
+                f"Unknown prompt segments: {', '.join(sorted(unknown))} "
+                f"(expected: {', '.join(SEGMENT_ORDER)})"
+            )
+
+        ordered = tuple(
+            (name, segments[name].strip())
+            for name in SEGMENT_ORDER
+            if segments.get(name) and segments[name].strip()
+        )
+        prompt = super().__new__(cls, SEGMENT_SEPARATOR.join(text for _, text in ordered))
+        prompt.segments = ordered
+
+        prefix = SEGMENT_SEPARATOR.join(text for name, text in ordered if name in PREFIX_SEGMENTS)
+        prompt.prefix_length = len(prefix)
+        prompt.prefix_hash = (
+            hashlib.sha256(prefix.encode('utf-8')).hexdigest()[:16] if prefix else ''
+        )
+        return prompt
+
+    def __getnewargs__(self) -> Tuple[Dict[str, str]]:
+        # Lets copy and pickle rebuild the prompt from its segments
+        return (dict(self.segments),)
+
+    @property
+    def prefix(self) -> str:
+        """The stable part of the prompt (system, rules and project segments)."""
+        return str(self[:self.prefix_length])
+
+    @property
+    def suffix(self) -> str:
+        """The part of the prompt after the prefix."""
+        return str(self[self.prefix_length:]).lstrip('\n')
+
+    def segment(self, name: str) -> str:
+        """Text of one segment ('' if absent)."""
+        return dict(self.segments).get(name, '')
+
+    def with_segment(self, name: str, text: str, prepend: bool = False) -> 'SegmentedPrompt':
+        """Return a new prompt with text added to one segment.
+
+        Args:
+            name: Segment to extend
+            text: Text to add
+            prepend: Add before the existing segment text instead of after
+
+        Returns:
+            New SegmentedPrompt
+        """
+        segments = dict(self.segments)
+        parts = [segments.get(name, ''), text]
+        if prepend:
+            parts.reverse()
+        segments[name] = SEGMENT_SEPARATOR.join(part for part in parts if part)
+        return SegmentedPrompt(segments)
+
+
+class PrefixCacheStats:
+    """Prompt cache reuse counters, keyed by prompt prefix hash.
+
+    A prompt "reuses" its prefix when the previous prompt had the same
+    prefix hash, which is when a server that keeps the last prompt's KV
+    state can skip re-processing it. Where the backend reports cached
+    input tokens (Claude), the cache-read ratio is tracked as well.
+
+    Attributes:
+        prompts: Segmented prompts recorded
+        reuses: Prompts whose prefix matched the previous prompt's
+        last_prefix_hash: Prefix hash of the most recent prompt
+    """
+
+    def __init__(self, max_prefixes: int = 100):
+        """Initialize counters.
+
+        Args:
+            max_prefixes: Number of distinct prefixes to keep counters for
+        """
+        self.max_prefixes = max_prefixes
+        self.prompts = 0
+        self.reuses = 0
+        self.last_prefix_hash: Optional[str] = None
+        self._prefixes: 'OrderedDict[str, Dict[str, int]]' = OrderedDict()
+
+    def record(
+        self,
+        prefix_hash: str,
+        input_tokens: int = 0,
+        cache_read_tokens: int = 0
+    ) -> Dict[str, Any]:
+        """Record one prompt sent with the given prefix.
+
+        Args:
+            prefix_hash: SegmentedPrompt.prefix_hash of the prompt
+            input_tokens: Total input tokens, cached or not (if reported)
+            cache_read_tokens: Input tokens served from the cache (if reported)
+
+        Returns:
+            Counters for this prefix plus 'reused' and 'cache_read_ratio'
+        """
+        reused = prefix_hash == self.last_prefix_hash
+        self.prompts += 1
+        self.reuses += reused
+        self.last_prefix_hash = prefix_hash
+
+        entry = self._prefixes.pop(prefix_hash, None) or {
+            'prompts': 0, 'input_tokens': 0, 'cache_read_tokens': 0
+        }
+        entry['prompts'] += 1
+        entry['input_tokens'] += input_tokens
+        entry['cache_read_tokens'] += cache_read_tokens
+        self._prefixes[prefix_hash] = entry
+        while len(self._prefixes) > self.max_prefixes:
+            self._prefixes.popitem(last=False)
+
+        return {**entry, 'reused': reused, 'cache_read_ratio': self._ratio(entry)}
+
+    @staticmethod
+    def _ratio(entry: Dict[str, int]) -> float:
+        if entry['input_tokens'] <= 0:
+            return 0.0
+        return entry['cache_read_tokens'] / entry['input_tokens']
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize prefix reuse.
+
+        Returns:
+            Dictionary with 'prompts', 'prefix_reuses', 'prefix_reuse_rate',
+            'cache_read_ratio' (over all recorded prefixes) and 'prefixes'
+            (per-prefix counters, most recent last)
+        """
+        totals = {
+            'input_tokens': sum(e['input_tokens'] for e in self._prefixes.values()),
+            'cache_read_tokens': sum(e['cache_read_tokens'] for e in self._prefixes.values())
+        }
+        return {
+            'prompts': self.prompts,
+            'prefix_reuses': self.reuses,
+            'prefix_reuse_rate': self.reuses / self.prompts if self.prompts else 0.0,
+            'cache_read_ratio': self._ratio(totals),
+            'prefixes': {
+                prefix_hash: {**entry, 'cache_read_ratio': self._ratio(entry)}
+                for prefix_hash, entry in self._prefixes.items()
+            }
+        }
@@ -21,12 +21,16 @@ from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
 from src.llm.prompt_rule import PromptRule
 from src.llm.prompt_rule_engine import PromptRuleEngine
+from src.llm.prompt_segments import SegmentedPrompt
 
 if TYPE_CHECKING:
     from src.orchestration.complexity_estimate import ComplexityEstimate
 
 logger = logging.getLogger(__name__)
 
+# Stands in for the rules list while the rest of a <RULES> block is serialized
+_RULES_PLACEHOLDER = '\x00rules\x00'
+
 
 class StructuredPromptBuilderException(Exception):
     """Base exception for StructuredPromptBuilder errors."""
@@ -75,13 +79,26 @@ class StructuredPromptBuilder:
         ...     }
         ... )
         >>> print(prompt)
+        <RULES>
+        {
+          "expectations": {...},
+          "prompt_type": "task_execution",
+          "rules": [...]
+        }
+        </RULES>
+
+        <PROJECT>
+        {
+          "dependencies": ["PyJWT"],
+          "project_id": 1
+        }
+        </PROJECT>
+
         <METADATA>
         {
           "prompt_type": "task_execution",
           "task_id": 123,
-          "context": {...},
-          "rules": [...],
-          "expectations": {...}
+          "task_title": "Implement authentication"
         }
         </METADATA>
 
@@ -97,6 +114,16 @@ class StructuredPromptBuilder:
         - Include proper error handling
         - Add comprehensive tests
         </INSTRUCTION>
+
+        <CONTEXT>
+        {
+          "files": ["auth.py", "models.py"]
+        }
+        </CONTEXT>
+
+    Task execution prompts are SegmentedPrompt strings: rules and project
+    blocks come first and form a prefix that stays identical between
+    iterations (see prompt_segments).
     """
 
     # Prompt type constants
@@ -106,6 +133,10 @@ class StructuredPromptBuilder:
     PROMPT_TYPE_DECISION = 'decision'
     PROMPT_TYPE_PLANNING = 'planning'
 
+    # Context keys that describe the project rather than the iteration;
+    # they go in the stable prompt prefix
+    PROJECT_CONTEXT_KEYS = ('project_id', 'project_name', 'working_directory', 'dependencies')
+
     # Valid prompt types
     VALID_PROMPT_TYPES = {
         PROMPT_TYPE_TASK_EXECUTION,
@@ -162,6 +193,11 @@ class StructuredPromptBuilder:
         Injects rules from domains: code_generation, testing, documentation, security.
         Optionally includes complexity analysis for parallelization suggestions.
 
+        The prompt is assembled stable-first: a <RULES> block (rules and
+        expectations), a <PROJECT> block (PROJECT_CONTEXT_KEYS from context),
+        the task <METADATA> and <INSTRUCTION>, then the remaining context
+        in a <CONTEXT> block.
+
         Args:
             task_data: Task information with keys:
                 - task_id: int - Unique task identifier
@@ -177,7 +213,7 @@ class StructuredPromptBuilder:
             complexity_estimate: Optional complexity analysis with Obra's parallelization suggestions
 
         Returns:
-            Structured prompt string with metadata and instruction sections
+            SegmentedPrompt with rules, project, task and context segments
 
         Raises:
             StructuredPromptBuilderException: If required task_data fields missing
@@ -208,19 +244,11 @@ class StructuredPromptBuilder:
                     context={'task_data': task_data}
                 )
 
-            # Build metadata
+            # Build metadata (task-specific; rules and context are separate segments)
             metadata = {
                 'prompt_type': self.PROMPT_TYPE_TASK_EXECUTION,
                 'task_id': task_data['task_id'],
-                'task_title': task_data['title'],
-                'context': context,
-                'expectations': {
-                    'complete_implementation': True,
-                    'no_stubs': True,
-                    'include_tests': True,
-                    'error_handling': True,
-                    'documentation': True
-                }
+                'task_title': task_data['title']
             }
 
             # Add optional fields
@@ -235,8 +263,17 @@ class StructuredPromptBuilder:
 
             # Inject rules for task execution domains
             domains = ['code_generation', 'testing', 'documentation', 'security']
-            metadata = self._inject_rules(
-                metadata,
+            rules_metadata = self._inject_rules(
+                {
+                    'prompt_type': self.PROMPT_TYPE_TASK_EXECUTION,
+                    'expectations': {
+                        'complete_implementation': True,
+                        'no_stubs': True,
+                        'include_tests': True,
+                        'error_handling': True,
+                        'documentation': True
+                    }
+                },
                 self.PROMPT_TYPE_TASK_EXECUTION,
                 domains
             )
@@ -270,8 +307,22 @@ Requirements:
             if complexity_estimate and complexity_estimate.obra_suggests_decomposition:
                 instruction += self._build_parallelization_query(complexity_estimate)
 
-            # Format hybrid prompt
-            prompt = self._format_hybrid_prompt(metadata, instruction)
+            # Assemble segments, most stable first
+            project_context = {
+                key: context[key] for key in self.PROJECT_CONTEXT_KEYS if key in context
+            }
+            iteration_context = {
+                key: value for key, value in context.items()
+                if key not in project_context
+            }
+            prompt = SegmentedPrompt({
+                'rules': self._format_rules_block(rules_metadata, domains),
+                'project': (self._format_json_block('PROJECT', project_context)
+                            if project_context else ''),
+                'task': self._format_hybrid_prompt(metadata, instruction),
+                'context': (self._format_json_block('CONTEXT', iteration_context)
+                            if iteration_context else '')
+            })
 
             # Update statistics
             self.stats['prompts_built'] += 1
@@ -279,7 +330,8 @@ Requirements:
 
             logger.debug(
                 f"Built task_execution prompt for task {task_data['task_id']} "
-                f"({len(metadata.get('rules', []))} rules injected)"
+                f"({len(rules_metadata['rules'])} rules injected, "
+                f"prefix={prompt.prefix_hash})"
             )
 
             return prompt
@@ -791,6 +843,50 @@ Please provide:
 
         return prompt
 
+    def _format_json_block(self, tag: str, data: Dict[str, Any]) -> str:
+        """Format data as pretty JSON inside <TAG> markers.
+
+        Keys are sorted so identical data always produces identical text.
+
+        Args:
+            tag: Block tag name (e.g. 'RULES')
+            data: JSON-serializable data
+
+        Returns:
+            Formatted block
+        """
+        data_json = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True, default=str)
+        return f"""<{tag}>
+{data_json}
+</{tag}>"""
+
+    def _format_rules_block(self, metadata: Dict[str, Any], domains: List[str]) -> str:
+        """Format a <RULES> block, reusing the rule engine's pre-rendered rules.
+
+        Produces the same text as _format_json_block('RULES', metadata), but
+        the 'rules' list is spliced in from RulePayload.text instead of being
+        serialized again for every prompt.
+
+        Args:
+            metadata: Metadata returned by _inject_rules
+            domains: Domains the rules were injected for
+
+        Returns:
+            Formatted block
+        """
+        if not self.rule_engine:
+            return self._format_json_block('RULES', metadata)
+
+        rules_text = self.rule_engine.get_rule_payload(domains).text
+        placeholder = json.dumps(_RULES_PLACEHOLDER)
+        data = dict(metadata, rules=_RULES_PLACEHOLDER)
+        data_json = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True, default=str)
+        # 'rules' sits one level deep, so indent the payload's lines to match
+        data_json = data_json.replace(placeholder, rules_text.replace('\n', '\n  '), 1)
+        return f"""<RULES>
+{data_json}
+</RULES>"""
+
     def _inject_rules(
         self,
         metadata: Dict[str, Any],
@@ -799,8 +895,8 @@ Please provide:
     ) -> Dict[str, Any]:
         """Inject rules from rule engine into metadata.
 
-        Queries the rule engine for applicable rules based on prompt type
-        and domains, then adds them to the metadata.
+        Uses the rule engine's precomputed payload for the domains, so rules
+        are not re-collected and re-serialized for every prompt.
 
         Args:
             metadata: Metadata dictionary to inject rules into
@@ -825,30 +921,15 @@ Please provide:
             metadata['rules'] = []
             return metadata
 
-        # Collect rules from all specified domains
-        all_rules = []
-        for domain in domains:
-            domain_rules = self.rule_engine.get_rules_for_domain(domain)
-            all_rules.extend(domain_rules)
-
-        # Convert rules to serializable format
-        metadata['rules'] = [
-            {
-                'id': rule.id,
-                'name': rule.name,
-                'description': rule.description,
-                'severity': rule.severity,
-                'validation_type': rule.validation_type,
-                'domain': rule.domain
-            }
-            for rule in all_rules
-        ]
+        # Precomputed per rules load; copy the list, share the entries
+        payload = self.rule_engine.get_rule_payload(domains)
+        metadata['rules'] = list(payload.entries)
 
         # Update statistics
-        self.stats['rules_injected_total'] += len(all_rules)
+        self.stats['rules_injected_total'] += len(payload)
 
         logger.debug(
-            f"Injected {len(all_rules)} rules from domains {domains} "
+            f"Injected {len(payload)} rules from domains {domains} "
             f"for {prompt_type} prompt"
         )
 
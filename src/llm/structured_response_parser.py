@@ -20,6 +20,7 @@ except ImportError:
     yaml = None  # Optional dependency
 
 from src.core.exceptions import ValidationException
+from src.utils.json_extractor import iter_json_objects
 
 logger = logging.getLogger(__name__)
 
@@ -355,37 +356,18 @@ class StructuredResponseParser:
         Raises:
             ValidationException: If no valid JSON found
         """
-        # Try to find JSON object pattern
-        json_pattern = re.compile(r'\{.*\}', re.DOTALL)
-        match = json_pattern.search(response)
+        # First JSON object in the response (single pass, string-aware)
+        metadata = next(iter_json_objects(response), None)
 
-        if not match:
+        if metadata is None:
             raise ValidationException(
                 "No metadata tags or JSON object found in response",
                 context={'response_preview': response[:200]},
                 recovery="Ensure response includes <METADATA> tags with JSON"
             )
 
-        try:
-            json_text = match.group(0)
-            metadata = json.loads(json_text)
-
-            if not isinstance(metadata, dict):
-                raise ValidationException(
-                    "Extracted JSON is not an object",
-                    context={'json_type': type(metadata).__name__},
-                    recovery="Ensure JSON is a dict/object {}"
-                )
-
-            logger.info("Successfully extracted JSON from untagged response")
-            return metadata
-
-        except json.JSONDecodeError as e:
-            raise ValidationException(
-                f"Failed to parse JSON fallback: {str(e)}",
-                context={'error': str(e)},
-                recovery="Add proper <METADATA> tags around JSON"
-            )
+        logger.info("Successfully extracted JSON from untagged response")
+        return metadata
 
     def _validate_against_schema(
         self,
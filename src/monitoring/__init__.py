@@ -4,13 +4,14 @@ This module provides:
 - FileWatcher: Detects and tracks file changes in the project directory
 - EventDetector: Detects significant events from file changes and patterns
 - ProductionLogger: Structured JSON logging for production monitoring
+- Tracer: Span tracing of per-stage latency in the orchestration loop
+- SamplingProfiler: Opt-in in-process stack sampler for long sessions
+
+Exports are resolved on first access so the CLI can import the logger and
+tracer without loading the database layer (FileWatcher -> StateManager).
 """
 
-from src.monitoring.file_watcher import FileWatcher
-from src.monitoring.event_detector import (
-    EventDetector, FailurePattern, Event, ThresholdEvent
-)
-from src.monitoring.production_logger import ProductionLogger
+from src.utils.lazy_import import lazy_exports
 
 __all__ = [
     'FileWatcher',
@@ -18,5 +19,32 @@ __all__ = [
     'FailurePattern',
     'Event',
     'ThresholdEvent',
-    'ProductionLogger'
+    'ProductionLogger',
+    'Tracer',
+    'Span',
+    'SpanExporter',
+    'JsonlSpanExporter',
+    'get_tracer',
+    'initialize_tracing',
+    'SamplingProfiler',
+    'ProfileReport',
+    'get_profiler'
 ]
+
+__getattr__ = lazy_exports(__name__, {
+    'FileWatcher': 'src.monitoring.file_watcher',
+    'EventDetector': 'src.monitoring.event_detector',
+    'FailurePattern': 'src.monitoring.event_detector',
+    'Event': 'src.monitoring.event_detector',
+    'ThresholdEvent': 'src.monitoring.event_detector',
+    'ProductionLogger': 'src.monitoring.production_logger',
+    'Tracer': 'src.monitoring.tracing',
+    'Span': 'src.monitoring.tracing',
+    'SpanExporter': 'src.monitoring.tracing',
+    'JsonlSpanExporter': 'src.monitoring.tracing',
+    'get_tracer': 'src.monitoring.tracing',
+    'initialize_tracing': 'src.monitoring.tracing',
+    'SamplingProfiler': 'src.monitoring.profiler',
+    'ProfileReport': 'src.monitoring.profiler',
+    'get_profiler': 'src.monitoring.profiler',
+})
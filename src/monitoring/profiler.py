@@ -0,0 +1,415 @@
+"""In-process sampling profiler for long-running sessions.
+
+Profiles a live ``Orchestrator.run`` loop or interactive REPL without
+restarting it under an external profiler. A background thread samples every
+thread's Python stack via ``sys._current_frames()`` at a fixed interval and
+counts identical stacks, so memory is bounded by the number of distinct
+stacks (``max_stacks``), not by run time.
+
+Stopping writes two files to the profiles directory:
+
+- ``profile_<timestamp>.folded``: collapsed stacks ("thread;a;b;c <count>"),
+  ready for flamegraph.pl / speedscope
+- ``profile_<timestamp>.txt``: top-N functions by self and total samples
+
+Control it with ``/profile start|stop|status`` in the REPL, or, when
+``monitoring.profiling.signal`` is set, by sending that signal to the
+process (each signal toggles profiling).
+
+Example:
+    >>> profiler = get_profiler(config)
+    >>> profiler.start()
+    >>> ...  # slow workload
+    >>> report = profiler.stop()
+    >>> print(report.summary_path)
+"""
+
+import logging
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_PATH = '~/obra-runtime/logs/profiles'
+
+# Stacks beyond max_stacks are counted under this frame
+OVERFLOW_FRAME = '[other stacks]'
+
+
+@dataclass
+class ProfileReport:
+    """Result of one profiling session.
+
+    Attributes:
+        started_at: Wall-clock start time
+        duration_seconds: Profiling duration
+        interval_ms: Sampling interval
+        ticks: Sampling rounds taken
+        samples: Stack samples recorded (one per thread per tick)
+        overflow_samples: Samples whose stack didn't fit in max_stacks
+        top_self: [(function, samples)] by self samples, largest first
+        top_total: [(function, samples)] by total (inclusive) samples
+        collapsed_path: Path of the collapsed-stack file
+        summary_path: Path of the text summary
+    """
+    started_at: datetime
+    duration_seconds: float
+    interval_ms: float
+    ticks: int
+    samples: int
+    overflow_samples: int
+    top_self: List[Tuple[str, int]] = field(default_factory=list)
+    top_total: List[Tuple[str, int]] = field(default_factory=list)
+    collapsed_path: Optional[Path] = None
+    summary_path: Optional[Path] = None
+
+
+class SamplingProfiler:
+    """Bounded-memory stack sampler for the current process.
+
+    Thread-safe: start()/stop() may be called from the REPL or any other
+    thread. They block (thread join, file writes), so signal handlers must
+    not call them directly; see install_profile_signal().
+
+    Example:
+        >>> profiler = SamplingProfiler(interval_ms=5, output_dir='/tmp/profiles')
+        >>> profiler.start()
+        >>> report = profiler.stop()
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = 10.0,
+        max_stacks: int = 5000,
+        max_depth: int = 64,
+        top_n: int = 25,
+        output_dir: str = DEFAULT_PROFILE_PATH
+    ):
+        """Initialize profiler.
+
+        Args:
+            interval_ms: Sampling interval in milliseconds
+            max_stacks: Maximum distinct stacks kept in memory
+            max_depth: Maximum frames recorded per stack (innermost kept)
+            top_n: Functions listed in the summary
+            output_dir: Directory for profile files
+        """
+        if interval_ms <= 0:
+            raise ValueError(f"interval_ms must be positive, got {interval_ms}")
+        self.interval_ms = interval_ms
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.top_n = top_n
+        self.output_dir = Path(output_dir).expanduser()
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stacks: Counter = Counter()
+        self._labels: Dict[Any, str] = {}
+        self._ticks = 0
+        self._samples = 0
+        self._overflow = 0
+        self._started_at: Optional[datetime] = None
+        self._started_monotonic = 0.0
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'SamplingProfiler':
+        """Create a profiler from the monitoring.profiling config section.
+
+        Args:
+            config: Config instance (dotted ``get``)
+        """
+        return cls(
+            interval_ms=config.get('monitoring.profiling.interval_ms', 10.0),
+            max_stacks=config.get('monitoring.profiling.max_stacks', 5000),
+            max_depth=config.get('monitoring.profiling.max_depth', 64),
+            top_n=config.get('monitoring.profiling.top_n', 25),
+            output_dir=config.get('monitoring.profiling.path', DEFAULT_PROFILE_PATH)
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a profiling session is active."""
+        return self._thread is not None
+
+    # ========================================================================
+    # Control
+    # ========================================================================
+
+    def start(self) -> bool:
+        """Start sampling.
+
+        Returns:
+            True if started, False if already running
+        """
+        with self._lock:
+            if self._thread is not None:
+                return False
+
+            self._stacks = Counter()
+            self._labels = {}
+            self._ticks = self._samples = self._overflow = 0
+            self._started_at = datetime.now()
+            self._started_monotonic = time.monotonic()
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='obra-profiler', daemon=True
+            )
+            self._thread.start()
+
+        logger.info(f"PROFILER START: interval={self.interval_ms}ms, max_stacks={self.max_stacks}")
+        return True
+
+    def stop(self) -> Optional[ProfileReport]:
+        """Stop sampling and write the collapsed stacks and summary.
+
+        Returns:
+            ProfileReport, or None if the profiler wasn't running
+        """
+        with self._lock:
+            if self._thread is None:
+                return None
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            stacks = self._stacks
+            report = self._build_report()
+
+        try:
+            self._write_report(report, stacks)
+        except OSError as e:
+            logger.error(f"Failed to write profile to {self.output_dir}: {e}")
+
+        logger.info(
+            f"PROFILER STOP: duration={report.duration_seconds:.1f}s, samples={report.samples}, "
+            f"stacks={len(stacks)}, overflow={report.overflow_samples}, "
+            f"summary={report.summary_path}"
+        )
+        return report
+
+    def toggle(self) -> Optional[ProfileReport]:
+        """Start if stopped, stop (and report) if running."""
+        if self.is_running:
+            return self.stop()
+        self.start()
+        return None
+
+    # ========================================================================
+    # Sampling
+    # ========================================================================
+
+    def _run(self) -> None:
+        """Sampler thread body."""
+        interval = self.interval_ms / 1000.0
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(interval):
+            self._sample(own_ident)
+
+    def _sample(self, own_ident: int) -> None:
+        """Record one stack per thread (except the sampler's)."""
+        names = {t.ident: t.name for t in threading.enumerate()}
+        self._ticks += 1
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            stack = self._collapse(frame, names.get(ident, f'thread-{ident}'))
+            if stack in self._stacks or len(self._stacks) < self.max_stacks:
+                self._stacks[stack] += 1
+            else:
+                self._stacks[f"{stack.split(';', 1)[0]};{OVERFLOW_FRAME}"] += 1
+                self._overflow += 1
+            self._samples += 1
+
+    def _collapse(self, frame: Any, thread_name: str) -> str:
+        """Collapsed stack string, outermost frame first."""
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.append(thread_name)
+        labels.reverse()
+        return ';'.join(labels)
+
+    def _label(self, code: Any) -> str:
+        """'file.py:Qualified.name' for a code object (cached)."""
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{os.path.basename(code.co_filename)}:{name}".replace(';', ':')
+            self._labels[code] = label
+        return label
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def _build_report(self) -> ProfileReport:
+        """Aggregate self/total samples per function."""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self._stacks.items():
+            frames = stack.split(';')[1:]  # drop thread name
+            if not frames or frames == [OVERFLOW_FRAME]:
+                continue
+            self_counts[frames[-1]] += count
+            for func in set(frames):
+                total_counts[func] += count
+
+        return ProfileReport(
+            started_at=self._started_at,
+            duration_seconds=time.monotonic() - self._started_monotonic,
+            interval_ms=self.interval_ms,
+            ticks=self._ticks,
+            samples=self._samples,
+            overflow_samples=self._overflow,
+            top_self=self_counts.most_common(self.top_n),
+            top_total=total_counts.most_common(self.top_n)
+        )
+
+    def _write_report(self, report: ProfileReport, stacks: Counter) -> None:
+        """Write the collapsed stacks and the text summary."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"profile_{report.started_at.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}"
+        collapsed_path = self.output_dir / f"{stem}.folded"
+        summary_path = self.output_dir / f"{stem}.txt"
+
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(self.format_summary(report))
+
+        report.collapsed_path = collapsed_path
+        report.summary_path = summary_path
+
+    @staticmethod
+    def format_summary(report: ProfileReport) -> str:
+        """Human-readable top-N summary."""
+        samples = max(report.samples, 1)
+        lines = [
+            f"Sampling profile started {report.started_at.isoformat(timespec='seconds')}",
+            f"Duration: {report.duration_seconds:.1f}s, interval: {report.interval_ms}ms, "
+            f"ticks: {report.ticks}, samples: {report.samples}, "
+            f"overflow: {report.overflow_samples}",
+            '',
+            f"Top {len(report.top_self)} by self samples:",
+            f"  {'Samples':>8} {'Self%':>7}  Function",
+        ]
+        lines += [f"  {count:>8} {count / samples * 100:>6.1f}%  {func}" for func, count in report.top_self]
+        lines += [
+            '',
+            f"Top {len(report.top_total)} by total samples:",
+            f"  {'Samples':>8} {'Total%':>7}  Function",
+        ]
+        lines += [f"  {count:>8} {count / samples * 100:>6.1f}%  {func}" for func, count in report.top_total]
+        return '\n'.join(lines) + '\n'
+
+
+# ============================================================================
+# Process-wide profiler and signal trigger
+# ============================================================================
+
+_profiler_instance: Optional[SamplingProfiler] = None
+_profiler_lock = threading.Lock()
+
+# Profilers to toggle, posted by the signal handler (SimpleQueue.put is
+# reentrant) and served by the control thread
+_toggle_requests: 'queue.SimpleQueue[SamplingProfiler]' = queue.SimpleQueue()
+_control_thread: Optional[threading.Thread] = None
+
+
+def get_profiler(config: Any = None) -> SamplingProfiler:
+    """Get the process-wide profiler, creating it from ``config`` on first use.
+
+    Example:
+        >>> profiler = get_profiler(config)
+        >>> profiler.toggle()
+    """
+    global _profiler_instance
+    with _profiler_lock:
+        if _profiler_instance is None:
+            _profiler_instance = (
+                SamplingProfiler.from_config(config) if config is not None
+                else SamplingProfiler()
+            )
+        return _profiler_instance
+
+
+def install_profile_signal(config: Any) -> bool:
+    """Toggle the process-wide profiler on ``monitoring.profiling.signal``.
+
+    No-op unless the signal is configured. Must be called from the main
+    thread.
+
+    Args:
+        config: Config instance
+
+    Returns:
+        True if the handler was installed
+
+    Example:
+        >>> install_profile_signal(config)  # then: kill -USR2 <pid>
+    """
+    signal_name = config.get('monitoring.profiling.signal')
+    if not signal_name:
+        return False
+
+    signal_name = str(signal_name).upper()
+    if not signal_name.startswith('SIG'):
+        signal_name = f'SIG{signal_name}'
+    signum = getattr(signal, signal_name, None)
+    if signum is None:
+        logger.warning(f"Profiling signal {signal_name} not available on this platform")
+        return False
+
+    profiler = get_profiler(config)
+
+    def handle(received, frame):
+        # Runs between bytecodes of the interrupted main thread, possibly
+        # inside start()/stop(): only post the request
+        _toggle_requests.put_nowait(profiler)
+
+    try:
+        signal.signal(signum, handle)
+    except ValueError as e:
+        # Not the main thread
+        logger.warning(f"Cannot install profiling signal handler: {e}")
+        return False
+
+    _start_control_thread()
+
+    logger.info(f"Profiling signal installed: kill -{signal_name[3:]} {os.getpid()}")
+    return True
+
+
+def _start_control_thread() -> None:
+    """Start the thread that serves signal toggle requests (once per process)."""
+    global _control_thread
+    with _profiler_lock:
+        if _control_thread is None:
+            _control_thread = threading.Thread(
+                target=_serve_toggle_requests, name='obra-profiler-control', daemon=True
+            )
+            _control_thread.start()
+
+
+def _serve_toggle_requests() -> None:
+    """Control thread body: toggle each profiler the signal handler posts."""
+    while True:
+        profiler = _toggle_requests.get()
+        try:
+            if profiler.toggle() is None:
+                logger.info("Profiling started by signal")
+        except Exception as e:
+            logger.error(f"Profiling toggle failed: {e}")
@@ -0,0 +1,519 @@
+"""Lightweight span tracing for the orchestration loop.
+
+Spans time each stage of a task (prompt generation, agent turn, database
+writes, validation, decision) and nest through ``contextvars``, so spans
+opened in ``asyncio.to_thread`` workers and asyncio tasks keep their parent.
+The span model follows OpenTelemetry (128-bit trace IDs, 64-bit span IDs,
+nanosecond timestamps, attributes, status).
+
+Tracing is off by default: the global tracer uses ``NoOpSpanExporter`` and
+``span()`` returns a shared inert span without timing anything. With
+``monitoring.tracing.enabled``, finished traces go to:
+
+- ``JsonlSpanExporter``: one JSON line per span in ``<path>/task_<id>.jsonl``;
+  each line carries its stack ``path`` ("task;iteration;agent.send_prompt")
+  and self time, so folded stacks for flamegraph tools fall out directly
+- ``OpenTelemetrySpanExporter``: replays spans into the OpenTelemetry SDK
+  (requires ``opentelemetry-sdk``)
+
+Example:
+    >>> tracer = initialize_tracing(config)
+    >>> with tracer.span('task', task_id=42):
+    ...     with tracer.span('prompt.generate'):
+    ...         prompt = generator.generate_prompt(...)
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_PATH = '~/obra-runtime/traces'
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar(
+    'obra_current_span', default=None
+)
+
+
+# ============================================================================
+# Span model
+# ============================================================================
+
+@dataclass
+class Span:
+    """One timed stage.
+
+    Attributes:
+        name: Stage name (e.g. 'agent.send_prompt')
+        trace_id: 32-hex-digit trace ID shared by all spans of a task run
+        span_id: 16-hex-digit span ID
+        parent_span_id: Parent span ID (None for the root span)
+        path: Names from the root span down to this one
+        start_ns: Start time (ns since epoch)
+        end_ns: End time (ns since epoch), None while open
+        attributes: Stage attributes (iteration, prompt_chars, ...)
+        status: 'UNSET', 'OK' or 'ERROR'
+        status_message: Error description for ERROR spans
+        child_ns: Summed wall time of child spans (for self time)
+    """
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    path: List[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = 'UNSET'
+    status_message: Optional[str] = None
+    child_ns: int = 0
+    _parent: Optional['Span'] = field(default=None, repr=False, compare=False)
+    _token: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration_ms(self) -> float:
+        """Wall time of the span in milliseconds (0 while open)."""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1e6
+
+    @property
+    def self_ms(self) -> float:
+        """Wall time not covered by child spans, in milliseconds."""
+        return max(0.0, self.duration_ms - self.child_ns / 1e6)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a span attribute."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status = 'ERROR'
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to an OTLP-style JSON dict (one JSONL line)."""
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_span_id,
+            'name': self.name,
+            'path': ';'.join(self.path),
+            'startTimeUnixNano': self.start_ns,
+            'endTimeUnixNano': self.end_ns,
+            'durationMs': round(self.duration_ms, 3),
+            'selfMs': round(self.self_ms, 3),
+            'attributes': self.attributes,
+            'status': {'code': self.status, 'message': self.status_message},
+        }
+
+
+class _NoOpSpan:
+    """Inert span returned while tracing is disabled."""
+
+    name = ''
+    attributes: Dict[str, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoOpSpan()
+
+
+# ============================================================================
+# Exporters
+# ============================================================================
+
+class SpanExporter:
+    """Receives each finished trace (all spans of one root span)."""
+
+    def export(self, spans: List[Span]) -> None:
+        """Export the spans of one finished trace, in start order."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+
+
+class NoOpSpanExporter(SpanExporter):
+    """Default exporter: tracing disabled."""
+
+    def export(self, spans: List[Span]) -> None:
+        pass
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Append spans as JSON lines to one file per task.
+
+    The file is chosen by the root span's ``task_id`` attribute
+    (``task_<id>.jsonl``; ``trace_<trace_id>.jsonl`` without one). Each task
+    run is a separate trace in the same file.
+
+    Example:
+        >>> exporter = JsonlSpanExporter('~/obra-runtime/traces')
+        >>> tracer = Tracer(exporter)
+    """
+
+    def __init__(self, directory: str = DEFAULT_TRACE_PATH):
+        """Initialize exporter.
+
+        Args:
+            directory: Directory for trace files (created on first export)
+        """
+        self.directory = Path(directory).expanduser()
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        """Append one trace to its task file."""
+        if not spans:
+            return
+        task_id = spans[0].attributes.get('task_id')
+        path = (
+            trace_file(self.directory, task_id) if task_id is not None
+            else self.directory / f"trace_{spans[0].trace_id}.jsonl"
+        )
+        lines = ''.join(json.dumps(span.to_dict(), default=str) + '\n' for span in spans)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Replay finished traces into the OpenTelemetry SDK.
+
+    Spans keep their names, timing, attributes and nesting; IDs are
+    assigned by the SDK. Configure the SDK's TracerProvider (and its
+    exporters) as usual before tracing starts.
+    """
+
+    def __init__(self, instrumentation_name: str = 'obra'):
+        """Initialize exporter.
+
+        Raises:
+            ImportError: If opentelemetry is not installed
+        """
+        if not OTEL_AVAILABLE:
+            raise ImportError(
+                "opentelemetry is required for the otel exporter. "
+                "Install with: pip install opentelemetry-sdk"
+            )
+        self._tracer = otel_trace.get_tracer(instrumentation_name)
+
+    def export(self, spans: List[Span]) -> None:
+        """Start and end one OpenTelemetry span per span, preserving parents."""
+        replayed: Dict[str, Any] = {}
+        for span in spans:
+            parent = replayed.get(span.parent_span_id)
+            context = otel_trace.set_span_in_context(parent) if parent is not None else None
+            otel_span = self._tracer.start_span(
+                span.name,
+                context=context,
+                attributes={k: _otel_value(v) for k, v in span.attributes.items()},
+                start_time=span.start_ns
+            )
+            if span.status == 'ERROR':
+                otel_span.set_status(otel_trace.Status(
+                    otel_trace.StatusCode.ERROR, span.status_message
+                ))
+            replayed[span.span_id] = otel_span
+        # End children before parents
+        for span in reversed(spans):
+            replayed[span.span_id].end(end_time=span.end_ns)
+
+
+def _otel_value(value: Any) -> Any:
+    """Coerce an attribute to an OpenTelemetry-supported type."""
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+class Tracer:
+    """Creates spans and hands finished traces to an exporter.
+
+    Thread-safe. The current span is tracked in a context variable, so
+    nesting follows threads started with ``asyncio.to_thread`` and asyncio
+    tasks. A trace is exported when its root span ends.
+
+    Example:
+        >>> tracer = Tracer(JsonlSpanExporter('/tmp/traces'))
+        >>> with tracer.span('task', task_id=1):
+        ...     with tracer.span('iteration', iteration=1):
+        ...         pass
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        """Initialize tracer.
+
+        Args:
+            exporter: Span exporter (default: NoOpSpanExporter)
+        """
+        self.exporter = exporter or NoOpSpanExporter()
+        self.enabled = not isinstance(self.exporter, NoOpSpanExporter)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Span]] = {}
+
+    def current_span(self) -> Optional[Span]:
+        """Span active in the current context, if any."""
+        return _current_span.get()
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+        """Open a span as a child of the current span and make it current.
+
+        Must be closed with end_span() in the same thread or task.
+
+        Returns:
+            The new Span (NOOP_SPAN when tracing is disabled)
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent else None,
+            path=(parent.path if parent else []) + [name],
+            start_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+            _parent=parent
+        )
+        span._token = _current_span.set(span)
+        return span
+
+    def end_span(self, span: Any) -> None:
+        """Close a span opened with start_span() and restore its parent."""
+        if span is NOOP_SPAN:
+            return
+
+        span.end_ns = time.time_ns()
+        if span.status == 'UNSET':
+            span.status = 'OK'
+        try:
+            _current_span.reset(span._token)
+        except ValueError:
+            # Closed from another context; the span's own context is gone anyway
+            _current_span.set(span._parent)
+
+        with self._lock:
+            if span._parent is not None:
+                span._parent.child_ns += span.end_ns - span.start_ns
+                self._pending.setdefault(span.trace_id, []).append(span)
+                return
+            trace = self._pending.pop(span.trace_id, [])
+        trace.append(span)
+        trace.sort(key=lambda s: s.start_ns)
+
+        try:
+            self.exporter.export(trace)
+        except Exception as e:
+            logger.warning(f"Failed to export trace {span.trace_id}: {e}")
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        """Context manager around start_span()/end_span().
+
+        Exceptions are recorded on the span and re-raised.
+
+        Example:
+            >>> with tracer.span('decision', iteration=2) as span:
+            ...     span.set_attribute('action', action.type)
+        """
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+
+        span = self.start_span(name, attributes)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            self.end_span(span)
+
+    @contextmanager
+    def use_span(self, span: Optional[Span]) -> Iterator[None]:
+        """Make ``span`` the current span (e.g. in a coroutine run on another thread)."""
+        token = _current_span.set(span)
+        try:
+            yield
+        finally:
+            _current_span.reset(token)
+
+    def shutdown(self) -> None:
+        """Shut down the exporter."""
+        self.exporter.shutdown()
+
+
+def traced(name: str) -> Callable:
+    """Decorator running a function in a span of the global tracer.
+
+    Example:
+        >>> @traced('prompt.generate')
+        ... def _build_iteration_prompt(self, ...):
+        ...     ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# Reading traces
+# ============================================================================
+
+def trace_file(directory: str, task_id: Any) -> Path:
+    """Path of the JSONL trace file for a task."""
+    return Path(directory).expanduser() / f"task_{task_id}.jsonl"
+
+
+def load_task_traces(directory: str, task_id: Any) -> List[List[Dict[str, Any]]]:
+    """Load all recorded runs of a task.
+
+    Args:
+        directory: Trace directory
+        task_id: Task ID
+
+    Returns:
+        One list of span dicts per run (trace), oldest run first
+
+    Raises:
+        FileNotFoundError: If the task has no trace file
+    """
+    runs: Dict[str, List[Dict[str, Any]]] = {}
+    with open(trace_file(directory, task_id), encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                span = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed trace line for task {task_id}")
+                continue
+            runs.setdefault(span['traceId'], []).append(span)
+    return list(runs.values())
+
+
+def stage_breakdown(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate self time by stage name, largest first.
+
+    Self time excludes child spans, so stages add up to the task's wall
+    time (up to stages that overlap in the async loop).
+
+    Returns:
+        List of {'name', 'count', 'total_ms', 'self_ms'} dicts
+    """
+    stages: Dict[str, Dict[str, Any]] = {}
+    for span in spans:
+        stage = stages.setdefault(span['name'], {
+            'name': span['name'], 'count': 0, 'total_ms': 0.0, 'self_ms': 0.0
+        })
+        stage['count'] += 1
+        stage['total_ms'] += span.get('durationMs') or 0.0
+        stage['self_ms'] += span.get('selfMs') or 0.0
+    return sorted(stages.values(), key=lambda s: s['self_ms'], reverse=True)
+
+
+def folded_stacks(spans: List[Dict[str, Any]]) -> List[str]:
+    """Collapsed-stack lines ("a;b;c <self microseconds>") for flamegraph tools."""
+    totals: Dict[str, int] = {}
+    for span in spans:
+        totals[span['path']] = totals.get(span['path'], 0) + int((span.get('selfMs') or 0.0) * 1000)
+    return [f"{path} {micros}" for path, micros in totals.items() if micros > 0]
+
+
+# ============================================================================
+# Global tracer
+# ============================================================================
+
+_tracer_instance = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (a no-op tracer unless tracing was initialized).
+
+    Example:
+        >>> with get_tracer().span('validation.quality'):
+        ...     result = controller.validate_output(...)
+    """
+    return _tracer_instance
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Replace the global tracer.
+
+    Returns:
+        The previous tracer
+    """
+    global _tracer_instance
+    previous = _tracer_instance
+    _tracer_instance = tracer
+    return previous
+
+
+def initialize_tracing(config: Dict[str, Any]) -> Tracer:
+    """Configure the global tracer from the monitoring.tracing config section.
+
+    Args:
+        config: Configuration dict
+
+    Returns:
+        The global tracer (no-op if tracing is disabled or misconfigured)
+
+    Example:
+        >>> tracer = initialize_tracing(config_mgr._config)
+    """
+    tracing_config = config.get('monitoring', {}).get('tracing', {}) or {}
+    if not tracing_config.get('enabled', False):
+        logger.debug("Tracing disabled in config")
+        set_tracer(Tracer())
+        return get_tracer()
+
+    exporter_name = tracing_config.get('exporter', 'jsonl')
+    try:
+        if exporter_name == 'otel':
+            exporter: SpanExporter = OpenTelemetrySpanExporter()
+        else:
+            exporter = JsonlSpanExporter(tracing_config.get('path', DEFAULT_TRACE_PATH))
+    except Exception as e:
+        logger.error(f"Failed to initialize tracing ({exporter_name}): {e}")
+        set_tracer(Tracer())
+        return get_tracer()
+
+    set_tracer(Tracer(exporter))
+    logger.info(f"Tracing enabled: exporter={exporter_name}")
+    return get_tracer()
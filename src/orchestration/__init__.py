@@ -2,6 +2,7 @@
 
 This package provides the core orchestration logic:
 - TaskScheduler: Task queue management with dependency resolution
+- SchedulingPolicy: Ready-queue ordering (priority, critical path) and makespan simulation
 - DecisionEngine: Intelligent decision making and action routing
 - BreakpointManager: Breakpoint triggering and resolution tracking
 - QualityController: Multi-stage quality validation
@@ -34,6 +35,15 @@ Example:
 """
 
 from src.orchestration.task_scheduler import TaskScheduler
+from src.orchestration.scheduling_policy import (
+    SchedulingPolicy,
+    PriorityPolicy,
+    CriticalPathPolicy,
+    TaskGraph,
+    create_scheduling_policy,
+    simulate_schedule,
+    compare_policies
+)
 from src.orchestration.breakpoint_manager import BreakpointManager, BreakpointEvent
 from src.orchestration.decision_engine import DecisionEngine, Action
 from src.orchestration.quality_controller import QualityController, QualityResult
@@ -45,6 +55,13 @@ from src.orchestration.intent_to_task_converter import IntentToTaskConverter, In
 
 __all__ = [
     'TaskScheduler',
+    'SchedulingPolicy',
+    'PriorityPolicy',
+    'CriticalPathPolicy',
+    'TaskGraph',
+    'create_scheduling_policy',
+    'simulate_schedule',
+    'compare_policies',
     'BreakpointManager',
     'BreakpointEvent',
     'DecisionEngine',
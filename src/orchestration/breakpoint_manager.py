@@ -21,6 +21,11 @@ Example:
     ...     event = manager.trigger_breakpoint('low_confidence', context)
     ...     # Wait for human resolution
     ...     manager.resolve_breakpoint(event.id, resolution)
+
+Rule conditions are parsed once into a restricted expression AST (comparisons,
+boolean logic, arithmetic, literals and names; no calls) and compiled to code
+objects. Each rule remembers the values of the context keys its conditions
+reference, and is only re-evaluated when one of them changes.
 """
 
 import logging
@@ -28,7 +33,8 @@ import ast
 from collections import defaultdict
 from datetime import datetime, UTC, timedelta
 from threading import RLock
-from typing import Dict, List, Optional, Any, Callable
+from types import CodeType
+from typing import Dict, List, Optional, Any, Callable, Tuple
 
 from src.core.exceptions import OrchestratorException
 from src.core.state import StateManager
@@ -36,6 +42,91 @@ from src.core.state import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Rule config values that override context values of the same name
+_RULE_PARAMETERS = ('threshold', 'count_threshold', 'timeout_seconds')
+
+# AST nodes allowed in condition expressions
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not,
+    ast.UAdd, ast.USub, ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.FloorDiv, ast.Mod, ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE,
+    ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Is, ast.IsNot, ast.Name,
+    ast.Constant, ast.List, ast.Tuple, ast.Set, ast.Subscript, ast.Attribute,
+    ast.Load
+)
+
+# Context values safe to memoize on (compared by value, never mutated in place)
+_MEMO_TYPES = (str, int, float, bool, type(None))
+
+_MISSING = object()
+
+
+def compile_condition(condition: str) -> Tuple[CodeType, Tuple[str, ...]]:
+    """Compile a breakpoint condition expression.
+
+    Args:
+        condition: Expression such as "confidence_score < threshold"
+
+    Returns:
+        Tuple of (code object, names the expression references)
+
+    Raises:
+        ValueError: If the expression is invalid or uses disallowed syntax
+            (calls, comprehensions, private attributes, etc.)
+
+    Example:
+        >>> code, names = compile_condition("confidence_score < threshold")
+        >>> names
+        ('confidence_score', 'threshold')
+    """
+    try:
+        tree = ast.parse(condition.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid condition {condition!r}: {e.msg}") from e
+
+    names = []
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(
+                f"Invalid condition {condition!r}: "
+                f"{type(node).__name__} is not allowed"
+            )
+        if isinstance(node, ast.Attribute) and node.attr.startswith('_'):
+            raise ValueError(
+                f"Invalid condition {condition!r}: private attribute {node.attr!r}"
+            )
+        if isinstance(node, ast.Name) and node.id not in names:
+            names.append(node.id)
+
+    return compile(tree, f'<breakpoint condition: {condition}>', 'eval'), tuple(names)
+
+
+class _CompiledRule:
+    """Compiled conditions of one rule plus its last evaluation."""
+
+    __slots__ = ('source', 'codes', 'inputs', 'last_values', 'last_result')
+
+    def __init__(self, breakpoint_type: str, conditions: List[str]):
+        self.source = tuple(conditions)
+        self.last_values: Optional[Tuple[Any, ...]] = None
+        self.last_result = False
+
+        codes = []
+        inputs: List[str] = []
+        for condition in self.source:
+            try:
+                code, names = compile_condition(condition)
+            except ValueError as e:
+                logger.warning(f"Breakpoint rule {breakpoint_type} disabled: {e}")
+                codes = None
+                break
+            codes.append((condition, code))
+            inputs.extend(name for name in names if name not in inputs)
+
+        # None: a condition failed to compile, the rule never triggers
+        self.codes: Optional[List[Tuple[str, CodeType]]] = codes
+        self.inputs: Tuple[str, ...] = tuple(inputs)
+
 
 class BreakpointEvent:
     """Represents a triggered breakpoint event.
@@ -155,6 +246,10 @@ class BreakpointManager:
         # Breakpoint rules (type -> rule config)
         self._rules: Dict[str, Dict[str, Any]] = self._load_breakpoint_rules()
 
+        # Compiled conditions (type -> _CompiledRule) and priority order
+        self._compiled_rules: Dict[str, _CompiledRule] = {}
+        self._rule_order: Optional[List[str]] = None
+
         # Disabled breakpoint types
         self._disabled_types: set = set()
 
@@ -194,14 +289,19 @@ class BreakpointManager:
         with self._lock:
             triggered_types = []
 
-            # Sort rules by priority
-            sorted_rules = sorted(
-                self._rules.items(),
-                key=lambda x: self._priority_to_int(x[1].get('priority', self.PRIORITY_MEDIUM)),
-                reverse=True
-            )
+            # Rules by priority (sorted once, until rules change)
+            if self._rule_order is None:
+                self._rule_order = sorted(
+                    self._rules,
+                    key=lambda t: self._priority_to_int(
+                        self._rules[t].get('priority', self.PRIORITY_MEDIUM)
+                    ),
+                    reverse=True
+                )
+
+            for breakpoint_type in self._rule_order:
+                rule = self._rules[breakpoint_type]
 
-            for breakpoint_type, rule in sorted_rules:
                 # Skip if disabled
                 if breakpoint_type in self._disabled_types:
                     continue
@@ -210,17 +310,8 @@ class BreakpointManager:
                 if not rule.get('enabled', True):
                     continue
 
-                # Merge rule config values into context for evaluation
-                eval_context = context.copy()
-                if 'threshold' in rule:
-                    eval_context['threshold'] = rule['threshold']
-                if 'count_threshold' in rule:
-                    eval_context['count_threshold'] = rule['count_threshold']
-                if 'timeout_seconds' in rule:
-                    eval_context['timeout_seconds'] = rule['timeout_seconds']
-
                 # Evaluate conditions
-                if self._evaluate_conditions(rule.get('conditions', []), eval_context):
+                if self._evaluate_rule(breakpoint_type, rule, context):
                     triggered_types.append(breakpoint_type)
                     logger.debug(f"Breakpoint condition met: {breakpoint_type}")
 
@@ -430,6 +521,8 @@ class BreakpointManager:
                 )
 
             self._rules[rule_type] = rule_definition
+            self._compiled_rules.pop(rule_type, None)
+            self._rule_order = None
             logger.info(f"Custom rule added: {rule_type}")
 
     def disable_breakpoint_type(self, breakpoint_type: str) -> None:
@@ -686,48 +779,84 @@ class BreakpointManager:
 
         return default_rules
 
-    def _evaluate_conditions(
+    def _evaluate_rule(
         self,
-        conditions: List[str],
+        breakpoint_type: str,
+        rule: Dict[str, Any],
         context: Dict[str, Any]
     ) -> bool:
-        """Evaluate list of condition expressions against context.
+        """Evaluate a rule's compiled conditions against context.
+
+        Rule config values (threshold, count_threshold, timeout_seconds)
+        override context values of the same name. If the referenced values
+        are unchanged since the last call, the previous result is returned.
 
         Args:
-            conditions: List of Python expressions as strings
+            breakpoint_type: Rule type
+            rule: Rule config
             context: Context dictionary with variables
 
         Returns:
             True if all conditions evaluate to True
         """
-        if not conditions:
+        conditions = rule.get('conditions') or []
+        compiled = self._compiled_rules.get(breakpoint_type)
+        if compiled is None or compiled.source != tuple(conditions):
+            compiled = _CompiledRule(breakpoint_type, conditions)
+            self._compiled_rules[breakpoint_type] = compiled
+
+        if not compiled.codes:
             return False
 
-        try:
-            # Create safe evaluation context
-            safe_context = {
-                'True': True,
-                'False': False,
-                'None': None,
-                **context
+        values = tuple(
+            rule[name] if name in _RULE_PARAMETERS and name in rule
+            else context.get(name, _MISSING)
+            for name in compiled.inputs
+        )
+        memoizable = all(v is _MISSING or type(v) in _MEMO_TYPES for v in values)
+        if memoizable and values == compiled.last_values:
+            return compiled.last_result
+
+        result = self._evaluate_conditions(
+            compiled.codes,
+            {
+                name: value
+                for name, value in zip(compiled.inputs, values)
+                if value is not _MISSING
             }
+        )
 
-            # Evaluate all conditions
-            for condition in conditions:
-                try:
-                    result = eval(condition, {"__builtins__": {}}, safe_context)
-                    if not result:
-                        return False
-                except Exception as e:
-                    logger.warning(f"Condition evaluation failed: {condition} - {e}")
-                    return False
+        compiled.last_values = values if memoizable else None
+        compiled.last_result = result
+        return result
 
-            return True
+    def _evaluate_conditions(
+        self,
+        conditions: List[Tuple[str, CodeType]],
+        namespace: Dict[str, Any]
+    ) -> bool:
+        """Evaluate compiled condition expressions.
+
+        Args:
+            conditions: (source, code) pairs from compile_condition()
+            namespace: Values of the names the conditions reference
 
-        except Exception as e:
-            logger.error(f"Condition evaluation error: {e}")
+        Returns:
+            True if all conditions evaluate to True
+        """
+        if not conditions:
             return False
 
+        for condition, code in conditions:
+            try:
+                if not eval(code, {"__builtins__": {}}, namespace):
+                    return False
+            except Exception as e:
+                logger.warning(f"Condition evaluation failed: {condition} - {e}")
+                return False
+
+        return True
+
     def _auto_resolve_breakpoint(
         self,
         event: BreakpointEvent,
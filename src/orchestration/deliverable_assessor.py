@@ -19,20 +19,130 @@ Example Usage:
     >>> print(f"Outcome: {assessment.outcome}")
     >>> print(f"Files created: {len(assessment.files)}")
     >>> print(f"Quality score: {assessment.quality_score:.2f}")
+
+Performance:
+    Each task file is read into memory once per assessment and every check
+    (syntax, quality heuristics) works on that snapshot. Syntax checks for
+    larger batches run in a process pool, and per-file results are cached by
+    content hash per task, so repeat assessments of the same task only pay
+    for files that actually changed since the previous iteration.
 """
 
+import hashlib
 import json
 import logging
-import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.core.models import Task, TaskOutcome
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FileSnapshot:
+    """In-memory snapshot of a deliverable file, read once per assessment.
+
+    Attributes:
+        path: File path
+        size: File size in bytes
+        content_hash: SHA-256 of the raw bytes
+        content: Decoded UTF-8 text (None if the file is not valid UTF-8)
+    """
+    path: str
+    size: int
+    content_hash: str
+    content: Optional[str]
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional['FileSnapshot']:
+        """Read a file once into a snapshot.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            FileSnapshot, or None if the file does not exist or cannot be read
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            logger.warning(f"File does not exist: {file_path}")
+            return None
+        except OSError as e:
+            logger.debug(f"Error reading {file_path}: {e}")
+            return None
+
+        try:
+            content: Optional[str] = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            content = None
+
+        return cls(
+            path=file_path,
+            size=len(raw),
+            content_hash=hashlib.sha256(raw).hexdigest(),
+            content=content
+        )
+
+
+def check_syntax(file_path: str, content: Optional[str]) -> bool:
+    """Check syntax of in-memory file content.
+
+    Module-level (not a method) so it can run in a process pool worker.
+
+    Supports:
+        - Python (.py): compile() check
+        - JSON (.json): json.loads() check
+        - YAML (.yaml, .yml): safe_load() check (if PyYAML available)
+        - Other: content must be valid UTF-8 text
+
+    Args:
+        file_path: Path to file (selects the checker by extension)
+        content: Decoded file content, None if not valid UTF-8
+
+    Returns:
+        True if syntax is valid, False otherwise
+    """
+    if content is None:
+        logger.debug(f"Error validating {file_path}: not valid UTF-8")
+        return False
+
+    try:
+        if file_path.endswith('.py'):
+            compile(content, file_path, 'exec')
+        elif file_path.endswith('.json'):
+            json.loads(content)
+        elif file_path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                # PyYAML not available, readability is all we can check
+                return True
+            yaml.safe_load(content)
+        return True
+
+    except SyntaxError as e:
+        logger.debug(f"Syntax error in {file_path}: {e}")
+        return False
+    except json.JSONDecodeError as e:
+        logger.debug(f"JSON decode error in {file_path}: {e}")
+        return False
+    except Exception as e:
+        logger.debug(f"Error validating {file_path}: {e}")
+        return False
+
+
+def _check_syntax_worker(args: Tuple[str, Optional[str]]) -> bool:
+    """Process pool entry point for check_syntax()."""
+    return check_syntax(*args)
+
+
 @dataclass
 class DeliverableAssessment:
     """Assessment of deliverables created during task execution.
@@ -92,6 +202,9 @@ class DeliverableAssessor:
     Attributes:
         file_watcher: FileWatcher instance for tracking file changes
         quality_controller: QualityController instance for advanced validation
+        parallel: Whether to run syntax checks in a process pool
+        max_workers: Process pool size (None = executor default)
+        stats: Counters for files assessed vs. reused from previous iterations
     """
 
     # Quality scoring weights
@@ -106,15 +219,35 @@ class DeliverableAssessor:
     GOOD_FILE_SIZE_MIN = 500  # Ideal minimum
     GOOD_FILE_SIZE_MAX = 10000  # Ideal maximum
 
-    def __init__(self, file_watcher, quality_controller=None):
+    # Below this many files to check, a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 8
+
+    # Number of tasks whose per-file results are kept for incremental assessment
+    MAX_CACHED_TASKS = 32
+
+    def __init__(
+        self,
+        file_watcher,
+        quality_controller=None,
+        parallel: bool = True,
+        max_workers: Optional[int] = None
+    ):
         """Initialize DeliverableAssessor.
 
         Args:
             file_watcher: FileWatcher instance for tracking file changes
             quality_controller: Optional QualityController for advanced validation
+            parallel: Run syntax checks for large batches in a process pool
+            max_workers: Process pool size (None = executor default)
         """
         self.file_watcher = file_watcher
         self.quality_controller = quality_controller
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+        # task_id -> {file_path: (content_hash, syntax_valid, file_score)}
+        self._task_results: 'OrderedDict[int, Dict[str, Tuple[str, bool, float]]]' = OrderedDict()
+        self.stats = {'files_assessed': 0, 'files_reused': 0}
 
         logger.debug("DeliverableAssessor initialized")
 
@@ -150,12 +283,18 @@ class DeliverableAssessor:
 
         logger.debug(f"Found {len(new_files)} files for task {task.id}")
 
-        # Validate syntax for all files
+        # Read each file once, then only assess files whose content changed
+        # since the previous assessment of this task
+        results = self._assess_files(task.id, new_files)
+
         valid_files = []
         syntax_errors = []
+        scores = []
         for file_path in new_files:
-            if self._is_valid_syntax(file_path):
+            syntax_valid, file_score = results[file_path]
+            if syntax_valid:
                 valid_files.append(file_path)
+                scores.append(file_score)
             else:
                 syntax_errors.append(file_path)
 
@@ -170,7 +309,7 @@ class DeliverableAssessor:
             )
 
         # Assess quality of valid files
-        quality_score = self._assess_file_quality(valid_files)
+        quality_score = self._combine_scores(scores)
 
         # Determine outcome based on quality
         if quality_score >= 0.7:
@@ -242,15 +381,87 @@ class DeliverableAssessor:
             logger.error(f"Failed to get file changes: {e}", exc_info=True)
             return []
 
+    def clear_cache(self, task_id: Optional[int] = None) -> None:
+        """Forget per-file results used for incremental assessment.
+
+        Args:
+            task_id: Task to forget (None = all tasks)
+        """
+        if task_id is None:
+            self._task_results.clear()
+        else:
+            self._task_results.pop(task_id, None)
+
+    def _assess_files(self, task_id: int, files: List[str]) -> Dict[str, Tuple[bool, float]]:
+        """Check syntax and score files, reusing results for unchanged content.
+
+        Args:
+            task_id: Task the files belong to (scope of the result cache)
+            files: File paths to assess
+
+        Returns:
+            Dict mapping file path to (syntax_valid, file_score)
+        """
+        previous = self._task_results.get(task_id, {})
+        current: Dict[str, Tuple[str, bool, float]] = {}
+        results: Dict[str, Tuple[bool, float]] = {}
+        pending: List[FileSnapshot] = []
+
+        for file_path in files:
+            snapshot = FileSnapshot.load(file_path)
+            if snapshot is None:
+                results[file_path] = (False, 0.0)
+                continue
+
+            cached = previous.get(file_path)
+            if cached is not None and cached[0] == snapshot.content_hash:
+                current[file_path] = cached
+                results[file_path] = cached[1:]
+                self.stats['files_reused'] += 1
+            else:
+                pending.append(snapshot)
+
+        for snapshot, syntax_valid in zip(pending, self._check_syntax_batch(pending)):
+            file_score = self._score_file(snapshot) if syntax_valid else 0.0
+            current[snapshot.path] = (snapshot.content_hash, syntax_valid, file_score)
+            results[snapshot.path] = (syntax_valid, file_score)
+            self.stats['files_assessed'] += 1
+
+        logger.debug(
+            f"Task {task_id}: assessed {len(pending)} changed files, "
+            f"reused {len(files) - len(pending)} unchanged/missing"
+        )
+
+        self._task_results[task_id] = current
+        self._task_results.move_to_end(task_id)
+        while len(self._task_results) > self.MAX_CACHED_TASKS:
+            self._task_results.popitem(last=False)
+
+        return results
+
+    def _check_syntax_batch(self, snapshots: List[FileSnapshot]) -> List[bool]:
+        """Check syntax of snapshots, in a process pool for large batches.
+
+        Args:
+            snapshots: File snapshots to check
+
+        Returns:
+            Syntax validity per snapshot, in input order
+        """
+        args = [(s.path, s.content) for s in snapshots]
+
+        if self.parallel and len(args) >= self.PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    return list(pool.map(_check_syntax_worker, args))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel syntax check unavailable, falling back to serial: {e}")
+
+        return [check_syntax(path, content) for path, content in args]
+
     def _is_valid_syntax(self, file_path: str) -> bool:
         """Check if file has valid syntax.
 
-        Supports:
-            - Python (.py): compile() check
-            - JSON (.json): json.load() check
-            - YAML (.yaml, .yml): basic parsing (if PyYAML available)
-            - Other: basic readability check
-
         Args:
             file_path: Path to file to validate
 
@@ -263,52 +474,97 @@ class DeliverableAssessor:
             >>> assessor._is_valid_syntax("broken.py")
             False  # Syntax error
         """
-        if not os.path.exists(file_path):
-            logger.warning(f"File does not exist: {file_path}")
+        snapshot = FileSnapshot.load(file_path)
+        if snapshot is None:
             return False
+        return check_syntax(snapshot.path, snapshot.content)
 
-        try:
-            if file_path.endswith('.py'):
-                # Python syntax check
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                compile(content, file_path, 'exec')
-                return True
+    def _score_file(self, snapshot: FileSnapshot) -> float:
+        """Score a single syntactically valid file (0.0-1.0).
 
-            elif file_path.endswith('.json'):
-                # JSON syntax check
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
-                return True
+        Args:
+            snapshot: File snapshot to score
 
-            elif file_path.endswith(('.yaml', '.yml')):
-                # YAML syntax check (basic)
-                try:
-                    import yaml
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        yaml.safe_load(f)
-                    return True
-                except ImportError:
-                    # PyYAML not available, just check readability
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        f.read()
-                    return True
+        Returns:
+            Weighted size/content/syntax score for the file
+        """
+        file_size = snapshot.size
+
+        # Size score (0.0-1.0)
+        if file_size < self.MIN_FILE_SIZE:
+            size_score = 0.1  # Too small, likely stub
+        elif file_size > self.MAX_FILE_SIZE:
+            size_score = 0.5  # Too large, possibly bloated
+        elif self.GOOD_FILE_SIZE_MIN <= file_size <= self.GOOD_FILE_SIZE_MAX:
+            size_score = 1.0  # Ideal size range
+        else:
+            size_score = 0.7  # Acceptable size
 
-            else:
-                # For other file types, just check if readable
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    f.read()
-                return True
+        # Content score (0.0-1.0) - only for code files
+        content_score = 0.5  # Base score for any valid file
+        content = snapshot.content
 
-        except SyntaxError as e:
-            logger.debug(f"Syntax error in {file_path}: {e}")
-            return False
-        except json.JSONDecodeError as e:
-            logger.debug(f"JSON decode error in {file_path}: {e}")
-            return False
-        except Exception as e:
-            logger.debug(f"Error validating {file_path}: {e}")
-            return False
+        if content is None:
+            # Binary file - can't be assessed
+            return 0.3
+
+        if snapshot.path.endswith('.py'):
+            # Check for quality indicators
+            has_docstrings = '"""' in content or "'''" in content
+            has_type_hints = ': ' in content and '->' in content
+            has_functions = 'def ' in content or 'class ' in content
+            has_imports = 'import ' in content
+
+            # Increment score for each indicator
+            if has_docstrings:
+                content_score += 0.15
+            if has_type_hints:
+                content_score += 0.15
+            if has_functions:
+                content_score += 0.10
+            if has_imports:
+                content_score += 0.10
+
+        elif snapshot.path.endswith('.md'):
+            # README/docs get bonus for having content
+            if len(content) > 500:
+                content_score += 0.3
+
+        # Combine scores (weighted)
+        file_score = (size_score * self.WEIGHT_SIZE) + (content_score * self.WEIGHT_CONTENT)
+
+        # Syntax always valid (pre-filtered)
+        file_score += 1.0 * self.WEIGHT_SYNTAX
+
+        return min(file_score, 1.0)
+
+    def _combine_scores(self, scores: List[float]) -> float:
+        """Combine per-file scores into an overall quality score.
+
+        Args:
+            scores: Per-file scores of valid files
+
+        Returns:
+            Quality score (0.0-1.0)
+        """
+        if not scores:
+            return 0.0
+
+        # Average score across all files
+        base_score = sum(scores) / len(scores)
+
+        # Bonus for file count (more files = more work)
+        file_count_bonus = min(len(scores) * 0.05, 0.2)  # Max 0.2 bonus for 4+ files
+
+        total_score = min(base_score + file_count_bonus, 1.0)
+
+        logger.debug(
+            f"Quality assessment: {len(scores)} files, "
+            f"avg_score={base_score:.2f}, bonus={file_count_bonus:.2f}, "
+            f"total={total_score:.2f}"
+        )
+
+        return total_score
 
     def _assess_file_quality(self, files: List[str]) -> float:
         """Lightweight quality assessment of created files.
@@ -330,82 +586,9 @@ class DeliverableAssessor:
             >>> score = assessor._assess_file_quality(files)
             >>> print(f"Quality: {score:.2f}")  # e.g., 0.85
         """
-        if not files:
-            return 0.0
-
         scores = []
-
         for file_path in files:
-            file_score = 0.0
-
-            try:
-                # Get file size
-                file_size = os.path.getsize(file_path)
-
-                # Size score (0.0-1.0)
-                if file_size < self.MIN_FILE_SIZE:
-                    size_score = 0.1  # Too small, likely stub
-                elif file_size > self.MAX_FILE_SIZE:
-                    size_score = 0.5  # Too large, possibly bloated
-                elif self.GOOD_FILE_SIZE_MIN <= file_size <= self.GOOD_FILE_SIZE_MAX:
-                    size_score = 1.0  # Ideal size range
-                else:
-                    size_score = 0.7  # Acceptable size
-
-                # Content score (0.0-1.0) - only for code files
-                content_score = 0.5  # Base score for any valid file
-
-                if file_path.endswith('.py'):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Check for quality indicators
-                    has_docstrings = '"""' in content or "'''" in content
-                    has_type_hints = ': ' in content and '->' in content
-                    has_functions = 'def ' in content or 'class ' in content
-                    has_imports = 'import ' in content
-
-                    # Increment score for each indicator
-                    if has_docstrings:
-                        content_score += 0.15
-                    if has_type_hints:
-                        content_score += 0.15
-                    if has_functions:
-                        content_score += 0.10
-                    if has_imports:
-                        content_score += 0.10
-
-                elif file_path.endswith('.md'):
-                    # README/docs get bonus for having content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    if len(content) > 500:
-                        content_score += 0.3
-
-                # Combine scores (weighted)
-                file_score = (size_score * self.WEIGHT_SIZE) + (content_score * self.WEIGHT_CONTENT)
-
-                # Syntax always valid (pre-filtered)
-                file_score += 1.0 * self.WEIGHT_SYNTAX
-
-                scores.append(min(file_score, 1.0))
-
-            except Exception as e:
-                logger.debug(f"Error assessing {file_path}: {e}")
-                scores.append(0.3)  # Low score for files that can't be assessed
-
-        # Average score across all files
-        base_score = sum(scores) / len(scores) if scores else 0.0
-
-        # Bonus for file count (more files = more work)
-        file_count_bonus = min(len(files) * 0.05, 0.2)  # Max 0.2 bonus for 4+ files
-
-        total_score = min(base_score + file_count_bonus, 1.0)
-
-        logger.debug(
-            f"Quality assessment: {len(files)} files, "
-            f"avg_score={base_score:.2f}, bonus={file_count_bonus:.2f}, "
-            f"total={total_score:.2f}"
-        )
-
-        return total_score
+            snapshot = FileSnapshot.load(file_path)
+            # Low score for files that can't be assessed
+            scores.append(self._score_file(snapshot) if snapshot else 0.3)
+        return self._combine_scores(scores)
@@ -5,7 +5,7 @@ including:
 - Topological sorting for execution order
 - Cycle detection (circular dependencies)
 - Dependency validation
-- Execution readiness checking
+- Execution readiness checking (set-based queries over task_dependency)
 - Visual dependency graph generation
 
 Key Features:
@@ -216,34 +216,31 @@ class DependencyResolver:
             ...     print("Task is blocked by dependencies")
         """
         with self._lock:
-            task = self.state_manager.get_task(task_id)
+            # One query for all dependency statuses (no dependencies = ready)
+            try:
+                statuses = self.state_manager.get_dependency_statuses(task_id)
+            except Exception as e:
+                logger.error(f"Error checking dependencies of task {task_id}: {e}")
+                return False
 
-            # No dependencies = ready
-            if not task.has_dependencies():
-                return True
+            for dep_id, status in statuses.items():
+                if status is None:
+                    logger.debug(f"Task {task_id} blocked by missing dependency {dep_id}")
+                    return False
 
-            # Check all dependencies
-            for dep_id in task.get_dependencies():
-                try:
-                    dep_task = self.state_manager.get_task(dep_id)
-
-                    # Dependency must be completed
-                    if dep_task.status != TaskStatus.COMPLETED:
-                        logger.debug(
-                            f"Task {task_id} blocked by dependency {dep_id} "
-                            f"(status: {dep_task.status.value})"
-                        )
-                        return False
-
-                    # Check if dependency failed
-                    if self.config.fail_on_dependency_error and dep_task.status == TaskStatus.FAILED:
-                        logger.warning(
-                            f"Task {task_id} blocked by failed dependency {dep_id}"
-                        )
-                        return False
-
-                except Exception as e:
-                    logger.error(f"Error checking dependency {dep_id}: {e}")
+                # Check if dependency failed
+                if self.config.fail_on_dependency_error and status == TaskStatus.FAILED:
+                    logger.warning(
+                        f"Task {task_id} blocked by failed dependency {dep_id}"
+                    )
+                    return False
+
+                # Dependency must be completed
+                if status != TaskStatus.COMPLETED:
+                    logger.debug(
+                        f"Task {task_id} blocked by dependency {dep_id} "
+                        f"(status: {status.value})"
+                    )
                     return False
 
             return True
@@ -262,15 +259,11 @@ class DependencyResolver:
             >>> print(f"{len(blocked)} tasks are blocked")
         """
         with self._lock:
-            tasks = self.state_manager.get_tasks_by_project(project_id)
-            blocked = []
-
-            for task in tasks:
-                if task.status in [TaskStatus.PENDING, TaskStatus.READY]:
-                    if task.has_dependencies() and not self.is_task_ready(task.id):
-                        blocked.append(task.id)
-
-            return blocked
+            readiness = self.state_manager.get_task_readiness(
+                project_id,
+                statuses=[TaskStatus.PENDING, TaskStatus.READY]
+            )
+            return [task_id for task_id, ready in readiness.items() if not ready]
 
     def get_execution_order(
         self,
@@ -23,9 +23,9 @@ Version: 1.0.0
 
 import logging
 import yaml
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +66,8 @@ class OptimizationProfile:
         checkpoint_operation_count: Operations before checkpoint
         max_operations: Max operations in working memory
         max_tokens_pct: Max % of context for working memory
+        eviction_policy: Working memory eviction policy (fifo, lru, gdsf, priority)
+        pinned_operation_types: Operation types working memory evicts last
     """
     name: str
     description: str
@@ -83,6 +85,8 @@ class OptimizationProfile:
     checkpoint_operation_count: int
     max_operations: int
     max_tokens_pct: float
+    eviction_policy: str = 'fifo'
+    pinned_operation_types: List[str] = field(default_factory=list)
 
 
 class AdaptiveOptimizer:
@@ -272,7 +276,9 @@ class AdaptiveOptimizer:
             checkpoint_threshold_pct=profile_data['checkpoint_threshold_pct'],
             checkpoint_operation_count=profile_data['checkpoint_operation_count'],
             max_operations=profile_data['max_operations'],
-            max_tokens_pct=profile_data['max_tokens_pct']
+            max_tokens_pct=profile_data['max_tokens_pct'],
+            eviction_policy=profile_data.get('eviction_policy', 'fifo'),
+            pinned_operation_types=list(profile_data.get('pinned_operation_types') or [])
         )
 
     def _apply_custom_thresholds(self) -> None:
@@ -331,7 +337,9 @@ class AdaptiveOptimizer:
             'checkpoint_threshold_pct': self.active_profile.checkpoint_threshold_pct,
             'checkpoint_operation_count': self.active_profile.checkpoint_operation_count,
             'max_operations': self.active_profile.max_operations,
-            'max_tokens_pct': self.active_profile.max_tokens_pct
+            'max_tokens_pct': self.active_profile.max_tokens_pct,
+            'eviction_policy': self.active_profile.eviction_policy,
+            'pinned_operation_types': list(self.active_profile.pinned_operation_types)
         }
 
     def get_active_profile_name(self) -> str:
@@ -381,7 +389,9 @@ class AdaptiveOptimizer:
             'max_tokens_pct': self.active_profile.max_tokens_pct,
             'max_tokens': int(
                 self.context_window_size * self.active_profile.max_tokens_pct
-            )
+            ),
+            'eviction_policy': self.active_profile.eviction_policy,
+            'pinned_types': list(self.active_profile.pinned_operation_types)
         }
 
     def get_pruning_config(self) -> Dict[str, Any]:
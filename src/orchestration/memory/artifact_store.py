@@ -0,0 +1,471 @@
+"""Content-addressed blob store for externalized context and checkpoints.
+
+Blobs are named by the SHA-256 of their content, so storing the same
+artifact, phase archive or checkpoint payload twice costs one file and a
+reference-count increment. Blobs are compressed (zstd when the
+``zstandard`` package is installed, gzip otherwise) unless compression is
+disabled, in which case reads are served from a memory map without copying.
+
+Layout under the store root::
+
+    objects/ab/ab12...ef.zst   # blob, codec in the suffix (.zst, .gz, .raw)
+    index.json                 # digest -> refs, size, stored_size, codec
+    index.journal              # index changes since index.json, one per line
+
+Each put, addref and release appends one line to the journal instead of
+rewriting the index; the journal is folded into index.json once it holds
+more lines than the index has entries (and on gc()), so index writes cost
+amortized O(1) per change.
+
+Classes:
+    ArtifactStore: Hash-named, compressed, reference-counted blob store
+    ArtifactStoreException: Exception for store errors
+
+Example:
+    >>> store = ArtifactStore('.obra/memory/artifacts')
+    >>> digest = store.put_json({'id': 'artifact_1', 'data': '...'})
+    >>> store.get_json(digest)['id']
+    'artifact_1'
+    >>> store.read_range(digest, 0, 16)
+    b'{"data":"...","i'
+    >>> store.release(digest)
+    0
+    >>> store.gc()['blobs_removed']
+    1
+
+Thread-safe within one process (instances on the same root share their
+index). Processes sharing a store root must not write to it concurrently.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock, RLock
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CODEC_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz', 'none': '.raw'}
+
+# Read size when skipping through a compressed stream for range reads
+_STREAM_CHUNK = 1 << 16
+
+# Journal lines always allowed before folding into index.json
+_JOURNAL_COMPACT_MIN_LINES = 1000
+
+
+class _SharedIndex:
+    """Index, lock and journal length shared by the instances on one root."""
+
+    __slots__ = ('entries', 'lock', 'journal_lines')
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]], journal_lines: int):
+        self.entries = entries
+        self.lock = RLock()
+        self.journal_lines = journal_lines
+
+
+# Instances on the same root share one index and lock, so two components of
+# a process (e.g. MemoryManager and a restore) never overwrite each other
+_shared_state: Dict[Path, _SharedIndex] = {}
+_shared_state_lock = Lock()
+
+
+class ArtifactStoreException(Exception):
+    """Exception raised for artifact store errors."""
+
+    def __init__(self, message: str, context: Optional[Dict[str, Any]] = None):
+        """Initialize exception.
+
+        Args:
+            message: Error message
+            context: Additional context about the error
+        """
+        super().__init__(message)
+        self.context = context or {}
+        logger.error(f"ArtifactStoreException: {message}", extra=context)
+
+
+class ArtifactStore:
+    """Hash-named, compressed, reference-counted blob store.
+
+    Attributes:
+        root: Store root directory
+        codec: Compression codec for new blobs ('zstd', 'gzip' or 'none')
+        min_compress_bytes: Blobs smaller than this are stored uncompressed
+
+    Example:
+        >>> store = ArtifactStore('.obra/memory/artifacts', compression='none')
+        >>> digest = store.put(b'x' * 100000)
+        >>> with store.view(digest) as data:  # memory-mapped, zero-copy
+        ...     header = bytes(data[:4])
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        compression: str = 'auto',
+        min_compress_bytes: int = 1024
+    ):
+        """Initialize store, creating the root directory if needed.
+
+        Args:
+            root: Store root directory
+            compression: 'auto' (zstd if installed, else gzip), 'zstd', 'gzip' or 'none'
+            min_compress_bytes: Size below which blobs are stored uncompressed
+
+        Raises:
+            ArtifactStoreException: If the codec is unknown or unavailable
+        """
+        if compression == 'auto':
+            compression = 'zstd' if ZSTD_AVAILABLE else 'gzip'
+        if compression not in CODEC_SUFFIXES:
+            raise ArtifactStoreException(
+                f"Unknown compression codec: {compression}",
+                context={'supported': ['auto', *CODEC_SUFFIXES]}
+            )
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            raise ArtifactStoreException(
+                "zstd compression requires the zstandard package "
+                "(pip install zstandard), or use compression='gzip'"
+            )
+
+        self.root = Path(root)
+        self.codec = compression
+        self.min_compress_bytes = min_compress_bytes
+        self._objects_dir = self.root / 'objects'
+        self._index_path = self.root / 'index.json'
+        self._journal_path = self.root / 'index.journal'
+
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        with _shared_state_lock:
+            key = self.root.resolve()
+            if key not in _shared_state:
+                _shared_state[key] = _SharedIndex(*self._load_index())
+            self._shared = _shared_state[key]
+            self._index, self._lock = self._shared.entries, self._shared.lock
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def put(self, data: bytes) -> str:
+        """Store bytes and take a reference to them.
+
+        Identical content is stored once; storing it again only increments
+        its reference count.
+
+        Args:
+            data: Blob content
+
+        Returns:
+            Hex SHA-256 digest identifying the blob
+        """
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is not None and self._blob_path(digest, entry['codec']).exists():
+                entry['refs'] += 1
+                self._record(digest)
+                logger.debug(f"Artifact {digest[:12]} deduplicated (refs={entry['refs']})")
+                return digest
+
+            codec = self.codec if len(data) >= self.min_compress_bytes else 'none'
+            stored = self._compress(data, codec)
+            if codec != 'none' and len(stored) >= len(data):
+                codec, stored = 'none', data  # incompressible
+
+            path = self._blob_path(digest, codec)
+            self._write_atomic(path, stored)
+            self._index[digest] = {
+                'refs': (entry['refs'] if entry else 0) + 1,
+                'size': len(data),
+                'stored_size': len(stored),
+                'codec': codec
+            }
+            self._record(digest)
+
+        logger.debug(f"Stored artifact {digest[:12]}: {len(data):,} → {len(stored):,} bytes ({codec})")
+        return digest
+
+    def put_json(self, obj: Any) -> str:
+        """Store a JSON-serializable object canonically (sorted keys, compact).
+
+        Equal objects produce the same digest regardless of key order.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            Blob digest
+        """
+        return self.put(json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+
+    def addref(self, digest: str) -> int:
+        """Take another reference to an existing blob.
+
+        Returns:
+            New reference count
+        """
+        with self._lock:
+            entry = self._entry(digest)
+            entry['refs'] += 1
+            self._record(digest)
+            return entry['refs']
+
+    def release(self, digest: str) -> int:
+        """Drop a reference; unreferenced blobs are deleted by gc().
+
+        Returns:
+            Remaining reference count
+        """
+        with self._lock:
+            entry = self._entry(digest)
+            entry['refs'] = max(entry['refs'] - 1, 0)
+            self._record(digest)
+            return entry['refs']
+
+    def gc(self) -> Dict[str, int]:
+        """Delete unreferenced blobs and files missing from the index.
+
+        Returns:
+            Dictionary with 'blobs_removed' and 'bytes_freed'
+        """
+        removed = 0
+        freed = 0
+
+        with self._lock:
+            for digest in [d for d, entry in self._index.items() if entry['refs'] <= 0]:
+                entry = self._index.pop(digest)
+                path = self._blob_path(digest, entry['codec'])
+                if path.exists():
+                    freed += path.stat().st_size
+                    path.unlink()
+                removed += 1
+
+            # Orphans: blobs written but never indexed (e.g. interrupted put)
+            for path in self._objects_dir.glob('*/*'):
+                digest = path.name.split('.', 1)[0]
+                entry = self._index.get(digest)
+                if entry is None or path.suffix != CODEC_SUFFIXES[entry['codec']]:
+                    freed += path.stat().st_size
+                    path.unlink()
+                    removed += 1
+
+            self._save_index()
+
+        if removed:
+            logger.info(f"Artifact store GC: removed {removed} blobs, freed {freed:,} bytes")
+        return {'blobs_removed': removed, 'bytes_freed': freed}
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def contains(self, digest: str) -> bool:
+        """Whether a blob with this digest is stored."""
+        with self._lock:
+            return digest in self._index
+
+    def path(self, digest: str) -> Path:
+        """Filesystem path of a blob (compressed unless its codec is 'none')."""
+        with self._lock:
+            return self._blob_path(digest, self._entry(digest)['codec'])
+
+    def get(self, digest: str) -> bytes:
+        """Read a whole blob."""
+        with self.open(digest) as stream:
+            return stream.read()
+
+    def get_json(self, digest: str) -> Any:
+        """Read a blob stored with put_json()."""
+        return json.loads(self.get(digest))
+
+    def open(self, digest: str) -> BinaryIO:
+        """Open a blob for streaming reads (decompressing on the fly).
+
+        Returns:
+            Binary file object; close it (or use it as a context manager)
+        """
+        with self._lock:
+            codec = self._entry(digest)['codec']
+            path = self._blob_path(digest, codec)
+
+        try:
+            if codec == 'gzip':
+                return gzip.open(path, 'rb')
+            if codec == 'zstd':
+                return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+            return open(path, 'rb')
+        except FileNotFoundError as e:
+            raise ArtifactStoreException(
+                f"Artifact blob missing: {digest}",
+                context={'digest': digest, 'path': str(path)}
+            ) from e
+
+    def read_range(self, digest: str, offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset`` of a blob's content.
+
+        Uncompressed blobs are sliced from a memory map; compressed blobs
+        are decompressed as a stream up to the end of the range only.
+
+        Args:
+            digest: Blob digest
+            offset: Start offset in the uncompressed content
+            length: Number of bytes to read
+
+        Returns:
+            The bytes in range (shorter at the end of the blob)
+        """
+        if self._entry(digest)['codec'] == 'none':
+            with self.view(digest) as data:
+                return bytes(data[offset:offset + length])
+
+        with self.open(digest) as stream:
+            remaining = offset
+            while remaining > 0:
+                skipped = stream.read(min(remaining, _STREAM_CHUNK))
+                if not skipped:
+                    return b''
+                remaining -= len(skipped)
+            return stream.read(length)
+
+    @contextmanager
+    def view(self, digest: str) -> Iterator[memoryview]:
+        """Zero-copy view of a blob's content.
+
+        Uncompressed blobs are memory-mapped; compressed blobs are
+        decompressed into memory first.
+
+        Example:
+            >>> with store.view(digest) as data:
+            ...     magic = bytes(data[:4])
+        """
+        if self._entry(digest)['codec'] != 'none':
+            yield memoryview(self.get(digest))
+            return
+
+        with open(self.path(digest), 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b'')
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Blob count, reference count and logical vs stored bytes."""
+        with self._lock:
+            entries = list(self._index.values())
+        return {
+            'blobs': len(entries),
+            'references': sum(e['refs'] for e in entries),
+            'unreferenced': sum(1 for e in entries if e['refs'] <= 0),
+            'logical_bytes': sum(e['size'] for e in entries),
+            'stored_bytes': sum(e['stored_size'] for e in entries),
+            'codec': self.codec
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entry(self, digest: str) -> Dict[str, Any]:
+        entry = self._index.get(digest)
+        if entry is None:
+            raise ArtifactStoreException(
+                f"Unknown artifact: {digest}",
+                context={'digest': digest, 'root': str(self.root)}
+            )
+        return entry
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self._objects_dir / digest[:2] / f"{digest}{CODEC_SUFFIXES[codec]}"
+
+    @staticmethod
+    def _compress(data: bytes, codec: str) -> bytes:
+        if codec == 'zstd':
+            return zstandard.ZstdCompressor().compress(data)
+        if codec == 'gzip':
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        return data
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write via a temp file and rename, so readers never see partial blobs."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _load_index(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Read index.json and replay the journal on top of it.
+
+        Returns:
+            Tuple of (index, journal lines replayed)
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        lines = 0
+        try:
+            if self._index_path.exists():
+                with open(self._index_path) as f:
+                    index = json.load(f)
+            if self._journal_path.exists():
+                with open(self._journal_path, encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            change = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn last line of an interrupted append: fold
+                            # what was read so new appends start clean
+                            logger.warning(f"Ignoring incomplete line in {self._journal_path}")
+                            self._write_atomic(self._index_path, json.dumps(index).encode('utf-8'))
+                            self._journal_path.unlink()
+                            return index, 0
+                        if change['entry'] is None:
+                            index.pop(change['digest'], None)
+                        else:
+                            index[change['digest']] = change['entry']
+                        lines += 1
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ArtifactStoreException(
+                f"Failed to load artifact store index: {e}",
+                context={'path': str(self._index_path)}
+            ) from e
+        return index, lines
+
+    def _record(self, digest: str) -> None:
+        """Persist the current index entry of ``digest`` (None if removed)."""
+        change = {'digest': digest, 'entry': self._index.get(digest)}
+        with open(self._journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(change, separators=(',', ':')) + '\n')
+        self._shared.journal_lines += 1
+        if self._shared.journal_lines > max(_JOURNAL_COMPACT_MIN_LINES, len(self._index)):
+            self._save_index()
+
+    def _save_index(self) -> None:
+        """Write the whole index to index.json and empty the journal."""
+        self._write_atomic(self._index_path, json.dumps(self._index).encode('utf-8'))
+        self._journal_path.unlink(missing_ok=True)
+        self._shared.journal_lines = 0
@@ -6,12 +6,14 @@ context window usage while preserving critical information:
 1. Summarization - Compress completed phases using LLM
 2. Artifact Registry - Replace file contents with metadata
 3. Differential State - Store state deltas vs full snapshots
-4. External Storage - Move large artifacts to disk
+4. External Storage - Move large artifacts to the content-addressed
+   ArtifactStore (deduplicated, compressed; read back with load_external)
 5. Pruning - Remove old/temporary data
 
 Classes:
     ContextOptimizer: Coordinates all optimization techniques
     OptimizationResult: Results from optimization operations
+    SizedContext: Context dict with cached serialized sizes per key/item
 
 Example:
     >>> optimizer = ContextOptimizer(llm_interface, config)
@@ -25,11 +27,13 @@ Version: 1.0.0
 
 import logging
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 
+from .artifact_store import ArtifactStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +78,199 @@ class OptimizationResult:
             self.errors = []
 
 
+# Token estimate used when data can't be serialized (matches _estimate_tokens)
+FALLBACK_TOKENS = 1000
+
+
+def _tokens_for_chars(chars: int) -> int:
+    """Token estimate for a JSON length: ~4 characters per token, minimum 1."""
+    return max(chars // 4, 1)
+
+
+def _container_chars(member_chars: Iterable[int]) -> int:
+    """JSON length of a list/dict from its members' lengths.
+
+    ``json.dumps`` separates members with ', ' and wraps them in two
+    brackets, so the length is additive.
+    """
+    count = 0
+    total = 0
+    for chars in member_chars:
+        count += 1
+        total += chars
+    return 2 + total + 2 * max(count - 1, 0)
+
+
+def _key_chars(key: Any) -> int:
+    """JSON length of a dict entry's key plus its ': ' separator."""
+    # json.dumps({key: 0}) == '{' + key + ': 0}'
+    return len(json.dumps({key: 0})) - 3
+
+
+class SizedContext:
+    """Context dictionary annotated with cached serialized sizes.
+
+    Token estimates in ContextOptimizer are ``len(json.dumps(data)) // 4``.
+    Instead of serializing the whole context before and after every
+    technique, SizedContext measures each top-level value once (list values
+    item by item) and derives the total from the cached lengths. Mutations
+    made through it (``set``, ``pop``, ``select_items``, ``replace_items``)
+    only measure the new values, so re-estimating after a technique costs
+    time proportional to what it changed. Totals are exact: ``chars`` always
+    equals ``len(json.dumps(context))``.
+
+    Values are measured lazily; code that mutates ``context`` directly must
+    call ``invalidate(key)``.
+
+    Example:
+        >>> sized = SizedContext(context)
+        >>> sized.tokens
+        52000
+        >>> sized.select_items('validation_results', range(5, 10))
+        >>> sized.tokens  # only the kept items' cached sizes are summed
+        51200
+    """
+
+    def __init__(self, context: Dict[str, Any]):
+        """Initialize size index.
+
+        Args:
+            context: Context dictionary (mutated in place through this object)
+        """
+        self.context = context
+        self._entry_chars: Dict[Any, int] = {}  # key -> len('"key": <value>')
+        self._item_chars: Dict[Any, List[int]] = {}  # list-valued key -> item lengths
+        self._unserializable: set = set()
+        self.measurements = 0  # values serialized so far (for tests/diagnostics)
+
+    # ------------------------------------------------------------------
+    # Size queries
+    # ------------------------------------------------------------------
+
+    @property
+    def chars(self) -> int:
+        """Serialized length of the whole context."""
+        return _container_chars(self._entry(key) for key in self.context)
+
+    @property
+    def tokens(self) -> int:
+        """Token estimate for the whole context (same as _estimate_tokens)."""
+        chars = self.chars
+        if any(key in self._unserializable for key in self.context):
+            return FALLBACK_TOKENS
+        return _tokens_for_chars(chars)
+
+    def value_tokens(self, key: Any) -> int:
+        """Token estimate for ``context[key]`` alone."""
+        value_chars = self._entry(key) - _key_chars(key)
+        if key in self._unserializable:
+            return FALLBACK_TOKENS
+        return _tokens_for_chars(value_chars)
+
+    def item_tokens(self, key: Any) -> List[int]:
+        """Token estimates for each item of the list at ``context[key]``."""
+        self._entry(key)
+        return [
+            FALLBACK_TOKENS if chars is None else _tokens_for_chars(chars)
+            for chars in self._item_chars.get(key, [])
+        ]
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def set(self, key: Any, value: Any) -> None:
+        """Set ``context[key]``, measuring only the new value."""
+        self.context[key] = value
+        self.invalidate(key)
+        self._entry(key)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove ``context[key]`` and its cached size."""
+        self.invalidate(key)
+        return self.context.pop(key, default)
+
+    def select_items(self, key: Any, indices: Iterable[int]) -> None:
+        """Keep the list items at ``indices`` (in that order) of ``context[key]``.
+
+        Sizes of kept items are reused; nothing is serialized.
+        """
+        items = self.context[key]
+        indices = list(indices)
+        self.context[key] = [items[i] for i in indices]
+        if key in self._item_chars:
+            old_chars = self._item_chars[key]
+            self._set_items(key, [old_chars[i] for i in indices])
+
+    def replace_items(self, key: Any, replacements: Dict[int, Any]) -> None:
+        """Replace list items of ``context[key]`` by index, measuring only those."""
+        if not replacements:
+            return
+        items = list(self.context[key])
+        for index, item in replacements.items():
+            items[index] = item
+        self.context[key] = items
+        if key in self._item_chars:
+            item_chars = list(self._item_chars[key])
+            for index, item in replacements.items():
+                item_chars[index] = self._measure(item)
+            self._set_items(key, item_chars)
+
+    def invalidate(self, key: Any) -> None:
+        """Forget the cached size of ``context[key]`` (re-measured when needed)."""
+        self._entry_chars.pop(key, None)
+        self._item_chars.pop(key, None)
+        self._unserializable.discard(key)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _measure(self, value: Any) -> Optional[int]:
+        """Serialized length of ``value``, or None if it can't be serialized."""
+        self.measurements += 1
+        try:
+            return len(json.dumps(value))
+        except (TypeError, ValueError):
+            return None
+
+    def _entry(self, key: Any) -> int:
+        """Length of ``"key": <value>``, measuring the value if not cached."""
+        chars = self._entry_chars.get(key)
+        if chars is not None:
+            return chars
+
+        value = self.context[key]
+        if isinstance(value, list):
+            self._set_items(key, [self._measure(item) for item in value])
+        else:
+            self._set_entry(key, self._measure(value))
+        return self._entry_chars[key]
+
+    def _set_items(self, key: Any, item_chars: List[Optional[int]]) -> None:
+        """Cache a list value's item lengths and derive its entry length."""
+        self._item_chars[key] = item_chars
+        serializable = all(chars is not None for chars in item_chars)
+        value_chars = _container_chars(
+            FALLBACK_TOKENS * 4 if chars is None else chars for chars in item_chars
+        )
+        self._set_entry(key, value_chars if serializable else None, value_chars)
+
+    def _set_entry(self, key: Any, value_chars: Optional[int], fallback_chars: int = FALLBACK_TOKENS * 4) -> None:
+        """Cache the entry length; None marks the value as unserializable."""
+        try:
+            key_chars = _key_chars(key)
+        except TypeError:
+            key_chars, value_chars = 0, None
+
+        if value_chars is None:
+            self._unserializable.add(key)
+            value_chars = fallback_chars
+        else:
+            self._unserializable.discard(key)
+        self._entry_chars[key] = key_chars + value_chars
+
+
 class ContextOptimizer:
     """Coordinator for context optimization techniques.
 
@@ -86,6 +283,7 @@ class ContextOptimizer:
         config: Configuration dictionary
         artifact_dir: Directory for external artifact storage
         archive_dir: Directory for archived data
+        artifact_store: Blob store for externalized artifacts and phase archives
 
     Example:
         >>> config = {
@@ -102,7 +300,8 @@ class ContextOptimizer:
     def __init__(
         self,
         llm_interface: Optional[Any] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        artifact_store: Optional[ArtifactStore] = None
     ):
         """Initialize context optimizer.
 
@@ -114,6 +313,8 @@ class ContextOptimizer:
                 - summarization_threshold: Token threshold for summarization
                 - externalization_threshold: Token threshold for external storage
                 - pruning_age_hours: Age threshold for pruning debug data
+                - artifact_compression: ArtifactStore codec (auto, zstd, gzip, none)
+            artifact_store: Shared blob store (default: one at artifact_storage_path)
 
         Raises:
             ContextOptimizerException: If configuration is invalid
@@ -132,6 +333,11 @@ class ContextOptimizer:
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
+        self.artifact_store = artifact_store or ArtifactStore(
+            self.artifact_dir,
+            compression=self.config.get('artifact_compression', 'auto')
+        )
+
         # Thresholds
         self.summarization_threshold = self.config.get('summarization_threshold', 500)
         self.externalization_threshold = self.config.get('externalization_threshold', 2000)
@@ -174,8 +380,9 @@ class ContextOptimizer:
                 context={'context_type': type(context).__name__}
             )
 
-        # Calculate initial tokens
-        tokens_before = self._estimate_tokens(context)
+        # Calculate initial tokens; techniques below keep the sizes current
+        sized = SizedContext(context)
+        tokens_before = sized.tokens
         techniques_applied = []
         errors = []
 
@@ -187,7 +394,7 @@ class ContextOptimizer:
         # Apply techniques in order
         try:
             # 1. Pruning - remove old/temporary data
-            context = self._prune_temporary_data(context)
+            context = self._prune_temporary_data(context, sized)
             techniques_applied.append('pruning')
         except Exception as e:
             logger.warning(f"Pruning failed: {e}")
@@ -195,7 +402,7 @@ class ContextOptimizer:
 
         try:
             # 2. Artifact Registry - replace file contents with metadata
-            context = self._apply_artifact_registry(context)
+            context = self._apply_artifact_registry(context, sized)
             techniques_applied.append('artifact_registry')
         except Exception as e:
             logger.warning(f"Artifact registry failed: {e}")
@@ -203,7 +410,7 @@ class ContextOptimizer:
 
         try:
             # 3. External Storage - move large items to disk
-            context, externalized_count = self._externalize_large_artifacts(context)
+            context, externalized_count = self._externalize_large_artifacts(context, sized)
             techniques_applied.append('external_storage')
         except Exception as e:
             logger.warning(f"External storage failed: {e}")
@@ -212,26 +419,26 @@ class ContextOptimizer:
 
         try:
             # 4. Differential State - convert to state deltas
-            context = self._convert_to_differential_state(context)
+            context = self._convert_to_differential_state(context, sized)
             techniques_applied.append('differential_state')
         except Exception as e:
             logger.warning(f"Differential state failed: {e}")
             errors.append(f"Differential state: {str(e)}")
 
         # 5. Summarization - only if we have LLM and haven't hit target
-        tokens_current = self._estimate_tokens(context)
+        tokens_current = sized.tokens
         current_reduction = 1 - (tokens_current / tokens_before) if tokens_before > 0 else 0
 
         if self.llm_interface and current_reduction < target_reduction:
             try:
-                context = self._summarize_completed_phases(context)
+                context = self._summarize_completed_phases(context, sized)
                 techniques_applied.append('summarization')
             except Exception as e:
                 logger.warning(f"Summarization failed: {e}")
                 errors.append(f"Summarization: {str(e)}")
 
         # Calculate final metrics
-        tokens_after = self._estimate_tokens(context)
+        tokens_after = sized.tokens
         compression_ratio = tokens_after / tokens_before if tokens_before > 0 else 1.0
 
         result = OptimizationResult(
@@ -250,6 +457,94 @@ class ContextOptimizer:
 
         return result
 
+    def load_external(self, reference: Dict[str, Any]) -> Any:
+        """Load the original data behind an externalized artifact or archived phase.
+
+        Args:
+            reference: Artifact reference or phase summary left in the context
+
+        Returns:
+            The original artifact/phase dictionary
+
+        Raises:
+            ContextOptimizerException: If the reference has no stored data
+
+        Example:
+            >>> artifact = optimizer.load_external(context['artifacts'][0])
+        """
+        digest = reference.get('_digest')
+        if digest:
+            return self.artifact_store.get_json(digest)
+
+        # References written before the artifact store: plain JSON files
+        legacy_path = reference.get('_external_ref') or reference.get('archived_at')
+        if legacy_path and Path(legacy_path).exists():
+            with open(legacy_path) as f:
+                return json.load(f)
+
+        raise ContextOptimizerException(
+            "Reference has no externalized data",
+            context={'reference_keys': sorted(reference)}
+        )
+
+    def external_refs(self, context: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """The externalized artifact and phase references in a context.
+
+        Args:
+            context: Optimized context
+
+        Returns:
+            Context-shaped dictionary holding only the items with a stored blob
+        """
+        refs = {}
+        for key in ('artifacts', 'phases'):
+            items = context.get(key)
+            if isinstance(items, list):
+                refs[key] = [
+                    item for item in items
+                    if isinstance(item, dict) and item.get('_digest')
+                ]
+        return refs
+
+    def retain_external(self, context: Dict[str, Any]) -> int:
+        """Take another store reference for each blob a context refers to.
+
+        Used when a context carries references over from another one that
+        will be released.
+
+        Args:
+            context: Optimized context (or its external_refs())
+
+        Returns:
+            Number of references taken
+        """
+        retained = 0
+        for items in self.external_refs(context).values():
+            for item in items:
+                if self.artifact_store.contains(item['_digest']):
+                    self.artifact_store.addref(item['_digest'])
+                    retained += 1
+        return retained
+
+    def release_external(self, context: Dict[str, Any]) -> int:
+        """Release the store references held by a context that is being discarded.
+
+        Blobs no longer referenced are removed by ``artifact_store.gc()``.
+
+        Args:
+            context: Optimized context (or its external_refs())
+
+        Returns:
+            Number of references released
+        """
+        released = 0
+        for items in self.external_refs(context).values():
+            for item in items:
+                if self.artifact_store.contains(item['_digest']):
+                    self.artifact_store.release(item['_digest'])
+                    released += 1
+        return released
+
     def _estimate_tokens(self, data: Any) -> int:
         """Estimate token count for data.
 
@@ -270,7 +565,11 @@ class ContextOptimizer:
             logger.warning(f"Token estimation failed: {e}")
             return 1000  # Default fallback
 
-    def _summarize_completed_phases(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _summarize_completed_phases(
+        self,
+        context: Dict[str, Any],
+        sized: Optional[SizedContext] = None
+    ) -> Dict[str, Any]:
         """Summarize completed phases using LLM.
 
         Compresses completed phases to ≤500 tokens while preserving:
@@ -280,6 +579,7 @@ class ContextOptimizer:
 
         Args:
             context: Context dictionary
+            sized: Size index over context (reuses cached phase sizes)
 
         Returns:
             Optimized context with summarized phases
@@ -291,48 +591,48 @@ class ContextOptimizer:
             logger.debug("Skipping summarization: no LLM interface")
             return context
 
-        optimized_phases = []
+        sized = sized or SizedContext(context)
+        phase_tokens_list = sized.item_tokens('phases')
+        summaries = {}
 
-        for phase in context['phases']:
+        for index, phase in enumerate(context['phases']):
             if phase.get('status') != 'completed':
-                optimized_phases.append(phase)
                 continue
 
-            # Estimate tokens in phase
-            phase_tokens = self._estimate_tokens(phase)
+            phase_tokens = phase_tokens_list[index]
 
             if phase_tokens <= self.summarization_threshold:
-                optimized_phases.append(phase)
                 continue
 
             # Archive full phase data
             phase_id = phase.get('phase_id', 'unknown')
-            archive_path = self.archive_dir / f"phase_{phase_id}.json"
 
             try:
-                with open(archive_path, 'w') as f:
-                    json.dump(phase, f, indent=2)
+                digest = self.artifact_store.put_json(phase)
 
                 # Create summary (placeholder - would use LLM in practice)
-                summary = {
+                summaries[index] = {
                     'phase_id': phase_id,
                     'status': 'completed',
                     'summary': f"Phase {phase_id} completed successfully",
-                    'archived_at': archive_path.as_posix(),
+                    'archived_at': self.artifact_store.path(digest).as_posix(),
+                    '_digest': digest,
                     'original_tokens': phase_tokens
                 }
 
-                optimized_phases.append(summary)
                 logger.debug(f"Summarized phase {phase_id}: {phase_tokens} → ~50 tokens")
 
             except Exception as e:
                 logger.warning(f"Failed to archive phase {phase_id}: {e}")
-                optimized_phases.append(phase)
 
-        context['phases'] = optimized_phases
+        sized.replace_items('phases', summaries)
         return context
 
-    def _apply_artifact_registry(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_artifact_registry(
+        self,
+        context: Dict[str, Any],
+        sized: Optional[SizedContext] = None
+    ) -> Dict[str, Any]:
         """Replace file contents with artifact registry.
 
         Replaces full file contents with metadata:
@@ -340,6 +640,7 @@ class ContextOptimizer:
 
         Args:
             context: Context dictionary
+            sized: Size index over context
 
         Returns:
             Optimized context with artifact registry
@@ -347,6 +648,7 @@ class ContextOptimizer:
         if 'files' not in context:
             return context
 
+        sized = sized or SizedContext(context)
         artifact_registry = {}
 
         for file_path, file_data in context.get('files', {}).items():
@@ -362,18 +664,23 @@ class ContextOptimizer:
             else:
                 artifact_registry[file_path] = file_data
 
-        context['artifact_registry'] = artifact_registry
-        context.pop('files', None)  # Remove full file contents
+        sized.set('artifact_registry', artifact_registry)
+        sized.pop('files')  # Remove full file contents
 
         return context
 
-    def _convert_to_differential_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _convert_to_differential_state(
+        self,
+        context: Dict[str, Any],
+        sized: Optional[SizedContext] = None
+    ) -> Dict[str, Any]:
         """Convert full state to differential state.
 
         Stores state_delta + checkpoint_id instead of full_state.
 
         Args:
             context: Context dictionary
+            sized: Size index over context (reuses the cached full_state size)
 
         Returns:
             Optimized context with differential state
@@ -384,14 +691,15 @@ class ContextOptimizer:
         # In practice, would compute diff against last checkpoint
         # For now, just mark as differential
 
-        full_state = context.pop('full_state')
-        state_tokens = self._estimate_tokens(full_state)
+        sized = sized or SizedContext(context)
+        state_tokens = sized.value_tokens('full_state')
+        sized.pop('full_state')
 
-        context['state_delta'] = {
+        sized.set('state_delta', {
             'checkpoint_id': 'latest',
             'changes': 'differential',  # Placeholder
             'original_tokens': state_tokens
-        }
+        })
 
         logger.debug(f"Converted to differential state: {state_tokens} → ~50 tokens")
 
@@ -399,14 +707,18 @@ class ContextOptimizer:
 
     def _externalize_large_artifacts(
         self,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        sized: Optional[SizedContext] = None
     ) -> tuple[Dict[str, Any], int]:
         """Move large artifacts to external storage.
 
-        Moves artifacts >2000 tokens to .obra/memory/artifacts/.
+        Moves artifacts >2000 tokens to the artifact store. Identical
+        artifacts (e.g. the same file snapshot in several iterations) are
+        stored once.
 
         Args:
             context: Context dictionary
+            sized: Size index over context (reuses cached artifact sizes)
 
         Returns:
             Tuple of (optimized context, number of externalized items)
@@ -416,32 +728,31 @@ class ContextOptimizer:
         if 'artifacts' not in context:
             return context, 0
 
-        optimized_artifacts = []
+        sized = sized or SizedContext(context)
+        artifact_tokens_list = sized.item_tokens('artifacts')
+        external_refs = {}
 
-        for artifact in context.get('artifacts', []):
-            artifact_tokens = self._estimate_tokens(artifact)
+        for index, artifact in enumerate(context.get('artifacts', [])):
+            artifact_tokens = artifact_tokens_list[index]
 
             if artifact_tokens <= self.externalization_threshold:
-                optimized_artifacts.append(artifact)
                 continue
 
             # Externalize large artifact
             artifact_id = artifact.get('id', f"artifact_{externalized_count}")
-            external_path = self.artifact_dir / f"{artifact_id}.json"
 
             try:
-                with open(external_path, 'w') as f:
-                    json.dump(artifact, f, indent=2)
+                digest = self.artifact_store.put_json(artifact)
+                external_path = self.artifact_store.path(digest)
 
                 # Replace with reference
-                external_ref = {
+                external_refs[index] = {
                     'id': artifact_id,
                     '_external_ref': external_path.as_posix(),
+                    '_digest': digest,
                     '_summary': f"Externalized artifact: {artifact_id}",
                     '_tokens': artifact_tokens
                 }
-
-                optimized_artifacts.append(external_ref)
                 externalized_count += 1
 
                 logger.debug(
@@ -451,12 +762,15 @@ class ContextOptimizer:
 
             except Exception as e:
                 logger.warning(f"Failed to externalize artifact {artifact_id}: {e}")
-                optimized_artifacts.append(artifact)
 
-        context['artifacts'] = optimized_artifacts
+        sized.replace_items('artifacts', external_refs)
         return context, externalized_count
 
-    def _prune_temporary_data(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _prune_temporary_data(
+        self,
+        context: Dict[str, Any],
+        sized: Optional[SizedContext] = None
+    ) -> Dict[str, Any]:
         """Prune old temporary data.
 
         Removes:
@@ -466,20 +780,22 @@ class ContextOptimizer:
 
         Args:
             context: Context dictionary
+            sized: Size index over context (kept items keep their sizes)
 
         Returns:
             Optimized context with pruned data
         """
         now = datetime.now(timezone.utc)
         cutoff = now - timedelta(hours=self.pruning_age_hours)
+        sized = sized or SizedContext(context)
 
         # Prune old debug traces
         if 'debug_traces' in context:
             original_count = len(context['debug_traces'])
-            context['debug_traces'] = [
-                trace for trace in context['debug_traces']
+            sized.select_items('debug_traces', [
+                index for index, trace in enumerate(context['debug_traces'])
                 if self._is_recent(trace.get('timestamp'), cutoff)
-            ]
+            ])
             pruned = original_count - len(context['debug_traces'])
             if pruned > 0:
                 logger.debug(f"Pruned {pruned} old debug traces")
@@ -487,18 +803,18 @@ class ContextOptimizer:
         # Keep only last 5 validation results
         if 'validation_results' in context:
             original_count = len(context['validation_results'])
-            context['validation_results'] = context['validation_results'][-5:]
+            sized.select_items('validation_results', range(max(original_count - 5, 0), original_count))
             pruned = original_count - len(context['validation_results'])
             if pruned > 0:
                 logger.debug(f"Pruned {pruned} old validation results")
 
         # Prune resolved errors (keep unresolved + last 10 resolved)
         if 'errors' in context:
-            unresolved = [e for e in context['errors'] if not e.get('resolved', False)]
-            resolved = [e for e in context['errors'] if e.get('resolved', False)]
+            unresolved = [i for i, e in enumerate(context['errors']) if not e.get('resolved', False)]
+            resolved = [i for i, e in enumerate(context['errors']) if e.get('resolved', False)]
 
             original_count = len(context['errors'])
-            context['errors'] = unresolved + resolved[-10:]
+            sized.select_items('errors', unresolved + resolved[-10:])
             pruned = original_count - len(context['errors'])
             if pruned > 0:
                 logger.debug(f"Pruned {pruned} old resolved errors")
@@ -0,0 +1,290 @@
+"""Eviction policies for Working Memory (Tier 1).
+
+WorkingMemory asks its policy which operation to evict when the operation
+count or token budget is exceeded. Order-based policies keep queues of
+sequence numbers (O(1)); the others keep a binary heap of
+``(tier, score, seq)`` keys with lazy invalidation, so adds, accesses and
+evictions are O(log n):
+
+    fifo      Oldest operation first (the original behaviour)
+    lru       Least recently added or accessed (get_operations/search)
+    gdsf      Greedy-Dual-Size-Frequency: lowest ``L + frequency / tokens``
+              first, so large, rarely used operations go before small ones;
+              ``L`` rises to each evicted score to age out stale entries
+    priority  FIFO, but pinned types (default: decisions) are evicted last
+
+Any policy can be given ``pinned_types``; pinned operations are only
+evicted once no unpinned operation is left.
+
+Classes:
+    EvictionPolicy: Base class for heap-backed eviction policies
+    FIFOEvictionPolicy, LRUEvictionPolicy, GDSFEvictionPolicy,
+    PriorityEvictionPolicy: Concrete policies
+
+Example:
+    >>> policy = create_eviction_policy('gdsf', pinned_types=['decision'])
+    >>> policy.name
+    'gdsf'
+    >>> memory = WorkingMemory({'context_window': 16000, 'eviction_policy': 'gdsf'})
+    >>> memory.get_eviction_report()['token_retention']
+    1.0
+"""
+
+import heapq
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from .working_memory import OperationRecord
+
+logger = logging.getLogger(__name__)
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+_HEAP_COMPACT_FACTOR = 2
+
+
+class EvictionPolicy:
+    """Base class for heap-backed eviction policies.
+
+    Heap-backed subclasses implement _score(); a lower score is evicted
+    first. Order-only subclasses may override on_add()/select_victim()
+    instead. The policy also keeps the statistics behind report().
+
+    Attributes:
+        name: Policy name used in configuration
+        pinned_types: Operation types evicted only after all others
+        evictions: Number of operations evicted
+        evicted_tokens: Tokens of evicted operations
+        added_tokens: Tokens of all operations added
+    """
+
+    name = 'base'
+    default_pinned_types: Tuple[str, ...] = ()
+
+    def __init__(self, pinned_types: Optional[Iterable[str]] = None):
+        """Initialize policy.
+
+        Args:
+            pinned_types: Operation types to evict last (policy default if None)
+        """
+        self.pinned_types = frozenset(
+            self.default_pinned_types if pinned_types is None else pinned_types
+        )
+        self._heap: List[Tuple[int, float, int]] = []
+        self._entries: Dict[int, Tuple[int, float, int]] = {}  # seq -> live heap entry
+        self.evictions = 0
+        self.evicted_tokens = 0
+        self.added_tokens = 0
+        self._utilization_sum = 0.0
+        self._utilization_samples = 0
+
+    def _score(self, record: 'OperationRecord') -> float:
+        """Eviction score for a record just added or accessed (lower goes first)."""
+        raise NotImplementedError
+
+    def _push(self, record: 'OperationRecord') -> None:
+        tier = 1 if record.type in self.pinned_types else 0
+        entry = (tier, self._score(record), record.seq)
+        self._entries[record.seq] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > _HEAP_COMPACT_FACTOR * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def on_add(self, record: 'OperationRecord') -> None:
+        """Track a newly stored record."""
+        self.added_tokens += record.tokens
+        self._push(record)
+
+    def on_access(self, record: 'OperationRecord') -> None:
+        """Note that a stored record was read (no-op for order-only policies)."""
+
+    def select_victim(self) -> int:
+        """Pop and return the sequence number of the next record to evict.
+
+        Raises:
+            IndexError: If the policy tracks no records
+        """
+        while True:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[2]) is entry:
+                del self._entries[entry[2]]
+                return entry[2]
+
+    def record_eviction(self, record: 'OperationRecord') -> None:
+        """Account for an evicted record."""
+        self.evictions += 1
+        self.evicted_tokens += record.tokens
+
+    def record_utilization(self, current_tokens: int, max_tokens: int) -> None:
+        """Sample how much of the token budget is used after evicting."""
+        if max_tokens > 0:
+            self._utilization_sum += min(current_tokens / max_tokens, 1.0)
+            self._utilization_samples += 1
+
+    def clear(self) -> None:
+        """Forget all tracked records (statistics are kept)."""
+        self._heap.clear()
+        self._entries.clear()
+
+    def report(self, current_tokens: int, max_tokens: int) -> Dict[str, Any]:
+        """How much of the token budget this policy retains.
+
+        Args:
+            current_tokens: Tokens currently held
+            max_tokens: Token budget
+
+        Returns:
+            Dictionary with 'policy', 'pinned_types', 'evictions',
+            'evicted_tokens', 'token_retention' (share of all added tokens
+            not evicted), 'budget_used' (current share of the budget) and
+            'budget_after_eviction' (mean share of the budget still used
+            right after evicting; low values mean evictions overshoot,
+            None before the first eviction)
+        """
+        retention = 1.0
+        if self.added_tokens:
+            retention = (self.added_tokens - self.evicted_tokens) / self.added_tokens
+        after_eviction = (self._utilization_sum / self._utilization_samples
+                          if self._utilization_samples else None)
+        return {
+            'policy': self.name,
+            'pinned_types': sorted(self.pinned_types),
+            'evictions': self.evictions,
+            'evicted_tokens': self.evicted_tokens,
+            'token_retention': retention,
+            'budget_used': current_tokens / max_tokens if max_tokens > 0 else 0,
+            'budget_after_eviction': after_eviction
+        }
+
+
+class FIFOEvictionPolicy(EvictionPolicy):
+    """Evict the oldest operation first.
+
+    Arrival order never changes, so queues of sequence numbers (one for
+    unpinned, one for pinned types) replace the heap.
+    """
+
+    name = 'fifo'
+
+    def __init__(self, pinned_types: Optional[Iterable[str]] = None):
+        super().__init__(pinned_types)
+        self._queue: deque = deque()
+        self._pinned_queue: deque = deque()
+
+    def on_add(self, record: 'OperationRecord') -> None:
+        self.added_tokens += record.tokens
+        if record.type in self.pinned_types:
+            self._pinned_queue.append(record.seq)
+        else:
+            self._queue.append(record.seq)
+
+    def select_victim(self) -> int:
+        return (self._queue or self._pinned_queue).popleft()
+
+    def clear(self) -> None:
+        self._queue.clear()
+        self._pinned_queue.clear()
+
+
+class PriorityEvictionPolicy(FIFOEvictionPolicy):
+    """FIFO eviction that keeps pinned types (decisions by default) longest."""
+
+    name = 'priority'
+    default_pinned_types = ('decision',)
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Evict the least recently added or accessed operation first."""
+
+    name = 'lru'
+
+    def __init__(self, pinned_types: Optional[Iterable[str]] = None):
+        super().__init__(pinned_types)
+        self._clock = 0
+
+    def _score(self, record: 'OperationRecord') -> float:
+        self._clock += 1
+        return self._clock
+
+    def on_access(self, record: 'OperationRecord') -> None:
+        if record.seq in self._entries:
+            self._push(record)
+
+    def clear(self) -> None:
+        super().clear()
+        self._clock = 0
+
+
+class GDSFEvictionPolicy(EvictionPolicy):
+    """Greedy-Dual-Size-Frequency: evict large, rarely used operations first.
+
+    Priority is ``L + frequency / tokens``. ``L`` (the inflation value) is
+    raised to the priority of each evicted operation, so entries that
+    aren't accessed again eventually fall below newer ones.
+    """
+
+    name = 'gdsf'
+
+    def __init__(self, pinned_types: Optional[Iterable[str]] = None):
+        super().__init__(pinned_types)
+        self._inflation = 0.0
+        self._frequency: Dict[int, int] = {}
+
+    def _score(self, record: 'OperationRecord') -> float:
+        frequency = self._frequency.get(record.seq, 0) + 1
+        self._frequency[record.seq] = frequency
+        return self._inflation + frequency / max(record.tokens, 1)
+
+    def on_access(self, record: 'OperationRecord') -> None:
+        if record.seq in self._entries:
+            self._push(record)
+
+    def select_victim(self) -> int:
+        while True:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[2]) is entry:
+                del self._entries[entry[2]]
+                self._frequency.pop(entry[2], None)
+                if entry[0] == 0:  # pinned scores don't age unpinned entries
+                    self._inflation = max(self._inflation, entry[1])
+                return entry[2]
+
+    def clear(self) -> None:
+        super().clear()
+        self._frequency.clear()
+        self._inflation = 0.0
+
+
+EVICTION_POLICIES: Dict[str, Type[EvictionPolicy]] = {
+    policy.name: policy
+    for policy in (FIFOEvictionPolicy, LRUEvictionPolicy, GDSFEvictionPolicy,
+                   PriorityEvictionPolicy)
+}
+
+
+def create_eviction_policy(
+    name: str,
+    pinned_types: Optional[Iterable[str]] = None
+) -> EvictionPolicy:
+    """Create an eviction policy by name.
+
+    Args:
+        name: One of EVICTION_POLICIES ('fifo', 'lru', 'gdsf', 'priority')
+        pinned_types: Operation types to evict last (policy default if None)
+
+    Returns:
+        New EvictionPolicy instance
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    try:
+        policy_class = EVICTION_POLICIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown eviction policy: {name!r} "
+            f"(available: {', '.join(sorted(EVICTION_POLICIES))})"
+        ) from None
+    return policy_class(pinned_types)
@@ -22,14 +22,16 @@ Version: 1.0.0
 
 import json
 import logging
+import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 from threading import RLock
 
 from .context_window_detector import ContextWindowDetector
 from .adaptive_optimizer import AdaptiveOptimizer
-from .working_memory import WorkingMemory
+from .working_memory import OperationRecord, WorkingMemory
+from .artifact_store import ArtifactStore, ArtifactStoreException
 from .context_optimizer import ContextOptimizer
 from .context_window_manager import ContextWindowManager
 
@@ -67,6 +69,7 @@ class MemoryManager:
         adaptive_optimizer: AdaptiveOptimizer instance
         working_memory: WorkingMemory instance
         context_optimizer: ContextOptimizer instance
+        artifact_store: Blob store for externalized artifacts and phase archives
         window_manager: ContextWindowManager instance
         llm_interface: Optional LLM interface for summarization
         config: Configuration dictionary
@@ -92,6 +95,9 @@ class MemoryManager:
         'utilization_limit': 0.85,  # Use 85% of context window
         'summarization_threshold': 500,
         'externalization_threshold': 2000,
+        'artifact_compression': 'auto',  # ArtifactStore codec: auto, zstd, gzip, none
+        'checkpoint_compaction_segments': 20,  # Delta segments before a new base
+        'checkpoint_log_generations': 2,  # Checkpoint logs kept after compaction
     }
 
     def __init__(
@@ -208,10 +214,20 @@ class MemoryManager:
         pruning_config = self.adaptive_optimizer.get_pruning_config()
         optimizer_config.update(pruning_config)
 
+        # Externalized artifacts and phase archives share one
+        # content-addressed store
+        self.artifact_store = ArtifactStore(
+            self.config['artifact_storage_path'],
+            compression=self.config['artifact_compression']
+        )
         self.context_optimizer = ContextOptimizer(
             llm_interface=llm_interface,
-            config=optimizer_config
+            config=optimizer_config,
+            artifact_store=self.artifact_store
         )
+        # Store references of the last built context; released when the
+        # next build_context() supersedes it
+        self._live_refs: Dict[str, List[Dict[str, Any]]] = {}
 
         # Step 5: Initialize ContextWindowManager for usage tracking
         self.window_manager = ContextWindowManager(
@@ -224,6 +240,16 @@ class MemoryManager:
         self._operation_count = 0  # Track operations for checkpoint triggers
         self._last_checkpoint_time = datetime.now(timezone.utc)
 
+        # Append-only checkpoint log (base segment + deltas), one per session
+        self._session_id = uuid.uuid4().hex[:8]
+        self._log_path: Optional[Path] = None
+        self._log_generation = 0
+        self._log_segments = 0
+        self._logged_seqs: set = set()
+        self._log_next_seq = 0
+        # Manifests written this session, by the log generation they point into
+        self._log_manifests: Dict[int, List[Path]] = {}
+
         # Create storage directories
         self._ensure_directories()
 
@@ -254,7 +280,7 @@ class MemoryManager:
         """Add operation to working memory and update usage tracking.
 
         Automatically adds timestamp, operation name, and estimates tokens if missing.
-        Thread-safe operation.
+        The caller's dictionary is not modified. Thread-safe operation.
 
         Args:
             operation: Operation dictionary with keys:
@@ -273,59 +299,52 @@ class MemoryManager:
             ... })
         """
         with self._lock:
-            # Add timestamp if missing
-            if 'timestamp' not in operation:
-                operation['timestamp'] = datetime.now(timezone.utc).isoformat()
-
-            # Add operation name if missing (required by WorkingMemory)
-            if 'operation' not in operation:
-                operation['operation'] = 'unknown'
+            # Compact record; defaults operation name to 'unknown' and
+            # timestamp to now
+            record = OperationRecord.from_dict(operation)
 
             # Estimate tokens if missing
             if 'tokens' not in operation:
-                operation['tokens'] = self._estimate_tokens(operation)
+                record.tokens = self._estimate_tokens(record)
                 logger.debug(
-                    f"Estimated {operation['tokens']} tokens for operation "
-                    f"type={operation.get('type')}"
+                    f"Estimated {record.tokens} tokens for operation "
+                    f"type={record.type}"
                 )
 
             # Add to working memory
-            self.working_memory.add_operation(operation)
+            self.working_memory.add_operation(record)
 
             # Update usage tracking
-            self.window_manager.add_usage(operation['tokens'])
+            self.window_manager.add_usage(record.tokens)
 
             # Increment operation count
             self._operation_count += 1
 
             logger.debug(
-                f"Added operation: type={operation.get('type')}, "
-                f"operation={operation.get('operation')}, "
-                f"tokens={operation['tokens']}, "
+                f"Added operation: type={record.type}, "
+                f"operation={record.operation}, "
+                f"tokens={record.tokens}, "
                 f"total_usage={self.window_manager.used_tokens():,}, "
                 f"zone={self.window_manager.get_zone()}"
             )
 
-    def _estimate_tokens(self, operation: Dict[str, Any]) -> int:
+    def _estimate_tokens(self, record: OperationRecord) -> int:
         """Estimate token count for operation without explicit tokens.
 
-        Uses simple heuristic: ~4 characters per token.
+        Uses simple heuristic: ~4 characters per token, measured on the
+        record's already-encoded data payload.
 
         Args:
-            operation: Operation dictionary
+            record: Operation record
 
         Returns:
             Estimated token count
         """
-        # Serialize operation data to estimate size
-        try:
-            data_str = json.dumps(operation.get('data', {}))
+        if record.payload_size or record.data is None:
             # Rough estimate: 4 characters per token
-            estimated = max(50, len(data_str) // 4)
-            return estimated
-        except Exception as e:
-            logger.warning(f"Token estimation failed: {e}, using default 100")
-            return 100
+            return max(50, record.payload_size // 4)
+        logger.warning("Token estimation failed: data not JSON-serializable, using default 100")
+        return 100
 
     def get_recent_operations(
         self,
@@ -367,6 +386,11 @@ class MemoryManager:
         Fetches recent operations from working memory and optionally applies
         optimization techniques based on the active profile.
 
+        The returned context supersedes the previously built one: artifacts
+        only the previous context referenced are released and their blobs
+        deleted by the next checkpoint, so externalized references stay
+        loadable until the following build_context() call.
+
         Args:
             base_context: Optional base context to merge with operations
             optimize: Whether to apply optimization techniques (default: True)
@@ -387,6 +411,7 @@ class MemoryManager:
         with self._lock:
             # Start with base context or empty dict
             context = base_context.copy() if base_context else {}
+            carried = self.context_optimizer.external_refs(context)
 
             # Add recent operations from working memory
             operations = self.working_memory.get_recent_operations()
@@ -424,13 +449,47 @@ class MemoryManager:
                     f"({result.compression_ratio:.2%} compression)"
                 )
 
+            self._supersede_context(context, carried)
+
             return context
 
+    def _supersede_context(
+        self,
+        context: Dict[str, Any],
+        carried: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        """Hold the store references of ``context`` and release the previous context's.
+
+        Externalization took a reference for each blob it stored; references
+        carried over from base_context get their own here, so releasing the
+        superseded context keeps them alive.
+
+        Args:
+            context: Newly built context
+            carried: external_refs() of base_context before optimization
+        """
+        self.context_optimizer.retain_external(carried)
+        previous, self._live_refs = self._live_refs, self.context_optimizer.external_refs(context)
+        self.context_optimizer.release_external(previous)
+
     def checkpoint(self, path: Optional[str] = None) -> str:
         """Save current state to checkpoint file.
 
-        Serializes state of all components to JSON file. Includes working memory,
-        window manager usage, and metadata.
+        Working memory is appended to a per-session checkpoint log in
+        checkpoint_dir: the first checkpoint writes a base segment with all
+        operations, later ones a delta segment with only the operations
+        added (and the sequence numbers evicted) since the previous
+        checkpoint. After ``checkpoint_compaction_segments`` deltas the next
+        checkpoint starts a new log with a fresh base; only the newest
+        ``checkpoint_log_generations`` logs are kept, and the checkpoints
+        written into a dropped log are deleted with it.
+
+        The checkpoint file itself is a small manifest holding window
+        manager usage, metadata and the log position to restore up to. The
+        log is referenced relative to checkpoint_dir, so a moved project can
+        still be restored.
+        Artifact blobs released since the last checkpoint are then
+        garbage-collected.
 
         Args:
             path: Optional custom checkpoint file path
@@ -460,15 +519,19 @@ class MemoryManager:
                 # Ensure parent directory exists
                 Path(path).parent.mkdir(parents=True, exist_ok=True)
 
+                log_path, log_offset = self._append_checkpoint_segment()
+
                 # Build checkpoint data
                 checkpoint_data = {
-                    'version': '1.0.0',
+                    'version': '2.0.0',
                     'timestamp': datetime.now(timezone.utc).isoformat(),
                     'context_window_size': self.context_window_size,
                     'model_name': self.model_name,
                     'optimization_profile': self.adaptive_optimizer.get_active_profile()['name'],
                     'working_memory': {
-                        'operations': self.working_memory.get_recent_operations(),
+                        # Relative to checkpoint_dir
+                        'log_path': log_path.name,
+                        'log_offset': log_offset,
                         'current_tokens': self.working_memory._current_tokens,
                         'max_operations': self.working_memory.max_operations,
                         'max_tokens': self.working_memory.max_tokens
@@ -488,11 +551,11 @@ class MemoryManager:
                 # Write to file
                 with open(path, 'w') as f:
                     json.dump(checkpoint_data, f, indent=2)
+                self._log_manifests.setdefault(self._log_generation, []).append(Path(path))
 
                 self._last_checkpoint_time = datetime.now(timezone.utc)
 
                 logger.info(f"Checkpoint created: {path}")
-                return path
 
             except Exception as e:
                 raise MemoryManagerException(
@@ -500,10 +563,20 @@ class MemoryManager:
                     context={'path': path}
                 ) from e
 
+            try:
+                self.artifact_store.gc()
+            except (ArtifactStoreException, OSError) as e:
+                logger.warning(f"Artifact store GC after checkpoint failed: {e}")
+            return path
+
     def restore(self, path: str) -> None:
         """Restore state from checkpoint file.
 
-        Loads checkpoint data and restores state of all components.
+        Replays the checkpoint log up to the manifest's position and loads
+        the resulting operations directly into working memory, replacing
+        its contents. Version 1.0.0 checkpoints with inline operations and
+        version 1.1.0 checkpoints with an artifact store reference are still
+        supported.
 
         Args:
             path: Path to checkpoint file
@@ -533,10 +606,13 @@ class MemoryManager:
                 )
 
                 # Restore working memory operations
-                wm_data = checkpoint_data.get('working_memory', {})
-                for operation in wm_data.get('operations', []):
-                    # Don't update usage again - will be done when we restore window manager
-                    self.working_memory.add_operation(operation)
+                entries, next_seq = self._load_checkpoint_operations(
+                    checkpoint_data, checkpoint_path.parent
+                )
+                self.working_memory.load_state(entries, next_seq)
+
+                # The next checkpoint starts a new log from the restored state
+                self._log_path = None
 
                 # Restore window manager usage
                 wm_mgr_data = checkpoint_data.get('window_manager', {})
@@ -555,7 +631,7 @@ class MemoryManager:
                     )
 
                 logger.info(
-                    f"Checkpoint restored: {len(wm_data.get('operations', []))} operations, "
+                    f"Checkpoint restored: {len(entries)} operations, "
                     f"{wm_mgr_data.get('used_tokens', 0):,} tokens used"
                 )
 
@@ -565,6 +641,144 @@ class MemoryManager:
                     context={'path': path}
                 ) from e
 
+    def _append_checkpoint_segment(self) -> Tuple[Path, int]:
+        """Append working memory changes to the checkpoint log.
+
+        Returns:
+            Tuple of (log path, byte offset just past the new segment)
+        """
+        if (self._log_path is None or
+                self._log_segments > self.config['checkpoint_compaction_segments']):
+            self._start_checkpoint_log()
+            state = self.working_memory.export_state()
+            segment = {'kind': 'base', 'next_seq': state['next_seq'],
+                       'operations': state['operations']}
+        else:
+            state = self.working_memory.export_state(since_seq=self._log_next_seq)
+            removed = self._logged_seqs.difference(state['seqs'])
+            segment = {'kind': 'delta', 'next_seq': state['next_seq'],
+                       'removed': sorted(removed), 'operations': state['operations']}
+
+        line = json.dumps(segment, separators=(',', ':')) + '\n'
+        with open(self._log_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            offset = f.tell()
+
+        self._log_segments += 1
+        self._logged_seqs = set(state['seqs'])
+        self._log_next_seq = state['next_seq']
+
+        logger.debug(
+            f"Checkpoint {segment['kind']} segment: {len(segment['operations'])} operations, "
+            f"{len(line):,} bytes -> {self._log_path.name}@{offset}"
+        )
+        return self._log_path, offset
+
+    def _start_checkpoint_log(self) -> None:
+        """Begin a new checkpoint log generation and drop old generations.
+
+        Checkpoints written into a dropped generation are deleted first, so
+        no manifest is left pointing at a log that no longer exists.
+        """
+        self._log_generation += 1
+        log_dir = Path(self.checkpoint_dir).resolve()
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self._log_path = log_dir / f'checkpoint_log_{self._session_id}_{self._log_generation:04d}.jsonl'
+        self._log_segments = 0
+
+        keep = self.config['checkpoint_log_generations']
+        for generation in range(1, self._log_generation - keep + 1):
+            old_log = log_dir / f'checkpoint_log_{self._session_id}_{generation:04d}.jsonl'
+            for manifest in self._log_manifests.pop(generation, ()):
+                self._remove_manifest(manifest, old_log.name)
+            if old_log.exists():
+                old_log.unlink()
+                logger.debug(f"Removed compacted checkpoint log: {old_log.name}")
+
+    def _remove_manifest(self, manifest: Path, log_name: str) -> None:
+        """Delete a checkpoint manifest if it still points into the given log."""
+        try:
+            with open(manifest) as f:
+                log_path = json.load(f).get('working_memory', {}).get('log_path')
+        except (OSError, ValueError):
+            return
+        # Overwritten since (e.g. a reused custom path) by a newer checkpoint
+        if log_path is None or Path(log_path).name != log_name:
+            return
+        try:
+            manifest.unlink()
+            logger.debug(f"Removed checkpoint of compacted log: {manifest}")
+        except OSError as e:
+            logger.warning(f"Failed to remove checkpoint of compacted log {manifest}: {e}")
+
+    def _load_checkpoint_operations(
+        self,
+        checkpoint_data: Dict[str, Any],
+        manifest_dir: Optional[Path] = None
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], int]:
+        """Working memory operations of a checkpoint, oldest first.
+
+        Version 1.0.0 checkpoints hold the operations inline and version
+        1.1.0 checkpoints reference a blob in an artifact store (both newest
+        first); version 2.0.0 checkpoints point into a checkpoint log,
+        relative to checkpoint_dir (or to the manifest's directory), or by
+        absolute path for checkpoints written before logs were relative.
+
+        Args:
+            checkpoint_data: Parsed checkpoint manifest
+            manifest_dir: Directory of the manifest, tried if the log isn't
+                in checkpoint_dir
+
+        Returns:
+            Tuple of ((seq, operation) pairs, next sequence number)
+
+        Raises:
+            MemoryManagerException: If the checkpoint format is not recognized
+        """
+        wm_data = checkpoint_data.get('working_memory', {})
+        if 'log_path' not in wm_data:
+            if 'operations_ref' in wm_data:
+                store_root = checkpoint_data.get('artifact_store') or Path(self.checkpoint_dir) / 'blobs'
+                operations = ArtifactStore(store_root).get_json(wm_data['operations_ref'])
+            elif 'operations' in wm_data:
+                operations = wm_data['operations']
+            else:
+                raise MemoryManagerException(
+                    f"Unsupported checkpoint format (version {checkpoint_data.get('version')}): "
+                    f"no operations, operations_ref or log_path in working_memory",
+                    context={'version': checkpoint_data.get('version'),
+                             'working_memory_keys': sorted(wm_data)}
+                )
+            operations = list(reversed(operations))
+            return list(enumerate(operations)), len(operations)
+
+        log_path = Path(self.checkpoint_dir) / wm_data['log_path']
+        if not log_path.exists() and manifest_dir is not None:
+            log_path = manifest_dir / wm_data['log_path']
+        if not log_path.exists():
+            raise MemoryManagerException(
+                f"Checkpoint log no longer exists (compacted or removed): {log_path}",
+                context={'log_path': str(log_path)}
+            )
+
+        with open(log_path, 'rb') as f:
+            data = f.read(wm_data['log_offset'])
+
+        entries: Dict[int, Dict[str, Any]] = {}
+        next_seq = 0
+        for line in data.splitlines():
+            segment = json.loads(line)
+            if segment['kind'] == 'base':
+                entries = {}
+            for seq in segment.get('removed', ()):
+                entries.pop(seq, None)
+            for seq, operation in segment['operations']:
+                entries[seq] = operation
+            next_seq = segment['next_seq']
+
+        return sorted(entries.items()), next_seq
+
     def should_checkpoint(self) -> bool:
         """Check if checkpoint is needed based on profile configuration.
 
@@ -604,6 +818,8 @@ class MemoryManager:
     def clear(self) -> None:
         """Clear working memory and reset usage tracking.
 
+        Also releases the artifacts of the last built context.
+
         Example:
             >>> manager.clear()
             >>> assert len(manager.get_recent_operations()) == 0
@@ -612,6 +828,8 @@ class MemoryManager:
             self.working_memory.clear()
             self.window_manager.reset()
             self._operation_count = 0
+            self.context_optimizer.release_external(self._live_refs)
+            self._live_refs = {}
             logger.info("Memory cleared: working memory and usage reset")
 
     def get_status(self) -> Dict[str, Any]:
@@ -4,8 +4,16 @@ This module implements a FIFO buffer of recent operations with adaptive sizing
 based on context window size. Working memory provides fast access to recent
 operations for context building and reference resolution.
 
+Operations are stored as compact OperationRecord objects (``__slots__``,
+interned type/operation names, epoch-float timestamps, JSON-encoded data
+decoded on access) and handed out as plain dictionaries.
+
+Which operation is evicted when a limit is exceeded is decided by a
+pluggable EvictionPolicy (fifo by default; see eviction_policy).
+
 Classes:
-    WorkingMemory: FIFO buffer with adaptive sizing and token tracking
+    WorkingMemory: Bounded buffer with adaptive sizing and token tracking
+    OperationRecord: Compact stored form of one operation
 
 Example:
     >>> config = {'context_window': 128000, 'max_operations': 50}
@@ -18,12 +26,17 @@ Created: 2025-01-15
 Version: 1.0.0
 """
 
+import json
 import logging
+import sys
 import threading
-from collections import deque
-from typing import Dict, List, Optional, Any
+import time
+from itertools import islice
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 from datetime import datetime, timezone
 
+from .eviction_policy import EVICTION_POLICIES, EvictionPolicy, create_eviction_policy
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,17 +55,174 @@ class WorkingMemoryException(Exception):
         logger.error(f"WorkingMemoryException: {message}", extra=context)
 
 
+# Keys held in OperationRecord slots; anything else goes to its extras dict
+_RECORD_KEYS = frozenset(('type', 'operation', 'tokens', 'timestamp', 'data'))
+
+_MISSING = object()
+
+# Types that come back from a JSON round trip as they went in
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _json_lossless(value: Any) -> bool:
+    """Tell whether json.loads(json.dumps(value)) gives back an equal value.
+
+    False for tuples, sets, non-str dict keys and subclasses (OrderedDict,
+    str enums, ...), which JSON would silently turn into other types.
+    """
+    kind = type(value)
+    if kind in _JSON_SCALARS:
+        return True
+    if kind is list:
+        return all(_json_lossless(item) for item in value)
+    if kind is dict:
+        return all(type(key) is str and _json_lossless(item) for key, item in value.items())
+    return False
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """ISO-8601 UTC string for an epoch timestamp."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _parse_timestamp(value: Any) -> Tuple[float, Any]:
+    """Epoch seconds for a timestamp value, plus the value itself if needed.
+
+    The original value is returned (second element) only when formatting
+    the epoch back would not reproduce it, e.g. for naive or non-UTC ISO
+    strings; otherwise it is None and the float is all that is stored.
+    """
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return time.time(), value
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        epoch = parsed.timestamp()
+        return epoch, None if _format_timestamp(epoch) == value else value
+    if isinstance(value, datetime):
+        return value.timestamp(), value
+    if isinstance(value, (int, float)):
+        return float(value), value
+    return time.time(), value
+
+
+class OperationRecord:
+    """Compact stored form of one working memory operation.
+
+    Type and operation names are interned, the timestamp is epoch seconds
+    and the data payload is kept as compact JSON bytes, decoded only when
+    the operation is read. Payloads that JSON wouldn't give back unchanged
+    (tuples, non-str dict keys, other objects) are kept as-is. Keys other than type/operation/tokens/timestamp/data are kept in
+    a small extras dict.
+
+    Attributes:
+        seq: Sequence number assigned by WorkingMemory
+        type: Operation type (interned)
+        operation: Operation name (interned)
+        tokens: Token count
+        timestamp: Epoch seconds (UTC)
+    """
+
+    __slots__ = ('seq', 'type', 'operation', 'tokens', 'timestamp',
+                 '_timestamp_raw', '_payload', '_extra')
+
+    def __init__(
+        self,
+        type: str,
+        operation: str,
+        tokens: int,
+        timestamp: Optional[float] = None,
+        data: Any = _MISSING,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.seq = -1
+        self.type = sys.intern(type) if isinstance(type, str) else type
+        self.operation = sys.intern(operation) if isinstance(operation, str) else operation
+        self.tokens = tokens
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self._timestamp_raw = None
+        self._payload = _MISSING if data is _MISSING else self._encode(data)
+        self._extra = extra or None
+
+    @classmethod
+    def from_dict(cls, operation: Dict[str, Any]) -> 'OperationRecord':
+        """Build a record from an operation dictionary (not modified).
+
+        Missing 'operation' defaults to 'unknown', missing 'tokens' to 0 and
+        a missing timestamp to now.
+        """
+        extra = {k: v for k, v in operation.items() if k not in _RECORD_KEYS}
+        record = cls(
+            operation.get('type'),
+            operation.get('operation', 'unknown'),
+            operation.get('tokens', 0),
+            data=operation.get('data', _MISSING),
+            extra=extra
+        )
+        if 'timestamp' in operation:
+            record.timestamp, record._timestamp_raw = _parse_timestamp(operation['timestamp'])
+        return record
+
+    @staticmethod
+    def _encode(data: Any) -> Any:
+        try:
+            if _json_lossless(data):
+                return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        except (RecursionError, ValueError):
+            pass  # Circular or too deeply nested
+        return (data,)  # JSON would change it: keep the object itself
+
+    @property
+    def data(self) -> Any:
+        """Decoded data payload (None if the operation had no data)."""
+        payload = self._payload
+        if payload is _MISSING:
+            return None
+        if isinstance(payload, bytes):
+            return json.loads(payload)
+        return payload[0]
+
+    @property
+    def payload_size(self) -> int:
+        """Length of the encoded data payload in bytes (0 if not encoded)."""
+        return len(self._payload) if isinstance(self._payload, bytes) else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the record as an operation dictionary."""
+        result = {
+            'type': self.type,
+            'operation': self.operation,
+            'tokens': self.tokens,
+            'timestamp': (self._timestamp_raw if self._timestamp_raw is not None
+                          else _format_timestamp(self.timestamp)),
+        }
+        if self._payload is not _MISSING:
+            result['data'] = self.data
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def __repr__(self) -> str:
+        return (f"OperationRecord(seq={self.seq}, type={self.type!r}, "
+                f"operation={self.operation!r}, tokens={self.tokens})")
+
+
 class WorkingMemory:
-    """FIFO working memory buffer with adaptive sizing.
+    """Working memory buffer with adaptive sizing and pluggable eviction.
 
-    Maintains a sliding window of recent operations with automatic eviction
-    when capacity limits are exceeded. Supports adaptive sizing based on
-    context window size.
+    Maintains a window of recent operations with automatic eviction when
+    capacity limits are exceeded; the eviction policy (fifo, lru, gdsf or
+    priority) picks the victim. Supports adaptive sizing based on context
+    window size.
 
     Attributes:
         max_operations: Maximum number of operations to store
         max_tokens: Maximum total tokens across all operations
-        _operations: Deque storing operation records
+        eviction_policy: EvictionPolicy choosing which operation to evict
+        _operations: OperationRecord objects by sequence number (oldest first)
+        _next_seq: Sequence number assigned to the next added operation
         _current_tokens: Current total token count
         _lock: Thread lock for concurrent access
         _eviction_count: Number of operations evicted
@@ -91,6 +261,9 @@ class WorkingMemory:
                 - max_operations (int, optional): Override default max operations
                 - max_tokens (int, optional): Override default max tokens
                 - max_tokens_pct (float, optional): Percentage of context for tokens
+                - eviction_policy (str, optional): 'fifo' (default), 'lru',
+                  'gdsf' or 'priority'
+                - pinned_types (list, optional): Operation types evicted last
 
         Raises:
             WorkingMemoryException: If configuration is invalid
@@ -115,15 +288,28 @@ class WorkingMemory:
         self.max_tokens = sizing['max_tokens']
         self.context_window = context_window
 
+        policy_name = config.get('eviction_policy') or 'fifo'
+        if policy_name not in EVICTION_POLICIES:
+            raise WorkingMemoryException(
+                f"Unknown eviction policy: {policy_name}",
+                context={'eviction_policy': policy_name,
+                         'available': sorted(EVICTION_POLICIES)}
+            )
+        self.eviction_policy: EvictionPolicy = create_eviction_policy(
+            policy_name, config.get('pinned_types')
+        )
+
         # Initialize state
-        self._operations: deque = deque(maxlen=self.max_operations)
+        self._operations: Dict[int, OperationRecord] = {}
+        self._next_seq = 0
         self._current_tokens = 0
         self._lock = threading.RLock()
         self._eviction_count = 0
 
         logger.info(
             f"WorkingMemory initialized: context={context_window:,}, "
-            f"max_ops={self.max_operations}, max_tokens={self.max_tokens:,}"
+            f"max_ops={self.max_operations}, max_tokens={self.max_tokens:,}, "
+            f"eviction={policy_name}"
         )
 
     def _calculate_adaptive_sizing(
@@ -170,80 +356,95 @@ class WorkingMemory:
             'max_tokens': max_tokens
         }
 
-    def add_operation(self, operation: Dict[str, Any]) -> None:
+    def add_operation(self, operation: Union[Dict[str, Any], OperationRecord]) -> None:
         """Add an operation to working memory.
 
-        Automatically evicts oldest operations if capacity exceeded.
+        Automatically evicts oldest operations if capacity exceeded. The
+        dictionary is converted to an OperationRecord and not modified.
 
         Args:
-            operation: Operation record with keys:
+            operation: Operation dictionary (or a prebuilt OperationRecord) with keys:
                 - type (str): Operation type (e.g., 'task', 'nl_command')
                 - operation (str): Specific operation (e.g., 'create_task')
                 - data (dict): Operation data
                 - tokens (int): Token count for this operation
-                - timestamp (str): ISO timestamp
+                - timestamp (str, optional): ISO timestamp (defaults to now)
 
         Raises:
             WorkingMemoryException: If operation format is invalid
         """
         with self._lock:
             # Validate operation
-            if not isinstance(operation, dict):
+            if isinstance(operation, OperationRecord):
+                if operation.type is None:
+                    raise WorkingMemoryException(
+                        "Operation missing required fields",
+                        context={'missing_fields': ['type'], 'operation': repr(operation)}
+                    )
+                record = operation
+            elif isinstance(operation, dict):
+                required_fields = ['type', 'operation', 'tokens']
+                missing = [f for f in required_fields if f not in operation]
+                if missing:
+                    raise WorkingMemoryException(
+                        "Operation missing required fields",
+                        context={'missing_fields': missing, 'operation': operation}
+                    )
+                record = None
+            else:
                 raise WorkingMemoryException(
                     "Operation must be a dictionary",
                     context={'operation_type': type(operation).__name__}
                 )
 
-            required_fields = ['type', 'operation', 'tokens']
-            missing = [f for f in required_fields if f not in operation]
-            if missing:
-                raise WorkingMemoryException(
-                    "Operation missing required fields",
-                    context={'missing_fields': missing, 'operation': operation}
-                )
-
-            tokens = operation.get('tokens', 0)
+            tokens = record.tokens if record is not None else operation.get('tokens', 0)
             if not isinstance(tokens, int) or tokens < 0:
                 raise WorkingMemoryException(
                     "Invalid token count",
                     context={'tokens': tokens}
                 )
 
-            # Add timestamp if not present
-            if 'timestamp' not in operation:
-                operation['timestamp'] = datetime.now(timezone.utc).isoformat()
+            if record is None:
+                record = OperationRecord.from_dict(operation)
 
             # Check token budget before adding
             # Evict operations if needed to make room
+            evictions = self._eviction_count
             while (self._current_tokens + tokens > self.max_tokens and
                    len(self._operations) > 0):
-                self._evict_oldest()
+                self._evict()
 
-            # Add operation (deque handles maxlen automatically for count limit)
+            # Enforce the operation count limit
             if len(self._operations) >= self.max_operations:
-                self._evict_oldest()
+                self._evict()
 
-            self._operations.append(operation)
+            record.seq = self._next_seq
+            self._next_seq += 1
+            self._operations[record.seq] = record
             self._current_tokens += tokens
+            self.eviction_policy.on_add(record)
+            if self._eviction_count != evictions:
+                self.eviction_policy.record_utilization(self._current_tokens, self.max_tokens)
 
             logger.debug(
-                f"Added operation: type={operation['type']}, "
-                f"op={operation['operation']}, tokens={tokens}, "
+                f"Added operation: type={record.type}, "
+                f"op={record.operation}, tokens={tokens}, "
                 f"total={self._current_tokens}/{self.max_tokens}"
             )
 
-    def _evict_oldest(self) -> None:
-        """Evict the oldest operation (FIFO)."""
+    def _evict(self) -> None:
+        """Evict the operation chosen by the eviction policy."""
         if len(self._operations) == 0:
             return
 
-        evicted = self._operations.popleft()
-        evicted_tokens = evicted.get('tokens', 0)
+        evicted = self._operations.pop(self.eviction_policy.select_victim())
+        evicted_tokens = evicted.tokens
         self._current_tokens -= evicted_tokens
         self._eviction_count += 1
+        self.eviction_policy.record_eviction(evicted)
 
         logger.debug(
-            f"Evicted operation: type={evicted['type']}, "
+            f"Evicted operation: type={evicted.type}, "
             f"tokens={evicted_tokens}, eviction_count={self._eviction_count}"
         )
 
@@ -254,7 +455,7 @@ class WorkingMemory:
             List of operation dictionaries (oldest to newest)
         """
         with self._lock:
-            return list(self._operations)
+            return [record.to_dict() for record in self._operations.values()]
 
     def get_recent_operations(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get recent operations (most recent first).
@@ -266,10 +467,12 @@ class WorkingMemory:
             List of operation dictionaries (newest to oldest)
         """
         with self._lock:
-            operations = list(reversed(self._operations))
-            if limit is not None:
-                operations = operations[:limit]
-            return operations
+            return [record.to_dict() for record in self._recent_records(limit)]
+
+    def _recent_records(self, limit: Optional[int] = None):
+        """Stored records, newest first, optionally limited."""
+        records = reversed(self._operations.values())
+        return records if limit is None else islice(records, limit)
 
     def get_operations(
         self,
@@ -285,21 +488,27 @@ class WorkingMemory:
 
         Returns:
             List of operation dictionaries (newest to oldest)
+
+        Returned operations count as accesses for the eviction policy.
         """
         with self._lock:
             if operation_type is None:
-                return self.get_recent_operations(limit)
-
-            filtered = [
-                op for op in reversed(self._operations)
-                if op.get('type') == operation_type
-            ]
-            return filtered[:limit]
+                records = list(self._recent_records(limit))
+            else:
+                records = list(islice(
+                    (record for record in self._recent_records()
+                     if record.type == operation_type),
+                    limit
+                ))
+            for record in records:
+                self.eviction_policy.on_access(record)
+            return [record.to_dict() for record in records]
 
     def search(self, query: str, max_results: int = 5) -> List[str]:
         """Search operations by keyword.
 
         Performs case-insensitive keyword search across operation data.
+        Matching operations count as accesses for the eviction policy.
 
         Args:
             query: Search keyword
@@ -312,10 +521,12 @@ class WorkingMemory:
             query_lower = query.lower()
             results = []
 
-            for op in reversed(self._operations):
+            for record in self._recent_records():
+                op = record.to_dict()
                 # Search in operation type, operation name, and data
                 searchable = f"{op.get('type', '')} {op.get('operation', '')} {str(op.get('data', ''))}"
                 if query_lower in searchable.lower():
+                    self.eviction_policy.on_access(record)
                     # Include data snippet in summary for context
                     data_str = str(op.get('data', {}))
                     data_preview = data_str[:50] + '...' if len(data_str) > 50 else data_str
@@ -332,10 +543,69 @@ class WorkingMemory:
 
             return results
 
+    def export_state(self, since_seq: int = 0) -> Dict[str, Any]:
+        """Export operations with their sequence numbers for checkpointing.
+
+        Every added operation gets the next sequence number, so a checkpoint
+        only needs the operations numbered at or after the previous
+        checkpoint's ``next_seq``, plus ``seqs`` to detect evictions.
+
+        Args:
+            since_seq: Only include operations with sequence number >= this
+
+        Returns:
+            Dictionary with 'seqs' (all stored, oldest first), 'operations'
+            (``[seq, operation]`` pairs >= since_seq, oldest first) and
+            'next_seq'
+        """
+        with self._lock:
+            return {
+                'seqs': list(self._operations),
+                'operations': [
+                    [record.seq, record.to_dict()] for record in self._operations.values()
+                    if record.seq >= since_seq
+                ],
+                'next_seq': self._next_seq
+            }
+
+    def load_state(self, entries: Sequence[Tuple[int, Dict[str, Any]]], next_seq: int) -> None:
+        """Replace contents with checkpointed operations.
+
+        Operations are trusted (they were validated when first added), so
+        they are loaded as-is instead of replayed through add_operation().
+        If the checkpoint holds more than the current limits allow, the
+        oldest operations are dropped.
+
+        Args:
+            entries: ``(seq, operation)`` pairs, oldest first
+            next_seq: Sequence number for the next added operation
+        """
+        with self._lock:
+            entries = list(entries)[-self.max_operations:]
+            self._operations.clear()
+            self.eviction_policy.clear()
+            for seq, operation in entries:
+                record = OperationRecord.from_dict(operation)
+                record.seq = seq
+                self._operations[seq] = record
+                self.eviction_policy.on_add(record)
+            self._current_tokens = sum(record.tokens for record in self._operations.values())
+            last_seq = max(self._operations, default=-1)
+            self._next_seq = max(next_seq, last_seq + 1)
+
+            while self._current_tokens > self.max_tokens and len(self._operations) > 1:
+                self._evict()
+
+            logger.debug(
+                f"Loaded {len(self._operations)} operations "
+                f"({self._current_tokens:,} tokens), next_seq={self._next_seq}"
+            )
+
     def clear(self) -> None:
         """Clear all operations from working memory."""
         with self._lock:
             self._operations.clear()
+            self.eviction_policy.clear()
             self._current_tokens = 0
             logger.info("Working memory cleared")
 
@@ -353,9 +623,21 @@ class WorkingMemory:
                 'max_tokens': self.max_tokens,
                 'token_utilization': self._current_tokens / self.max_tokens if self.max_tokens > 0 else 0,
                 'eviction_count': self._eviction_count,
+                'eviction_policy': self.eviction_policy.name,
                 'context_window': self.context_window
             }
 
+    def get_eviction_report(self) -> Dict[str, Any]:
+        """Report how much of the token budget the eviction policy retains.
+
+        Returns:
+            Dictionary from EvictionPolicy.report() (policy, evictions,
+            evicted_tokens, token_retention, budget_used,
+            budget_after_eviction, pinned_types)
+        """
+        with self._lock:
+            return self.eviction_policy.report(self._current_tokens, self.max_tokens)
+
     def __len__(self) -> int:
         """Get number of operations in memory."""
         with self._lock:
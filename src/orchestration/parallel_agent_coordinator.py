@@ -4,8 +4,14 @@ This module provides coordination for multiple Claude Code agents executing subt
 simultaneously. It handles agent spawning, monitoring, failure handling, and result merging.
 
 Key Features:
-- Spawn parallel agents (one per subtask in parallel group)
-- Monitor agent progress with timeouts
+- Bounded pool of agent workers, each reusing one agent across subtasks
+- DAG-aware dispatch: a subtask starts as soon as its own dependencies
+  complete, longest remaining dependency chain first
+- Monitor agent progress with per-subtask timeouts
+- Cancellation of queued subtasks
+- Optional workspace isolation: one git worktree per agent, with each
+  subtask's commit three-way merged back and conflicts reported
+- Optional process isolation: each agent runs in its own process
 - Handle failures with retry logic
 - Merge results from successful agents
 - Enforce RULE_SINGLE_AGENT_TESTING (no parallel testing)
@@ -35,20 +41,209 @@ warnings.warn(
     DeprecationWarning,
     stacklevel=2
 )
+import heapq
+import multiprocessing
 import time
 from datetime import datetime, UTC
+from pathlib import Path
 from queue import Queue, Empty
-from threading import Thread, RLock
-from typing import List, Dict, Any, Optional, Callable
+from threading import Event, Thread, RLock
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
 from src.core.exceptions import OrchestratorException
 from src.core.state import StateManager
+from src.orchestration.scheduling_policy import TaskGraph
 from src.orchestration.subtask import SubTask
 from src.plugins.base import AgentPlugin
 from src.plugins.exceptions import AgentException
+from src.utils.git_manager import GitException, GitManager
 
 logger = logging.getLogger(__name__)
 
+WORKSPACE_SHARED = 'shared'
+WORKSPACE_WORKTREE = 'worktree'
+
+
+class _AgentWorker:
+    """A pool worker: one thread, one agent, one inbox of subtasks."""
+
+    def __init__(self, agent_id: str):
+        self.agent_id = agent_id
+        self.inbox: Queue = Queue()
+        self.thread: Optional[Thread] = None
+        self.agent: Optional[Any] = None
+        self.workspace: Optional[Path] = None
+
+
+class _WorktreeIntegration:
+    """Folds each subtask's worktree commit into one integration worktree.
+
+    Starts from the project's HEAD. Every completed subtask commit is
+    three-way merged into the integration worktree as it arrives, so later
+    subtasks can start from ``head`` and see the work of everything that
+    finished before them. ``finish`` applies the integrated result to the
+    project working tree as uncommitted changes.
+    """
+
+    def __init__(self, git_manager: GitManager):
+        self._git = git_manager
+        self.base = git_manager.get_commit('HEAD')
+        self.path = git_manager.create_worktree(self.base, prefix='obra-integration-')
+        self.head = self.base
+        self.merged: List[int] = []
+        self.conflicts: Dict[int, List[str]] = {}
+
+    def integrate(self, subtask: SubTask, commit: str) -> List[str]:
+        """Merge a subtask commit; returns conflicting files (empty on success)."""
+        conflicts = self._git.merge_into_worktree(
+            self.path, commit, f"Merge subtask {subtask.subtask_id}: {subtask.title}"
+        )
+        if conflicts:
+            self.conflicts[subtask.subtask_id] = conflicts
+            return conflicts
+        self.head = self._git.get_commit('HEAD', path=self.path)
+        self.merged.append(subtask.subtask_id)
+        return []
+
+    def finish(self) -> Dict[str, Any]:
+        """Apply the integrated changes to the project and remove the worktree."""
+        apply_conflicts: List[str] = []
+        try:
+            if self.head != self.base:
+                apply_conflicts = self._git.apply_commit(self.head)
+        finally:
+            self._git.remove_worktree(self.path)
+
+        return self.report(apply_conflicts)
+
+    def report(
+        self,
+        apply_conflicts: Optional[List[str]] = None,
+        error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Summary of the integration for ``last_merge_report``."""
+        return {
+            'base_commit': self.base,
+            'integrated_commit': self.head,
+            'merged_subtask_ids': list(self.merged),
+            'conflicts': dict(self.conflicts),
+            'apply_conflicts': apply_conflicts or [],
+            'error': error
+        }
+
+
+def _agent_process_main(conn: Any, agent_factory: Callable[[], AgentPlugin], agent_config: Dict[str, Any]) -> None:
+    """Child-process loop: build one agent, then serve prompts until told to stop.
+
+    Protocol over ``conn``: the child sends ('ready', None) or ('error', ...)
+    after initialization; each (prompt, context) request is answered with
+    ('ok', response) or ('error', (type_name, message, is_agent_error)).
+    A None request stops the loop.
+    """
+    agent = None
+    try:
+        try:
+            agent = agent_factory()
+            if hasattr(agent, 'initialize') and callable(agent.initialize):
+                agent.initialize(agent_config)
+        except Exception as exc:
+            conn.send(('error', (type(exc).__name__, str(exc), isinstance(exc, AgentException))))
+            return
+        conn.send(('ready', None))
+
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            prompt, context = request
+            try:
+                conn.send(('ok', agent.send_prompt(prompt, context=context)))
+            except Exception as exc:
+                conn.send(('error', (type(exc).__name__, str(exc), isinstance(exc, AgentException))))
+    except (EOFError, OSError):
+        pass  # Parent went away
+    finally:
+        if agent is not None and hasattr(agent, 'cleanup') and callable(agent.cleanup):
+            try:
+                agent.cleanup()
+            except Exception:
+                pass
+        conn.close()
+
+
+class _AgentProcess:
+    """Proxy for an agent running in its own process.
+
+    Exposes the ``send_prompt``/``cleanup`` subset of AgentPlugin so the
+    coordinator can use it like an in-process agent, plus ``terminate`` so
+    a stuck agent can actually be stopped. The agent factory, agent config,
+    prompts, contexts and responses must be picklable (the child is started
+    with the 'spawn' method).
+    """
+
+    def __init__(
+        self,
+        agent_factory: Callable[[], AgentPlugin],
+        agent_config: Dict[str, Any],
+        startup_timeout: float
+    ):
+        mp_context = multiprocessing.get_context('spawn')
+        self._conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_agent_process_main,
+            args=(child_conn, agent_factory, agent_config),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        if not self._conn.poll(startup_timeout):
+            self.terminate()
+            raise AgentException(
+                f"Agent process did not start within {startup_timeout}s",
+                context={'pid': self.process.pid}
+            )
+        self._receive()
+
+    def send_prompt(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Send a prompt to the child agent and wait for its response."""
+        try:
+            self._conn.send((prompt, context))
+        except (OSError, EOFError) as exc:
+            raise AgentException(f"Agent process unavailable: {exc}") from exc
+        return self._receive()
+
+    def cleanup(self) -> None:
+        """Stop the child process, letting the agent clean up first."""
+        try:
+            self._conn.send(None)
+        except (OSError, EOFError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.terminate()
+        self._conn.close()
+
+    def terminate(self) -> None:
+        """Kill the child process immediately."""
+        self.process.terminate()
+        self.process.join(timeout=5)
+
+    def _receive(self) -> Any:
+        try:
+            kind, payload = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            raise AgentException(
+                "Agent process exited unexpectedly",
+                context={'pid': self.process.pid, 'exitcode': self.process.exitcode}
+            ) from exc
+        if kind == 'error':
+            type_name, message, is_agent_error = payload
+            if is_agent_error:
+                raise AgentException(message)
+            raise RuntimeError(f"{type_name}: {message}")
+        return payload
+
 
 class ParallelAgentCoordinator:
     """
@@ -58,7 +253,8 @@ class ParallelAgentCoordinator:
     See ADR-005 for details.
 
     Responsibilities:
-    - Spawn parallel agents (one per subtask in parallel group)
+    - Run subtasks on at most max_parallel_agents reusable agents
+    - Start each subtask as soon as its dependencies complete
     - Monitor agent progress and status
     - Handle agent failures with retry logic
     - Merge results from successful agents
@@ -78,13 +274,16 @@ class ParallelAgentCoordinator:
         ...     parent_task=task,
         ...     context={'project_id': 1}
         ... )
+        >>> # From another thread: stop dispatching queued subtasks
+        >>> coordinator.cancel()
     """
 
     def __init__(
         self,
         state_manager: StateManager,
         agent_factory: Optional[Callable[[], AgentPlugin]] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        git_manager: Optional[GitManager] = None
     ):
         """
         Initialize coordinator.
@@ -94,15 +293,22 @@ class ParallelAgentCoordinator:
         Args:
             state_manager: StateManager for logging and state tracking
             agent_factory: Factory function to create agent instances
+                (must be picklable when process_isolation is enabled)
             config: Configuration dict with:
                 - max_parallel_agents: int (default 5)
                 - agent_timeout_seconds: int (default 600)
                 - retry_failed_agents: bool (default True)
                 - max_retries: int (default 2)
                 - parallelization_strategy: str (default 'parallel_groups')
+                - workspace_isolation: 'shared' | 'worktree' (default 'shared')
+                - process_isolation: bool (default False)
+                - agent_startup_timeout_seconds: int (default 60, process
+                  isolation only)
+            git_manager: Initialized GitManager (required for 'worktree')
 
         Raises:
-            ValueError: If state_manager is None
+            ValueError: If state_manager is None, or worktree isolation is
+                requested without a git_manager
         """
         warnings.warn(
             "ParallelAgentCoordinator is deprecated and should not be used",
@@ -116,6 +322,8 @@ class ParallelAgentCoordinator:
         self._agent_factory = agent_factory
         self._config = config or {}
         self._lock = RLock()
+        self._cancel_event = Event()
+        self._result_queue: Optional[Queue] = None
 
         # Configuration with defaults
         self._max_parallel_agents = self._config.get('max_parallel_agents', 5)
@@ -126,12 +334,28 @@ class ParallelAgentCoordinator:
             'parallelization_strategy',
             'parallel_groups'
         )
+        self._workspace_isolation = self._config.get('workspace_isolation', WORKSPACE_SHARED)
+        self._process_isolation = self._config.get('process_isolation', False)
+        self._agent_startup_timeout = self._config.get('agent_startup_timeout_seconds', 60)
+
+        if self._workspace_isolation not in (WORKSPACE_SHARED, WORKSPACE_WORKTREE):
+            raise ValueError(
+                f"workspace_isolation must be '{WORKSPACE_SHARED}' or "
+                f"'{WORKSPACE_WORKTREE}', got '{self._workspace_isolation}'"
+            )
+        if self._workspace_isolation == WORKSPACE_WORKTREE and git_manager is None:
+            raise ValueError("workspace_isolation='worktree' requires a git_manager")
+
+        self._git_manager = git_manager
+        self.last_merge_report: Optional[Dict[str, Any]] = None
 
         logger.info(
             f"ParallelAgentCoordinator initialized: "
             f"max_agents={self._max_parallel_agents}, "
             f"timeout={self._agent_timeout_seconds}s, "
-            f"retry={self._retry_failed_agents} (max={self._max_retries})"
+            f"retry={self._retry_failed_agents} (max={self._max_retries}), "
+            f"workspace={self._workspace_isolation}, "
+            f"process_isolation={self._process_isolation}"
         )
 
     def execute_parallel(
@@ -141,17 +365,32 @@ class ParallelAgentCoordinator:
         context: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Execute subtasks in parallel groups.
+        Execute subtasks on a bounded pool of reusable agents.
 
         Process:
-        1. Group subtasks by parallel_group
-        2. For each group (sequential):
-           a. Spawn agents for all tasks in group (parallel)
-           b. Monitor agent progress
-           c. Collect results
-           d. Handle failures
-        3. Merge all results
-        4. Return consolidated results
+        1. Validate RULE_SINGLE_AGENT_TESTING per parallel group
+        2. Queue every subtask whose dependencies are satisfied
+        3. Dispatch ready subtasks to at most max_parallel_agents workers,
+           longest remaining dependency chain first
+        4. As each subtask completes, queue the dependents it unblocked
+        5. Merge all results
+
+        A subtask starts as soon as its own dependencies complete; there is
+        no barrier between parallel groups. Dependencies on subtask IDs
+        outside ``subtasks`` are treated as satisfied. Subtasks whose
+        dependencies fail, time out or form a cycle are reported as
+        'cancelled', as are queued subtasks when cancel() is called.
+
+        With workspace_isolation='worktree', each agent works in its own git
+        worktree, synced before every subtask to the integration of all
+        subtasks completed so far (starting from HEAD; uncommitted changes
+        in the project are not visible to agents). A completed subtask's
+        commit is three-way merged into that integration; if it conflicts,
+        the subtask is reported with status 'conflict' and the conflicting
+        files, and its dependents are cancelled. The integrated result is
+        left as uncommitted changes in the project working tree, and a
+        summary is stored in ``last_merge_report`` (with 'error' set if the
+        changes could not be applied).
 
         Args:
             subtasks: List of SubTask instances
@@ -179,31 +418,45 @@ class ParallelAgentCoordinator:
 
         logger.info(f"Starting parallel execution of {len(subtasks)} subtasks")
 
-        # Group subtasks by parallel_group
-        groups = self._group_subtasks_by_parallel_group(subtasks)
-
-        all_results = []
-
-        # Execute each group sequentially
-        for group_id, group_subtasks in groups.items():
-            logger.info(
-                f"Executing parallel group {group_id} with {len(group_subtasks)} subtasks"
-            )
-
-            # Enforce testing rule
+        # Testing tasks may not share a parallel group with anything else
+        for group_subtasks in self._group_subtasks_by_parallel_group(subtasks).values():
             self._enforce_testing_rule(group_subtasks)
 
-            # Execute group in parallel
-            group_results = self._spawn_agents_for_group(
-                subtasks=group_subtasks,
-                parent_task=parent_task,
-                context=context
+        started_at = datetime.now(UTC)
+        self.last_merge_report = None
+        integration = None
+        if self._workspace_isolation == WORKSPACE_WORKTREE:
+            integration = _WorktreeIntegration(self._git_manager)
+        try:
+            results, stats = self._run_work_queue(subtasks, parent_task, context, integration)
+        finally:
+            # Cleared only once a run ends, so a cancel() that arrived before
+            # or during startup is not lost
+            self._cancel_event.clear()
+            if integration is not None:
+                self.last_merge_report = self._finish_integration(integration)
+        completed_at = datetime.now(UTC)
+
+        report = self.last_merge_report
+        if report and report['apply_conflicts']:
+            logger.error(
+                f"Integrated subtask changes conflict with the working tree: "
+                f"{report['apply_conflicts']}"
             )
 
-            all_results.extend(group_results)
+        self._log_parallel_attempt(
+            parent_task_id=parent_task.id,
+            subtask_ids=[st.subtask_id for st in subtasks],
+            results=results,
+            started_at=started_at,
+            completed_at=completed_at,
+            agent_ids=stats['agent_ids'],
+            max_concurrent_agents=stats['max_concurrent_agents'],
+            merge_report=report
+        )
 
         # Merge and sort results
-        merged_results = self._merge_agent_results(all_results, subtasks)
+        merged_results = self._merge_agent_results(results, subtasks)
 
         logger.info(
             f"Parallel execution complete: {len(merged_results)} results, "
@@ -212,6 +465,42 @@ class ParallelAgentCoordinator:
 
         return merged_results
 
+    def _finish_integration(self, integration: _WorktreeIntegration) -> Dict[str, Any]:
+        """
+        Apply the integrated result, recording (not raising) failures.
+
+        Runs from a ``finally`` block, so raising here would replace an
+        exception from the work queue and discard completed results.
+
+        Args:
+            integration: Worktree integration of the finished run
+
+        Returns:
+            Merge report; 'error' is set if the changes could not be applied
+        """
+        try:
+            return integration.finish()
+        except Exception as e:
+            logger.error(f"Failed to apply integrated subtask changes: {e}")
+            return integration.report(error=str(e))
+
+    def cancel(self) -> None:
+        """
+        Cancel the execution in progress.
+
+        No further subtasks are dispatched. Agents already running finish
+        (or time out) and their results are kept; every subtask that has
+        not started is reported as 'cancelled'. If called before an
+        execution starts, that execution is cancelled as soon as it starts.
+        Safe to call from any thread.
+        """
+        self._cancel_event.set()
+        with self._lock:
+            if self._result_queue is not None:
+                # Wake the dispatcher if it is waiting on results
+                self._result_queue.put(None)
+        logger.info("Parallel execution cancellation requested")
+
     def _group_subtasks_by_parallel_group(
         self,
         subtasks: List[SubTask]
@@ -246,104 +535,446 @@ class ParallelAgentCoordinator:
         # Sort groups by key for deterministic execution order
         return dict(sorted(groups.items()))
 
-    def _spawn_agents_for_group(
+    def _run_work_queue(
         self,
         subtasks: List[SubTask],
         parent_task: Any,
+        context: Optional[Dict[str, Any]] = None,
+        integration: Optional[_WorktreeIntegration] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Dispatch subtasks to agent workers as their dependencies complete.
+
+        Workers are started lazily, up to max_parallel_agents, and each keeps
+        its agent for every subtask it runs. A worker whose subtask times out
+        is retired (a process-isolated agent is killed; a thread cannot be
+        interrupted) and a fresh worker may take its slot, so at most
+        max_parallel_agents subtasks are ever being waited on. Testing
+        subtasks run with no other subtask in flight.
+
+        Args:
+            subtasks: Subtasks to execute
+            parent_task: Parent task
+            context: Execution context
+            integration: Worktree integration (worktree isolation only)
+
+        Returns:
+            Tuple of (results, stats) where stats has 'agent_ids' and
+            'max_concurrent_agents'
+        """
+        by_id = {st.subtask_id: st for st in subtasks}
+        waiting_on = {
+            st.subtask_id: {dep_id for dep_id in st.dependencies if dep_id in by_id}
+            for st in subtasks
+        }
+        dependents: Dict[int, List[int]] = {subtask_id: [] for subtask_id in by_id}
+        for subtask_id, dep_ids in waiting_on.items():
+            for dep_id in dep_ids:
+                dependents[dep_id].append(subtask_id)
+
+        # Longest remaining chain first keeps the critical path moving
+        ranks = TaskGraph(
+            dependencies={sid: sorted(deps) for sid, deps in waiting_on.items()},
+            durations={st.subtask_id: float(st.estimated_duration_minutes) for st in subtasks}
+        ).upward_ranks()
+        ready = [(-ranks[sid], sid) for sid, deps in waiting_on.items() if not deps]
+        heapq.heapify(ready)
+
+        result_queue: Queue = Queue()
+        with self._lock:
+            self._result_queue = result_queue
+
+        results: Dict[int, Dict[str, Any]] = {}
+        workers: List[_AgentWorker] = []
+        idle: List[_AgentWorker] = []
+        retired: List[_AgentWorker] = []
+        in_flight: Dict[int, Tuple[_AgentWorker, float]] = {}  # subtask_id -> (worker, deadline)
+        exclusive_running = False
+        max_concurrent = 0
+
+        def skip(subtask_id: int, reason: str) -> None:
+            """Record a subtask that will not run, and everything downstream of it."""
+            results[subtask_id] = self._new_result(subtask_id, status='cancelled', error=reason)
+            for dependent_id in dependents[subtask_id]:
+                if dependent_id not in results:
+                    skip(dependent_id, f"Dependency {subtask_id} did not complete")
+
+        def finish(subtask_id: int, result: Dict[str, Any]) -> None:
+            """Record a result and queue the dependents it unblocked."""
+            results[subtask_id] = result
+            if result['status'] != 'completed':
+                for dependent_id in dependents[subtask_id]:
+                    if dependent_id not in results:
+                        skip(dependent_id, f"Dependency {subtask_id} {result['status']}")
+                return
+            for dependent_id in dependents[subtask_id]:
+                waiting_on[dependent_id].discard(subtask_id)
+                if not waiting_on[dependent_id] and dependent_id not in results:
+                    heapq.heappush(ready, (-ranks[dependent_id], dependent_id))
+
+        try:
+            while True:
+                # Dispatch as many ready subtasks as the pool allows
+                while ready and not self._cancel_event.is_set():
+                    _, subtask_id = ready[0]
+                    if subtask_id in results:
+                        heapq.heappop(ready)
+                        continue
+                    subtask = by_id[subtask_id]
+                    exclusive = self._is_testing_subtask(subtask)
+                    if exclusive_running or (exclusive and in_flight):
+                        break
+                    if not idle and len(in_flight) >= self._max_parallel_agents:
+                        break
+
+                    heapq.heappop(ready)
+                    if idle:
+                        worker = idle.pop()
+                    else:
+                        worker = self._start_worker(len(workers), parent_task, result_queue, context)
+                        workers.append(worker)
+                    in_flight[subtask_id] = (worker, time.time() + self._agent_timeout_seconds)
+                    exclusive_running = exclusive
+                    worker.inbox.put((subtask, integration.head if integration else None))
+                    max_concurrent = max(max_concurrent, len(in_flight))
+
+                if self._cancel_event.is_set():
+                    while ready:
+                        _, subtask_id = heapq.heappop(ready)
+                        if subtask_id not in results:
+                            skip(subtask_id, 'Execution cancelled')
+
+                if not in_flight:
+                    break
+
+                # Wait for the next result or the nearest agent deadline
+                nearest_deadline = min(deadline for _, deadline in in_flight.values())
+                try:
+                    result = result_queue.get(timeout=max(0.0, nearest_deadline - time.time()))
+                except Empty:
+                    result = None
+
+                if result is not None:
+                    subtask_id = result['subtask_id']
+                    entry = in_flight.get(subtask_id)
+                    if entry is None or entry[0].agent_id != result['agent_id']:
+                        logger.debug(f"Ignoring late result for subtask {subtask_id}")
+                        continue
+                    del in_flight[subtask_id]
+                    idle.append(entry[0])
+                    exclusive_running = False
+                    if integration is not None and result['status'] == 'completed':
+                        self._integrate_result(integration, by_id[subtask_id], result)
+                    finish(subtask_id, result)
+
+                now = time.time()
+                for subtask_id, (worker, deadline) in list(in_flight.items()):
+                    if now < deadline:
+                        continue
+                    logger.error(
+                        f"Subtask {subtask_id} timed out on {worker.agent_id}, retiring agent"
+                    )
+                    del in_flight[subtask_id]
+                    exclusive_running = False
+                    worker.inbox.put(None)  # Exits once the stuck call returns
+                    if hasattr(worker.agent, 'terminate'):
+                        worker.agent.terminate()
+                    retired.append(worker)
+                    self._mark_subtask_failed(by_id[subtask_id])
+                    finish(subtask_id, self._new_result(
+                        subtask_id,
+                        status='timeout',
+                        error=f'Agent timed out after {self._agent_timeout_seconds}s',
+                        duration_seconds=self._agent_timeout_seconds,
+                        agent_id=worker.agent_id
+                    ))
+        finally:
+            with self._lock:
+                self._result_queue = None
+            for worker in idle:
+                worker.inbox.put(None)
+            for worker in idle:
+                worker.thread.join(timeout=self._agent_timeout_seconds)
+            for worker in retired:
+                worker.thread.join(timeout=1.0)
+            for worker in idle + retired:
+                if worker.workspace is None:
+                    continue
+                if worker.thread.is_alive():
+                    logger.warning(
+                        f"Leaving worktree {worker.workspace} of stuck agent {worker.agent_id}"
+                    )
+                else:
+                    self._git_manager.remove_worktree(worker.workspace)
+
+        # Whatever is left never became ready
+        reason = (
+            'Execution cancelled' if self._cancel_event.is_set()
+            else 'Dependency cycle prevents execution'
+        )
+        for subtask_id in by_id:
+            if subtask_id not in results:
+                results[subtask_id] = self._new_result(subtask_id, status='cancelled', error=reason)
+
+        stats = {
+            'agent_ids': [worker.agent_id for worker in workers],
+            'max_concurrent_agents': max_concurrent
+        }
+        return list(results.values()), stats
+
+    def _start_worker(
+        self,
+        index: int,
+        parent_task: Any,
+        result_queue: Queue,
         context: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> _AgentWorker:
         """
-        Spawn and manage agents for a parallel group.
+        Start a worker thread that owns one agent.
 
         Args:
-            subtasks: List of subtasks in this parallel group
+            index: Worker index (used for agent_id)
             parent_task: Parent task
+            result_queue: Queue where results are put
             context: Execution context
 
         Returns:
-            List of results (one per subtask)
+            Started _AgentWorker
+        """
+        worker = _AgentWorker(f"agent_{index}")
+        worker.thread = Thread(
+            target=self._agent_worker_loop,
+            args=(worker, parent_task, result_queue, context),
+            name=f"Agent-Worker-{index}",
+            daemon=True
+        )
+        worker.thread.start()
+        logger.debug(f"Started agent worker {worker.agent_id}")
+        return worker
 
-        Process:
-        1. Create agent for each subtask
-        2. Start agents in threads
-        3. Monitor progress with timeouts
-        4. Collect results as agents complete
-        5. Handle timeouts and failures
+    def _agent_worker_loop(
+        self,
+        worker: _AgentWorker,
+        parent_task: Any,
+        result_queue: Queue,
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
-        if not subtasks:
-            return []
+        Run subtasks from a worker's inbox on one reused agent (runs in thread).
 
-        # Track start time
-        started_at = datetime.now(UTC)
+        The agent (and, with worktree isolation, its worktree) is created on
+        the first subtask and cleaned up when the worker receives the None
+        sentinel. If creation fails, the subtask is reported as failed and
+        creation is retried on the next one. Inbox items are
+        ``(subtask, base_commit)``; base_commit is None without worktrees.
 
-        # Limit to max_parallel_agents
-        num_agents = min(len(subtasks), self._max_parallel_agents)
+        Args:
+            worker: Worker whose inbox to consume
+            parent_task: Parent task
+            result_queue: Queue to put results in
+            context: Execution context
+        """
+        agent = None
+        try:
+            while True:
+                item = worker.inbox.get()
+                if item is None:
+                    break
+                subtask, base_commit = item
+
+                if agent is None:
+                    try:
+                        if self._workspace_isolation == WORKSPACE_WORKTREE and worker.workspace is None:
+                            worker.workspace = self._git_manager.create_worktree(base_commit)
+                        agent = self._create_agent(context, subtask.subtask_id, worker.workspace)
+                        worker.agent = agent
+                    except Exception as exc:
+                        logger.error(f"Failed to create agent {worker.agent_id}: {exc}")
+                        result_queue.put(self._new_result(
+                            subtask.subtask_id,
+                            error=f"Agent creation failed: {exc}",
+                            agent_id=worker.agent_id
+                        ))
+                        continue
+
+                self._execute_agent_for_subtask(
+                    subtask=subtask,
+                    parent_task=parent_task,
+                    result_queue=result_queue,
+                    context=context,
+                    agent=agent,
+                    agent_id=worker.agent_id,
+                    workspace=worker.workspace,
+                    base_commit=base_commit
+                )
+        finally:
+            if agent is not None:
+                self._cleanup_agent(agent, worker.agent_id)
 
-        if num_agents < len(subtasks):
-            logger.warning(
-                f"Limiting parallel agents from {len(subtasks)} to {num_agents} "
-                f"(max_parallel_agents={self._max_parallel_agents})"
+    def _create_agent(
+        self,
+        context: Optional[Dict[str, Any]] = None,
+        subtask_id: Optional[int] = None,
+        workspace: Optional[Path] = None
+    ) -> AgentPlugin:
+        """
+        Create and initialize an agent from the factory.
+
+        Args:
+            context: Execution context (may contain 'agent_config')
+            subtask_id: Subtask the agent is created for (error context)
+            workspace: Worktree to use as the agent's workspace_path
+
+        Returns:
+            Initialized agent (an _AgentProcess proxy with process isolation)
+
+        Raises:
+            OrchestratorException: If agent_factory is not configured
+        """
+        if self._agent_factory is None:
+            raise OrchestratorException(
+                "agent_factory not configured",
+                context={'subtask_id': subtask_id},
+                recovery="Configure agent_factory in ParallelAgentCoordinator"
             )
-            # TODO: Handle excess subtasks (batch or queue them)
 
-        # Create result queue (thread-safe)
-        result_queue: Queue = Queue()
+        agent_config = dict(context.get('agent_config', {})) if context else {}
+        if workspace is not None:
+            agent_config['workspace_path'] = str(workspace)
+
+        if self._process_isolation:
+            return _AgentProcess(
+                self._agent_factory,
+                agent_config,
+                startup_timeout=self._agent_startup_timeout
+            )
 
-        # Create threads for each subtask
-        threads: List[Thread] = []
-        agent_subtasks = subtasks[:num_agents]  # Only take what we can handle
+        agent = self._agent_factory()
 
-        for subtask in agent_subtasks:
-            thread = Thread(
-                target=self._execute_agent_for_subtask,
-                args=(subtask, parent_task, result_queue, context),
-                name=f"Agent-Subtask-{subtask.subtask_id}",
-                daemon=True
+        # Initialize agent (if needed)
+        if hasattr(agent, 'initialize') and callable(agent.initialize):
+            agent.initialize(agent_config)
+
+        return agent
+
+    def _integrate_result(
+        self,
+        integration: _WorktreeIntegration,
+        subtask: SubTask,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Merge a completed subtask's commit, downgrading the result on conflict.
+
+        Args:
+            integration: Worktree integration
+            subtask: Completed subtask
+            result: Its result dict (updated in place)
+        """
+        commit = result.get('commit')
+        if not commit:
+            return  # Subtask changed nothing
+
+        try:
+            conflicts = integration.integrate(subtask, commit)
+        except GitException as exc:
+            logger.error(f"Merge of subtask {subtask.subtask_id} failed: {exc.stderr}")
+            result['status'] = 'failed'
+            result['error'] = f"Merge failed: {exc}"
+            subtask.status = 'failed'
+            return
+
+        if conflicts:
+            logger.warning(
+                f"Subtask {subtask.subtask_id} conflicts with completed work: {conflicts}"
             )
-            threads.append(thread)
+            result['status'] = 'conflict'
+            result['error'] = f"Merge conflict in: {', '.join(conflicts)}"
+            result['conflicts'] = conflicts
+            subtask.status = 'failed'
 
-        # Start all threads
-        logger.info(f"Starting {len(threads)} agent threads")
-        for thread in threads:
-            thread.start()
+    def _cleanup_agent(self, agent: AgentPlugin, agent_id: str) -> None:
+        """
+        Clean up an agent, logging (not raising) failures.
 
-        # Monitor progress and collect results
-        results = self._monitor_agent_progress(
-            threads=threads,
-            result_queue=result_queue,
-            subtasks=agent_subtasks,
-            timeout_seconds=self._agent_timeout_seconds
-        )
+        Args:
+            agent: Agent to clean up
+            agent_id: Agent identifier for logging
+        """
+        if hasattr(agent, 'cleanup') and callable(agent.cleanup):
+            try:
+                agent.cleanup()
+            except Exception as cleanup_err:
+                logger.warning(f"Agent cleanup failed for {agent_id}: {cleanup_err}")
 
-        # Track completion time
-        completed_at = datetime.now(UTC)
+    def _new_result(
+        self,
+        subtask_id: int,
+        status: str = 'failed',
+        error: Optional[str] = None,
+        duration_seconds: float = 0.0,
+        agent_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a subtask result dict.
 
-        # Log parallel attempt
-        self._log_parallel_attempt(
-            parent_task_id=parent_task.id,
-            subtask_ids=[st.subtask_id for st in agent_subtasks],
-            results=results,
-            started_at=started_at,
-            completed_at=completed_at
-        )
+        Args:
+            subtask_id: Subtask ID
+            status: 'completed' | 'failed' | 'timeout' | 'conflict' | 'cancelled'
+            error: Error message
+            duration_seconds: Execution time
+            agent_id: Agent that ran the subtask (None if it never ran)
 
-        return results
+        Returns:
+            Result dict
+        """
+        return {
+            'subtask_id': subtask_id,
+            'status': status,
+            'result': None,
+            'error': error,
+            'duration_seconds': duration_seconds,
+            'agent_id': agent_id
+        }
+
+    def _mark_subtask_failed(self, subtask: SubTask) -> None:
+        """
+        Mark an in-progress subtask as failed.
+
+        Args:
+            subtask: Subtask to mark
+        """
+        try:
+            if subtask.status == 'in_progress':
+                subtask.mark_failed()
+        except ValueError:
+            pass  # Already in different state
 
     def _execute_agent_for_subtask(
         self,
         subtask: SubTask,
         parent_task: Any,
         result_queue: Queue,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        agent: Optional[AgentPlugin] = None,
+        agent_id: Optional[str] = None,
+        workspace: Optional[Path] = None,
+        base_commit: Optional[str] = None
     ) -> None:
         """
-        Execute a single subtask with an agent (runs in thread).
+        Execute a single subtask with an agent.
 
         Args:
             subtask: Subtask to execute
             parent_task: Parent task
             result_queue: Queue to put result in
             context: Execution context
+            agent: Agent to reuse; if None, one is created for this
+                subtask and cleaned up afterwards
+            agent_id: Identifier of the agent, reported in the result
+            workspace: Agent's worktree; reset to base_commit before the
+                subtask and committed after it
+            base_commit: Commit the worktree starts from
 
         Puts result dict in queue:
         {
@@ -351,35 +982,24 @@ class ParallelAgentCoordinator:
             'status': 'completed' | 'failed' | 'timeout',
             'result': Any,
             'error': Optional[str],
-            'duration_seconds': float
+            'duration_seconds': float,
+            'agent_id': Optional[str],
+            'commit': Optional[str]  # worktree isolation only
         }
         """
         start_time = time.time()
-        result = {
-            'subtask_id': subtask.subtask_id,
-            'status': 'failed',
-            'result': None,
-            'error': None,
-            'duration_seconds': 0.0
-        }
+        result = self._new_result(subtask.subtask_id, agent_id=agent_id)
+        owns_agent = agent is None
 
         try:
             logger.info(f"Agent starting execution of subtask {subtask.subtask_id}")
 
-            # Create agent instance
-            if self._agent_factory is None:
-                raise OrchestratorException(
-                    "agent_factory not configured",
-                    context={'subtask_id': subtask.subtask_id},
-                    recovery="Configure agent_factory in ParallelAgentCoordinator"
-                )
+            if owns_agent:
+                agent = self._create_agent(context, subtask.subtask_id, workspace)
 
-            agent = self._agent_factory()
-
-            # Initialize agent (if needed)
-            if hasattr(agent, 'initialize') and callable(agent.initialize):
-                agent_config = context.get('agent_config', {}) if context else {}
-                agent.initialize(agent_config)
+            # Start from everything integrated so far
+            if workspace is not None:
+                self._git_manager.sync_worktree(workspace, base_commit)
 
             # Mark subtask as in progress
             subtask.mark_in_progress()
@@ -390,6 +1010,11 @@ class ParallelAgentCoordinator:
             # Execute with agent
             response = agent.send_prompt(prompt, context=context)
 
+            if workspace is not None:
+                result['commit'] = self._git_manager.commit_worktree(
+                    workspace, f"Subtask {subtask.subtask_id}: {subtask.title}"
+                )
+
             # Mark subtask as completed
             subtask.mark_completed()
 
@@ -402,28 +1027,13 @@ class ParallelAgentCoordinator:
                 f"in {time.time() - start_time:.2f}s"
             )
 
-            # Cleanup agent
-            if hasattr(agent, 'cleanup') and callable(agent.cleanup):
-                try:
-                    agent.cleanup()
-                except Exception as cleanup_err:
-                    logger.warning(
-                        f"Agent cleanup failed for subtask {subtask.subtask_id}: {cleanup_err}"
-                    )
-
         except AgentException as agent_err:
             logger.error(
                 f"Agent failed for subtask {subtask.subtask_id}: {agent_err}"
             )
             result['status'] = 'failed'
             result['error'] = str(agent_err)
-
-            # Mark subtask as failed
-            try:
-                if subtask.status == 'in_progress':
-                    subtask.mark_failed()
-            except ValueError:
-                pass  # Already in different state
+            self._mark_subtask_failed(subtask)
 
         except Exception as exc:
             logger.exception(
@@ -431,15 +1041,12 @@ class ParallelAgentCoordinator:
             )
             result['status'] = 'failed'
             result['error'] = f"Unexpected error: {str(exc)}"
-
-            # Mark subtask as failed
-            try:
-                if subtask.status == 'in_progress':
-                    subtask.mark_failed()
-            except ValueError:
-                pass
+            self._mark_subtask_failed(subtask)
 
         finally:
+            if owns_agent and agent is not None:
+                self._cleanup_agent(agent, f"subtask {subtask.subtask_id}")
+
             # Record duration
             result['duration_seconds'] = time.time() - start_time
 
@@ -485,106 +1092,6 @@ class ParallelAgentCoordinator:
 
         return prompt
 
-    def _monitor_agent_progress(
-        self,
-        threads: List[Thread],
-        result_queue: Queue,
-        subtasks: List[SubTask],
-        timeout_seconds: int
-    ) -> List[Dict[str, Any]]:
-        """
-        Monitor running agent threads and collect results.
-
-        Args:
-            threads: List of agent threads
-            result_queue: Queue where agents put results
-            subtasks: List of subtasks being executed
-            timeout_seconds: Max time to wait per agent
-
-        Returns:
-            List of results (successful + failed + timed out)
-
-        Behavior:
-        - Waits for all threads to complete or timeout
-        - Collects results from queue as agents finish
-        - Marks timed-out agents as failed
-        - Returns all results (including failures)
-        """
-        results = []
-        start_time = time.time()
-
-        # Calculate per-thread timeout (use global timeout for all threads)
-        deadline = start_time + timeout_seconds
-
-        logger.info(
-            f"Monitoring {len(threads)} agent threads "
-            f"(timeout={timeout_seconds}s, deadline={deadline - start_time:.1f}s)"
-        )
-
-        # Track which subtasks have returned results
-        completed_subtask_ids = set()
-
-        # Wait for all threads with timeout
-        for thread in threads:
-            remaining = deadline - time.time()
-
-            if remaining <= 0:
-                logger.warning(
-                    f"Global timeout reached, {len(threads) - len(completed_subtask_ids)} "
-                    "threads still running"
-                )
-                break
-
-            # Wait for thread with remaining time
-            thread.join(timeout=remaining)
-
-            # Collect results from queue (non-blocking)
-            while not result_queue.empty():
-                try:
-                    result = result_queue.get_nowait()
-                    results.append(result)
-                    completed_subtask_ids.add(result['subtask_id'])
-                except Empty:
-                    break
-
-        # Collect any remaining results
-        while not result_queue.empty():
-            try:
-                result = result_queue.get_nowait()
-                results.append(result)
-                completed_subtask_ids.add(result['subtask_id'])
-            except Empty:
-                break
-
-        # Handle timed-out threads
-        for subtask in subtasks:
-            if subtask.subtask_id not in completed_subtask_ids:
-                logger.error(f"Subtask {subtask.subtask_id} timed out")
-                results.append({
-                    'subtask_id': subtask.subtask_id,
-                    'status': 'timeout',
-                    'result': None,
-                    'error': f'Agent timed out after {timeout_seconds}s',
-                    'duration_seconds': timeout_seconds
-                })
-
-                # Mark subtask as failed
-                try:
-                    if subtask.status == 'in_progress':
-                        subtask.mark_failed()
-                except ValueError:
-                    pass
-
-        elapsed = time.time() - start_time
-        logger.info(
-            f"Agent monitoring complete: {len(results)} results in {elapsed:.2f}s, "
-            f"{sum(1 for r in results if r['status'] == 'completed')} successful, "
-            f"{sum(1 for r in results if r['status'] == 'failed')} failed, "
-            f"{sum(1 for r in results if r['status'] == 'timeout')} timed out"
-        )
-
-        return results
-
     def _handle_agent_failure(
         self,
         subtask: SubTask,
@@ -726,10 +1233,7 @@ class ParallelAgentCoordinator:
             OrchestratorException: If testing rule violated
         """
         # Check if any subtask is a testing task
-        testing_tasks = [
-            st for st in subtasks
-            if 'test' in st.title.lower() or 'test' in st.description.lower()
-        ]
+        testing_tasks = [st for st in subtasks if self._is_testing_subtask(st)]
 
         if len(testing_tasks) > 1:
             raise OrchestratorException(
@@ -762,13 +1266,28 @@ class ParallelAgentCoordinator:
                 )
             )
 
+    def _is_testing_subtask(self, subtask: SubTask) -> bool:
+        """
+        Check whether a subtask is a testing task (must run alone).
+
+        Args:
+            subtask: Subtask to check
+
+        Returns:
+            True if "test" appears in the title or description
+        """
+        return 'test' in subtask.title.lower() or 'test' in subtask.description.lower()
+
     def _log_parallel_attempt(
         self,
         parent_task_id: int,
         subtask_ids: List[int],
         results: List[Dict[str, Any]],
         started_at: datetime,
-        completed_at: datetime
+        completed_at: datetime,
+        agent_ids: Optional[List[str]] = None,
+        max_concurrent_agents: Optional[int] = None,
+        merge_report: Optional[Dict[str, Any]] = None
     ) -> None:
         """
         Log parallel execution attempt to StateManager.
@@ -779,6 +1298,10 @@ class ParallelAgentCoordinator:
             results: List of results from agents
             started_at: Start timestamp
             completed_at: Completion timestamp
+            agent_ids: Agents used (default: one per subtask)
+            max_concurrent_agents: Peak number of agents running at once
+                (default: number of agents)
+            merge_report: Worktree merge summary (worktree isolation only)
         """
         with self._lock:
             # Calculate metrics
@@ -802,25 +1325,35 @@ class ParallelAgentCoordinator:
                     for r in failed_results
                 )
 
+            if agent_ids is None:
+                agent_ids = [f"agent_{i}" for i in range(len(subtask_ids))]
+            if max_concurrent_agents is None:
+                max_concurrent_agents = len(agent_ids)
+
             # Create attempt data
             attempt_data = {
-                'num_agents': len(subtask_ids),
-                'agent_ids': [f"agent_{i}" for i in range(len(subtask_ids))],
+                'num_agents': len(agent_ids),
+                'agent_ids': agent_ids,
                 'subtask_ids': subtask_ids,
                 'success': success,
                 'failure_reason': failure_reason,
-                'conflict_detected': False,  # TODO: Implement conflict detection
+                'conflict_detected': bool(
+                    merge_report and (merge_report['conflicts'] or merge_report['apply_conflicts'])
+                ),
                 'total_duration_seconds': total_duration,
                 'sequential_estimate_seconds': sequential_estimate,
                 'speedup_factor': speedup_factor,
-                'max_concurrent_agents': len(subtask_ids),
+                'max_concurrent_agents': max_concurrent_agents,
                 'failed_agent_count': failed_count,
                 'parallelization_strategy': self._parallelization_strategy,
                 'fallback_to_sequential': False,
                 'execution_metadata': {
                     'timeout_seconds': self._agent_timeout_seconds,
                     'retry_enabled': self._retry_failed_agents,
-                    'max_retries': self._max_retries
+                    'max_retries': self._max_retries,
+                    'workspace_isolation': self._workspace_isolation,
+                    'process_isolation': self._process_isolation,
+                    'merge_report': merge_report
                 },
                 'started_at': started_at,
                 'completed_at': completed_at
@@ -833,7 +1366,7 @@ class ParallelAgentCoordinator:
                 )
                 logger.info(
                     f"Logged parallel attempt: task_id={parent_task_id}, "
-                    f"agents={len(subtask_ids)}, success={success}, "
+                    f"agents={len(agent_ids)}, success={success}, "
                     f"duration={total_duration:.2f}s, speedup={speedup_factor:.2f}x"
                 )
             except Exception as log_err:
@@ -10,6 +10,12 @@ Validation Stages:
     3. Code Quality - Error handling, documentation, conventions
     4. Testing - Tests exist and pass
 
+Stages run as a pipeline in a configurable order. After each stage the
+controller tracks lower/upper bounds on the overall score; with early exit
+enabled it stops as soon as the gate outcome can no longer change. M9 context
+(dependencies, git, retry) is only gathered when a step actually needs it,
+and per-stage timings are kept as histograms (see get_stage_timings()).
+
 Example:
     >>> controller = QualityController(state_manager, config)
     >>>
@@ -29,10 +35,14 @@ Example:
 import ast
 import logging
 import re
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, UTC, timedelta
-from threading import RLock
-from typing import Dict, List, Optional, Any, Callable
+from threading import Lock, RLock
+from typing import Dict, List, Optional, Any, Callable, Deque, Iterator, Tuple
 
 from src.core.exceptions import OrchestratorException
 from src.core.models import Task
@@ -43,6 +53,28 @@ from src.llm.prompt_rule_engine import PromptRuleEngine
 
 logger = logging.getLogger(__name__)
 
+# Persistence errors that won't go away by retrying (schema not migrated)
+_MISSING_TABLE = re.compile(
+    r"no such table|relation \S+ does not exist|table \S+ doesn't exist",
+    re.IGNORECASE
+)
+
+
+def _is_permanent_persistence_error(error: BaseException) -> bool:
+    """Tell whether a history persistence error will recur on every write.
+
+    Missing quality tables, or a state manager without quality persistence,
+    are permanent; anything else (a locked database, a dropped connection)
+    may succeed next time.
+    """
+    if isinstance(error, (AttributeError, NotImplementedError)):
+        return True
+    while error is not None:
+        if _MISSING_TABLE.search(str(error)):
+            return True
+        error = error.__cause__
+    return False
+
 
 @dataclass
 class QualityResult:
@@ -85,13 +117,81 @@ class QualityResult:
         }
 
 
+class StageTimingHistogram:
+    """Fixed-bucket latency histogram for one validation stage.
+
+    Buckets are cumulative-free counts per upper bound (milliseconds), so
+    recording is O(log buckets) and memory is constant.
+
+    Attributes:
+        count: Number of recorded samples
+        total_ms: Sum of recorded durations (ms)
+        max_ms: Largest recorded duration (ms)
+    """
+
+    # Bucket upper bounds in milliseconds (last bucket is +Inf)
+    BUCKET_BOUNDS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0)
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        self._buckets = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_s: float) -> None:
+        """Record a duration.
+
+        Args:
+            duration_s: Duration in seconds
+        """
+        duration_ms = duration_s * 1000.0
+        self._buckets[bisect_left(self.BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary.
+
+        Returns:
+            Dictionary with count, total_ms, mean_ms, max_ms and buckets
+            (upper bound label -> count)
+        """
+        labels = [f'{bound:g}' for bound in self.BUCKET_BOUNDS_MS] + ['+Inf']
+        return {
+            'count': self.count,
+            'total_ms': self.total_ms,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms,
+            'buckets': dict(zip(labels, self._buckets))
+        }
+
+
 class QualityController:
     """Multi-stage quality validation controller.
 
     Validates agent output through 4 stages with configurable weights and gates.
     Tracks quality trends and suggests improvements.
 
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access. Validation stages are pure functions
+    of their inputs; only shared state (history, timings) is locked.
+
+    Configuration keys (all optional):
+        minimum_score: Quality gate threshold (default: 0.70)
+        weight_<stage>: Stage weights
+        stage_order: Order in which unstructured stages run
+            (default: DEFAULT_STAGE_ORDER)
+        early_exit: Stop running stages once the gate outcome is decided
+            (default: False). Short-circuited results report the guaranteed
+            lower bound of the overall score and list skipped stages in
+            ``metadata['skipped_stages']``.
+        blocking_stage_minimum: If set, a BLOCKING_STAGES stage scoring below
+            this fails the gate regardless of the overall score
+        persist_history: Persist results through StateManager so trends and
+            reports survive restarts (default: True)
+        history_cache_size: Recent results kept in memory per project
+            (default: HISTORY_CACHE_SIZE)
 
     Example:
         >>> controller = QualityController(state_manager)
@@ -131,6 +231,18 @@ class QualityController:
     MINIMUM_SCORE = 0.70
     BLOCKING_STAGES = [STAGE_SYNTAX, STAGE_REQUIREMENTS]
 
+    # Default pipeline order: blocking stages first (they can decide the gate
+    # on their own), then the remaining stages
+    DEFAULT_STAGE_ORDER = [STAGE_SYNTAX, STAGE_REQUIREMENTS, STAGE_QUALITY, STAGE_TESTING]
+
+    # Recent results kept in memory per project (full history is persisted)
+    HISTORY_CACHE_SIZE = 100
+
+    # Timing keys for non-stage pipeline steps
+    TIMING_M9_CONTEXT = 'm9_context'
+    TIMING_STRUCTURED_PARSE = 'structured_parse'
+    TIMING_RULE_CHECK = 'rule_check'
+
     def __init__(
         self,
         state_manager: StateManager,
@@ -158,8 +270,30 @@ class QualityController:
             self.STAGE_TESTING: self.config.get('weight_testing', self.WEIGHT_TESTING)
         }
 
-        # Validation history (project_id -> List[QualityResult])
-        self._validation_history: Dict[int, List[QualityResult]] = {}
+        # Staged pipeline configuration (stage -> callable(output, task, context))
+        self._stage_validators: Dict[str, Callable[..., Tuple[float, Dict[str, Any]]]] = {
+            self.STAGE_SYNTAX: lambda out, tsk, ctx: self._validate_stage_1_syntax(out, ctx),
+            self.STAGE_REQUIREMENTS: lambda out, tsk, ctx: self._validate_stage_2_requirements(out, tsk, ctx),
+            self.STAGE_QUALITY: lambda out, tsk, ctx: self._validate_stage_3_quality(out, ctx),
+            self.STAGE_TESTING: lambda out, tsk, ctx: self._validate_stage_4_testing(out, ctx)
+        }
+        self._stage_order = [
+            stage for stage in self.config.get('stage_order', self.DEFAULT_STAGE_ORDER)
+            if stage in self._stage_validators
+        ]
+        self._early_exit = self.config.get('early_exit', False)
+        self._blocking_stage_minimum = self.config.get('blocking_stage_minimum')
+
+        # Per-stage timing histograms (stage/step name -> histogram)
+        self._stage_timings: Dict[str, StageTimingHistogram] = {}
+        self._timing_lock = Lock()
+
+        # Bounded cache of recent results (project_id -> deque of QualityResult).
+        # Full history is persisted via StateManager; the cache is only used
+        # for trends/reports if persistence is disabled or unavailable.
+        self._history_cache_size = self.config.get('history_cache_size', self.HISTORY_CACHE_SIZE)
+        self._persist_history = self.config.get('persist_history', True)
+        self._validation_history: Dict[int, Deque[QualityResult]] = {}
 
         # Custom validators
         self._custom_validators: Dict[str, List[Callable]] = {
@@ -346,30 +480,125 @@ class QualityController:
             ... )
             >>> print(f"Score: {result.overall_score:.2f}")
         """
-        with self._lock:
-            # Gather M9 context and merge with provided context (TASK_1.2.4)
+        # Determine response type from context
+        response_type = context.get('response_type', 'task_execution')
+
+        # M9 context is merged lazily by the steps that need it (TASK_1.2.4)
+        if self._response_parser:
+            logger.debug(f"Using structured validation for {response_type} response")
+            return self._validate_structured_response(
+                output=output,
+                task=task,
+                context=context,
+                response_type=response_type
+            )
+        else:
+            logger.debug("Using unstructured validation")
+            return self._validate_unstructured_response(
+                output=output,
+                task=task,
+                context=context
+            )
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        """Record the duration of a pipeline step in its timing histogram.
+
+        Args:
+            name: Stage or step name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._timing_lock:
+                histogram = self._stage_timings.get(name)
+                if histogram is None:
+                    histogram = self._stage_timings[name] = StageTimingHistogram()
+                histogram.record(elapsed)
+
+    def get_stage_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-stage timing histograms.
+
+        Returns:
+            Dictionary mapping stage/step name to histogram data
+            (see StageTimingHistogram.to_dict())
+
+        Example:
+            >>> timings = controller.get_stage_timings()
+            >>> print(f"Syntax mean: {timings['syntax']['mean_ms']:.2f}ms")
+        """
+        with self._timing_lock:
+            return {name: h.to_dict() for name, h in self._stage_timings.items()}
+
+    def _with_m9_context(self, task: Task, output: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Gather M9 context and merge it into a validation context.
+
+        Called only by steps that need dependency/git/retry information, so
+        the lookups are skipped entirely when no such step runs.
+
+        Args:
+            task: Task being validated
+            output: Agent output
+            context: Validation context
+
+        Returns:
+            New context dictionary including M9 context
+        """
+        with self._timed(self.TIMING_M9_CONTEXT):
             m9_context = self._gather_m9_context(task, output)
-            enhanced_context = {**context, **m9_context}
+        return {**context, **m9_context}
 
-            # Determine response type from context
-            response_type = enhanced_context.get('response_type', 'task_execution')
+    def _record_result(self, task: Optional[Task], result: QualityResult) -> None:
+        """Store a validation result in history.
 
-            # Use structured parsing if available
-            if self._response_parser:
-                logger.debug(f"Using structured validation for {response_type} response")
-                return self._validate_structured_response(
-                    output=output,
-                    task=task,
-                    context=enhanced_context,
-                    response_type=response_type
+        Appends to the bounded in-memory cache and persists a compact record
+        through StateManager. A result that fails to persist is kept in
+        memory only; persistence is disabled for this controller (and trends
+        fall back to the in-memory cache) only when the failure is permanent,
+        such as missing quality tables. The database write happens outside
+        the controller lock.
+
+        Args:
+            task: Task that was validated (None = project 0)
+            result: Validation result
+        """
+        project_id = task.project_id if task else 0
+        with self._lock:
+            history = self._validation_history.get(project_id)
+            if history is None:
+                history = self._validation_history[project_id] = deque(
+                    maxlen=self._history_cache_size
                 )
-            else:
-                logger.debug("Using unstructured validation")
-                return self._validate_unstructured_response(
-                    output=output,
-                    task=task,
-                    context=enhanced_context
+            history.append(result)
+
+        if not self._persist_history:
+            return
+
+        try:
+            self.state_manager.record_quality_result(
+                project_id,
+                {
+                    'task_id': task.id if task else None,
+                    'timestamp': result.timestamp,
+                    'overall_score': result.overall_score,
+                    'passes_gate': result.passes_gate,
+                    'stage_scores': result.stage_scores,
+                    'improvements': result.improvements,
+                    'structured_mode': result.metadata.get('structured_mode', False)
+                }
+            )
+        except Exception as e:
+            if not _is_permanent_persistence_error(e):
+                logger.warning(
+                    f"Failed to persist quality result, kept in memory only: {e}"
                 )
+                return
+            logger.error(
+                f"Quality history can't be persisted, using in-memory history only: {e}"
+            )
+            self._persist_history = False
 
     def _validate_structured_response(
         self,
@@ -397,11 +626,12 @@ class QualityController:
             QualityResult with structured validation results
         """
         # Parse structured response
-        parsed_response = self._parse_structured_response(
-            agent_response=output,
-            response_type=response_type,
-            context=context
-        )
+        with self._timed(self.TIMING_STRUCTURED_PARSE):
+            parsed_response = self._parse_structured_response(
+                agent_response=output,
+                response_type=response_type,
+                context=context
+            )
 
         # Extract metadata
         metadata = parsed_response.get('metadata', {})
@@ -413,12 +643,15 @@ class QualityController:
         # Check rule violations if rule engine available
         rule_violations = []
         if self._rule_engine and is_valid:
-            rule_violations = self._check_rule_violations(
-                task=task,
-                metadata=metadata,
-                content=content,
-                context=context
-            )
+            # Rules may inspect dependency/git/retry context
+            context = self._with_m9_context(task, output, context)
+            with self._timed(self.TIMING_RULE_CHECK):
+                rule_violations = self._check_rule_violations(
+                    task=task,
+                    metadata=metadata,
+                    content=content,
+                    context=context
+                )
 
             # Log violations to StateManager
             if rule_violations and task:
@@ -473,10 +706,7 @@ class QualityController:
         )
 
         # Store in history
-        project_id = task.project_id if task else 0
-        if project_id not in self._validation_history:
-            self._validation_history[project_id] = []
-        self._validation_history[project_id].append(result)
+        self._record_result(task, result)
 
         logger.info(
             f"Structured validation: score={quality_score:.2f}, "
@@ -504,37 +734,52 @@ class QualityController:
         Returns:
             QualityResult with traditional validation results
         """
-        # Run all validation stages
-        syntax_score, syntax_details = self._validate_stage_1_syntax(output, context)
-        requirements_score, requirements_details = self._validate_stage_2_requirements(
-            output, task, context
-        )
-        quality_score, quality_details = self._validate_stage_3_quality(output, context)
-        testing_score, testing_details = self._validate_stage_4_testing(output, context)
-
-        # Calculate weighted overall score
-        stage_scores = {
-            self.STAGE_SYNTAX: syntax_score,
-            self.STAGE_REQUIREMENTS: requirements_score,
-            self.STAGE_QUALITY: quality_score,
-            self.STAGE_TESTING: testing_score
-        }
+        stage_scores: Dict[str, float] = {}
+        stage_details: Dict[str, Dict[str, Any]] = {}
+        blocking_failed = False
+        lower, upper = 0.0, 1.0
+
+        # Run stages in pipeline order, tracking bounds on the overall score
+        for index, stage in enumerate(self._stage_order):
+            with self._timed(stage):
+                score, details = self._stage_validators[stage](output, task, context)
+            stage_scores[stage] = score
+            stage_details[stage] = details
+
+            if (self._blocking_stage_minimum is not None
+                    and stage in self.BLOCKING_STAGES
+                    and score < self._blocking_stage_minimum):
+                blocking_failed = True
+
+            lower, upper = self._score_bounds(stage_scores, self._stage_order[index + 1:])
+            gate_decided = blocking_failed or upper < self._minimum_score or lower >= self._minimum_score
+            if self._early_exit and gate_decided and index < len(self._stage_order) - 1:
+                logger.debug(
+                    f"Quality gate decided after '{stage}' "
+                    f"(bounds={lower:.2f}-{upper:.2f}), skipping remaining stages"
+                )
+                break
 
-        overall_score = self.calculate_quality_score(stage_scores)
+        skipped_stages = [stage for stage in self._stage_order if stage not in stage_scores]
+
+        # Calculate weighted overall score (guaranteed lower bound if short-circuited)
+        overall_score = lower if skipped_stages else self.calculate_quality_score(stage_scores)
 
         # Check quality gate
-        passes_gate = self.enforce_quality_gate(
+        passes_gate = not blocking_failed and self.enforce_quality_gate(
             overall_score,
             {'minimum_score': self._minimum_score, 'blocking_stages': self.BLOCKING_STAGES}
         )
 
-        # Generate improvement suggestions
-        improvements = self.suggest_improvements({
-            self.STAGE_SYNTAX: syntax_details,
-            self.STAGE_REQUIREMENTS: requirements_details,
-            self.STAGE_QUALITY: quality_details,
-            self.STAGE_TESTING: testing_details
-        })
+        # Generate improvement suggestions (only for stages that ran)
+        improvements = self.suggest_improvements(stage_details)
+
+        metadata: Dict[str, Any] = {'structured_mode': False}
+        if skipped_stages:
+            metadata['skipped_stages'] = skipped_stages
+            metadata['score_bounds'] = (lower, upper)
+        if blocking_failed:
+            metadata['blocking_failed'] = True
 
         # Create result
         result = QualityResult(
@@ -542,28 +787,41 @@ class QualityController:
             stage_scores=stage_scores,
             passes_gate=passes_gate,
             improvements=improvements,
-            details={
-                self.STAGE_SYNTAX: syntax_details,
-                self.STAGE_REQUIREMENTS: requirements_details,
-                self.STAGE_QUALITY: quality_details,
-                self.STAGE_TESTING: testing_details
-            },
-            metadata={'structured_mode': False}
+            details=stage_details,
+            metadata=metadata
         )
 
         # Store in history
-        project_id = task.project_id if task else 0
-        if project_id not in self._validation_history:
-            self._validation_history[project_id] = []
-        self._validation_history[project_id].append(result)
+        self._record_result(task, result)
 
         logger.info(
             f"Quality validation: score={overall_score:.2f}, "
             f"gate={'PASS' if passes_gate else 'FAIL'}"
+            + (f", skipped={skipped_stages}" if skipped_stages else "")
         )
 
         return result
 
+    def _score_bounds(
+        self,
+        stage_scores: Dict[str, float],
+        remaining_stages: List[str]
+    ) -> Tuple[float, float]:
+        """Bound the overall score given the stages run so far.
+
+        Remaining stages can contribute between 0.0 and their full weight.
+
+        Args:
+            stage_scores: Scores of stages already run
+            remaining_stages: Stages not yet run
+
+        Returns:
+            Tuple of (lower_bound, upper_bound), clamped to 0.0-1.0
+        """
+        lower = self.calculate_quality_score(stage_scores)
+        headroom = sum(self._weights.get(stage, 0.0) for stage in remaining_stages)
+        return lower, max(0.0, min(1.0, lower + headroom))
+
     def cross_validate(
         self,
         output: str,
@@ -664,6 +922,9 @@ class QualityController:
     ) -> List[str]:
         """Generate actionable improvement suggestions.
 
+        Only stages present in ``validation_results`` are considered, so
+        stages skipped by early exit produce no suggestions.
+
         Args:
             validation_results: Detailed validation results per stage
 
@@ -678,35 +939,39 @@ class QualityController:
         suggestions = []
 
         # Syntax issues
-        syntax_details = validation_results.get(self.STAGE_SYNTAX, {})
-        if not syntax_details.get('valid_syntax', True):
-            suggestions.append("Fix syntax errors before proceeding")
-        if syntax_details.get('has_markers', False):
-            suggestions.append("Remove TODO/FIXME markers")
+        if self.STAGE_SYNTAX in validation_results:
+            syntax_details = validation_results[self.STAGE_SYNTAX]
+            if not syntax_details.get('valid_syntax', True):
+                suggestions.append("Fix syntax errors before proceeding")
+            if syntax_details.get('has_markers', False):
+                suggestions.append("Remove TODO/FIXME markers")
 
         # Requirements issues
-        req_details = validation_results.get(self.STAGE_REQUIREMENTS, {})
-        if not req_details.get('complete_solution', True):
-            suggestions.append("Complete all required functionality (no partial implementations)")
-        missing_features = req_details.get('missing_features', [])
-        if missing_features:
-            suggestions.append(f"Implement missing features: {', '.join(missing_features)}")
+        if self.STAGE_REQUIREMENTS in validation_results:
+            req_details = validation_results[self.STAGE_REQUIREMENTS]
+            if not req_details.get('complete_solution', True):
+                suggestions.append("Complete all required functionality (no partial implementations)")
+            missing_features = req_details.get('missing_features', [])
+            if missing_features:
+                suggestions.append(f"Implement missing features: {', '.join(missing_features)}")
 
         # Quality issues
-        quality_details = validation_results.get(self.STAGE_QUALITY, {})
-        if not quality_details.get('has_error_handling', False):
-            suggestions.append("Add error handling (try/except blocks)")
-        if not quality_details.get('has_documentation', False):
-            suggestions.append("Add docstrings to functions and classes")
-        if quality_details.get('high_complexity', False):
-            suggestions.append("Reduce cyclomatic complexity (simplify logic)")
+        if self.STAGE_QUALITY in validation_results:
+            quality_details = validation_results[self.STAGE_QUALITY]
+            if not quality_details.get('has_error_handling', False):
+                suggestions.append("Add error handling (try/except blocks)")
+            if not quality_details.get('has_documentation', False):
+                suggestions.append("Add docstrings to functions and classes")
+            if quality_details.get('high_complexity', False):
+                suggestions.append("Reduce cyclomatic complexity (simplify logic)")
 
         # Testing issues
-        testing_details = validation_results.get(self.STAGE_TESTING, {})
-        if not testing_details.get('has_tests', False):
-            suggestions.append("Create test file with unit tests")
-        if not testing_details.get('tests_passing', True):
-            suggestions.append("Fix failing tests")
+        if self.STAGE_TESTING in validation_results:
+            testing_details = validation_results[self.STAGE_TESTING]
+            if not testing_details.get('has_tests', False):
+                suggestions.append("Create test file with unit tests")
+            if not testing_details.get('tests_passing', True):
+                suggestions.append("Fix failing tests")
 
         return suggestions if suggestions else ["No improvements needed"]
 
@@ -739,6 +1004,9 @@ class QualityController:
     ) -> Dict[str, Any]:
         """Get quality trends for a project.
 
+        Aggregates persisted results in the database; falls back to the
+        in-memory cache of recent results when persistence is unavailable.
+
         Args:
             project_id: Project ID
             days: Number of days to analyze
@@ -751,55 +1019,86 @@ class QualityController:
             >>> print(f"Average: {trends['average_score']:.2f}")
             >>> print(f"Trend: {trends['trend']}")
         """
-        with self._lock:
-            history = self._validation_history.get(project_id, [])
-
-            # Filter to recent results
-            cutoff = datetime.now(UTC) - timedelta(days=days)
-            recent_results = [
-                r for r in history
-                if r.timestamp >= cutoff
-            ]
-
-            if not recent_results:
-                return {
-                    'average_score': 0.0,
-                    'count': 0,
-                    'trend': 'no_data'
-                }
+        cutoff = datetime.now(UTC) - timedelta(days=days)
 
-            scores = [r.overall_score for r in recent_results]
-            average_score = sum(scores) / len(scores)
-
-            # Calculate trend (improving/declining/stable)
-            if len(scores) >= 5:
-                first_half = sum(scores[:len(scores)//2]) / (len(scores)//2)
-                second_half = sum(scores[len(scores)//2:]) / (len(scores) - len(scores)//2)
+        stats = None
+        if self._persist_history:
+            try:
+                stats = self.state_manager.get_quality_trend_stats(project_id, cutoff)
+            except Exception as e:
+                logger.warning(f"Failed to query quality trends, using in-memory history: {e}")
 
-                if second_half > first_half + 0.05:
-                    trend = 'improving'
-                elif second_half < first_half - 0.05:
-                    trend = 'declining'
-                else:
-                    trend = 'stable'
-            else:
-                trend = 'insufficient_data'
+        if stats is None:
+            with self._lock:
+                stats = self._trend_stats_from_cache(project_id, cutoff)
 
+        if not stats['count']:
             return {
-                'average_score': average_score,
-                'min_score': min(scores),
-                'max_score': max(scores),
-                'count': len(recent_results),
-                'trend': trend,
-                'recent_scores': scores[-10:]  # Last 10
+                'average_score': 0.0,
+                'count': 0,
+                'trend': 'no_data'
             }
 
+        # Calculate trend (improving/declining/stable)
+        if stats['count'] >= 5:
+            first_half = stats['first_half_average']
+            second_half = stats['second_half_average']
+
+            if second_half > first_half + 0.05:
+                trend = 'improving'
+            elif second_half < first_half - 0.05:
+                trend = 'declining'
+            else:
+                trend = 'stable'
+        else:
+            trend = 'insufficient_data'
+
+        return {
+            'average_score': stats['average_score'],
+            'min_score': stats['min_score'],
+            'max_score': stats['max_score'],
+            'count': stats['count'],
+            'trend': trend,
+            'recent_scores': stats['recent_scores']  # Last 10
+        }
+
+    def _trend_stats_from_cache(self, project_id: int, cutoff: datetime) -> Dict[str, Any]:
+        """Compute trend statistics from the in-memory cache.
+
+        Args:
+            project_id: Project ID
+            cutoff: Only include results at or after this time
+
+        Returns:
+            Dictionary in the format of StateManager.get_quality_trend_stats()
+        """
+        scores = [
+            r.overall_score for r in self._validation_history.get(project_id, ())
+            if r.timestamp >= cutoff
+        ]
+        if not scores:
+            return {'count': 0}
+
+        half = len(scores) // 2
+        return {
+            'count': len(scores),
+            'average_score': sum(scores) / len(scores),
+            'min_score': min(scores),
+            'max_score': max(scores),
+            'first_half_average': sum(scores[:half]) / half if half else None,
+            'second_half_average': sum(scores[half:]) / (len(scores) - half),
+            'recent_scores': scores[-10:]
+        }
+
     def generate_quality_report(
         self,
         project_id: int
     ) -> Dict[str, Any]:
         """Generate comprehensive quality report for project.
 
+        Aggregates persisted results in the database; falls back to the
+        in-memory cache of recent results when persistence is unavailable.
+
         Args:
             project_id: Project ID
 
@@ -811,52 +1110,75 @@ class QualityController:
             >>> print(f"Total validations: {report['total_validations']}")
             >>> print(f"Pass rate: {report['gate_pass_rate']:.2%}")
         """
-        with self._lock:
-            history = self._validation_history.get(project_id, [])
-
-            if not history:
-                return {
-                    'total_validations': 0,
-                    'gate_pass_rate': 0.0,
-                    'average_scores': {},
-                    'common_issues': []
-                }
-
-            # Calculate metrics
-            total = len(history)
-            passed_gate = sum(1 for r in history if r.passes_gate)
-            gate_pass_rate = passed_gate / total
-
-            # Average scores per stage
-            stage_averages = {}
-            for stage in [self.STAGE_SYNTAX, self.STAGE_REQUIREMENTS,
-                         self.STAGE_QUALITY, self.STAGE_TESTING]:
-                scores = [r.stage_scores.get(stage, 0.0) for r in history]
-                stage_averages[stage] = sum(scores) / len(scores) if scores else 0.0
-
-            # Most common issues
-            all_improvements = []
-            for result in history:
-                all_improvements.extend(result.improvements)
-
-            issue_counts = {}
-            for improvement in all_improvements:
-                issue_counts[improvement] = issue_counts.get(improvement, 0) + 1
+        stats = None
+        if self._persist_history:
+            try:
+                stats = self.state_manager.get_quality_report_stats(project_id)
+            except Exception as e:
+                logger.warning(f"Failed to query quality report, using in-memory history: {e}")
 
-            common_issues = sorted(
-                issue_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
+        if stats is None:
+            with self._lock:
+                stats = self._report_stats_from_cache(project_id)
 
+        total = stats['total']
+        if not total:
             return {
-                'total_validations': total,
-                'gate_pass_rate': gate_pass_rate,
-                'average_scores': stage_averages,
-                'overall_average': sum(r.overall_score for r in history) / total,
-                'common_issues': [issue for issue, _ in common_issues]
+                'total_validations': 0,
+                'gate_pass_rate': 0.0,
+                'average_scores': {},
+                'common_issues': []
             }
 
+        return {
+            'total_validations': total,
+            'gate_pass_rate': stats['passed'] / total,
+            'average_scores': stats['stage_averages'],
+            'overall_average': stats['overall_average'],
+            'common_issues': stats['common_issues']
+        }
+
+    def _report_stats_from_cache(self, project_id: int) -> Dict[str, Any]:
+        """Compute report statistics from the in-memory cache.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Dictionary in the format of StateManager.get_quality_report_stats()
+        """
+        history = list(self._validation_history.get(project_id, ()))
+        if not history:
+            return {'total': 0, 'passed': 0, 'common_issues': []}
+
+        total = len(history)
+
+        # Average scores per stage
+        stage_averages = {}
+        for stage in [self.STAGE_SYNTAX, self.STAGE_REQUIREMENTS,
+                      self.STAGE_QUALITY, self.STAGE_TESTING]:
+            stage_averages[stage] = sum(r.stage_scores.get(stage, 0.0) for r in history) / total
+
+        # Most common issues (counted once per result)
+        issue_counts: Dict[str, int] = {}
+        for result in history:
+            for improvement in dict.fromkeys(result.improvements):
+                issue_counts[improvement] = issue_counts.get(improvement, 0) + 1
+
+        common_issues = sorted(
+            issue_counts.items(),
+            key=lambda x: x[1],
+            reverse=True
+        )[:5]
+
+        return {
+            'total': total,
+            'passed': sum(1 for r in history if r.passes_gate),
+            'overall_average': sum(r.overall_score for r in history) / total,
+            'stage_averages': stage_averages,
+            'common_issues': [issue for issue, _ in common_issues]
+        }
+
     # Private helper methods for structured validation (TASK_5.1)
 
     def _parse_structured_response(
@@ -953,10 +1275,7 @@ class QualityController:
             # Get rules for relevant domains
             domains = self._get_domains_from_context(context)
 
-            applicable_rules = []
-            for domain in domains:
-                domain_rules = self._rule_engine.get_rules_for_domain(domain)
-                applicable_rules.extend(domain_rules)
+            applicable_rules = self._rule_engine.get_rule_payload(domains)
 
             # Validate response against rules
             if applicable_rules:
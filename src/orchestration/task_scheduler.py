@@ -7,6 +7,7 @@ This module implements the TaskScheduler, which manages task queue execution wit
 - Exponential backoff retry logic
 - Deadlock detection for circular dependencies
 - Deadline-based priority boosting
+- Pluggable ready-queue ordering (see scheduling_policy)
 
 The scheduler coordinates with StateManager for all state persistence.
 """
@@ -17,7 +18,7 @@ import time
 from collections import defaultdict, deque
 from datetime import datetime, UTC, timedelta
 from threading import RLock
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.core.exceptions import (
     OrchestratorException,
@@ -26,6 +27,11 @@ from src.core.exceptions import (
 )
 from src.core.models import Task, TaskStatus
 from src.core.state import StateManager
+from src.orchestration.scheduling_policy import (
+    PriorityPolicy,
+    SchedulingPolicy,
+    TaskGraph
+)
 
 
 logger = logging.getLogger(__name__)
@@ -67,6 +73,9 @@ class TaskScheduler:
         >>> task = scheduler.get_next_task(project_id)
         >>> # ... execute task ...
         >>> scheduler.mark_complete(task.id, result)
+        >>>
+        >>> # Start tasks on the longest dependency chain first
+        >>> scheduler = TaskScheduler(state_manager, policy=CriticalPathPolicy())
     """
 
     # Task state constants (use TaskStatus enum)
@@ -102,20 +111,30 @@ class TaskScheduler:
     BLOCKING_BOOST = 1
     RETRY_PENALTY = -1
 
-    def __init__(self, state_manager: StateManager):
+    def __init__(
+        self,
+        state_manager: StateManager,
+        policy: Optional[SchedulingPolicy] = None
+    ):
         """Initialize task scheduler.
 
         Args:
             state_manager: StateManager instance for state persistence
+            policy: Ready-queue ordering policy (default: PriorityPolicy)
         """
         self.state_manager = state_manager
+        self.policy = policy or PriorityPolicy()
         self._lock = RLock()
 
-        # Priority queue: (priority, task_id) tuples
-        # Note: heapq is min-heap, so we negate priority for max-heap behavior
-        self._ready_queues: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        # Priority queue: (policy key, task_id) tuples
+        # Note: heapq is min-heap, so policies negate "bigger runs first" values
+        self._ready_queues: Dict[int, List[Tuple[Any, int]]] = defaultdict(list)
+
+        # Graph snapshots for graph-based policies, rebuilt when tasks are added
+        self._graphs: Dict[int, TaskGraph] = {}
+        self._stale_queues: Set[int] = set()
 
-        logger.info("TaskScheduler initialized")
+        logger.info(f"TaskScheduler initialized (policy={self.policy.name})")
 
     def schedule_task(self, task: Task) -> None:
         """Schedule a task for execution.
@@ -132,6 +151,11 @@ class TaskScheduler:
         with self._lock:
             logger.debug(f"Scheduling task {task.id}: {task.title}")
 
+            # A new task can lengthen chains through already-queued tasks
+            if self.policy.requires_graph:
+                self._graphs.pop(task.project_id, None)
+                self._stale_queues.add(task.project_id)
+
             # Check if dependencies are satisfied
             dependencies = self._parse_dependencies(task)
             dependencies_satisfied = self._check_dependencies_satisfied(task.project_id, dependencies)
@@ -173,6 +197,8 @@ class TaskScheduler:
 
             # Apply priority boosting before selection
             self._apply_priority_boosts(project_id)
+            if project_id in self._stale_queues:
+                self._reprioritize(project_id)
 
             # Pop highest priority task
             _, task_id = heapq.heappop(ready_queue)
@@ -609,10 +635,51 @@ class TaskScheduler:
         Args:
             task: Task to add
         """
-        # Negative priority for max-heap behavior
-        priority_key = -task.priority
+        priority_key = self.policy.priority_key(
+            task.id, task.priority, self._policy_graph(task.project_id)
+        )
         heapq.heappush(self._ready_queues[task.project_id], (priority_key, task.id))
 
+    def _policy_graph(self, project_id: int) -> Optional[TaskGraph]:
+        """Get the project graph snapshot if the policy needs one.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            TaskGraph, or None for policies that only use task priority
+        """
+        if not self.policy.requires_graph:
+            return None
+
+        graph = self._graphs.get(project_id)
+        if graph is None:
+            graph = TaskGraph.from_project(self.state_manager, project_id)
+            self._graphs[project_id] = graph
+        return graph
+
+    def _reprioritize(self, project_id: int) -> None:
+        """Recompute policy keys for a project's ready queue.
+
+        Args:
+            project_id: Project ID
+        """
+        self._stale_queues.discard(project_id)
+        ready_queue = self._ready_queues.get(project_id)
+        if not ready_queue:
+            return
+
+        graph = self._policy_graph(project_id)
+        tasks = self.state_manager.get_tasks_by_ids([task_id for _, task_id in ready_queue])
+        rekeyed = []
+        for _, task_id in ready_queue:
+            task = tasks.get(task_id)
+            priority = task.priority if task else self.DEFAULT_PRIORITY
+            rekeyed.append((self.policy.priority_key(task_id, priority, graph), task_id))
+        heapq.heapify(rekeyed)
+        # In place: callers may hold a reference to the queue list
+        ready_queue[:] = rekeyed
+
     def _apply_priority_boosts(self, project_id: int) -> None:
         """Apply priority boosts based on deadlines and dependencies.
 
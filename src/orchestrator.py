@@ -35,8 +35,10 @@ import src.llm  # Import to register LLM plugins
 from src.llm.local_interface import LocalLLMInterface
 from src.llm.response_validator import ResponseValidator
 from src.llm.prompt_generator import PromptGenerator
+from src.llm.prompt_segments import SegmentedPrompt
 from src.monitoring.file_watcher import FileWatcher
 from src.orchestration.task_scheduler import TaskScheduler
+from src.orchestration.scheduling_policy import create_scheduling_policy
 from src.orchestration.breakpoint_manager import BreakpointManager
 from src.orchestration.decision_engine import DecisionEngine
 from src.orchestration.quality_controller import QualityController
@@ -48,6 +50,8 @@ from src.utils.token_counter import TokenCounter
 from src.utils.context_manager import ContextManager
 from src.utils.confidence_scorer import ConfidenceScorer
 from src.monitoring.production_logger import get_production_logger
+from src.monitoring.tracing import get_tracer, traced
+from src.monitoring.profiler import install_profile_signal
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +126,9 @@ class Orchestrator:
         self.complexity_estimator: Optional[TaskComplexityEstimator] = None
         self.max_turns_calculator = None  # Phase 4, Task 4.2: Adaptive max_turns
 
-        # ADR-017: Natural Language components (Story 5)
+        # ADR-017: Natural Language components (Story 5), built on first
+        # access (see the properties below)
+        self._nl_components_pending = False
         self.intent_to_task_converter = None  # Converts OperationContext → Task
         self.nl_query_helper = None  # Handles read-only query operations
 
@@ -1098,7 +1104,8 @@ class Orchestrator:
             self.prompt_generator = PromptGenerator(
                 template_dir=template_dir,
                 llm_interface=self.llm_interface,
-                state_manager=self.state_manager
+                state_manager=self.state_manager,
+                config={'bytecode_cache_dir': self.config.get('prompts.bytecode_cache_dir')}
             )
             self.response_validator = ResponseValidator()
 
@@ -1139,7 +1146,8 @@ class Orchestrator:
                     self.prompt_generator = PromptGenerator(
                         template_dir=template_dir,
                         llm_interface=None,  # Will be set when LLM reconnects
-                        state_manager=self.state_manager
+                        state_manager=self.state_manager,
+                        config={'bytecode_cache_dir': self.config.get('prompts.bytecode_cache_dir')}
                     )
                 except Exception as pg_error:
                     logger.warning(f"Could not initialize prompt generator: {pg_error}")
@@ -1190,7 +1198,10 @@ class Orchestrator:
             config=self.config.get('orchestration.quality', {})
         )
         self.task_scheduler = TaskScheduler(
-            self.state_manager
+            self.state_manager,
+            policy=create_scheduling_policy(
+                self.config.get('orchestration.scheduling.policy', 'priority')
+            )
         )
 
         # v1.8.1: Initialize DeliverableAssessor for partial success detection
@@ -1200,11 +1211,39 @@ class Orchestrator:
         )
         logger.info("DeliverableAssessor initialized")
 
-        # ADR-017: Initialize Natural Language components (Story 5)
-        self._initialize_nl_components()
+        # ADR-017: Natural Language components (Story 5) import the NL
+        # stack (~0.1s); defer them until an NL command needs them
+        self._nl_components_pending = True
 
         logger.info("Orchestration components initialized")
 
+    @property
+    def intent_to_task_converter(self):
+        """IntentToTaskConverter, built on first access after initialize()."""
+        self._ensure_nl_components()
+        return self._intent_to_task_converter
+
+    @intent_to_task_converter.setter
+    def intent_to_task_converter(self, value) -> None:
+        self._intent_to_task_converter = value
+
+    @property
+    def nl_query_helper(self):
+        """NLQueryHelper, built on first access after initialize()."""
+        self._ensure_nl_components()
+        return self._nl_query_helper
+
+    @nl_query_helper.setter
+    def nl_query_helper(self, value) -> None:
+        self._nl_query_helper = value
+
+    def _ensure_nl_components(self) -> None:
+        """Build the deferred NL components if initialize() scheduled them."""
+        if self._nl_components_pending:
+            with self._lock:
+                if self._nl_components_pending:
+                    self._initialize_nl_components()
+
     def _initialize_nl_components(self) -> None:
         """Initialize Natural Language components for ADR-017 unified execution.
 
@@ -1234,6 +1273,8 @@ class Orchestrator:
             self.intent_to_task_converter = None
             self.nl_query_helper = None
 
+        self._nl_components_pending = False
+
     def _initialize_complexity_estimator(self) -> None:
         """Initialize TaskComplexityEstimator if enabled."""
         # Phase 4, Task 4.2: Initialize MaxTurnsCalculator (independent of complexity estimation)
@@ -1414,7 +1455,8 @@ class Orchestrator:
                 self.prompt_generator = PromptGenerator(
                     template_dir=template_dir,
                     llm_interface=self.llm_interface,
-                    state_manager=self.state_manager
+                    state_manager=self.state_manager,
+                    config={'bytecode_cache_dir': self.config.get('prompts.bytecode_cache_dir')}
                 )
                 logger.debug("  ✓ Recreated PromptGenerator with new LLM")
             except Exception as e:
@@ -1981,6 +2023,12 @@ class Orchestrator:
             # BUG FIX: Initialize streaming_handler before try block to avoid UnboundLocalError
             streaming_handler = None
 
+            # Root span of this run's latency trace (see `obra trace show`)
+            tracer = get_tracer()
+            task_span = tracer.start_span(
+                'task', {'task_id': task_id, 'max_iterations': max_iterations}
+            )
+
             try:
                 # Get task first to get project_id for session creation
                 self.current_task = self.state_manager.get_task(task_id)
@@ -2054,7 +2102,8 @@ class Orchestrator:
                 # Estimate complexity if enabled (suggestions only, not commands)
                 complexity_estimate = None
                 if self.complexity_estimator:
-                    complexity_estimate = self._estimate_task_complexity(self.current_task, context)
+                    with tracer.span('complexity.estimate'):
+                        complexity_estimate = self._estimate_task_complexity(self.current_task, context)
                     logger.info(
                         f"COMPLEXITY: task_id={task_id}, score={complexity_estimate.complexity_score:.0f}/100, "
                         f"category={complexity_estimate.get_complexity_category()}, "
@@ -2210,11 +2259,14 @@ class Orchestrator:
                     f"TASK END: task_id={task_id}, status={result['status']}, "
                     f"iterations={result.get('iterations', 0)}, max_iterations={max_iterations}"
                 )
+                task_span.set_attribute('status', result['status'])
+                task_span.set_attribute('iterations', result.get('iterations', 0))
                 return result
 
             except TaskStoppedException as e:
                 # Phase 2: Handle user-requested stop gracefully
                 logger.info(f"Task stopped by user: {e}")
+                task_span.set_attribute('status', 'stopped')
                 self.state_manager.update_task_status(
                     task_id=task_id,
                     status=TaskStatus.PAUSED
@@ -2227,6 +2279,7 @@ class Orchestrator:
 
             except Exception as e:
                 logger.error(f"TASK ERROR: task_id={task_id}, error={e}", exc_info=True)
+                task_span.record_error(e)
                 raise
 
             finally:
@@ -2260,6 +2313,8 @@ class Orchestrator:
                     if hasattr(self, 'current_session_id') and self.current_session_id == temp_session_id:
                         self.current_session_id = None
 
+                tracer.end_span(task_span)
+
     def _execute_single_task(
         self,
         task: Task,
@@ -2269,6 +2324,9 @@ class Orchestrator:
     ) -> Dict[str, Any]:
         """Execute a single task (Claude handles parallelization if needed).
 
+        Each iteration is built from the step helpers below, which
+        AsyncOrchestrator shares for its asyncio loop.
+
         Args:
             task: Task to execute
             max_iterations: Maximum iterations
@@ -2280,6 +2338,7 @@ class Orchestrator:
         """
         iteration = 0
         accumulated_context = []
+        tracer = get_tracer()
 
         while iteration < max_iterations:
             iteration += 1
@@ -2293,371 +2352,687 @@ class Orchestrator:
             iteration_session_id = str(uuid.uuid4())
             old_agent_session_id = getattr(self.agent, 'session_id', None)
             session_created = False
+            iteration_span = tracer.start_span('iteration', {'iteration': iteration})
 
             try:
-                # Create session record for this iteration (linked to task for aggregation)
-                self.state_manager.create_session_record(
-                    session_id=iteration_session_id,
-                    project_id=task.project_id,
-                    task_id=task.id,  # Link to task for metrics aggregation
-                    milestone_id=None,
-                    metadata={'iteration': iteration}
-                )
+                self._start_iteration_session(task, iteration, max_iterations, iteration_session_id)
                 session_created = True
-                logger.debug(
-                    f"ITERATION_SESSION: session_id={iteration_session_id[:8]}..., "
-                    f"task_id={task.id}, iteration={iteration}/{max_iterations}"
-                )
 
-                # Assign session_id to agent for this iteration
-                if hasattr(self.agent, 'session_id'):
-                    self.agent.session_id = iteration_session_id
-                # 1. Build context (text from accumulated context)
-                context_text = self._build_context(accumulated_context)
-                logger.debug(f"CONTEXT BUILT: iteration={iteration}, context_chars={len(context_text):,}")
-                self._print_obra(f"Built context ({len(context_text)} chars)")
-
-                # 2. Generate prompt (include complexity estimate if available)
-                # BUG-TETRIS-001 FIX: Flatten task object into template variables
-                prompt_context = {
-                    # Task attributes (flattened from self.current_task)
-                    'task_id': self.current_task.id,
-                    'task_title': self.current_task.title,
-                    'task_description': self.current_task.description,
-                    'task_priority': self.current_task.priority,
-                    'task_status': self.current_task.status.value if hasattr(self.current_task.status, 'value') else str(self.current_task.status),
-                    'task_dependencies': self.current_task.dependencies if self.current_task.dependencies else [],
-
-                    # Project attributes (flattened from self.current_project)
-                    'project_name': self.current_project.project_name if self.current_project else 'Unknown',
-                    'project_id': self.current_project.id if self.current_project else None,
-                    'working_directory': self.current_project.working_directory if self.current_project else './workspace',
-                    'project_goals': self.current_project.description if self.current_project and self.current_project.description else None,
-
-                    # Context text
-                    'context': context_text,
-
-                    # Instructions (BUG-TETRIS-004 FIX: explicit working directory)
-                    'instructions': f"Work in the directory: {self.current_project.working_directory if self.current_project else './workspace'}. All project files should be created there."
-                }
-                if complexity_estimate:
-                    prompt_context['complexity_estimate'] = complexity_estimate
-
-                prompt = self.prompt_generator.generate_prompt(
-                    'task_execution',
-                    prompt_context
+                # 1-2. Build context and prompt
+                prompt = self._build_iteration_prompt(
+                    task, iteration, accumulated_context, complexity_estimate
                 )
 
-                # Phase 2, Task 2.4: Inject epic context on first task, first iteration
-                if (iteration == 1 and
-                    hasattr(self, '_current_epic_context') and
-                    hasattr(self, '_current_epic_first_task') and
-                    self._current_epic_first_task == task.id):
-
-                    prompt = f"""[EPIC CONTEXT]
-{self._current_epic_context}
-
-[CURRENT TASK]
-{prompt}
-"""
-                    logger.info("Injected epic context into first task")
-
-                # Phase 3, Task 3.2: Check context window before execution
-                if self.agent.use_session_persistence and hasattr(self.agent, 'session_id'):
-                    session_id = self.agent.session_id
-                    if session_id:
-                        context_summary = self._check_context_window_manual(session_id)
-                        if context_summary:
-                            # Session was refreshed, prepend summary to prompt
-                            prompt = f"""[CONTEXT FROM PREVIOUS SESSION]
-{context_summary}
-
-[CURRENT TASK]
-{prompt}
-"""
-                            logger.info(f"SESSION REFRESH: session_id={session_id[:8]}..., summary_chars={len(context_summary):,}")
-
                 # Phase 2: Interactive mode integration - Check for stop/pause/commands
                 if self.interactive_mode:
-                    # Update status tracking for /status command
-                    self.current_task_id = task.id
-                    self.current_iteration = iteration
-                    self.max_turns = max_turns
-
-                    # [1] START - Check for stop/pause/commands
-                    self._check_interactive_commands()
-
-                    if self.stop_requested:
-                        raise TaskStoppedException(
-                            "User requested stop",
-                            context={'task_id': task.id, 'iterations_completed': iteration - 1}
-                        )
-
-                    if self.paused:
-                        self._wait_for_resume()
-
-                    # [2] PRE-PROMPT - Apply injected context
-                    if self.injected_context.get('to_impl') or self.injected_context.get('to_claude'):
-                        prompt = self._apply_injected_context(prompt, self.injected_context)
+                    prompt = self._interactive_checkpoint(task, iteration, prompt, context)
 
                 # 3. Send to agent
-                logger.info(f"AGENT SEND: task_id={self.current_task.id}, iteration={iteration}, prompt_chars={len(prompt):,}")
-                # Phase 1: Streaming log for Obra→Claude
-                logger.info(f"[OBRA→CLAUDE] Iteration {iteration}/{max_iterations} | Prompt: {len(prompt):,} chars")
-                self._print_obra(f"Sending prompt to Claude Code...", "[OBRA→CLAUDE]")
-                # Phase 4, Task 4.2: Pass context with max_turns (if present) and task_id
-                agent_context = context.copy() if context else {}
-                agent_context['task_id'] = self.current_task.id
-                response = self.agent.send_prompt(prompt, context=agent_context)
+                agent_context = self._log_agent_send(prompt, iteration, max_iterations, context)
+                with tracer.span('agent.send_prompt', prompt_chars=len(prompt)) as agent_span:
+                    response = self.agent.send_prompt(prompt, context=agent_context)
+                    agent_span.set_attribute('response_chars', len(response))
                 # Phase 1: Streaming log for Claude→Obra
                 logger.info(f"[CLAUDE→OBRA] Response received | {len(response):,} chars")
                 self._print_obra(f"Response received ({len(response)} chars)")
 
                 # Phase 2, Task 2.4: Update session usage tracking
-                # Phase 3, Task 3.2: Add token tracking for context window management
-                if hasattr(self.agent, 'get_last_metadata'):
-                    metadata = self.agent.get_last_metadata()
-                    if metadata and metadata.get('session_id'):
-                        try:
-                            # Extract and log metadata
-                            total_tokens = metadata.get('total_tokens', 0)
-                            input_tokens = metadata.get('input_tokens', 0)
-                            cache_read_tokens = metadata.get('cache_read_tokens', 0)
-                            output_tokens = metadata.get('output_tokens', 0)
-                            num_turns = metadata.get('num_turns', 0)
-                            duration_ms = metadata.get('duration_ms', 0)
-                            cache_hit_rate = metadata.get('cache_hit_rate', 0.0)
-
-                            logger.info(
-                                f"RESPONSE METADATA: iteration={iteration}, "
-                                f"tokens={total_tokens:,} "
-                                f"(input={input_tokens:,}, cache_read={cache_read_tokens:,}, output={output_tokens:,}), "
-                                f"turns={num_turns}, duration={duration_ms}ms, "
-                                f"cache_efficiency={cache_hit_rate:.1%}"
-                            )
-
-                            # Update session-level metrics (total tokens, turns, cost)
-                            self.state_manager.update_session_usage(
-                                session_id=metadata['session_id'],
-                                tokens=metadata.get('total_tokens', 0),
-                                turns=metadata.get('num_turns', 0),
-                                cost=metadata.get('cost_usd', 0.0)
-                            )
-
-                            # Add tokens to cumulative tracking for context window management
-                            tokens_dict = {
-                                'input_tokens': metadata.get('input_tokens', 0),
-                                'cache_creation_tokens': metadata.get('cache_creation_tokens', 0),
-                                'cache_read_tokens': metadata.get('cache_read_tokens', 0),
-                                'output_tokens': metadata.get('output_tokens', 0)
-                            }
-                            # Calculate total from breakdown
-                            tokens_dict['total_tokens'] = sum(tokens_dict.values())
-
-                            self.state_manager.add_session_tokens(
-                                session_id=metadata['session_id'],
-                                task_id=task.id,
-                                tokens_dict=tokens_dict
-                            )
-                            logger.debug(f"CONTEXT_WINDOW: session_id={metadata['session_id'][:8]}..., tracked={tokens_dict['total_tokens']:,} tokens")
-                        except Exception as e:
-                            logger.debug(f"Failed to update session usage: {e}")
+                self._track_agent_usage(task, iteration)
 
                 # 4. Validate response
-                is_valid = self.response_validator.validate_format(
-                    response,
-                    expected_format='markdown'
-                )
+                with tracer.span('validation.format'):
+                    is_valid = self.response_validator.validate_format(
+                        response,
+                        expected_format='markdown'
+                    )
                 self._print_obra(f"Validation: {'✓' if is_valid else '✗'}")
 
                 if not is_valid:
-                    logger.warning(f"Invalid response format")
-                    accumulated_context.append({
-                        'type': 'error',
-                        'content': f"Previous response format was invalid (expected markdown)",
-                        'timestamp': datetime.now(UTC)
-                    })
+                    self._note_invalid_format(accumulated_context)
                     continue
 
                 # 5. Quality control
                 self._print_orch("Validating response...")
-                quality_result = self.quality_controller.validate_output(
-                    response,
-                    self.current_task,
-                    {'language': 'python'}
-                )
-                gate_status = "PASS" if quality_result.passes_gate else "FAIL"
-                # Phase 1: Streaming log for orchestrator validation
-                llm_name = self.llm_interface.get_name() if self.llm_interface else 'unknown'
-                logger.info(f"[ORCH:{llm_name}] Quality: {quality_result.overall_score:.2f} ({gate_status})")
-                self._print_orch(f"  Quality: {quality_result.overall_score:.2f} ({gate_status})")
-
-                # [PHASE 2.3] Log validation guidance if user provided it
-                if self.interactive_mode and self.injected_context.get('to_orch_intent') == 'validation_guidance':
-                    orch_message = self.injected_context.get('to_orch', '')
-                    logger.info(f"[ORCH_GUIDANCE] User validation guidance: \"{orch_message}\"")
-                    self._print_orch(f"  Note: User guidance active: {orch_message[:50]}...")
-                    # Note: This guidance is logged for human awareness but doesn't modify
-                    # quality scoring (which uses complex rule-based heuristics, not LLM prompts)
+                with tracer.span('validation.quality'):
+                    quality_result = self.quality_controller.validate_output(
+                        response,
+                        self.current_task,
+                        {'language': 'python'}
+                    )
+                self._report_quality(quality_result)
 
                 # 6. Confidence scoring
-                confidence = self.confidence_scorer.score_response(
-                    response,
-                    self.current_task,
-                    {'validation': is_valid, 'quality': quality_result}
+                with tracer.span('validation.confidence'):
+                    confidence = self.confidence_scorer.score_response(
+                        response,
+                        self.current_task,
+                        {'validation': is_valid, 'quality': quality_result}
+                    )
+                self._report_confidence(confidence, quality_result)
+
+                # BUG-TETRIS-002 FIX: Record interaction to database
+                self._record_iteration_interaction(
+                    prompt, response, iteration, is_valid, quality_result, confidence
                 )
 
-                # Phase 2: Update tracking variables for /status command
-                if self.interactive_mode:
-                    self.latest_quality_score = quality_result.overall_score
-                    self.latest_confidence = confidence
+                # BUG-TETRIS-003 FIX: Detect "no work done" scenarios before decision
+                if self._check_no_work(response, iteration, accumulated_context):
+                    continue  # Skip to next iteration
 
-                self._print_orch(f"  Confidence: {confidence:.2f}")
+                # 7. Decision making
+                action = self._decide_iteration_action(
+                    response, is_valid, quality_result, confidence
+                )
+                iteration_span.set_attribute('action', action.type)
 
-                # BUG-TETRIS-002 FIX: Record interaction to database
-                try:
-                    # Get metadata from agent if available
-                    interaction_metadata = {}
-                    if hasattr(self.agent, 'get_last_metadata'):
-                        agent_metadata = self.agent.get_last_metadata()
-                        if agent_metadata:
-                            interaction_metadata = {
-                                'input_tokens': agent_metadata.get('input_tokens', 0),
-                                'cache_creation_input_tokens': agent_metadata.get('cache_creation_tokens', 0),
-                                'cache_read_input_tokens': agent_metadata.get('cache_read_tokens', 0),
-                                'output_tokens': agent_metadata.get('output_tokens', 0),
-                                'total_tokens': agent_metadata.get('total_tokens', 0),
-                                'duration_ms': agent_metadata.get('duration_ms', 0),
-                                'num_turns': agent_metadata.get('num_turns', 0),
-                                'agent_session_id': agent_metadata.get('session_id')
-                            }
+                # [PHASE 2.3] Generate feedback if user requested analysis
+                feedback_prompt = self._feedback_request_prompt(response)
+                if feedback_prompt:
+                    try:
+                        # Generate feedback using orchestrator LLM
+                        with tracer.span('llm.feedback'):
+                            feedback = self.llm_interface.generate(
+                                feedback_prompt,
+                                max_tokens=500,
+                                temperature=0.3
+                            )
+                        self._inject_orch_feedback(feedback)
+                    except Exception as e:
+                        logger.error(f"[ORCH_FEEDBACK] Failed to generate feedback: {e}")
+                        self._print_orch(f"  Error generating feedback: {str(e)}")
 
-                    # Record interaction
-                    self.state_manager.record_interaction(
-                        project_id=self.current_project.id,
-                        task_id=self.current_task.id,
-                        interaction_data={
-                            'source': InteractionSource.CLAUDE_CODE,
-                            'prompt': prompt,
-                            'response': response,
-                            'confidence_score': confidence,
-                            'quality_score': quality_result.overall_score,
-                            'validation_passed': is_valid,
-                            'context': {'iteration': iteration},
-                            **interaction_metadata
-                        }
+                # 8. Handle decision
+                result = self._handle_iteration_action(
+                    action, response, iteration, quality_result, confidence,
+                    accumulated_context
+                )
+                if result is not None:
+                    return result
+
+            except AgentException as e:
+                # Phase 4, Task 4.2: Let error_max_turns propagate to retry loop
+                if e.context_data.get('subtype') == 'error_max_turns':
+                    logger.debug(f"Propagating error_max_turns exception to retry loop")
+                    raise
+                # Other agent errors - log and continue
+                self._note_iteration_error(iteration, e, accumulated_context)
+            except Exception as e:
+                self._note_iteration_error(iteration, e, accumulated_context)
+            finally:
+                # BUG-PHASE4-006 FIX: Always complete session and restore agent state
+                self._end_iteration_session(
+                    iteration_session_id, session_created, old_agent_session_id
+                )
+                tracer.end_span(iteration_span)
+
+        # Max iterations reached
+        logger.warning(f"Max iterations ({max_iterations}) reached")
+        return {
+            'status': 'max_iterations',
+            'iterations': iteration,
+            'message': 'Task did not complete within iteration limit'
+        }
+
+    # ========================================================================
+    # Iteration steps (shared by the sync and asyncio loops)
+    # ========================================================================
+
+    @traced('db.session_start')
+    def _start_iteration_session(
+        self,
+        task: Task,
+        iteration: int,
+        max_iterations: int,
+        iteration_session_id: str,
+        assign_agent: bool = True
+    ) -> None:
+        """Create the per-iteration session record and assign it to the agent.
+
+        Args:
+            task: Task being executed
+            iteration: Current iteration (1-based)
+            max_iterations: Iteration limit (for logging)
+            iteration_session_id: Fresh session UUID for this iteration
+            assign_agent: Set the agent's session_id (False when the session
+                is passed per call instead)
+        """
+        # Create session record for this iteration (linked to task for aggregation)
+        self.state_manager.create_session_record(
+            session_id=iteration_session_id,
+            project_id=task.project_id,
+            task_id=task.id,  # Link to task for metrics aggregation
+            milestone_id=None,
+            metadata={'iteration': iteration}
+        )
+        logger.debug(
+            f"ITERATION_SESSION: session_id={iteration_session_id[:8]}..., "
+            f"task_id={task.id}, iteration={iteration}/{max_iterations}"
+        )
+
+        # Assign session_id to agent for this iteration
+        if assign_agent and hasattr(self.agent, 'session_id'):
+            self.agent.session_id = iteration_session_id
+
+    @traced('db.session_end')
+    def _end_iteration_session(
+        self,
+        iteration_session_id: str,
+        session_created: bool,
+        old_agent_session_id: Optional[str]
+    ) -> None:
+        """Complete the iteration's session record and restore the agent session.
+
+        Args:
+            iteration_session_id: Session created for the iteration
+            session_created: Whether the record was actually created
+            old_agent_session_id: Agent session_id to restore
+        """
+        if session_created:
+            try:
+                # Complete session record for this iteration
+                self.state_manager.complete_session_record(
+                    session_id=iteration_session_id,
+                    ended_at=datetime.now(UTC)
+                )
+                logger.debug(f"ITERATION_SESSION_END: session_id={iteration_session_id[:8]}...")
+            except Exception as e:
+                logger.warning(f"Failed to complete iteration session {iteration_session_id[:8]}...: {e}")
+
+        # Restore agent's previous session_id
+        if hasattr(self.agent, 'session_id'):
+            self.agent.session_id = old_agent_session_id
+
+    @traced('prompt.generate')
+    def _build_iteration_prompt(
+        self,
+        task: Task,
+        iteration: int,
+        accumulated_context: List[Dict[str, Any]],
+        complexity_estimate: Optional[ComplexityEstimate] = None
+    ) -> str:
+        """Build the agent prompt for one iteration.
+
+        Renders the task_execution template from accumulated context and adds
+        epic context (first iteration of an epic's first task) and a session
+        summary when the agent's context window was refreshed.
+
+        Args:
+            task: Task being executed
+            iteration: Current iteration (1-based)
+            accumulated_context: Feedback and errors from earlier iterations
+            complexity_estimate: Optional complexity estimate to include
+
+        Returns:
+            Prompt text
+        """
+        # 1. Build context (text from accumulated context)
+        context_text = self._build_context(accumulated_context)
+        logger.debug(f"CONTEXT BUILT: iteration={iteration}, context_chars={len(context_text):,}")
+        self._print_obra(f"Built context ({len(context_text)} chars)")
+
+        # 2. Generate prompt (include complexity estimate if available)
+        # BUG-TETRIS-001 FIX: Flatten task object into template variables
+        prompt_context = {
+            # Task attributes (flattened from self.current_task)
+            'task_id': self.current_task.id,
+            'task_title': self.current_task.title,
+            'task_description': self.current_task.description,
+            'task_priority': self.current_task.priority,
+            'task_status': self.current_task.status.value if hasattr(self.current_task.status, 'value') else str(self.current_task.status),
+            'task_dependencies': self.current_task.dependencies if self.current_task.dependencies else [],
+
+            # Project attributes (flattened from self.current_project)
+            'project_name': self.current_project.project_name if self.current_project else 'Unknown',
+            'project_id': self.current_project.id if self.current_project else None,
+            'working_directory': self.current_project.working_directory if self.current_project else './workspace',
+            'project_goals': self.current_project.description if self.current_project and self.current_project.description else None,
+
+            # Context text
+            'context': context_text,
+
+            # Instructions (BUG-TETRIS-004 FIX: explicit working directory)
+            'instructions': f"Work in the directory: {self.current_project.working_directory if self.current_project else './workspace'}. All project files should be created there."
+        }
+        if complexity_estimate:
+            prompt_context['complexity_estimate'] = complexity_estimate
+
+        prompt = self.prompt_generator.generate_prompt(
+            'task_execution',
+            prompt_context
+        )
+
+        # Phase 2, Task 2.4: Inject epic context on first task, first iteration
+        if (iteration == 1 and
+            hasattr(self, '_current_epic_context') and
+            hasattr(self, '_current_epic_first_task') and
+            self._current_epic_first_task == task.id):
+
+            prompt = self._prepend_prompt_context(
+                prompt, 'EPIC CONTEXT', self._current_epic_context
+            )
+            logger.info("Injected epic context into first task")
+
+        # Phase 3, Task 3.2: Check context window before execution
+        if self.agent.use_session_persistence and hasattr(self.agent, 'session_id'):
+            session_id = self.agent.session_id
+            if session_id:
+                context_summary = self._check_context_window_manual(session_id)
+                if context_summary:
+                    # Session was refreshed, prepend summary to prompt
+                    prompt = self._prepend_prompt_context(
+                        prompt, 'CONTEXT FROM PREVIOUS SESSION', context_summary
                     )
-                    logger.debug(f"Recorded interaction for task {self.current_task.id}, iteration {iteration}")
-                except Exception as e:
-                    logger.warning(f"Failed to record interaction: {e}")
+                    logger.info(f"SESSION REFRESH: session_id={session_id[:8]}..., summary_chars={len(context_summary):,}")
 
-                # BUG-TETRIS-003 FIX: Detect "no work done" scenarios before decision
-                # These heuristics prevent false positives where agent just asks questions or expresses confusion
-                no_work_indicators = []
-                response_lower = response.lower()
-
-                # Heuristic 1: Response too short for real work (first iteration only)
-                if iteration == 1 and len(response) < 500:
-                    no_work_indicators.append("response_too_short")
-
-                # Heuristic 2: Contains confusion/question phrases
-                confusion_phrases = [
-                    ('empty', 'directory'),
-                    ('not sure', ''),
-                    ('confused', ''),
-                    ("don't know", ''),
-                    ('unclear', ''),
-                    ('what should', '')
-                ]
-                for phrase1, phrase2 in confusion_phrases:
-                    if phrase1 in response_lower and (not phrase2 or phrase2 in response_lower):
-                        no_work_indicators.append(f"confusion_phrase:{phrase1}")
-                        break
+        return prompt
 
-                # Heuristic 3: No files modified (if file watcher available and first iteration)
-                if iteration == 1 and hasattr(self, 'file_watcher') and self.file_watcher:
-                    try:
-                        file_changes = self.file_watcher.get_changes()
-                        if len(file_changes) == 0:
-                            no_work_indicators.append("no_files_modified")
-                    except Exception:
-                        pass  # Ignore file watcher errors
-
-                # Heuristic 4: Response is mostly questions (contains many ? without deliverables)
-                question_count = response.count('?')
-                if question_count > 3 and 'created' not in response_lower and 'implemented' not in response_lower:
-                    no_work_indicators.append("mostly_questions")
-
-                # If we detect "no work done" on first iteration, force CLARIFY
-                if no_work_indicators and iteration == 1:
-                    logger.warning(f"No work done detected: {', '.join(no_work_indicators)}")
-                    logger.info("Forcing CLARIFY decision to request actual work")
-                    accumulated_context.append({
-                        'type': 'feedback',
-                        'content': f"Previous response did not contain actionable work. Please actually perform the requested task instead of just describing or asking questions. Create files, write code, generate documentation as specified in the requirements.",
-                        'timestamp': datetime.now(UTC)
-                    })
-                    continue  # Skip to next iteration
+    @staticmethod
+    def _prepend_prompt_context(prompt: str, label: str, text: str) -> str:
+        """Add labelled context ahead of the task prompt.
 
-                # 7. Decision making
-                decision_context = {
-                    'task': self.current_task,
+        Segmented prompts get the text at the start of their volatile
+        context segment, so the cacheable prefix is unchanged.
+
+        Args:
+            prompt: Prompt from PromptGenerator
+            label: Section label (e.g. 'EPIC CONTEXT')
+            text: Context text
+
+        Returns:
+            Prompt including the context
+        """
+        if isinstance(prompt, SegmentedPrompt) and prompt.prefix_length:
+            return prompt.with_segment('context', f"[{label}]\n{text}", prepend=True)
+        return f"""[{label}]
+{text}
+
+[CURRENT TASK]
+{prompt}
+"""
+
+    @traced('interactive.checkpoint')
+    def _interactive_checkpoint(
+        self,
+        task: Task,
+        iteration: int,
+        prompt: str,
+        context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Process interactive commands before a prompt is sent.
+
+        Args:
+            task: Task being executed
+            iteration: Current iteration (1-based)
+            prompt: Prompt about to be sent
+            context: Execution context (reads 'max_turns')
+
+        Returns:
+            Prompt with any injected context applied
+
+        Raises:
+            TaskStoppedException: If the user requested stop
+        """
+        # Update status tracking for /status command
+        self.current_task_id = task.id
+        self.current_iteration = iteration
+        self.max_turns = (context or {}).get('max_turns', self.max_turns)
+
+        # [1] START - Check for stop/pause/commands
+        self._check_interactive_commands()
+
+        if self.stop_requested:
+            raise TaskStoppedException(
+                "User requested stop",
+                context={'task_id': task.id, 'iterations_completed': iteration - 1}
+            )
+
+        if self.paused:
+            self._wait_for_resume()
+
+        # [2] PRE-PROMPT - Apply injected context
+        if self.injected_context.get('to_impl') or self.injected_context.get('to_claude'):
+            prompt = self._apply_injected_context(prompt, self.injected_context)
+
+        return prompt
+
+    def _log_agent_send(
+        self,
+        prompt: str,
+        iteration: int,
+        max_iterations: int,
+        context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Log an outgoing agent prompt and build the agent context.
+
+        Returns:
+            Context dict for send_prompt (execution context plus task_id)
+        """
+        logger.info(f"AGENT SEND: task_id={self.current_task.id}, iteration={iteration}, prompt_chars={len(prompt):,}")
+        # Phase 1: Streaming log for Obra→Claude
+        logger.info(f"[OBRA→CLAUDE] Iteration {iteration}/{max_iterations} | Prompt: {len(prompt):,} chars")
+        self._print_obra(f"Sending prompt to Claude Code...", "[OBRA→CLAUDE]")
+        # Phase 4, Task 4.2: Pass context with max_turns (if present) and task_id
+        agent_context = context.copy() if context else {}
+        agent_context['task_id'] = self.current_task.id
+        return agent_context
+
+    def _last_agent_metadata(self) -> Optional[Dict[str, Any]]:
+        """Metadata of the agent's most recent response, if it reports any."""
+        if hasattr(self.agent, 'get_last_metadata'):
+            return self.agent.get_last_metadata()
+        return None
+
+    @traced('db.track_usage')
+    def _track_agent_usage(
+        self,
+        task: Task,
+        iteration: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record the agent's last-response token usage against its session.
+
+        Phase 3, Task 3.2: Feeds cumulative token tracking for context
+        window management. Failures are logged and ignored.
+
+        Args:
+            task: Task being executed
+            iteration: Current iteration (1-based)
+            metadata: Response metadata (default: the agent's last response)
+        """
+        if metadata is None:
+            metadata = self._last_agent_metadata()
+        if not metadata or not metadata.get('session_id'):
+            return
+
+        try:
+            # Extract and log metadata
+            total_tokens = metadata.get('total_tokens', 0)
+            input_tokens = metadata.get('input_tokens', 0)
+            cache_read_tokens = metadata.get('cache_read_tokens', 0)
+            output_tokens = metadata.get('output_tokens', 0)
+            num_turns = metadata.get('num_turns', 0)
+            duration_ms = metadata.get('duration_ms', 0)
+            cache_hit_rate = metadata.get('cache_hit_rate', 0.0)
+
+            logger.info(
+                f"RESPONSE METADATA: iteration={iteration}, "
+                f"tokens={total_tokens:,} "
+                f"(input={input_tokens:,}, cache_read={cache_read_tokens:,}, output={output_tokens:,}), "
+                f"turns={num_turns}, duration={duration_ms}ms, "
+                f"cache_efficiency={cache_hit_rate:.1%}"
+            )
+
+            # Update session-level metrics (total tokens, turns, cost)
+            self.state_manager.update_session_usage(
+                session_id=metadata['session_id'],
+                tokens=metadata.get('total_tokens', 0),
+                turns=metadata.get('num_turns', 0),
+                cost=metadata.get('cost_usd', 0.0)
+            )
+
+            # Add tokens to cumulative tracking for context window management
+            tokens_dict = {
+                'input_tokens': metadata.get('input_tokens', 0),
+                'cache_creation_tokens': metadata.get('cache_creation_tokens', 0),
+                'cache_read_tokens': metadata.get('cache_read_tokens', 0),
+                'output_tokens': metadata.get('output_tokens', 0)
+            }
+            # Calculate total from breakdown
+            tokens_dict['total_tokens'] = sum(tokens_dict.values())
+
+            self.state_manager.add_session_tokens(
+                session_id=metadata['session_id'],
+                task_id=task.id,
+                tokens_dict=tokens_dict
+            )
+            logger.debug(f"CONTEXT_WINDOW: session_id={metadata['session_id'][:8]}..., tracked={tokens_dict['total_tokens']:,} tokens")
+        except Exception as e:
+            logger.debug(f"Failed to update session usage: {e}")
+
+    def _note_invalid_format(self, accumulated_context: List[Dict[str, Any]]) -> None:
+        """Queue feedback for a response that failed format validation."""
+        logger.warning(f"Invalid response format")
+        accumulated_context.append({
+            'type': 'error',
+            'content': f"Previous response format was invalid (expected markdown)",
+            'timestamp': datetime.now(UTC)
+        })
+
+    def _note_iteration_error(
+        self,
+        iteration: int,
+        error: Exception,
+        accumulated_context: List[Dict[str, Any]]
+    ) -> None:
+        """Log a failed iteration and queue the error for the next prompt."""
+        logger.error(f"Iteration {iteration} failed: {error}", exc_info=True)
+        current_span = get_tracer().current_span()
+        if current_span is not None:
+            current_span.record_error(error)
+        accumulated_context.append({
+            'type': 'error',
+            'content': f"Error: {str(error)}",
+            'timestamp': datetime.now(UTC)
+        })
+
+    def _report_quality(self, quality_result: Any) -> None:
+        """Log the quality gate result and any active validation guidance."""
+        gate_status = "PASS" if quality_result.passes_gate else "FAIL"
+        # Phase 1: Streaming log for orchestrator validation
+        llm_name = self.llm_interface.get_name() if self.llm_interface else 'unknown'
+        logger.info(f"[ORCH:{llm_name}] Quality: {quality_result.overall_score:.2f} ({gate_status})")
+        self._print_orch(f"  Quality: {quality_result.overall_score:.2f} ({gate_status})")
+
+        # [PHASE 2.3] Log validation guidance if user provided it
+        if self.interactive_mode and self.injected_context.get('to_orch_intent') == 'validation_guidance':
+            orch_message = self.injected_context.get('to_orch', '')
+            logger.info(f"[ORCH_GUIDANCE] User validation guidance: \"{orch_message}\"")
+            self._print_orch(f"  Note: User guidance active: {orch_message[:50]}...")
+            # Note: This guidance is logged for human awareness but doesn't modify
+            # quality scoring (which uses complex rule-based heuristics, not LLM prompts)
+
+    def _report_confidence(self, confidence: float, quality_result: Any) -> None:
+        """Publish the confidence score (and quality) for /status."""
+        # Phase 2: Update tracking variables for /status command
+        if self.interactive_mode:
+            self.latest_quality_score = quality_result.overall_score
+            self.latest_confidence = confidence
+
+        self._print_orch(f"  Confidence: {confidence:.2f}")
+
+    @traced('db.record_interaction')
+    def _record_iteration_interaction(
+        self,
+        prompt: str,
+        response: str,
+        iteration: int,
+        is_valid: bool,
+        quality_result: Any,
+        confidence: float,
+        agent_metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record the iteration's prompt/response exchange in the database.
+
+        Failures are logged and ignored.
+
+        Args:
+            agent_metadata: Response metadata (default: the agent's last response)
+        """
+        try:
+            # Get metadata from agent if available
+            interaction_metadata = {}
+            if agent_metadata is None:
+                agent_metadata = self._last_agent_metadata()
+            if agent_metadata:
+                interaction_metadata = {
+                    'input_tokens': agent_metadata.get('input_tokens', 0),
+                    'cache_creation_input_tokens': agent_metadata.get('cache_creation_tokens', 0),
+                    'cache_read_input_tokens': agent_metadata.get('cache_read_tokens', 0),
+                    'output_tokens': agent_metadata.get('output_tokens', 0),
+                    'total_tokens': agent_metadata.get('total_tokens', 0),
+                    'duration_ms': agent_metadata.get('duration_ms', 0),
+                    'num_turns': agent_metadata.get('num_turns', 0),
+                    'agent_session_id': agent_metadata.get('session_id')
+                }
+
+            # Record interaction
+            self.state_manager.record_interaction(
+                project_id=self.current_project.id,
+                task_id=self.current_task.id,
+                interaction_data={
+                    'source': InteractionSource.CLAUDE_CODE,
+                    'prompt': prompt,
                     'response': response,
-                    'validation_result': {'valid': is_valid, 'complete': True},
+                    'confidence_score': confidence,
                     'quality_score': quality_result.overall_score,
-                    'confidence_score': confidence
+                    'validation_passed': is_valid,
+                    'context': {'iteration': iteration},
+                    **interaction_metadata
                 }
+            )
+            logger.debug(f"Recorded interaction for task {self.current_task.id}, iteration {iteration}")
+        except Exception as e:
+            logger.warning(f"Failed to record interaction: {e}")
 
-                # [PHASE 2.3] Apply decision hint if user provided guidance
-                threshold_adjustment = 0.0
-                if self.interactive_mode and self.injected_context.get('to_orch_intent') == 'decision_hint':
-                    # User wants to override decision - lower threshold temporarily
-                    threshold_adjustment = 0.15  # Make decision more lenient
-                    orch_message = self.injected_context.get('to_orch', '')
-                    logger.info(f"[ORCH_HINT] User decision hint active: \"{orch_message}\" "
-                               f"(adjusting thresholds by +{threshold_adjustment})")
-                    self._print_orch(f"  Applying decision hint: {orch_message[:50]}...")
-
-                action = self.decision_engine.decide_next_action(decision_context, threshold_adjustment)
-
-                # Phase 2: Allow user to override decision
-                if self.interactive_mode and self.injected_context.get('override_decision'):
-                    override_str = self.injected_context.pop('override_decision')
-                    # Map command strings to DecisionEngine action types
-                    decision_map = {
-                        'proceed': DecisionEngine.ACTION_PROCEED,
-                        'retry': DecisionEngine.ACTION_RETRY,
-                        'clarify': DecisionEngine.ACTION_CLARIFY,
-                        'escalate': DecisionEngine.ACTION_ESCALATE,
-                        'checkpoint': DecisionEngine.ACTION_CHECKPOINT,
-                    }
+    def _check_no_work(
+        self,
+        response: str,
+        iteration: int,
+        accumulated_context: List[Dict[str, Any]]
+    ) -> bool:
+        """Detect a first-iteration response that did no actual work.
 
-                    if override_str in decision_map:
-                        # Create new action with overridden type
-                        from src.orchestration.decision_engine import Action
-                        action = Action(
-                            type=decision_map[override_str],
-                            confidence=1.0,  # User override has full confidence
-                            explanation=f"User override: {override_str}",
-                            metadata={'user_override': True},
-                            timestamp=datetime.now(UTC)
-                        )
-                        logger.info(f"[USER OVERRIDE] Decision changed to: {action.type}")
+        These heuristics prevent false positives where the agent just asks
+        questions or expresses confusion. When triggered, feedback asking for
+        real work is queued and the caller should skip to the next iteration.
+
+        Returns:
+            True if the iteration should be treated as CLARIFY
+        """
+        no_work_indicators = []
+        response_lower = response.lower()
+
+        # Heuristic 1: Response too short for real work (first iteration only)
+        if iteration == 1 and len(response) < 500:
+            no_work_indicators.append("response_too_short")
+
+        # Heuristic 2: Contains confusion/question phrases
+        confusion_phrases = [
+            ('empty', 'directory'),
+            ('not sure', ''),
+            ('confused', ''),
+            ("don't know", ''),
+            ('unclear', ''),
+            ('what should', '')
+        ]
+        for phrase1, phrase2 in confusion_phrases:
+            if phrase1 in response_lower and (not phrase2 or phrase2 in response_lower):
+                no_work_indicators.append(f"confusion_phrase:{phrase1}")
+                break
+
+        # Heuristic 3: No files modified (if file watcher available and first iteration)
+        if iteration == 1 and hasattr(self, 'file_watcher') and self.file_watcher:
+            try:
+                file_changes = self.file_watcher.get_changes()
+                if len(file_changes) == 0:
+                    no_work_indicators.append("no_files_modified")
+            except Exception:
+                pass  # Ignore file watcher errors
+
+        # Heuristic 4: Response is mostly questions (contains many ? without deliverables)
+        question_count = response.count('?')
+        if question_count > 3 and 'created' not in response_lower and 'implemented' not in response_lower:
+            no_work_indicators.append("mostly_questions")
+
+        # If we detect "no work done" on first iteration, force CLARIFY
+        if no_work_indicators and iteration == 1:
+            logger.warning(f"No work done detected: {', '.join(no_work_indicators)}")
+            logger.info("Forcing CLARIFY decision to request actual work")
+            accumulated_context.append({
+                'type': 'feedback',
+                'content': f"Previous response did not contain actionable work. Please actually perform the requested task instead of just describing or asking questions. Create files, write code, generate documentation as specified in the requirements.",
+                'timestamp': datetime.now(UTC)
+            })
+            return True
+        return False
 
-                # Phase 1: Streaming log for decision
-                logger.info(f"[OBRA] Decision: {action.type} | Confidence: {action.confidence:.2f}")
-                logger.info(f"Decision: {action.type} (confidence: {action.confidence:.2f})")
-                self._print_obra(f"Decision: {action.type}")
+    @traced('decision')
+    def _decide_iteration_action(
+        self,
+        response: str,
+        is_valid: bool,
+        quality_result: Any,
+        confidence: float
+    ) -> Any:
+        """Ask the decision engine for the next action, applying user hints.
 
-                # [PHASE 2.3] Generate feedback if user requested analysis
-                if self.interactive_mode and self.injected_context.get('to_orch_intent') == 'feedback_request':
-                    orch_message = self.injected_context.get('to_orch', '')
-                    logger.info(f"[ORCH_FEEDBACK] Generating feedback based on user request: \"{orch_message}\"")
-                    self._print_orch(f"  Generating feedback: {orch_message[:50]}...")
+        Returns:
+            DecisionEngine Action (possibly a user override)
+        """
+        decision_context = {
+            'task': self.current_task,
+            'response': response,
+            'validation_result': {'valid': is_valid, 'complete': True},
+            'quality_score': quality_result.overall_score,
+            'confidence_score': confidence
+        }
 
-                    try:
-                        # Build feedback prompt for orchestrator LLM
-                        feedback_prompt = f"""Analyze the following code implementation and provide feedback.
+        # [PHASE 2.3] Apply decision hint if user provided guidance
+        threshold_adjustment = 0.0
+        if self.interactive_mode and self.injected_context.get('to_orch_intent') == 'decision_hint':
+            # User wants to override decision - lower threshold temporarily
+            threshold_adjustment = 0.15  # Make decision more lenient
+            orch_message = self.injected_context.get('to_orch', '')
+            logger.info(f"[ORCH_HINT] User decision hint active: \"{orch_message}\" "
+                       f"(adjusting thresholds by +{threshold_adjustment})")
+            self._print_orch(f"  Applying decision hint: {orch_message[:50]}...")
+
+        action = self.decision_engine.decide_next_action(decision_context, threshold_adjustment)
+
+        # Phase 2: Allow user to override decision
+        if self.interactive_mode and self.injected_context.get('override_decision'):
+            override_str = self.injected_context.pop('override_decision')
+            # Map command strings to DecisionEngine action types
+            decision_map = {
+                'proceed': DecisionEngine.ACTION_PROCEED,
+                'retry': DecisionEngine.ACTION_RETRY,
+                'clarify': DecisionEngine.ACTION_CLARIFY,
+                'escalate': DecisionEngine.ACTION_ESCALATE,
+                'checkpoint': DecisionEngine.ACTION_CHECKPOINT,
+            }
+
+            if override_str in decision_map:
+                # Create new action with overridden type
+                from src.orchestration.decision_engine import Action
+                action = Action(
+                    type=decision_map[override_str],
+                    confidence=1.0,  # User override has full confidence
+                    explanation=f"User override: {override_str}",
+                    metadata={'user_override': True},
+                    timestamp=datetime.now(UTC)
+                )
+                logger.info(f"[USER OVERRIDE] Decision changed to: {action.type}")
+
+        # Phase 1: Streaming log for decision
+        logger.info(f"[OBRA] Decision: {action.type} | Confidence: {action.confidence:.2f}")
+        logger.info(f"Decision: {action.type} (confidence: {action.confidence:.2f})")
+        self._print_obra(f"Decision: {action.type}")
+        return action
+
+    def _feedback_request_prompt(self, response: str) -> Optional[str]:
+        """Build the orchestrator-LLM feedback prompt if the user asked for one.
+
+        Returns:
+            Feedback prompt, or None when no feedback was requested
+        """
+        if not (self.interactive_mode and self.injected_context.get('to_orch_intent') == 'feedback_request'):
+            return None
+
+        orch_message = self.injected_context.get('to_orch', '')
+        logger.info(f"[ORCH_FEEDBACK] Generating feedback based on user request: \"{orch_message}\"")
+        self._print_orch(f"  Generating feedback: {orch_message[:50]}...")
+
+        return f"""Analyze the following code implementation and provide feedback.
 
 User Request: {orch_message}
 
@@ -2669,132 +3044,94 @@ Implementation (Response):
 
 Provide concise, actionable feedback focusing on what the user requested. Be specific."""
 
-                        # Generate feedback using orchestrator LLM
-                        feedback = self.llm_interface.generate(
-                            feedback_prompt,
-                            max_tokens=500,
-                            temperature=0.3
-                        )
-
-                        # Inject feedback into next implementer prompt
-                        feedback_message = f"ORCHESTRATOR FEEDBACK:\n{feedback}\n\nPlease address this feedback in your next iteration."
-                        self.injected_context['to_impl'] = feedback_message
-                        self.injected_context['to_claude'] = feedback_message  # Legacy key
-
-                        logger.info(f"[ORCH_FEEDBACK] Generated {len(feedback)} chars of feedback, injected for next iteration")
-                        self._print_orch(f"  Feedback generated ({len(feedback)} chars) → will be sent to implementer")
-
-                    except Exception as e:
-                        logger.error(f"[ORCH_FEEDBACK] Failed to generate feedback: {e}")
-                        self._print_orch(f"  Error generating feedback: {str(e)}")
-
-                # Phase 2: Clear injected context based on decision (persist through RETRY)
-                if self.interactive_mode:
-                    if action.type == DecisionEngine.ACTION_PROCEED:
-                        # Clear context on success
-                        # Clear both new and legacy keys
-                        self.injected_context.pop('to_impl', None)
-                        self.injected_context.pop('to_orch', None)
-                        self.injected_context.pop('to_orch_intent', None)
-                        # Keep legacy keys for backward compat
-                        self.injected_context.pop('to_claude', None)
-                        self.injected_context.pop('to_obra', None)
-                    elif action.type == DecisionEngine.ACTION_ESCALATE:
-                        # Clear context on escalation (user will re-inject if needed)
-                        self.injected_context.clear()
-                    # For RETRY and CLARIFY, preserve context for next attempt
+    def _inject_orch_feedback(self, feedback: str) -> None:
+        """Queue generated orchestrator feedback for the next implementer prompt."""
+        feedback_message = f"ORCHESTRATOR FEEDBACK:\n{feedback}\n\nPlease address this feedback in your next iteration."
+        self.injected_context['to_impl'] = feedback_message
+        self.injected_context['to_claude'] = feedback_message  # Legacy key
 
-                # 8. Handle decision
-                if action.type == DecisionEngine.ACTION_PROCEED:
-                    # Task completed successfully
-                    self.state_manager.update_task_status(
-                        self.current_task.id,
-                        TaskStatus.COMPLETED
-                    )
+        logger.info(f"[ORCH_FEEDBACK] Generated {len(feedback)} chars of feedback, injected for next iteration")
+        self._print_orch(f"  Feedback generated ({len(feedback)} chars) → will be sent to implementer")
 
-                    # Parse parallel metadata from Claude's response
-                    parallel_metadata = self._parse_parallel_metadata(response)
+    @traced('decision.apply')
+    def _handle_iteration_action(
+        self,
+        action: Any,
+        response: str,
+        iteration: int,
+        quality_result: Any,
+        confidence: float,
+        accumulated_context: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply a decision to the task and the iteration context.
 
-                    return {
-                        'status': 'completed',
-                        'response': response,
-                        'iterations': iteration,
-                        'quality_score': quality_result.overall_score,
-                        'confidence': confidence,
-                        'parallel_metadata': parallel_metadata
-                    }
+        Returns:
+            Final task result for PROCEED/ESCALATE, or None to keep iterating
+        """
+        # Phase 2: Clear injected context based on decision (persist through RETRY)
+        if self.interactive_mode:
+            if action.type == DecisionEngine.ACTION_PROCEED:
+                # Clear context on success
+                # Clear both new and legacy keys
+                self.injected_context.pop('to_impl', None)
+                self.injected_context.pop('to_orch', None)
+                self.injected_context.pop('to_orch_intent', None)
+                # Keep legacy keys for backward compat
+                self.injected_context.pop('to_claude', None)
+                self.injected_context.pop('to_obra', None)
+            elif action.type == DecisionEngine.ACTION_ESCALATE:
+                # Clear context on escalation (user will re-inject if needed)
+                self.injected_context.clear()
+            # For RETRY and CLARIFY, preserve context for next attempt
+
+        if action.type == DecisionEngine.ACTION_PROCEED:
+            # Task completed successfully
+            self.state_manager.update_task_status(
+                self.current_task.id,
+                TaskStatus.COMPLETED
+            )
 
-                elif action.type == DecisionEngine.ACTION_ESCALATE:
-                    # Need human intervention
-                    logger.warning("Escalating to human")
-                    return {
-                        'status': 'escalated',
-                        'reason': action.explanation,
-                        'response': response,
-                        'iterations': iteration
-                    }
+            # Parse parallel metadata from Claude's response
+            parallel_metadata = self._parse_parallel_metadata(response)
 
-                elif action.type == DecisionEngine.ACTION_CLARIFY:
-                    # Need more information
-                    logger.info("Requesting clarification")
-                    accumulated_context.append({
-                        'type': 'feedback',
-                        'content': f"Issues to address: {action.metadata.get('issues', [])}",
-                        'timestamp': datetime.now(UTC)
-                    })
+            return {
+                'status': 'completed',
+                'response': response,
+                'iterations': iteration,
+                'quality_score': quality_result.overall_score,
+                'confidence': confidence,
+                'parallel_metadata': parallel_metadata
+            }
 
-                elif action.type == DecisionEngine.ACTION_RETRY:
-                    # Try again with updated context
-                    logger.info("Retrying with updated context")
-                    accumulated_context.append({
-                        'type': 'previous_attempt',
-                        'content': response,
-                        'timestamp': datetime.now(UTC)
-                    })
+        elif action.type == DecisionEngine.ACTION_ESCALATE:
+            # Need human intervention
+            logger.warning("Escalating to human")
+            return {
+                'status': 'escalated',
+                'reason': action.explanation,
+                'response': response,
+                'iterations': iteration
+            }
 
-            except AgentException as e:
-                # Phase 4, Task 4.2: Let error_max_turns propagate to retry loop
-                if e.context_data.get('subtype') == 'error_max_turns':
-                    logger.debug(f"Propagating error_max_turns exception to retry loop")
-                    raise
-                # Other agent errors - log and continue
-                logger.error(f"Iteration {iteration} failed: {e}", exc_info=True)
-                accumulated_context.append({
-                    'type': 'error',
-                    'content': f"Error: {str(e)}",
-                    'timestamp': datetime.now(UTC)
-                })
-            except Exception as e:
-                logger.error(f"Iteration {iteration} failed: {e}", exc_info=True)
-                accumulated_context.append({
-                    'type': 'error',
-                    'content': f"Error: {str(e)}",
-                    'timestamp': datetime.now(UTC)
-                })
-            finally:
-                # BUG-PHASE4-006 FIX: Always complete session and restore agent state
-                if session_created:
-                    try:
-                        # Complete session record for this iteration
-                        self.state_manager.complete_session_record(
-                            session_id=iteration_session_id,
-                            ended_at=datetime.now(UTC)
-                        )
-                        logger.debug(f"ITERATION_SESSION_END: session_id={iteration_session_id[:8]}...")
-                    except Exception as e:
-                        logger.warning(f"Failed to complete iteration session {iteration_session_id[:8]}...: {e}")
+        elif action.type == DecisionEngine.ACTION_CLARIFY:
+            # Need more information
+            logger.info("Requesting clarification")
+            accumulated_context.append({
+                'type': 'feedback',
+                'content': f"Issues to address: {action.metadata.get('issues', [])}",
+                'timestamp': datetime.now(UTC)
+            })
 
-                # Restore agent's previous session_id
-                if hasattr(self.agent, 'session_id'):
-                    self.agent.session_id = old_agent_session_id
+        elif action.type == DecisionEngine.ACTION_RETRY:
+            # Try again with updated context
+            logger.info("Retrying with updated context")
+            accumulated_context.append({
+                'type': 'previous_attempt',
+                'content': response,
+                'timestamp': datetime.now(UTC)
+            })
 
-        # Max iterations reached
-        logger.warning(f"Max iterations ({max_iterations}) reached")
-        return {
-            'status': 'max_iterations',
-            'iterations': iteration,
-            'message': 'Task did not complete within iteration limit'
-        }
+        return None
 
     def _build_context(self, accumulated_context: List[Dict[str, Any]]) -> str:
         """Build context for prompt generation.
@@ -2846,7 +3183,11 @@ Provide concise, actionable feedback focusing on what the user requested. Be spe
         from src.utils.json_extractor import extract_json
 
         try:
-            response_json = extract_json(agent_response)
+            # Skip other JSON (code, tool output) the agent may have printed first
+            response_json = extract_json(
+                agent_response,
+                required_keys=['parallel_execution_used']
+            )
 
             if response_json:
                 return {
@@ -3235,6 +3576,7 @@ DO NOT repeat the raw interaction data - synthesize and summarize it.
             self._start_time = datetime.now(UTC)
 
         logger.info("Starting orchestration loop...")
+        install_profile_signal(self.config)
 
         try:
             while self._state == OrchestratorState.RUNNING:
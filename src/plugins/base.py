@@ -5,8 +5,14 @@ This module defines the core plugin interfaces that enable extensibility:
 - LLMPlugin: Interface for local LLM providers (Ollama, llama.cpp, etc.)
 
 All plugins must implement these interfaces to work with the orchestration system.
+
+Both interfaces also expose coroutine variants (``AgentPlugin.asend_prompt``,
+``LLMPlugin.agenerate``) for the asyncio orchestration path. The defaults run
+the blocking method in a worker thread; plugins with native async I/O
+override them.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Iterator
@@ -88,6 +94,8 @@ class AgentPlugin(ABC):
                 - 'timeout': Override default timeout
                 - 'files': List of files to focus on
                 - 'constraints': List of constraints/requirements
+                - 'session_id': Session for this call only (overrides the
+                  agent's current session, if the agent supports sessions)
 
         Returns:
             Agent's complete response as string
@@ -107,6 +115,32 @@ class AgentPlugin(ABC):
         """
         pass
 
+    async def asend_prompt(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Coroutine variant of send_prompt().
+
+        The default implementation runs send_prompt() in a worker thread so
+        every agent can be awaited. Override with a native implementation
+        when the agent's transport supports non-blocking I/O.
+
+        Args:
+            prompt: Text prompt to send to agent
+            context: Same as send_prompt()
+
+        Returns:
+            Agent's complete response as string
+
+        Raises:
+            AgentException: If agent encounters an error
+
+        Example:
+            >>> response = await agent.asend_prompt("Fix the bug in main.py")
+        """
+        return await asyncio.to_thread(self.send_prompt, prompt, context)
+
     @abstractmethod
     def get_workspace_files(self) -> List[Path]:
         """Get list of all files in agent's workspace.
@@ -356,6 +390,32 @@ class LLMPlugin(ABC):
         """
         pass
 
+    async def agenerate(
+        self,
+        prompt: str,
+        **kwargs
+    ) -> str:
+        """Coroutine variant of generate().
+
+        The default implementation runs generate() in a worker thread.
+        Override with a native implementation when the provider has an
+        async client.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Same as generate()
+
+        Returns:
+            Generated text as string
+
+        Raises:
+            LLMException: If generation fails
+
+        Example:
+            >>> response = await llm.agenerate("Explain this code:", max_tokens=500)
+        """
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
+
     @abstractmethod
     def generate_stream(
         self,
@@ -2,8 +2,15 @@
 
 This module provides registries for agents and LLMs with decorator-based
 auto-registration, enabling configuration-driven plugin selection.
+
+Plugins can also be registered lazily as ``'module:Class'`` specs (built-in
+plugins, and third-party plugins advertised through the ``obra.agents`` /
+``obra.llms`` entry point groups). The module is imported only when the
+plugin is first requested, so listing plugins or running unrelated CLI
+commands doesn't pay for paramiko, requests, etc.
 """
 
+import importlib
 import inspect
 import logging
 from typing import Dict, List, Type, Any
@@ -18,6 +25,27 @@ from src.plugins.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+AGENT_ENTRY_POINT_GROUP = 'obra.agents'
+LLM_ENTRY_POINT_GROUP = 'obra.llms'
+
+
+def _import_target(target: str) -> Any:
+    """Import a ``'module:attr'`` spec and return the attribute."""
+    module_name, _, attr = target.partition(':')
+    if not attr:
+        raise ValueError(f"Plugin spec must be 'module:attr', got {target!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _entry_point_specs(group: str) -> Dict[str, str]:
+    """Map entry point names in ``group`` to their ``'module:attr'`` specs."""
+    from importlib.metadata import entry_points  # ~10ms, only needed here
+    try:
+        return {ep.name: ep.value for ep in entry_points(group=group)}
+    except Exception as e:
+        logger.warning(f"Failed to read entry points for {group}: {e}")
+        return {}
+
 
 class AgentRegistry:
     """Registry for agent plugins with decorator-based registration.
@@ -48,6 +76,7 @@ class AgentRegistry:
     """
 
     _agents: Dict[str, Type[AgentPlugin]] = {}
+    _lazy: Dict[str, str] = {}  # name -> 'module:Class', imported on first get()
     _lock = RLock()  # Thread-safe registration
 
     @classmethod
@@ -101,8 +130,43 @@ class AgentRegistry:
                 )
 
             cls._agents[name] = agent_class
+            cls._lazy.pop(name, None)
             logger.debug(f"Registered agent: {name} -> {agent_class.__name__}")
 
+    @classmethod
+    def register_lazy(cls, name: str, target: str) -> None:
+        """Register an agent by import path without importing it.
+
+        The module is imported on the first get(); an explicit register()
+        of the same name takes precedence.
+
+        Args:
+            name: Unique name for the agent
+            target: ``'module:Class'`` import path
+
+        Example:
+            >>> AgentRegistry.register_lazy('claude-code-ssh',
+            ...     'src.agents.claude_code_ssh:ClaudeCodeSSHAgent')
+        """
+        with cls._lock:
+            if name not in cls._agents:
+                cls._lazy[name] = target
+
+    @classmethod
+    def discover(cls, group: str = AGENT_ENTRY_POINT_GROUP) -> List[str]:
+        """Register agents advertised by installed packages' entry points.
+
+        Args:
+            group: Entry point group (default: 'obra.agents')
+
+        Returns:
+            Names registered (lazily) from entry points
+        """
+        specs = _entry_point_specs(group)
+        for name, target in specs.items():
+            cls.register_lazy(name, target)
+        return list(specs)
+
     @classmethod
     def get(cls, name: str) -> Type[AgentPlugin]:
         """Get agent class by name.
@@ -121,6 +185,8 @@ class AgentRegistry:
             >>> agent = agent_class()
         """
         with cls._lock:
+            if name not in cls._agents and name in cls._lazy:
+                cls._resolve_lazy(name)
             if name not in cls._agents:
                 available = cls.list()
                 raise PluginNotFoundError(
@@ -130,6 +196,19 @@ class AgentRegistry:
                 )
             return cls._agents[name]
 
+    @classmethod
+    def _resolve_lazy(cls, name: str) -> None:
+        """Import a lazily registered agent and register its class."""
+        target = cls._lazy.pop(name)
+        try:
+            # Importing usually registers the class via @register_agent
+            agent_class = _import_target(target)
+        except (ImportError, AttributeError, ValueError) as e:
+            logger.error(f"Failed to load agent plugin {name} from {target}: {e}")
+            return
+        if name not in cls._agents:
+            cls.register(name, agent_class)
+
     @classmethod
     def is_registered(cls, name: str) -> bool:
         """Check if an agent is registered.
@@ -145,7 +224,7 @@ class AgentRegistry:
             ...     agent = AgentRegistry.get('claude-code-ssh')
         """
         with cls._lock:
-            return name in cls._agents
+            return name in cls._agents or name in cls._lazy
 
     @classmethod
     def list(cls) -> List[str]:
@@ -160,7 +239,7 @@ class AgentRegistry:
             ['claude-code-ssh', 'aider', 'mock']
         """
         with cls._lock:
-            return list(cls._agents.keys())
+            return list(cls._agents.keys()) + [n for n in cls._lazy if n not in cls._agents]
 
     @classmethod
     def unregister(cls, name: str) -> None:
@@ -175,6 +254,7 @@ class AgentRegistry:
             >>> AgentRegistry.unregister('test-agent')
         """
         with cls._lock:
+            cls._lazy.pop(name, None)
             if name in cls._agents:
                 del cls._agents[name]
                 logger.debug(f"Unregistered agent: {name}")
@@ -191,6 +271,7 @@ class AgentRegistry:
         """
         with cls._lock:
             cls._agents.clear()
+            cls._lazy.clear()
             logger.debug("Cleared all agent registrations")
 
     @classmethod
@@ -251,6 +332,7 @@ class LLMRegistry:
     """
 
     _llms: Dict[str, Type[LLMPlugin]] = {}
+    _lazy: Dict[str, str] = {}  # name -> 'module:Class', imported on first get()
     _lock = RLock()
 
     @classmethod
@@ -298,8 +380,36 @@ class LLMRegistry:
                 )
 
             cls._llms[name] = llm_class
+            cls._lazy.pop(name, None)
             logger.debug(f"Registered LLM: {name} -> {llm_class.__name__}")
 
+    @classmethod
+    def register_lazy(cls, name: str, target: str) -> None:
+        """Register an LLM by import path without importing it.
+
+        Args:
+            name: Unique name for the LLM
+            target: ``'module:Class'`` import path
+        """
+        with cls._lock:
+            if name not in cls._llms:
+                cls._lazy[name] = target
+
+    @classmethod
+    def discover(cls, group: str = LLM_ENTRY_POINT_GROUP) -> List[str]:
+        """Register LLMs advertised by installed packages' entry points.
+
+        Args:
+            group: Entry point group (default: 'obra.llms')
+
+        Returns:
+            Names registered (lazily) from entry points
+        """
+        specs = _entry_point_specs(group)
+        for name, target in specs.items():
+            cls.register_lazy(name, target)
+        return list(specs)
+
     @classmethod
     def get(cls, name: str) -> Type[LLMPlugin]:
         """Get LLM class by name.
@@ -314,6 +424,8 @@ class LLMRegistry:
             PluginNotFoundError: If LLM not registered
         """
         with cls._lock:
+            if name not in cls._llms and name in cls._lazy:
+                cls._resolve_lazy(name)
             if name not in cls._llms:
                 available = cls.list()
                 raise PluginNotFoundError(
@@ -323,6 +435,19 @@ class LLMRegistry:
                 )
             return cls._llms[name]
 
+    @classmethod
+    def _resolve_lazy(cls, name: str) -> None:
+        """Import a lazily registered LLM and register its class."""
+        target = cls._lazy.pop(name)
+        try:
+            # Importing usually registers the class via @register_llm
+            llm_class = _import_target(target)
+        except (ImportError, AttributeError, ValueError) as e:
+            logger.error(f"Failed to load LLM plugin {name} from {target}: {e}")
+            return
+        if name not in cls._llms:
+            cls.register(name, llm_class)
+
     @classmethod
     def list(cls) -> List[str]:
         """List all registered LLM names.
@@ -331,12 +456,13 @@ class LLMRegistry:
             List of registered LLM names
         """
         with cls._lock:
-            return list(cls._llms.keys())
+            return list(cls._llms.keys()) + [n for n in cls._lazy if n not in cls._llms]
 
     @classmethod
     def unregister(cls, name: str) -> None:
         """Remove LLM from registry."""
         with cls._lock:
+            cls._lazy.pop(name, None)
             if name in cls._llms:
                 del cls._llms[name]
                 logger.debug(f"Unregistered LLM: {name}")
@@ -346,6 +472,7 @@ class LLMRegistry:
         """Clear all LLM registrations (use only in tests!)."""
         with cls._lock:
             cls._llms.clear()
+            cls._lazy.clear()
             logger.debug("Cleared all LLM registrations")
 
     @classmethod
@@ -1,11 +1,19 @@
-"""Utility services for token counting, context management, and confidence scoring."""
+"""Utility services for token counting, context management, and confidence scoring.
 
-from src.utils.token_counter import TokenCounter
-from src.utils.context_manager import ContextManager
-from src.utils.confidence_scorer import ConfidenceScorer
+Exports are resolved on first access (see src.utils.lazy_import) so that
+importing a light utility doesn't load the database models.
+"""
+
+from src.utils.lazy_import import lazy_exports
 
 __all__ = [
     'TokenCounter',
     'ContextManager',
     'ConfidenceScorer'
 ]
+
+__getattr__ = lazy_exports(__name__, {
+    'TokenCounter': 'src.utils.token_counter',
+    'ContextManager': 'src.utils.context_manager',
+    'ConfidenceScorer': 'src.utils.confidence_scorer',
+})
@@ -6,6 +6,7 @@ This module provides the GitManager class for automatic git operations including
 - Branch management per task
 - Optional PR creation via gh CLI
 - Rollback support
+- Isolated worktrees for parallel agents with three-way merge back
 
 Key Features:
 - LLM-generated semantic commit messages
@@ -28,7 +29,9 @@ Example:
 
 import logging
 import re
+import shutil
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from pathlib import Path
@@ -506,6 +509,251 @@ This PR addresses Obra task #{task.id}: {task.title}
             logger.error(f"Failed to rollback task: {e}")
             return False
 
+    # =========================================================================
+    # Worktrees (parallel agent isolation)
+    # =========================================================================
+
+    # Commits made inside worktrees are intermediate (they are squashed into
+    # the main working tree), so they use a fixed identity instead of
+    # requiring user.name/user.email to be configured
+    WORKTREE_IDENTITY = ['-c', 'user.name=Obra', '-c', 'user.email=obra@localhost']
+
+    def get_commit(self, ref: str = 'HEAD', path: Optional[Path] = None) -> str:
+        """Resolve a ref to a commit SHA.
+
+        Args:
+            ref: Git ref (branch, tag, SHA)
+            path: Worktree to resolve in (default: project directory)
+
+        Returns:
+            Full commit SHA
+
+        Raises:
+            GitException: If the ref cannot be resolved
+        """
+        location = ['-C', str(path)] if path else []
+        result = self._run_git_command(
+            location + ['rev-parse', '--verify', f'{ref}^{{commit}}'], check=True
+        )
+        return result.stdout.strip()
+
+    def create_worktree(self, ref: str = 'HEAD', prefix: str = 'obra-worktree-') -> Path:
+        """Create a detached worktree checked out at ``ref``.
+
+        Args:
+            ref: Commit to check out
+            prefix: Prefix for the temporary worktree directory
+
+        Returns:
+            Path to the new worktree
+
+        Raises:
+            GitException: If the worktree cannot be created
+
+        Example:
+            >>> path = git_manager.create_worktree()
+            >>> # ... agent works in path ...
+            >>> git_manager.remove_worktree(path)
+        """
+        path = Path(tempfile.mkdtemp(prefix=prefix))
+        try:
+            self._run_git_command(['worktree', 'add', '--detach', str(path), ref], check=True)
+        except GitException:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        logger.debug(f"Created worktree {path} at {ref}")
+        return path
+
+    def remove_worktree(self, path: Path) -> None:
+        """Remove a worktree, discarding any uncommitted changes in it.
+
+        Args:
+            path: Worktree path
+        """
+        try:
+            self._run_git_command(['worktree', 'remove', '--force', str(path)], check=True)
+        except GitException as e:
+            logger.warning(f"Failed to remove worktree {path}: {e.stderr}")
+            shutil.rmtree(path, ignore_errors=True)
+            self._run_git_command(['worktree', 'prune'])
+        logger.debug(f"Removed worktree {path}")
+
+    def fork_worktree(self, prefix: str = 'obra-fork-') -> Tuple[Path, str]:
+        """Create a worktree holding the project's current working-tree state.
+
+        Uncommitted changes and untracked (non-ignored) files are copied in
+        and committed on the worktree's detached HEAD, so work done in the
+        fork can later be applied back with ``apply_worktree_changes``. The
+        project's index and HEAD are not touched.
+
+        Args:
+            prefix: Prefix for the temporary worktree directory
+
+        Returns:
+            Tuple of (worktree path, commit holding the forked state)
+
+        Raises:
+            GitException: If the worktree cannot be created or populated
+        """
+        path = self.create_worktree('HEAD', prefix=prefix)
+        try:
+            with tempfile.TemporaryDirectory(prefix='obra-patch-') as patch_dir:
+                patch = Path(patch_dir) / 'changes.patch'
+                self._run_git_command(
+                    ['diff', 'HEAD', '--binary', f'--output={patch}'], check=True
+                )
+                if patch.stat().st_size:
+                    self._run_git_command(['-C', str(path), 'apply', '--binary', str(patch)], check=True)
+
+            untracked = self._run_git_command(
+                ['ls-files', '--others', '--exclude-standard', '-z'], check=True
+            )
+            for name in filter(None, untracked.stdout.split('\0')):
+                target = path / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(self.project_dir / name, target)
+
+            base = self.commit_worktree(path, 'Fork of working tree') or self.get_commit('HEAD', path=path)
+        except Exception:
+            self.remove_worktree(path)
+            raise
+        return path, base
+
+    def apply_worktree_changes(self, path: Path, base: str) -> bool:
+        """Apply the changes made in a forked worktree to the project working tree.
+
+        Args:
+            path: Worktree created by ``fork_worktree``
+            base: Commit returned by ``fork_worktree``
+
+        Returns:
+            True if there were changes to apply
+
+        Raises:
+            GitException: If the changes do not apply cleanly
+        """
+        head = self.commit_worktree(path, 'Forked work')
+        if head is None:
+            return False
+        with tempfile.TemporaryDirectory(prefix='obra-patch-') as patch_dir:
+            patch = Path(patch_dir) / 'changes.patch'
+            self._run_git_command(
+                ['-C', str(path), 'diff', '--binary', f'--output={patch}', base, head], check=True
+            )
+            self._run_git_command(['apply', '--binary', str(patch)], check=True)
+        return True
+
+    def sync_worktree(self, path: Path, ref: str) -> None:
+        """Reset a worktree to ``ref`` and remove untracked files.
+
+        Args:
+            path: Worktree path
+            ref: Commit to reset to
+
+        Raises:
+            GitException: If the reset fails
+        """
+        self._run_git_command(['-C', str(path), 'reset', '--hard', '--quiet', ref], check=True)
+        self._run_git_command(['-C', str(path), 'clean', '-fdq'], check=True)
+
+    def commit_worktree(self, path: Path, message: str) -> Optional[str]:
+        """Commit all changes in a worktree.
+
+        Args:
+            path: Worktree path
+            message: Commit message
+
+        Returns:
+            New commit SHA, or None if there was nothing to commit
+
+        Raises:
+            GitException: If staging or committing fails
+        """
+        self._run_git_command(['-C', str(path), 'add', '-A'], check=True)
+        if self._run_git_command(['-C', str(path), 'diff', '--cached', '--quiet']).returncode == 0:
+            return None
+
+        self._run_git_command(
+            self.WORKTREE_IDENTITY + ['-C', str(path), 'commit', '--quiet', '-m', message],
+            check=True
+        )
+        return self.get_commit('HEAD', path=path)
+
+    def merge_into_worktree(self, path: Path, commit: str, message: str) -> List[str]:
+        """Three-way merge ``commit`` into a worktree's HEAD.
+
+        On conflict the merge is aborted, leaving the worktree unchanged.
+
+        Args:
+            path: Worktree path
+            commit: Commit to merge
+            message: Merge commit message
+
+        Returns:
+            Conflicting file paths (empty if the merge succeeded)
+
+        Raises:
+            GitException: If the merge fails for a reason other than conflicts
+        """
+        result = self._run_git_command(
+            self.WORKTREE_IDENTITY + ['-C', str(path), 'merge', '--no-ff', '-m', message, commit]
+        )
+        if result.returncode == 0:
+            return []
+
+        conflicts = self._conflicted_files(path)
+        self._run_git_command(['-C', str(path), 'merge', '--abort'])
+        if not conflicts:
+            raise GitException(
+                f"Merge of {commit} failed",
+                command=f"git merge {commit}",
+                stderr=result.stderr
+            )
+        return conflicts
+
+    def apply_commit(self, commit: str) -> List[str]:
+        """Apply a commit's changes to the project working tree without committing.
+
+        Uses ``git merge --squash``, so the changes are three-way merged with
+        HEAD and left staged for the normal commit flow (``commit_task``).
+        Conflicts are left in the working tree for resolution, as with
+        ``git merge``.
+
+        Args:
+            commit: Commit whose changes to apply
+
+        Returns:
+            Conflicting file paths (empty if applied cleanly)
+
+        Raises:
+            GitException: If git refuses the merge (e.g. local changes
+                would be overwritten)
+        """
+        result = self._run_git_command(['merge', '--squash', commit])
+        if result.returncode == 0:
+            return []
+
+        conflicts = self._conflicted_files(self.project_dir)
+        if not conflicts:
+            raise GitException(
+                f"Could not apply {commit} to working tree",
+                command=f"git merge --squash {commit}",
+                stderr=result.stderr
+            )
+        return conflicts
+
+    def _conflicted_files(self, path: Path) -> List[str]:
+        """List unmerged paths in a working tree.
+
+        Args:
+            path: Working tree path
+
+        Returns:
+            Conflicting file paths
+        """
+        result = self._run_git_command(['-C', str(path), 'diff', '--name-only', '--diff-filter=U'])
+        return [line for line in result.stdout.splitlines() if line]
+
     def _run_git_command(
         self,
         args: List[str],
@@ -1,28 +1,310 @@
 """JSON extraction utilities for LLM responses.
 
-Provides robust JSON parsing with multiple fallback strategies for handling
-LLM responses that may include preambles, explanations, or markdown formatting.
+Provides robust JSON parsing for handling LLM responses that may include
+preambles, explanations, or markdown formatting.
+
+Candidate objects are found by a single-pass scanner that tracks brace depth
+and skips braces inside JSON strings (escape-aware). It works on a complete
+response or on a stream of chunks (e.g. from generate_stream()), keeps only
+the text of the object being scanned, and yields candidates lazily so
+extraction stops at the first object that parses and has the expected keys.
+A candidate that doesn't parse is passed over by resuming the scan just
+after its opening brace; spans already scanned are skipped in one step, so
+deeply nested prose stays linear.
 """
 
 import json
 import logging
 import re
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Longest partial candidate kept between chunks; longer ones are dropped
+MAX_JSON_OBJECT_CHARS = 1_000_000
+
+# Characters that matter inside an object, and inside a string
+_OBJECT_TOKENS = re.compile(r'[{}"]')
+_STRING_TOKENS = re.compile(r'["\\]')
+
+# A JSON object starts with a key or is empty; anything else isn't worth parsing
+_OBJECT_START = re.compile(r'\{\s*["}]')
+
+
+class JsonObjectScanner:
+    """Incremental scanner for brace-delimited JSON object candidates.
+
+    Feed text chunks; each call yields the text of every top-level
+    {...} span closed by that chunk. Braces inside JSON strings are
+    ignored. Text outside a candidate is discarded, so memory is bounded
+    by max_object_chars.
+
+    A candidate that turns out not to be JSON (prose in braces, or a
+    stray quote that made the scanner misread strings) can be passed over
+    with reject(): scanning restarts just after its opening brace, outside
+    any string. A brace that is never closed (prose such as "{{" or a
+    truncated response) is passed over the same way by finish(), or as
+    soon as the unclosed candidate exceeds max_object_chars.
+
+    Spans already scanned are remembered, so a restart skips straight over
+    text whose outcome is known and every nesting level costs O(1) to pass
+    over, however deep.
+
+    Example:
+        >>> scanner = JsonObjectScanner()
+        >>> list(scanner.feed('Result: {"a": "}'))
+        []
+        >>> list(scanner.feed('", "b": {}} done'))
+        ['{"a": "}", "b": {}}']
+    """
+
+    def __init__(self, max_object_chars: int = MAX_JSON_OBJECT_CHARS):
+        """Initialize scanner.
+
+        Args:
+            max_object_chars: Longest partial candidate to keep between
+                chunks; longer ones are dropped
+        """
+        self.max_object_chars = max_object_chars
+        self._buffer = ''
+        self._base = 0  # Offset of the buffer in the whole text
+        self._pos = 0
+        self._in_string = False
+        self._open: List[int] = []  # Offsets of open braces
+        # Braces already scanned: offset -> offset after the closing brace,
+        # or None if it never closes
+        self._spans: Dict[int, Optional[int]] = {}
+        self._candidate = 0  # Offset of the last candidate yielded
+
+    def feed(self, chunk: str) -> Iterator[str]:
+        """Scan a chunk of text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Yields:
+            Text of each top-level candidate object completed in this chunk
+        """
+        for buffer, start, end in self._feed(chunk):
+            yield buffer[start:end]
+
+    def finish(self) -> Iterator[str]:
+        """End the current candidate (end of text, or too long).
+
+        Braces that were never closed are passed over, so the spans
+        nested in them become candidates.
+
+        Yields:
+            Candidates found after the unclosed braces
+        """
+        for buffer, start, end in self._finish():
+            yield buffer[start:end]
+
+    def reject(self) -> None:
+        """Pass over the candidate just yielded because it didn't parse.
+
+        Call before asking for the next candidate. Scanning resumes just
+        after the candidate's opening brace, outside any string, so objects
+        nested in it, or hidden by a stray quote, are still found.
+        """
+        self._restart(self._candidate + 1)
+
+    def _feed(self, chunk: str) -> Iterator[Tuple[str, int, int]]:
+        # Candidates as (buffer, start, end), so callers can look before slicing
+        self._buffer += chunk
+        yield from self._scan()
+
+        if not self._open:
+            self._reset()
+        elif len(self._buffer) - (self._open[0] - self._base) > self.max_object_chars:
+            logger.debug(
+                f"JSON candidate longer than {self.max_object_chars} chars, "
+                f"keeping only the objects nested in it"
+            )
+            yield from self._finish()
+        else:
+            keep = self._open[0] - self._base
+            if keep:
+                self._buffer = self._buffer[keep:]
+                self._base += keep
+                self._pos -= keep
+                self._spans = {
+                    offset: end for offset, end in self._spans.items()
+                    if offset >= self._base
+                }
+
+    def _finish(self) -> Iterator[Tuple[str, int, int]]:
+        while self._open:
+            for offset in self._open:
+                self._spans[offset] = None
+            self._restart(self._open[0] + 1)
+            yield from self._scan()
+        self._reset()
+
+    def _scan(self) -> Iterator[Tuple[str, int, int]]:
+        buffer, base, spans = self._buffer, self._base, self._spans
+        pos, in_string, open_braces = self._pos, self._in_string, self._open
+        length = len(buffer)
+
+        while pos < length:
+            if in_string:
+                match = _STRING_TOKENS.search(buffer, pos)
+                if match is None:
+                    pos = length
+                    break
+                if match.group() == '"':
+                    in_string = False
+                    pos = match.end()
+                else:
+                    # Skip the escaped character (may be in the next chunk)
+                    pos = match.end() + 1
+                continue
+
+            if open_braces:
+                match = _OBJECT_TOKENS.search(buffer, pos)
+                if match is None:
+                    pos = length
+                    break
+                start, pos = match.start(), match.end()
+                token = match.group()
+                if token == '"':
+                    in_string = True
+                    continue
+                if token == '}':
+                    offset = open_braces.pop()
+                    spans[offset] = base + pos
+                    if not open_braces:
+                        self._pos, self._in_string, self._candidate = pos, False, offset
+                        yield buffer, offset - base, pos
+                        pos, in_string, open_braces = self._pos, self._in_string, self._open
+                    continue
+            else:
+                start = buffer.find('{', pos)
+                if start < 0:
+                    pos = length
+                    break
+
+            # An opening brace outside any string
+            offset = base + start
+            if offset not in spans:
+                open_braces.append(offset)
+                pos = start + 1
+                continue
+
+            # Scanned before from the same state, so the outcome is known
+            end = spans[offset]
+            if end is None:
+                # Never closes, so neither do the braces around it
+                for outer in open_braces:
+                    spans[outer] = None
+                restart = open_braces[0] if open_braces else offset
+                open_braces = self._open = []
+                pos = restart + 1 - base
+            elif open_braces:
+                pos = end - base
+            else:
+                self._pos, self._in_string, self._candidate = end - base, False, offset
+                yield buffer, start, end - base
+                pos, in_string, open_braces = self._pos, self._in_string, self._open
+
+        self._pos, self._in_string = pos, in_string
+
+    def _restart(self, offset: int) -> None:
+        self._pos = offset - self._base
+        self._in_string = False
+        self._open = []
+
+    def _reset(self) -> None:
+        self._base += len(self._buffer)
+        self._buffer = ''
+        self._pos = 0
+        self._in_string = False
+        self._open = []
+        self._spans = {}
+
+
+def iter_json_candidates(
+    source: Union[str, Iterable[str]],
+    max_object_chars: int = MAX_JSON_OBJECT_CHARS
+) -> Iterator[str]:
+    """Yield top-level {...} spans from text or a stream of text chunks.
+
+    Args:
+        source: Response text, or an iterable of chunks (e.g. generate_stream())
+        max_object_chars: Longest partial candidate to keep between chunks
 
-def extract_json(response: str) -> Optional[Dict[str, Any]]:
+    Yields:
+        Candidate JSON object text, in order of appearance
+    """
+    scanner = JsonObjectScanner(max_object_chars)
+    chunks = (source,) if isinstance(source, str) else source
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.finish()
+
+
+def iter_json_objects(
+    source: Union[str, Iterable[str]],
+    max_object_chars: int = MAX_JSON_OBJECT_CHARS
+) -> Iterator[Dict[str, Any]]:
+    """Yield JSON objects found in text or a stream of text chunks.
+
+    A candidate that does not parse (e.g. prose in braces) is rejected,
+    so the scan goes on inside it and the objects it contains are found.
+
+    Args:
+        source: Response text, or an iterable of chunks
+        max_object_chars: Longest partial candidate to keep between chunks
+
+    Yields:
+        Parsed JSON objects (dicts), in order of appearance
+    """
+    scanner = JsonObjectScanner(max_object_chars)
+    chunks = (source,) if isinstance(source, str) else source
+    for chunk in chunks:
+        yield from _parse_candidates(scanner, scanner._feed(chunk))
+    yield from _parse_candidates(scanner, scanner._finish())
+
+
+def _parse_candidates(
+    scanner: JsonObjectScanner,
+    candidates: Iterator[Tuple[str, int, int]]
+) -> Iterator[Dict[str, Any]]:
+    for buffer, start, end in candidates:
+        if _OBJECT_START.match(buffer, start):
+            try:
+                data = json.loads(buffer[start:end])
+            except json.JSONDecodeError:
+                pass
+            else:
+                yield data
+                continue
+        scanner.reject()
+
+
+def _first_matching(
+    objects: Iterator[Dict[str, Any]],
+    required_keys: Optional[List[str]]
+) -> Optional[Dict[str, Any]]:
+    for data in objects:
+        if not required_keys or validate_json_structure(data, required_keys)[0]:
+            return data
+    return None
+
+
+def extract_json(
+    response: str,
+    required_keys: Optional[List[str]] = None
+) -> Optional[Dict[str, Any]]:
     """Extract JSON from LLM response that may have extra text.
 
-    Tries multiple strategies:
-    1. Parse response directly
-    2. Find JSON block with regex
-    3. Find content between first { and last }
-    4. Extract from markdown code block
+    Parses the response directly if it is pure JSON; otherwise scans it
+    for {...} objects (including inside markdown code blocks) and returns
+    the first that parses and has the required keys.
 
     Args:
         response: LLM response text
+        required_keys: Keys the object must have (skip objects without them)
 
     Returns:
         Parsed JSON dict or None if extraction fails
@@ -32,50 +314,59 @@ def extract_json(response: str) -> Optional[Dict[str, Any]]:
         {'key': 'value'}
         >>> extract_json('```json\\n{"key": "value"}\\n```')
         {'key': 'value'}
+        >>> extract_json('{"a": 1} then {"b": 2}', required_keys=['b'])
+        {'b': 2}
     """
     if not response:
         return None
 
     response = response.strip()
 
-    # Strategy 1: Direct parse
-    try:
-        return json.loads(response)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 2: Find JSON with regex (greedy, captures outermost braces)
-    # This pattern handles nested braces
-    json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-    matches = re.findall(json_pattern, response, re.DOTALL)
-    if matches:
-        # Try each match (usually just one)
-        for match in matches:
-            try:
-                return json.loads(match)
-            except json.JSONDecodeError:
-                continue
-
-    # Strategy 3: Find content between first { and last }
-    try:
-        first_brace = response.index('{')
-        last_brace = response.rindex('}')
-        json_str = response[first_brace:last_brace + 1]
-        return json.loads(json_str)
-    except (ValueError, json.JSONDecodeError):
-        pass
-
-    # Strategy 4: Extract from markdown code block
-    code_block_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-    match = re.search(code_block_pattern, response, re.DOTALL)
-    if match:
+    # Direct parse
+    if response[:1] in ('{', '['):
         try:
-            return json.loads(match.group(1))
+            data = json.loads(response)
+            if not required_keys or validate_json_structure(data, required_keys)[0]:
+                return data
         except json.JSONDecodeError:
             pass
 
-    logger.warning(f"Failed to extract JSON from response: {response[:200]}...")
-    return None
+    data = _first_matching(iter_json_objects(response), required_keys)
+    if data is None:
+        logger.warning(f"Failed to extract JSON from response: {response[:200]}...")
+    return data
+
+
+def extract_json_from_stream(
+    chunks: Iterable[str],
+    required_keys: Optional[List[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """Extract the first matching JSON object from a stream of text chunks.
+
+    Stops consuming (and closes) the stream as soon as a matching object
+    is complete, so generation can end early.
+
+    Args:
+        chunks: Text chunks, e.g. from LocalLLMInterface.generate_stream()
+        required_keys: Keys the object must have (skip objects without them)
+
+    Returns:
+        Parsed JSON dict or None if the stream ends without one
+
+    Example:
+        >>> extract_json_from_stream(llm.generate_stream(prompt), ['is_valid'])
+        {'is_valid': True, 'quality_score': 0.85}
+    """
+    try:
+        data = _first_matching(iter_json_objects(chunks), required_keys)
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+    if data is None:
+        logger.warning("Failed to extract JSON from streamed response")
+    return data
 
 
 def validate_json_structure(
@@ -0,0 +1,122 @@
+"""Deferred imports for fast CLI startup.
+
+Importing ``src.orchestrator`` pulls in SQLAlchemy, paramiko, requests and
+every orchestration component (~0.4s). Commands like ``obra --help`` or
+``obra config show`` need none of that, so entry points and package
+``__init__`` modules reference heavy classes through these helpers and the
+import happens on first use.
+
+Two forms:
+
+- ``lazy_import('module', 'attr')``: module-level proxy that imports on first
+  call or attribute access. Callers (and ``unittest.mock.patch``) use it like
+  the real object.
+- ``lazy_exports(__name__, {...})``: a PEP 562 module ``__getattr__`` that
+  resolves a package's public names on first access.
+
+Example:
+    >>> Orchestrator = lazy_import('src.orchestrator', 'Orchestrator')
+    >>> orchestrator = Orchestrator(config=config)  # imports here
+"""
+
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Dict
+
+
+class LazyImport:
+    """Proxy for ``module.attr`` that imports the module on first use.
+
+    Supports calling and attribute access; the resolved object is cached.
+    Use ``resolve()`` where the real object is required (``isinstance``,
+    ``except`` clauses, subclassing).
+
+    Example:
+        >>> StateManager = LazyImport('src.core.state', 'StateManager')
+        >>> StateManager.get_instance(db_url)
+    """
+
+    __slots__ = ('_module', '_attr', '_target', '_lock')
+
+    def __init__(self, module: str, attr: str):
+        """Initialize proxy.
+
+        Args:
+            module: Dotted module path
+            attr: Attribute name within the module
+        """
+        self._module = module
+        self._attr = attr
+        self._target = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """Import the module (once) and return the attribute."""
+        target = self._target
+        if target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = getattr(importlib.import_module(self._module), self._attr)
+                target = self._target
+        return target
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the underlying module has been imported."""
+        return self._target is not None
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = 'resolved' if self.is_resolved else 'deferred'
+        return f"<LazyImport {self._module}.{self._attr} ({state})>"
+
+
+def lazy_import(module: str, attr: str) -> LazyImport:
+    """Create a deferred reference to ``module.attr``.
+
+    Args:
+        module: Dotted module path
+        attr: Attribute name
+
+    Returns:
+        LazyImport proxy
+
+    Example:
+        >>> Orchestrator = lazy_import('src.orchestrator', 'Orchestrator')
+    """
+    return LazyImport(module, attr)
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """Build a PEP 562 ``__getattr__`` resolving a package's exports lazily.
+
+    Resolved names are cached in the package namespace, so each is imported
+    at most once.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> dotted module path defining it
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+
+    Example:
+        >>> __getattr__ = lazy_exports(__name__, {
+        ...     'FileWatcher': 'src.monitoring.file_watcher',
+        ... })
+    """
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -26,15 +26,19 @@ Example:
     >>>
     >>> # Direct invocation
     >>> result = retry_manager.execute(api_call, *args, **kwargs)
+    >>>
+    >>> # Coroutine functions (delays use asyncio.sleep)
+    >>> result = await retry_manager.aexecute(async_api_call, *args, **kwargs)
 """
 
+import asyncio
 import logging
 import random
 import time
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar, Union
 from threading import RLock
 
 logger = logging.getLogger(__name__)
@@ -312,6 +316,94 @@ class RetryManager:
             attempts=attempts
         )
 
+    async def aexecute(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args,
+        **kwargs
+    ) -> T:
+        """Await a coroutine function with retry logic.
+
+        Same policy as execute(), but backoff delays use asyncio.sleep so the
+        event loop keeps running other work between attempts.
+
+        Args:
+            func: Coroutine function to await
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            RetryExhaustedError: If all retry attempts fail
+            Exception: If non-retryable error occurs
+
+        Example:
+            >>> result = await retry_manager.aexecute(fetch, url='https://example.com')
+        """
+        attempts: List[RetryAttempt] = []
+        last_error: Optional[Exception] = None
+
+        for attempt_num in range(self.config.max_attempts):
+            try:
+                if attempt_num > 0:
+                    delay = self.calculate_delay(attempt_num - 1)
+                    logger.info(
+                        f"Retry attempt {attempt_num + 1}/{self.config.max_attempts} "
+                        f"after {delay:.2f}s delay"
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    delay = 0.0
+
+                attempts.append(RetryAttempt(
+                    attempt_number=attempt_num + 1,
+                    delay=delay,
+                    error=last_error,
+                    timestamp=datetime.now(UTC)
+                ))
+
+                result = await func(*args, **kwargs)
+
+                if attempt_num > 0:
+                    logger.info(
+                        f"Operation succeeded on attempt {attempt_num + 1} "
+                        f"after {len(attempts)} attempts"
+                    )
+
+                return result
+
+            except Exception as e:
+                last_error = e
+
+                if not self.is_retryable_error(e):
+                    logger.error(
+                        f"Non-retryable error occurred: {type(e).__name__}: {e}"
+                    )
+                    raise
+
+                if attempt_num >= self.config.max_attempts - 1:
+                    logger.error(
+                        f"All retry attempts exhausted after {self.config.max_attempts} attempts"
+                    )
+                    raise RetryExhaustedError(
+                        f"Operation failed after {self.config.max_attempts} attempts",
+                        original_error=e,
+                        attempts=attempts
+                    ) from e
+
+                logger.warning(
+                    f"Retryable error on attempt {attempt_num + 1}: "
+                    f"{type(e).__name__}: {e}"
+                )
+
+        raise RetryExhaustedError(
+            "Unexpected retry exhaustion",
+            original_error=last_error or Exception("Unknown error"),
+            attempts=attempts
+        )
+
     def retry(
         self,
         max_attempts: Optional[int] = None,
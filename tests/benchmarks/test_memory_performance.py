@@ -481,6 +481,64 @@ class TestMemoryUsage:
             print(f"Context: {data['context_size']:>7,} | Ops: {data['operation_count']:>3} | "
                   f"Tokens: {data['current_tokens']:>6,} | Memory: ~{data['estimated_kb']:.1f}KB")
 
+    def test_operation_record_footprint(self, caplog):
+        """Compare per-operation memory of OperationRecord vs plain dicts."""
+        import logging
+        import tracemalloc
+        from collections import deque
+        from datetime import datetime, timezone
+        from src.orchestration.memory.working_memory import WorkingMemory
+
+        count = 10000
+        # Captured debug records would be counted as retained memory
+        caplog.set_level(logging.WARNING, logger='src.orchestration.memory')
+
+        def make_operation(i):
+            return {
+                'type': 'task',
+                'operation': 'execute',
+                'data': {'id': i, 'status': 'completed', 'files': ['src/app.py']},
+                'tokens': 120,
+                'timestamp': datetime.now(timezone.utc).isoformat()
+            }
+
+        def measure(store):
+            tracemalloc.start()
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                container = store()
+                return (tracemalloc.get_traced_memory()[0] - before) / count, container
+            finally:
+                tracemalloc.stop()
+
+        def dict_store():
+            # Previous representation: the operation dicts themselves
+            operations = deque(maxlen=count)
+            for i in range(count):
+                operations.append(make_operation(i))
+            return operations
+
+        def record_store():
+            memory = WorkingMemory({
+                'context_window': 128000,
+                'max_operations': count,
+                'max_tokens': 10 ** 9
+            })
+            for i in range(count):
+                memory.add_operation(make_operation(i))
+            return memory
+
+        dict_bytes, _ = measure(dict_store)
+        record_bytes, memory = measure(record_store)
+
+        print(f"\n\nPer-operation memory ({count:,} operations):")
+        print(f"  dict:            {dict_bytes:.0f} bytes")
+        print(f"  OperationRecord: {record_bytes:.0f} bytes "
+              f"({1 - record_bytes / dict_bytes:.0%} less)")
+
+        assert len(memory) == count
+        assert record_bytes < dict_bytes * 0.6
+
     def test_checkpoint_file_sizes(self, fast_time):
         """Measure checkpoint file sizes."""
         checkpoint_sizes = []
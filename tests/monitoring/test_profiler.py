@@ -0,0 +1,178 @@
+"""Unit tests for the sampling profiler."""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from src.monitoring import profiler as profiler_module
+from src.monitoring.profiler import (
+    OVERFLOW_FRAME, SamplingProfiler, get_profiler, install_profile_signal
+)
+
+
+def busy_loop(stop_event):
+    """CPU-bound workload for the sampler to find."""
+    while not stop_event.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def workload():
+    """Background thread running busy_loop until the test ends."""
+    stop_event = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stop_event,), name='workload')
+    thread.start()
+    yield thread
+    stop_event.set()
+    thread.join()
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """Fast-sampling profiler writing to tmp_path."""
+    profiler = SamplingProfiler(interval_ms=1, output_dir=str(tmp_path))
+    yield profiler
+    profiler.stop()
+
+
+@pytest.fixture
+def global_profiler(profiler, monkeypatch):
+    """Install ``profiler`` as the process-wide profiler."""
+    monkeypatch.setattr(profiler_module, '_profiler_instance', profiler)
+    return profiler
+
+
+class TestSamplingProfiler:
+    """Tests for sampling, bounds and reports."""
+
+    def test_finds_hot_function(self, profiler, workload):
+        """Test the busy thread's function dominates its stacks."""
+        profiler.start()
+        time.sleep(0.2)
+        report = profiler.stop()
+
+        assert report.ticks > 0
+        assert report.samples >= report.ticks
+        total = dict(report.top_total)
+        assert total.get('test_profiler.py:busy_loop', 0) > 0
+
+    def test_writes_collapsed_stacks_and_summary(self, profiler, workload, tmp_path):
+        """Test stop() writes a .folded and a .txt file to the output dir."""
+        profiler.start()
+        time.sleep(0.1)
+        report = profiler.stop()
+
+        assert report.collapsed_path.parent == tmp_path
+        lines = report.collapsed_path.read_text().splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(' ', 1)
+        assert int(count) > 0
+        assert any(line.startswith('workload;') for line in lines)
+        summary = report.summary_path.read_text()
+        assert 'by self samples' in summary
+        assert 'by total samples' in summary
+
+    def test_max_stacks_bounds_memory(self, tmp_path, workload):
+        """Test stacks beyond max_stacks are folded into one overflow entry."""
+        profiler = SamplingProfiler(interval_ms=1, max_stacks=1, output_dir=str(tmp_path))
+        profiler.start()
+        time.sleep(0.1)
+        report = profiler.stop()
+
+        lines = report.collapsed_path.read_text().splitlines()
+        assert report.overflow_samples > 0
+        assert any(OVERFLOW_FRAME in line for line in lines)
+        # One real stack plus at most one overflow entry per thread
+        assert len([line for line in lines if OVERFLOW_FRAME not in line]) == 1
+
+    def test_max_depth_truncates_stacks(self, tmp_path, workload):
+        """Test stacks keep at most max_depth frames (plus the thread name)."""
+        profiler = SamplingProfiler(interval_ms=1, max_depth=2, output_dir=str(tmp_path))
+        profiler.start()
+        time.sleep(0.05)
+        report = profiler.stop()
+
+        for line in report.collapsed_path.read_text().splitlines():
+            assert len(line.rsplit(' ', 1)[0].split(';')) <= 3
+
+    def test_start_stop_idempotent(self, profiler):
+        """Test double start and stop-when-idle are harmless."""
+        assert profiler.stop() is None
+        assert profiler.start() is True
+        assert profiler.start() is False
+        assert profiler.is_running
+        assert profiler.stop() is not None
+        assert not profiler.is_running
+
+    def test_invalid_interval(self):
+        """Test a non-positive interval is rejected."""
+        with pytest.raises(ValueError):
+            SamplingProfiler(interval_ms=0)
+
+    def test_from_config(self, tmp_path):
+        """Test settings come from monitoring.profiling."""
+        settings = {
+            'monitoring.profiling.interval_ms': 20,
+            'monitoring.profiling.max_stacks': 100,
+            'monitoring.profiling.path': str(tmp_path),
+        }
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+
+        profiler = SamplingProfiler.from_config(config)
+
+        assert profiler.interval_ms == 20
+        assert profiler.max_stacks == 100
+        assert profiler.max_depth == 64
+        assert profiler.output_dir == tmp_path
+
+
+class TestProfileSignal:
+    """Tests for the signal trigger."""
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGUSR2'), reason='SIGUSR2 not available')
+    def test_signal_toggles_profiler(self, global_profiler):
+        """Test each signal starts/stops the process-wide profiler."""
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: (
+            'usr2' if key == 'monitoring.profiling.signal' else default
+        )
+        toggled_on = []
+        toggle = global_profiler.toggle
+
+        def record_toggle():
+            toggled_on.append(threading.current_thread().name)
+            return toggle()
+
+        global_profiler.toggle = record_toggle
+        previous = signal.getsignal(signal.SIGUSR2)
+        try:
+            assert install_profile_signal(config) is True
+
+            os.kill(os.getpid(), signal.SIGUSR2)
+            time.sleep(0.05)
+            assert global_profiler.is_running
+
+            os.kill(os.getpid(), signal.SIGUSR2)
+            time.sleep(0.05)
+            assert not global_profiler.is_running
+        finally:
+            signal.signal(signal.SIGUSR2, previous)
+        # Start/stop run on the control thread, never in the handler
+        assert toggled_on == ['obra-profiler-control'] * 2
+
+    def test_not_installed_without_config(self):
+        """Test no handler is installed unless a signal is configured."""
+        config = Mock()
+        config.get.return_value = None
+
+        assert install_profile_signal(config) is False
+
+    def test_get_profiler_is_shared(self, global_profiler):
+        """Test REPL and signal handler share one profiler."""
+        assert get_profiler() is global_profiler
+        assert get_profiler(Mock()) is global_profiler
@@ -0,0 +1,226 @@
+"""Unit tests for span tracing."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import trace_show
+from src.monitoring.tracing import (
+    NOOP_SPAN, JsonlSpanExporter, SpanExporter, Tracer, folded_stacks,
+    get_tracer, initialize_tracing, load_task_traces, set_tracer,
+    stage_breakdown, trace_file, traced
+)
+
+
+class RecordingExporter(SpanExporter):
+    """Exporter keeping finished traces in memory."""
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+@pytest.fixture
+def exporter():
+    """In-memory exporter."""
+    return RecordingExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    """Tracer installed as the global tracer for the test."""
+    tracer = Tracer(exporter)
+    previous = set_tracer(tracer)
+    yield tracer
+    set_tracer(previous)
+
+
+class TestTracer:
+    """Tests for span creation and nesting."""
+
+    def test_disabled_by_default(self):
+        """Test the default global tracer records nothing."""
+        tracer = Tracer()
+
+        with tracer.span('task', task_id=1) as span:
+            assert span is NOOP_SPAN
+            assert tracer.current_span() is None
+
+    def test_nested_spans_share_trace(self, tracer, exporter):
+        """Test children link to their parent and export with the root."""
+        with tracer.span('task', task_id=1):
+            with tracer.span('iteration', iteration=1):
+                with tracer.span('agent.send_prompt'):
+                    pass
+
+        assert len(exporter.traces) == 1
+        task, iteration, agent = exporter.traces[0]
+        assert {s.trace_id for s in (task, iteration, agent)} == {task.trace_id}
+        assert iteration.parent_span_id == task.span_id
+        assert agent.parent_span_id == iteration.span_id
+        assert agent.path == ['task', 'iteration', 'agent.send_prompt']
+        assert task.parent_span_id is None
+        assert len(task.trace_id) == 32 and len(task.span_id) == 16
+
+    def test_self_time_excludes_children(self, tracer, exporter):
+        """Test self time subtracts child span time."""
+        with tracer.span('task'):
+            with tracer.span('child'):
+                pass
+
+        task, child = exporter.traces[0]
+        assert task.child_ns == child.end_ns - child.start_ns
+        assert task.self_ms == pytest.approx(task.duration_ms - child.duration_ms)
+
+    def test_exception_marks_span_error(self, tracer, exporter):
+        """Test an exception is recorded and re-raised."""
+        with pytest.raises(ValueError):
+            with tracer.span('task'):
+                raise ValueError('boom')
+
+        span = exporter.traces[0][0]
+        assert span.status == 'ERROR'
+        assert 'boom' in span.status_message
+        assert tracer.current_span() is None
+
+    def test_to_thread_keeps_parent(self, tracer, exporter):
+        """Test spans opened in asyncio.to_thread workers nest under the caller."""
+        @traced('validation.quality')
+        def validate():
+            return threading.current_thread()
+
+        async def run():
+            with tracer.span('task'):
+                return await asyncio.to_thread(validate)
+
+        worker = asyncio.run(run())
+
+        task, quality = exporter.traces[0]
+        assert worker is not threading.current_thread()
+        assert quality.parent_span_id == task.span_id
+
+    def test_use_span_adopts_parent_across_threads(self, tracer, exporter):
+        """Test use_span parents spans on another thread explicitly."""
+        def worker(parent):
+            with tracer.use_span(parent):
+                with tracer.span('iteration'):
+                    pass
+
+        with tracer.span('task') as task_span:
+            thread = threading.Thread(target=worker, args=(task_span,))
+            thread.start()
+            thread.join()
+
+        task, iteration = exporter.traces[0]
+        assert iteration.parent_span_id == task.span_id
+
+    def test_export_failure_is_logged(self, tracer, exporter):
+        """Test a failing exporter doesn't break the traced code."""
+        def fail(spans):
+            raise OSError('disk full')
+        exporter.export = fail
+
+        with tracer.span('task'):
+            pass
+
+        assert tracer.current_span() is None
+
+
+class TestJsonlExport:
+    """Tests for JSONL trace files and their analysis."""
+
+    def test_one_file_per_task(self, tmp_path):
+        """Test runs of a task append to task_<id>.jsonl as separate traces."""
+        tracer = Tracer(JsonlSpanExporter(str(tmp_path)))
+        for _ in range(2):
+            with tracer.span('task', task_id=7):
+                with tracer.span('iteration', iteration=1):
+                    pass
+
+        lines = trace_file(str(tmp_path), 7).read_text().splitlines()
+        first = json.loads(lines[0])
+        assert len(lines) == 4
+        assert first['name'] == 'task'
+        assert first['path'] == 'task'
+        assert first['status'] == {'code': 'OK', 'message': None}
+        assert json.loads(lines[1])['path'] == 'task;iteration'
+
+        runs = load_task_traces(str(tmp_path), 7)
+        assert len(runs) == 2
+        assert runs[0][0]['traceId'] != runs[1][0]['traceId']
+
+    def test_stage_breakdown_and_folded_stacks(self):
+        """Test self time aggregates per stage and per stack."""
+        spans = [
+            {'name': 'task', 'path': 'task', 'durationMs': 10.0, 'selfMs': 1.0},
+            {'name': 'agent.send_prompt', 'path': 'task;agent.send_prompt', 'durationMs': 6.0, 'selfMs': 6.0},
+            {'name': 'agent.send_prompt', 'path': 'task;agent.send_prompt', 'durationMs': 3.0, 'selfMs': 3.0},
+        ]
+
+        breakdown = stage_breakdown(spans)
+
+        assert breakdown[0] == {'name': 'agent.send_prompt', 'count': 2, 'total_ms': 9.0, 'self_ms': 9.0}
+        assert folded_stacks(spans) == ['task 1000', 'task;agent.send_prompt 9000']
+
+    def test_initialize_tracing(self, tmp_path):
+        """Test config selects the exporter and disabled config stays no-op."""
+        previous = get_tracer()
+        try:
+            tracer = initialize_tracing({'monitoring': {'tracing': {'enabled': True, 'path': str(tmp_path)}}})
+            assert tracer.enabled
+            assert isinstance(tracer.exporter, JsonlSpanExporter)
+            assert get_tracer() is tracer
+
+            assert not initialize_tracing({}).enabled
+        finally:
+            set_tracer(previous)
+
+
+class TestTraceShowCommand:
+    """Tests for `obra trace show`."""
+
+    def record(self, directory):
+        tracer = Tracer(JsonlSpanExporter(str(directory)))
+        with tracer.span('task', task_id=3) as task_span:
+            with tracer.span('iteration', iteration=1) as iteration_span:
+                with tracer.span('agent.send_prompt'):
+                    pass
+                iteration_span.set_attribute('action', 'proceed')
+            task_span.set_attribute('status', 'completed')
+            task_span.set_attribute('iterations', 1)
+
+    def test_show_tree_and_breakdown(self, tmp_path):
+        """Test the timeline and the per-stage table."""
+        self.record(tmp_path)
+
+        result = CliRunner().invoke(trace_show, ['3', '--path', str(tmp_path)], obj={})
+
+        assert result.exit_code == 0, result.output
+        assert 'Status: completed, 1 iterations' in result.output
+        assert 'iteration [1] action=proceed' in result.output
+        assert 'agent.send_prompt' in result.output
+        assert 'Stage breakdown' in result.output
+
+    def test_show_folded(self, tmp_path):
+        """Test --folded prints collapsed stacks."""
+        self.record(tmp_path)
+
+        result = CliRunner().invoke(trace_show, ['3', '--path', str(tmp_path), '--folded'], obj={})
+
+        assert result.exit_code == 0
+        for line in result.output.splitlines():
+            stack, micros = line.rsplit(' ', 1)
+            assert stack.startswith('task')
+            assert int(micros) >= 0
+
+    def test_show_missing_task(self, tmp_path):
+        """Test a helpful message when the task has no trace."""
+        result = CliRunner().invoke(trace_show, ['99', '--path', str(tmp_path)], obj={})
+
+        assert result.exit_code == 1
+        assert 'No trace recorded for task 99' in result.output
@@ -13,6 +13,7 @@ Created: 2025-01-15
 """
 
 import pytest
+import yaml
 import tempfile
 from pathlib import Path
 
@@ -336,6 +337,39 @@ def test_get_working_memory_config(config_path):
     assert config['max_tokens'] == 5120  # 64000 * 0.08
 
 
+@pytest.mark.parametrize('context_size,policy', [
+    (4000, 'gdsf'),
+    (16000, 'gdsf'),
+    (64000, 'lru'),
+    (200000, 'lru'),
+    (1000000, 'fifo'),
+])
+def test_working_memory_eviction_policy_by_profile(config_path, context_size, policy):
+    """Test each profile selects a working memory eviction policy."""
+    optimizer = AdaptiveOptimizer(context_window_size=context_size, config_path=config_path)
+
+    config = optimizer.get_working_memory_config()
+
+    assert config['eviction_policy'] == policy
+    assert config['pinned_types'] == ['decision']
+
+
+def test_eviction_policy_defaults_to_fifo(tmp_path):
+    """Test profiles without eviction settings keep FIFO eviction."""
+    with open('config/optimization_profiles.yaml') as f:
+        profiles = yaml.safe_load(f)
+    for profile in profiles['profiles'].values():
+        profile.pop('eviction_policy')
+        profile.pop('pinned_operation_types')
+    path = tmp_path / 'profiles.yaml'
+    path.write_text(yaml.safe_dump(profiles))
+
+    config = AdaptiveOptimizer(context_window_size=16000, config_path=str(path)).get_working_memory_config()
+
+    assert config['eviction_policy'] == 'fifo'
+    assert config['pinned_types'] == []
+
+
 def test_get_pruning_config(config_path):
     """Test get_pruning_config."""
     optimizer = AdaptiveOptimizer(context_window_size=64000, config_path=config_path)
@@ -0,0 +1,230 @@
+"""Unit tests for ArtifactStore.
+
+Tests cover:
+- Content addressing and deduplication
+- Compression codecs
+- Streaming, memory-mapped and range reads
+- Reference counting and garbage collection
+"""
+
+import mmap
+
+import pytest
+
+from src.orchestration.memory.artifact_store import (
+    ArtifactStore,
+    ArtifactStoreException,
+    ZSTD_AVAILABLE
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a gzip-compressed store."""
+    return ArtifactStore(tmp_path / 'artifacts', compression='gzip')
+
+
+@pytest.fixture
+def raw_store(tmp_path):
+    """Create an uncompressed (memory-mapped) store."""
+    return ArtifactStore(tmp_path / 'raw', compression='none')
+
+
+PAYLOAD = b''.join(f'line {i}: {"x" * 40}\n'.encode() for i in range(2000))
+
+
+# ============================================================================
+# Test: Content addressing
+# ============================================================================
+
+def test_put_get_roundtrip(store):
+    """Test stored bytes read back unchanged."""
+    digest = store.put(PAYLOAD)
+
+    assert len(digest) == 64
+    assert store.contains(digest)
+    assert store.get(digest) == PAYLOAD
+
+
+def test_identical_content_stored_once(store):
+    """Test storing the same content again only adds a reference."""
+    first = store.put_json({'id': 'a', 'data': 'x' * 5000})
+    second = store.put_json({'data': 'x' * 5000, 'id': 'a'})  # key order differs
+
+    stats = store.stats()
+    assert first == second
+    assert stats['blobs'] == 1
+    assert stats['references'] == 2
+    assert len(list((store.root / 'objects').glob('*/*'))) == 1
+
+
+def test_compression_reduces_stored_size(store):
+    """Test compressible blobs are stored compressed."""
+    digest = store.put(PAYLOAD)
+
+    assert store.path(digest).suffix == '.gz'
+    assert store.stats()['stored_bytes'] < len(PAYLOAD) // 5
+
+
+def test_small_blobs_not_compressed(store):
+    """Test blobs under min_compress_bytes are stored raw."""
+    digest = store.put(b'tiny')
+
+    assert store.path(digest).suffix == '.raw'
+    assert store.get(digest) == b'tiny'
+
+
+@pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+def test_zstd_roundtrip(tmp_path):
+    """Test zstd-compressed blobs read back and support range reads."""
+    store = ArtifactStore(tmp_path / 'zstd', compression='zstd')
+    digest = store.put(PAYLOAD)
+
+    assert store.path(digest).suffix == '.zst'
+    assert store.get(digest) == PAYLOAD
+    assert store.read_range(digest, 1000, 50) == PAYLOAD[1000:1050]
+
+
+def test_unknown_codec_raises(tmp_path):
+    """Test an unknown compression codec is rejected."""
+    with pytest.raises(ArtifactStoreException):
+        ArtifactStore(tmp_path / 'bad', compression='lzma')
+
+
+# ============================================================================
+# Test: Reads
+# ============================================================================
+
+@pytest.mark.parametrize('fixture_name', ['store', 'raw_store'])
+def test_read_range(request, fixture_name):
+    """Test range reads for compressed (streamed) and raw (mmap) blobs."""
+    target = request.getfixturevalue(fixture_name)
+    digest = target.put(PAYLOAD)
+
+    assert target.read_range(digest, 70000, 100) == PAYLOAD[70000:70100]
+    assert target.read_range(digest, len(PAYLOAD) - 10, 100) == PAYLOAD[-10:]
+    assert target.read_range(digest, len(PAYLOAD) + 5, 10) == b''
+
+
+def test_view_is_memory_mapped_for_raw_blobs(raw_store):
+    """Test view() maps uncompressed blobs instead of reading them."""
+    digest = raw_store.put(PAYLOAD)
+
+    with raw_store.view(digest) as data:
+        assert isinstance(data.obj, mmap.mmap)
+        assert bytes(data[:7]) == b'line 0:'
+
+
+def test_open_streams_content(store):
+    """Test open() yields the decompressed content as a stream."""
+    digest = store.put(PAYLOAD)
+
+    with store.open(digest) as stream:
+        assert stream.readline() == PAYLOAD.split(b'\n')[0] + b'\n'
+
+
+def test_unknown_digest_raises(store):
+    """Test reading an unknown digest raises."""
+    with pytest.raises(ArtifactStoreException):
+        store.get('0' * 64)
+
+
+# ============================================================================
+# Test: Reference counting and GC
+# ============================================================================
+
+def test_gc_removes_only_unreferenced(store):
+    """Test gc() deletes blobs whose references were all released."""
+    kept = store.put(b'kept' * 1000)
+    dropped = store.put(b'dropped' * 1000)
+    store.addref(dropped)
+
+    assert store.release(dropped) == 1
+    assert store.gc()['blobs_removed'] == 0
+
+    assert store.release(dropped) == 0
+    result = store.gc()
+
+    assert result['blobs_removed'] == 1
+    assert result['bytes_freed'] > 0
+    assert not store.contains(dropped)
+    assert store.get(kept) == b'kept' * 1000
+
+
+def test_gc_removes_orphan_files(store):
+    """Test gc() deletes blob files missing from the index."""
+    orphan = store.root / 'objects' / 'ab' / ('ab' * 32 + '.gz')
+    orphan.parent.mkdir(parents=True, exist_ok=True)
+    orphan.write_bytes(b'partial')
+
+    assert store.gc()['blobs_removed'] == 1
+    assert not orphan.exists()
+
+
+def test_index_persists_across_processes(store):
+    """Test a store reopened from its index sees blobs and refcounts."""
+    digest = store.put(PAYLOAD)
+    store.addref(digest)
+
+    # Simulate a new process: drop the shared in-process state
+    from src.orchestration.memory import artifact_store
+    artifact_store._shared_state.clear()
+    reopened = ArtifactStore(store.root, compression='gzip')
+
+    assert reopened.get(digest) == PAYLOAD
+    assert reopened.stats()['references'] == 2
+
+
+def test_changes_append_to_journal(store, monkeypatch):
+    """Test put/addref/release append to the journal instead of rewriting the index."""
+    from src.orchestration.memory import artifact_store
+    digest = store.put(PAYLOAD)
+    store.addref(digest)
+    store.release(digest)
+
+    assert not (store.root / 'index.json').exists()
+    assert len((store.root / 'index.journal').read_text().splitlines()) == 3
+
+    # Past the threshold, the journal is folded into index.json
+    monkeypatch.setattr(artifact_store, '_JOURNAL_COMPACT_MIN_LINES', 4)
+    for i in range(3):
+        store.put(f'blob {i}'.encode())
+
+    assert (store.root / 'index.json').exists()
+    assert len((store.root / 'index.journal').read_text().splitlines()) == 1
+    artifact_store._shared_state.clear()
+    reopened = ArtifactStore(store.root, compression='gzip')
+    assert reopened.stats()['blobs'] == 4
+    assert reopened.stats()['references'] == 4
+
+
+def test_torn_journal_line_ignored(store):
+    """Test an interrupted journal append doesn't break reopening."""
+    from src.orchestration.memory import artifact_store
+    digest = store.put(PAYLOAD)
+    with open(store.root / 'index.journal', 'a') as f:
+        f.write('{"digest": "ab')
+
+    artifact_store._shared_state.clear()
+    reopened = ArtifactStore(store.root, compression='gzip')
+    other = reopened.put(b'after' * 500)
+
+    artifact_store._shared_state.clear()
+    reopened = ArtifactStore(store.root, compression='gzip')
+    assert reopened.get(digest) == PAYLOAD
+    assert reopened.contains(other)
+
+
+def test_instances_share_index(store):
+    """Test two instances on one root don't overwrite each other's entries."""
+    other = ArtifactStore(store.root, compression='gzip')
+
+    first = store.put(b'first' * 500)
+    second = other.put(b'second' * 500)
+
+    assert store.contains(second)
+    assert other.contains(first)
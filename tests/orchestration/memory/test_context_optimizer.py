@@ -21,7 +21,8 @@ from unittest.mock import Mock, patch
 from src.orchestration.memory.context_optimizer import (
     ContextOptimizer,
     ContextOptimizerException,
-    OptimizationResult
+    OptimizationResult,
+    SizedContext
 )
 
 
@@ -300,6 +301,37 @@ def test_externalize_large_artifacts(optimizer, temp_dirs):
     assert external_file.exists()
 
 
+def test_externalize_deduplicates_identical_artifacts(optimizer):
+    """Test the same artifact externalized twice is stored once and loads back."""
+    artifact = {'id': 'snapshot', 'data': 'x' * 10000}
+    context = {'artifacts': [dict(artifact), dict(artifact)]}
+
+    optimized, count = optimizer._externalize_large_artifacts(context)
+
+    first, second = optimized['artifacts']
+    assert count == 2
+    assert first['_digest'] == second['_digest']
+    assert optimizer.artifact_store.stats()['blobs'] == 1
+    assert optimizer.load_external(first) == artifact
+
+
+def test_release_external_allows_gc(optimizer):
+    """Test releasing a discarded context's references lets gc() reclaim blobs."""
+    context = {'artifacts': [{'id': 'big', 'data': 'x' * 10000}]}
+    optimized, _ = optimizer._externalize_large_artifacts(context)
+
+    assert optimizer.release_external(optimized) == 1
+    assert optimizer.artifact_store.gc()['blobs_removed'] == 1
+
+
+def test_load_external_legacy_file(optimizer, temp_dirs):
+    """Test references to pre-store JSON files still load."""
+    legacy = Path(temp_dirs['artifact_dir']) / 'old.json'
+    legacy.write_text(json.dumps({'id': 'old'}))
+
+    assert optimizer.load_external({'_external_ref': legacy.as_posix()}) == {'id': 'old'}
+
+
 def test_externalize_keeps_small_artifacts(optimizer):
     """Test that small artifacts are not externalized."""
     context = {
@@ -470,6 +502,91 @@ def test_optimize_context_with_errors(optimizer):
     # assert len(result.errors) > 0  # Might have errors
 
 
+# ============================================================================
+# Test: SizedContext
+# ============================================================================
+
+def test_sized_context_matches_json_length(sample_context):
+    """Test cached sizes add up to the full serialization."""
+    sample_context[7] = 'non-string key'
+    sample_context['empty'] = []
+    sized = SizedContext(sample_context)
+
+    assert sized.chars == len(json.dumps(sample_context))
+    assert sized.tokens == ContextOptimizer._estimate_tokens(None, sample_context)
+
+
+def test_sized_context_mutations_stay_exact(sample_context):
+    """Test set/pop/select/replace keep the total exact without re-measuring kept data."""
+    sized = SizedContext(sample_context)
+    sized.tokens
+    measured = sized.measurements
+
+    sized.select_items('errors', [3, 1, 0])
+    sized.pop('full_state')
+    assert sized.measurements == measured
+
+    sized.replace_items('phases', {0: {'phase_id': 'phase_1', 'summary': 'done'}})
+    sized.set('state_delta', {'checkpoint_id': 'latest'})
+
+    assert sized.measurements == measured + 2
+    assert sized.chars == len(json.dumps(sample_context))
+    assert [e['error'] for e in sample_context['errors']] == ['old_error_1', 'error_2', 'error_1']
+
+
+def test_sized_context_invalidate_after_direct_mutation(sample_context):
+    """Test invalidate() picks up changes made to the dict directly."""
+    sized = SizedContext(sample_context)
+    sized.tokens
+
+    sample_context['task_id'] = 'x' * 400
+    sized.invalidate('task_id')
+
+    assert sized.chars == len(json.dumps(sample_context))
+
+
+def test_sized_context_unserializable_fallback():
+    """Test unserializable values give the _estimate_tokens fallback until removed."""
+    context = {'ok': 'value', 'items': [1, object()]}
+    sized = SizedContext(context)
+
+    assert sized.tokens == 1000
+    assert sized.item_tokens('items')[1] == 1000
+
+    sized.select_items('items', [0])
+
+    assert sized.tokens == max(len(json.dumps(context)) // 4, 1)
+
+
+def test_externalize_reuses_cached_artifact_sizes(optimizer):
+    """Test externalization decides from cached sizes, measuring only new refs."""
+    context = {
+        'artifacts': [
+            {'id': f'artifact_{i}', 'data': 'x' * (10000 if i % 2 else 10)}
+            for i in range(6)
+        ]
+    }
+    sized = SizedContext(context)
+    tokens_before = sized.tokens
+    measured = sized.measurements
+
+    context, count = optimizer._externalize_large_artifacts(context, sized)
+
+    assert count == 3
+    assert sized.measurements == measured + 3
+    assert sized.tokens == optimizer._estimate_tokens(context) < tokens_before
+
+
+def test_optimize_context_token_counts_exact(optimizer, sample_context):
+    """Test incremental accounting reports the same counts as full serialization."""
+    expected_before = optimizer._estimate_tokens(sample_context)
+
+    result = optimizer.optimize_context(sample_context)
+
+    assert result.tokens_before == expected_before
+    assert result.tokens_after == optimizer._estimate_tokens(sample_context)
+
+
 # ============================================================================
 # Test: OptimizationResult
 # ============================================================================
@@ -0,0 +1,225 @@
+"""Unit tests for working memory eviction policies.
+
+Tests cover:
+- Victim selection for fifo, lru, gdsf and priority policies
+- Pinned operation types
+- Retention reporting
+- WorkingMemory integration (accesses via get_operations/search)
+"""
+
+import pytest
+
+from src.orchestration.memory.eviction_policy import (
+    EVICTION_POLICIES,
+    create_eviction_policy
+)
+from src.orchestration.memory.working_memory import (
+    OperationRecord,
+    WorkingMemory,
+    WorkingMemoryException
+)
+
+
+def make_record(seq, op_type='task', tokens=10):
+    """Create a record with a given sequence number."""
+    record = OperationRecord(op_type, f'op_{seq}', tokens)
+    record.seq = seq
+    return record
+
+
+def fill(policy, records):
+    """Add records to a policy and return them by seq."""
+    for record in records:
+        policy.on_add(record)
+    return {record.seq: record for record in records}
+
+
+def memory_with(policy, **overrides):
+    """WorkingMemory with 4 operations / 100 tokens and the given policy."""
+    config = {'context_window': 16000, 'max_operations': 4, 'max_tokens': 100,
+              'eviction_policy': policy}
+    config.update(overrides)
+    return WorkingMemory(config)
+
+
+def add(memory, name, tokens=10, op_type='task'):
+    memory.add_operation({'type': op_type, 'operation': name, 'tokens': tokens})
+
+
+def names(memory):
+    return [op['operation'] for op in memory.get_all_operations()]
+
+
+# ============================================================================
+# Test: Victim selection
+# ============================================================================
+
+def test_fifo_evicts_in_arrival_order():
+    """Test FIFO returns the oldest record first, ignoring accesses."""
+    policy = create_eviction_policy('fifo')
+    records = fill(policy, [make_record(i) for i in range(3)])
+
+    policy.on_access(records[0])
+
+    assert [policy.select_victim() for _ in range(3)] == [0, 1, 2]
+
+
+def test_lru_evicts_least_recently_accessed():
+    """Test LRU moves accessed records to the back."""
+    policy = create_eviction_policy('lru')
+    records = fill(policy, [make_record(i) for i in range(3)])
+
+    policy.on_access(records[0])
+
+    assert [policy.select_victim() for _ in range(3)] == [1, 2, 0]
+
+
+def test_gdsf_prefers_large_rarely_used():
+    """Test GDSF evicts the large operation before small or frequently used ones."""
+    policy = create_eviction_policy('gdsf')
+    records = fill(policy, [
+        make_record(0, tokens=10),
+        make_record(1, tokens=1000),
+        make_record(2, tokens=10),
+    ])
+    policy.on_access(records[2])
+
+    assert [policy.select_victim() for _ in range(3)] == [1, 0, 2]
+
+
+def test_gdsf_ages_stale_entries():
+    """Test inflation lets new operations outrank old unused ones."""
+    policy = create_eviction_policy('gdsf')
+    fill(policy, [make_record(0, tokens=10), make_record(1, tokens=20)])
+
+    assert policy.select_victim() == 1  # score 1/20 < 1/10
+
+    # Inflation is now 1/20, so the new record scores 1/20 + 1/10
+    # and outranks record 0 (1/10) despite being the same size
+    fill(policy, [make_record(2, tokens=10)])
+    assert policy.select_victim() == 0
+
+
+@pytest.mark.parametrize('name', sorted(EVICTION_POLICIES))
+def test_pinned_types_evicted_last(name):
+    """Test every policy evicts pinned types only after all others."""
+    policy = create_eviction_policy(name, pinned_types=['decision'])
+    fill(policy, [
+        make_record(0, op_type='decision', tokens=1000),
+        make_record(1),
+        make_record(2),
+    ])
+
+    victims = [policy.select_victim() for _ in range(3)]
+
+    assert victims[-1] == 0
+
+
+def test_priority_pins_decisions_by_default():
+    """Test the priority policy keeps decisions without configuration."""
+    policy = create_eviction_policy('priority')
+
+    assert policy.pinned_types == frozenset({'decision'})
+
+
+def test_unknown_policy_raises():
+    """Test unknown policy names are rejected."""
+    with pytest.raises(ValueError, match='Unknown eviction policy'):
+        create_eviction_policy('random')
+    with pytest.raises(WorkingMemoryException):
+        memory_with('random')
+
+
+def test_heap_compaction_keeps_order():
+    """Test repeated accesses don't grow the heap without bound."""
+    policy = create_eviction_policy('lru')
+    records = fill(policy, [make_record(i) for i in range(5)])
+
+    for _ in range(200):
+        policy.on_access(records[1])
+
+    assert len(policy._heap) <= 2 * 5 + 64 + 1
+    assert [policy.select_victim() for _ in range(5)] == [0, 2, 3, 4, 1]
+
+
+# ============================================================================
+# Test: WorkingMemory integration
+# ============================================================================
+
+def test_default_policy_is_fifo():
+    """Test WorkingMemory evicts FIFO unless configured otherwise."""
+    memory = WorkingMemory({'context_window': 16000})
+
+    assert memory.eviction_policy.name == 'fifo'
+    assert memory.get_status()['eviction_policy'] == 'fifo'
+
+
+def test_lru_keeps_operations_read_via_get_operations():
+    """Test operations returned by get_operations survive LRU eviction."""
+    memory = memory_with('lru')
+    add(memory, 'a', op_type='decision')
+    for name in ('b', 'c', 'd'):
+        add(memory, name)
+
+    memory.get_operations(operation_type='decision')
+    add(memory, 'e')
+
+    assert names(memory) == ['a', 'c', 'd', 'e']
+
+
+def test_lru_keeps_operations_found_by_search():
+    """Test search matches count as accesses."""
+    memory = memory_with('lru')
+    for name in ('alpha', 'b', 'c', 'd'):
+        add(memory, name)
+
+    memory.search('alpha')
+    add(memory, 'e')
+
+    assert names(memory) == ['alpha', 'c', 'd', 'e']
+
+
+def test_gdsf_evicts_large_operation_to_fit_budget():
+    """Test one large stale operation goes instead of several small ones."""
+    memory = memory_with('gdsf')
+    add(memory, 'big', tokens=70)
+    add(memory, 'small_1')
+    add(memory, 'small_2')
+    add(memory, 'small_3', tokens=15)  # 105 > 100: one eviction needed
+
+    assert names(memory) == ['small_1', 'small_2', 'small_3']
+
+    fifo = memory_with('fifo')
+    add(fifo, 'small_1')
+    add(fifo, 'small_2')
+    add(fifo, 'big', tokens=70)
+    add(fifo, 'small_3', tokens=15)
+    assert names(fifo) == ['small_2', 'big', 'small_3']
+
+
+def test_eviction_report():
+    """Test the report tracks evicted tokens and budget retained."""
+    memory = memory_with('fifo')
+    for name in ('a', 'b', 'c', 'd', 'e'):
+        add(memory, name, tokens=20)
+
+    report = memory.get_eviction_report()
+
+    assert report['policy'] == 'fifo'
+    assert report['evictions'] == 1
+    assert report['evicted_tokens'] == 20
+    assert report['token_retention'] == pytest.approx(80 / 100)
+    assert report['budget_used'] == pytest.approx(0.8)
+    assert report['budget_after_eviction'] == pytest.approx(0.8)
+
+
+def test_load_state_uses_policy():
+    """Test restored operations are tracked by the policy."""
+    memory = memory_with('priority')
+    entries = [(i, {'type': 'decision' if i == 0 else 'task', 'operation': f'op_{i}',
+                    'tokens': 10}) for i in range(4)]
+
+    memory.load_state(entries, next_seq=4)
+    add(memory, 'op_4')
+
+    assert names(memory) == ['op_0', 'op_2', 'op_3', 'op_4']
@@ -12,6 +12,7 @@ Created: 2025-01-15
 Version: 1.0.0
 """
 
+import json
 import pytest
 import tempfile
 import shutil
@@ -19,6 +20,7 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime, timezone
 
+from src.orchestration.memory.artifact_store import ArtifactStore
 from src.orchestration.memory.memory_manager import (
     MemoryManager,
     MemoryManagerException
@@ -361,6 +363,155 @@ class TestMemoryManagerCheckpointing:
         assert len(operations) == 1
         assert operations[0]['data']['id'] == 1
 
+    def test_checkpoints_append_deltas(self, manager):
+        """Test later checkpoints append only new operations to the log."""
+        for i in range(5):
+            manager.add_operation({'type': 'task', 'data': {'id': i}, 'tokens': 100})
+        first = manager.checkpoint(path=str(Path(manager.checkpoint_dir) / 'a.json'))
+        manager.add_operation({'type': 'task', 'data': {'id': 5}, 'tokens': 100})
+        second = manager.checkpoint(path=str(Path(manager.checkpoint_dir) / 'b.json'))
+
+        with open(second) as f:
+            wm_data = json.load(f)['working_memory']
+        log_path = Path(manager.checkpoint_dir) / wm_data['log_path']
+        segments = [json.loads(line) for line in log_path.read_text().splitlines()]
+
+        assert [seg['kind'] for seg in segments] == ['base', 'delta']
+        assert len(segments[0]['operations']) == 5
+        assert [op['data']['id'] for _, op in segments[1]['operations']] == [5]
+
+        # Each checkpoint restores the state it was taken at
+        for path, expected in ((first, [4, 3, 2, 1, 0]), (second, [5, 4, 3, 2, 1, 0])):
+            restored = MemoryManager(
+                model_config={'context_window': 128000},
+                config={'checkpoint_dir': manager.checkpoint_dir}
+            )
+            restored.restore(path)
+            assert [op['data']['id'] for op in restored.get_recent_operations()] == expected
+
+    def test_checkpoint_delta_records_evictions(self, manager):
+        """Test operations evicted between checkpoints are removed on restore."""
+        limit = manager.working_memory.max_operations
+        for i in range(limit):
+            manager.add_operation({'type': 'task', 'data': {'id': i}, 'tokens': 1})
+        manager.checkpoint()
+        for i in range(limit, limit + 3):
+            manager.add_operation({'type': 'task', 'data': {'id': i}, 'tokens': 1})
+        path = manager.checkpoint(path=str(Path(manager.checkpoint_dir) / 'evicted.json'))
+
+        restored = MemoryManager(
+            model_config={'context_window': 128000},
+            config={'checkpoint_dir': manager.checkpoint_dir}
+        )
+        restored.restore(path)
+
+        assert restored.get_recent_operations() == manager.get_recent_operations()
+        assert restored.working_memory._current_tokens == manager.working_memory._current_tokens
+
+    def test_checkpoint_log_compaction(self, manager):
+        """Test the log restarts with a new base after the configured deltas."""
+        manager.config['checkpoint_compaction_segments'] = 2
+        paths = []
+        for i in range(7):
+            manager.add_operation({'type': 'task', 'data': {'id': i}, 'tokens': 10})
+            paths.append(manager.checkpoint(path=str(Path(manager.checkpoint_dir) / f'cp{i}.json')))
+
+        logs = sorted(Path(manager.checkpoint_dir).glob('checkpoint_log_*.jsonl'))
+        assert len(logs) == manager.config['checkpoint_log_generations']
+        assert json.loads(logs[-1].read_text().splitlines()[0])['kind'] == 'base'
+
+        manager.restore(paths[-1])
+        assert len(manager.get_recent_operations()) == 7
+
+        # Checkpoints whose log was compacted away are deleted with it
+        assert not Path(paths[0]).exists()
+        with pytest.raises(MemoryManagerException):
+            manager.restore(paths[0])
+
+    def test_oldest_surviving_checkpoint_restores(self, manager):
+        """Test every checkpoint left after compaction can still be restored."""
+        manager.config['checkpoint_compaction_segments'] = 2
+        paths = []
+        for i in range(12):
+            manager.add_operation({'type': 'task', 'data': {'id': i}, 'tokens': 10})
+            paths.append(manager.checkpoint(path=str(Path(manager.checkpoint_dir) / f'cp{i}.json')))
+
+        surviving = [i for i, path in enumerate(paths) if Path(path).exists()]
+        assert 0 < surviving[0] < len(paths) - 1
+        assert surviving == list(range(surviving[0], len(paths)))
+
+        restored = MemoryManager(
+            model_config={'context_window': 128000},
+            config={'checkpoint_dir': manager.checkpoint_dir}
+        )
+        restored.restore(paths[surviving[0]])
+        assert len(restored.get_recent_operations()) == surviving[0] + 1
+
+    def test_restore_moved_checkpoint_dir(self, manager, tmp_path):
+        """Test checkpoints restore after the checkpoint directory is moved."""
+        manager.add_operation({'type': 'task', 'data': {'id': 1}, 'tokens': 10})
+        manager.checkpoint(path=str(Path(manager.checkpoint_dir) / 'moved.json'))
+        moved_dir = tmp_path / 'moved_checkpoints'
+        shutil.copytree(manager.checkpoint_dir, moved_dir)
+        for log in Path(manager.checkpoint_dir).glob('checkpoint_log_*.jsonl'):
+            log.unlink()
+
+        restored = MemoryManager(
+            model_config={'context_window': 128000},
+            config={'checkpoint_dir': str(moved_dir)}
+        )
+        restored.restore(str(moved_dir / 'moved.json'))
+
+        assert restored.get_recent_operations()[0]['data']['id'] == 1
+
+    def test_restore_inline_operations_checkpoint(self, manager):
+        """Test version 1.0.0 checkpoints with inline operations still restore."""
+        legacy_path = Path(manager.checkpoint_dir) / 'legacy.json'
+        legacy_path.write_text(json.dumps({
+            'version': '1.0.0',
+            'working_memory': {'operations': [
+                {'type': 'task', 'operation': 'task', 'data': {'id': 7}, 'tokens': 10}
+            ]},
+            'window_manager': {'used_tokens': 10},
+            'metadata': {'operation_count': 1}
+        }))
+
+        manager.restore(str(legacy_path))
+
+        assert manager.get_recent_operations()[0]['data']['id'] == 7
+
+    def test_restore_artifact_store_checkpoint(self, manager, tmp_path):
+        """Test version 1.1.0 checkpoints restore from their artifact store."""
+        store = ArtifactStore(tmp_path / 'blobs')
+        operations_ref = store.put_json([
+            {'type': 'task', 'operation': 'task', 'data': {'id': 9}, 'tokens': 10},
+            {'type': 'task', 'operation': 'task', 'data': {'id': 8}, 'tokens': 10},
+        ])
+        legacy_path = Path(manager.checkpoint_dir) / 'legacy.json'
+        legacy_path.write_text(json.dumps({
+            'version': '1.1.0',
+            'artifact_store': store.root.as_posix(),
+            'working_memory': {'operations_ref': operations_ref},
+            'window_manager': {'used_tokens': 20},
+            'metadata': {'operation_count': 2}
+        }))
+
+        manager.restore(str(legacy_path))
+
+        assert [op['data']['id'] for op in manager.get_recent_operations()] == [9, 8]
+
+    def test_restore_unknown_format_raises_error(self, manager):
+        """Test checkpoints without a recognized operations source are refused."""
+        unknown_path = Path(manager.checkpoint_dir) / 'unknown.json'
+        unknown_path.write_text(json.dumps({
+            'version': '9.0.0',
+            'working_memory': {'operations_blob': 'abc'},
+            'metadata': {'operation_count': 3}
+        }))
+
+        with pytest.raises(MemoryManagerException, match='Unsupported checkpoint format'):
+            manager.restore(str(unknown_path))
+
     def test_restore_nonexistent_checkpoint_raises_error(self, manager):
         """Test that restoring nonexistent checkpoint raises error."""
         with pytest.raises(MemoryManagerException):
@@ -394,6 +545,42 @@ class TestMemoryManagerCheckpointing:
         assert manager.should_checkpoint()
 
 
+    def test_superseded_context_artifacts_collected_on_checkpoint(self, tmp_path):
+        """Test artifacts only a superseded context referenced are deleted at checkpoint."""
+        manager = MemoryManager(
+            model_config={'context_window': 128000},
+            config={
+                'artifact_storage_path': str(tmp_path / 'artifacts'),
+                'archive_path': str(tmp_path / 'archive'),
+                'checkpoint_dir': str(tmp_path / 'checkpoints'),
+            }
+        )
+        manager.add_operation({'type': 'task', 'operation': 'run', 'tokens': 10})
+
+        def artifact(name):
+            return {'id': name, 'content': name * 100000}
+
+        first = manager.build_context({'artifacts': [artifact('a'), artifact('b')]})
+        kept, dropped = (ref['_digest'] for ref in first['artifacts'])
+        # The next context keeps 'a' (re-externalized) and carries 'b' over by reference
+        second = manager.build_context({'artifacts': [artifact('a'), first['artifacts'][1]]})
+        assert [ref['_digest'] for ref in second['artifacts']] == [kept, dropped]
+
+        manager.checkpoint()
+        store = manager.artifact_store
+        assert store.contains(kept) and store.contains(dropped)
+        assert manager.context_optimizer.load_external(second['artifacts'][1])['id'] == 'b'
+
+        manager.build_context({'artifacts': [artifact('a')]})
+        manager.checkpoint()
+        assert store.contains(kept)
+        assert not store.contains(dropped)
+
+        manager.clear()
+        manager.checkpoint()
+        assert store.stats()['blobs'] == 0
+
+
 class TestMemoryManagerStatus:
     """Test MemoryManager status reporting."""
 
@@ -452,6 +639,18 @@ class TestMemoryManagerEdgeCases:
         assert 'tokens' in recent[0]
         assert recent[0]['tokens'] > 0
 
+    def test_add_operation_does_not_modify_input(self):
+        """Test defaults are applied to the stored record, not the caller's dict."""
+        manager = MemoryManager(model_config={'context_window': 128000})
+        operation = {'type': 'task', 'data': {'title': 'x' * 400}}
+
+        manager.add_operation(operation)
+
+        assert operation == {'type': 'task', 'data': {'title': 'x' * 400}}
+        stored = manager.get_recent_operations(limit=1)[0]
+        assert stored['operation'] == 'unknown'
+        assert stored['tokens'] == len('{"title":"' + 'x' * 400 + '"}') // 4
+
     def test_clear_resets_state(self):
         """Test that clear resets working memory and usage."""
         manager = MemoryManager(model_config={'context_window': 128000})
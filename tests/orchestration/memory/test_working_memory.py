@@ -17,6 +17,7 @@ import threading
 import time
 from datetime import datetime
 from src.orchestration.memory.working_memory import (
+    OperationRecord,
     WorkingMemory,
     WorkingMemoryException
 )
@@ -554,6 +555,129 @@ def test_repr(working_memory):
     assert 'tokens=100/1120' in repr_str
 
 
+# ============================================================================
+# Test: Operation Records
+# ============================================================================
+
+def test_add_operation_does_not_modify_input(working_memory):
+    """Test the caller's dictionary is left untouched."""
+    op = {'type': 'task', 'operation': 'task_1', 'tokens': 10, 'data': {'id': 1}}
+
+    working_memory.add_operation(op)
+
+    assert op == {'type': 'task', 'operation': 'task_1', 'tokens': 10, 'data': {'id': 1}}
+    assert working_memory.get_all_operations()[0]['data'] == {'id': 1}
+
+
+def test_operation_record_roundtrip():
+    """Test records reproduce the operation dictionary they were built from."""
+    op = {
+        'type': 'task',
+        'operation': 'create_task',
+        'tokens': 42,
+        'timestamp': '2025-01-15T10:00:00.123456+00:00',
+        'data': {'title': 'Example', 'tags': ['a', 'b']},
+        'priority': 'high'
+    }
+
+    record = OperationRecord.from_dict(op)
+
+    assert record.to_dict() == op
+    assert record.timestamp == pytest.approx(1736935200.123456)
+    assert record._timestamp_raw is None  # reproducible from the float
+    assert record._extra == {'priority': 'high'}
+
+
+def test_operation_record_compact_fields():
+    """Test names are interned and JSON data is stored encoded."""
+    first = OperationRecord.from_dict({'type': ''.join(['ta', 'sk']), 'operation': 'x', 'data': {'id': 1}})
+    second = OperationRecord.from_dict({'type': 'task', 'operation': 'x'})
+
+    assert first.type is second.type
+    assert first._payload == b'{"id":1}'
+    assert first.payload_size == 8
+    assert 'data' not in second.to_dict()
+
+
+def test_operation_record_keeps_unserializable_data():
+    """Test data that isn't JSON-serializable is kept as the object itself."""
+    payload = {'callback': object()}
+
+    record = OperationRecord.from_dict({'type': 'task', 'operation': 'x', 'data': payload})
+
+    assert record.data is payload
+    assert record.payload_size == 0
+
+
+@pytest.mark.parametrize('payload', [
+    {'ids': (1, 2)},
+    {'by_id': {1: 'a'}},
+    {'tags': {'a'}},
+])
+def test_operation_record_keeps_data_json_would_change(payload):
+    """Test tuples and non-str keys come back unchanged, not as JSON types."""
+    memory = WorkingMemory({'context_window': 128000})
+
+    memory.add_operation({'type': 'task', 'operation': 'x', 'data': payload, 'tokens': 1})
+
+    assert memory.get_recent_operations()[0]['data'] == payload
+
+
+def test_operation_record_keeps_circular_data():
+    """Test self-referencing data is kept instead of failing to encode."""
+    payload = []
+    payload.append(payload)
+
+    record = OperationRecord.from_dict({'type': 'task', 'operation': 'x', 'data': payload})
+
+    assert record.data is payload
+
+
+# ============================================================================
+# Test: Checkpoint State
+# ============================================================================
+
+def test_export_state_since_sequence(small_context_config):
+    """Test export_state returns only operations added since a sequence number."""
+    memory = WorkingMemory(small_context_config)
+    for i in range(12):  # max_operations = 10
+        memory.add_operation({'type': 'task', 'operation': f'task_{i}', 'tokens': 10})
+
+    state = memory.export_state(since_seq=10)
+
+    assert state['seqs'] == list(range(2, 12))
+    assert [op['operation'] for _, op in state['operations']] == ['task_10', 'task_11']
+    assert state['next_seq'] == 12
+
+
+def test_load_state_replaces_contents(small_context_config):
+    """Test load_state loads operations without replaying add_operation."""
+    memory = WorkingMemory(small_context_config)
+    memory.add_operation({'type': 'task', 'operation': 'old', 'tokens': 10})
+    entries = [(5, {'type': 'task', 'operation': 'a', 'tokens': 20}),
+               (7, {'type': 'task', 'operation': 'b', 'tokens': 30})]
+
+    memory.load_state(entries, next_seq=8)
+    memory.add_operation({'type': 'task', 'operation': 'c', 'tokens': 5})
+
+    assert [op['operation'] for op in memory.get_all_operations()] == ['a', 'b', 'c']
+    assert memory._current_tokens == 55
+    assert memory.export_state()['seqs'] == [5, 7, 8]
+
+
+def test_load_state_respects_limits(small_context_config):
+    """Test load_state drops the oldest operations beyond current limits."""
+    memory = WorkingMemory(small_context_config)  # max_ops=10, max_tokens=200
+    entries = [(i, {'type': 'task', 'operation': f'task_{i}', 'tokens': 50}) for i in range(12)]
+
+    memory.load_state(entries, next_seq=12)
+
+    assert [op['operation'] for op in memory.get_all_operations()] == [
+        'task_8', 'task_9', 'task_10', 'task_11'
+    ]
+    assert memory._current_tokens == 200
+
+
 # ============================================================================
 # Test: Thread Safety
 # ============================================================================
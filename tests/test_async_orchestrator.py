@@ -0,0 +1,486 @@
+"""Tests for AsyncOrchestrator - asyncio iteration loop."""
+
+import asyncio
+import subprocess
+import threading
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.async_orchestrator import AsyncOrchestrator
+from src.monitoring.tracing import SpanExporter, Tracer, set_tracer
+from src.orchestration.decision_engine import Action, DecisionEngine
+from src.orchestrator import OrchestratorState
+from src.plugins.base import AgentPlugin
+from src.plugins.exceptions import AgentException
+from src.utils.git_manager import GitManager
+
+
+WORK_RESPONSE = "Implemented the feature and created the module.\n" * 20
+SLOW_STEP_SECONDS = 0.3
+
+
+class AsyncAgent:
+    """Agent stub with a native asend_prompt."""
+
+    def __init__(self, responses=None, delay=0):
+        self.session_id = None
+        self.workspace_path = None
+        self.use_session_persistence = False
+        self.responses = list(responses or [])
+        self.delay = delay
+        self.delays = []
+        self.prompts = []
+        self.contexts = []
+        self.threads = []
+        self.cancelled = 0
+
+    async def asend_prompt(self, prompt, context=None):
+        self.prompts.append(prompt)
+        self.contexts.append(context)
+        self.threads.append(threading.current_thread())
+        workspace = (context or {}).get('workspace_path') or self.workspace_path
+        if workspace is not None:
+            # Edit made before the turn finishes (left behind if cancelled)
+            Path(workspace, f'turn{len(self.prompts)}.txt').write_text(prompt)
+        try:
+            await asyncio.sleep(self.delays.pop(0) if self.delays else self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        response = self.responses.pop(0) if self.responses else WORK_RESPONSE
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def send_prompt(self, prompt, context=None):
+        return asyncio.run(self.asend_prompt(prompt, context))
+
+    def get_last_metadata(self):
+        return None
+
+    def cleanup(self):
+        pass
+
+
+def make_action(action_type):
+    """DecisionEngine Action of the given type."""
+    return Action(
+        type=action_type,
+        confidence=0.9,
+        explanation=f'{action_type} for test',
+        metadata={},
+        timestamp=datetime.now(UTC)
+    )
+
+
+def slow(result):
+    """Side effect that blocks like an LLM-backed validator."""
+    def call(*args, **kwargs):
+        time.sleep(SLOW_STEP_SECONDS)
+        return result
+    return call
+
+
+@pytest.fixture
+def task():
+    """Task stub."""
+    task = Mock(
+        id=1, project_id=1, title='Test Task', description='Implement a test function',
+        priority=5, status=Mock(value='pending'), dependencies=[]
+    )
+    task.to_dict.return_value = {'id': 1}
+    return task
+
+
+def make_orchestrator(task, pipelining=False):
+    """AsyncOrchestrator with mocked components, ready to execute ``task``."""
+    config = Mock()
+    config.get.side_effect = lambda key, default=None: (
+        pipelining if key == 'orchestration.pipelining.enabled' else default
+    )
+
+    orch = AsyncOrchestrator(config=config)
+    orch._state = OrchestratorState.INITIALIZED
+    orch.state_manager = Mock()
+    orch.state_manager.get_task.return_value = task
+    orch.state_manager.get_project.return_value = Mock(
+        id=1, project_name='Test', working_directory='/tmp/test', description=None
+    )
+    orch.llm_interface = Mock()
+    orch.llm_interface.is_available.return_value = True
+    orch.llm_interface.get_name.return_value = 'mock'
+    orch.agent = AsyncAgent()
+    orch.context_manager = Mock()
+    orch.context_manager.build_context.side_effect = lambda items, max_tokens: '\n'.join(
+        str(item['content']) for item in items
+    )
+    orch.prompt_generator = Mock()
+    orch.prompt_generator.generate_prompt.return_value = 'Test prompt'
+    orch.response_validator = Mock()
+    orch.response_validator.validate_format.return_value = True
+    orch.quality_controller = Mock()
+    orch.quality_controller.validate_output.side_effect = slow(
+        Mock(overall_score=0.9, passes_gate=True)
+    )
+    orch.confidence_scorer = Mock()
+    orch.confidence_scorer.score_response.side_effect = slow(0.85)
+    orch.decision_engine = Mock()
+    orch.decision_engine.decide_next_action.return_value = make_action(DecisionEngine.ACTION_PROCEED)
+    orch.breakpoint_manager = Mock()
+    orch.breakpoint_manager.should_trigger_destructive_nl_breakpoint.return_value = False
+    orch.file_watcher = Mock()
+    orch.file_watcher.get_changes.return_value = [{'path': 'module.py'}]
+    orch.current_task = task
+    orch.current_project = orch.state_manager.get_project.return_value
+    return orch
+
+
+@pytest.fixture
+def orchestrator(task):
+    """Mocked AsyncOrchestrator."""
+    orch = make_orchestrator(task)
+    yield orch
+    orch.shutdown()
+
+
+class TestAsyncIterationLoop:
+    """Tests for the asyncio iteration loop."""
+
+    def test_completes_task(self, orchestrator, task):
+        """Test a PROCEED decision completes the task."""
+        result = asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=3))
+
+        assert result['status'] == 'completed'
+        assert result['iterations'] == 1
+        assert result['confidence'] == 0.85
+        orchestrator.state_manager.update_task_status.assert_called_once()
+        orchestrator.state_manager.complete_session_record.assert_called_once()
+
+    def test_quality_and_confidence_overlap(self, orchestrator, task):
+        """Test the two validator calls run concurrently, not back to back."""
+        start = time.perf_counter()
+        asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=1))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2 * SLOW_STEP_SECONDS
+
+    def test_retry_feeds_previous_attempt(self, orchestrator, task):
+        """Test RETRY carries the response into the next prompt's context."""
+        orchestrator.decision_engine.decide_next_action.side_effect = [
+            make_action(DecisionEngine.ACTION_RETRY),
+            make_action(DecisionEngine.ACTION_PROCEED),
+        ]
+
+        result = asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=3))
+
+        assert result['iterations'] == 2
+        second_context = orchestrator.prompt_generator.generate_prompt.call_args_list[1][0][1]
+        assert WORK_RESPONSE in second_context['context']
+
+    def test_agent_error_continues(self, orchestrator, task):
+        """Test agent errors are recorded and the loop continues."""
+        orchestrator.agent.responses = [AgentException('CLI crashed'), WORK_RESPONSE]
+
+        result = asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=3))
+
+        assert result['status'] == 'completed'
+        assert result['iterations'] == 2
+
+    def test_max_turns_error_propagates(self, orchestrator, task):
+        """Test error_max_turns reaches execute_task's retry loop."""
+        orchestrator.agent.responses = [
+            AgentException('Hit max_turns', context={'subtype': 'error_max_turns', 'num_turns': 10})
+        ]
+
+        with pytest.raises(AgentException):
+            asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=3))
+
+    def test_max_iterations(self, orchestrator, task):
+        """Test loop stops at max_iterations."""
+        orchestrator.decision_engine.decide_next_action.return_value = make_action(
+            DecisionEngine.ACTION_CLARIFY
+        )
+
+        result = asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=2))
+
+        assert result['status'] == 'max_iterations'
+        assert len(orchestrator.agent.prompts) == 2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Git repository with one commit, used as the agent workspace."""
+    subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+    (tmp_path / 'README.md').write_text("project\n")
+    subprocess.run(['git', '-C', str(tmp_path), 'add', '-A'], check=True)
+    subprocess.run(
+        ['git'] + GitManager.WORKTREE_IDENTITY + ['-C', str(tmp_path), 'commit', '-qm', 'init'],
+        check=True
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def pipelined(task, workspace):
+    """Mocked AsyncOrchestrator with pipelining enabled and a slow agent."""
+    orch = make_orchestrator(task, pipelining=True)
+    orch.agent.delay = SLOW_STEP_SECONDS
+    orch.agent.workspace_path = workspace
+    yield orch
+    orch.shutdown()
+
+
+class TestPipelining:
+    """Tests for speculative next turns (orchestration.pipelining)."""
+
+    def test_disabled_by_default(self, orchestrator, task):
+        """Test no speculative turn runs unless enabled."""
+        orchestrator.decision_engine.decide_next_action.side_effect = [
+            make_action(DecisionEngine.ACTION_RETRY),
+            make_action(DecisionEngine.ACTION_PROCEED),
+        ]
+
+        result = asyncio.run(orchestrator._aexecute_single_task(task, max_iterations=3))
+
+        assert 'pipeline_stats' not in result
+        assert len(orchestrator.agent.prompts) == 2
+
+    def test_retry_adopts_speculative_turn(self, pipelined, task):
+        """Test RETRY reuses the turn started during evaluation."""
+        pipelined.decision_engine.decide_next_action.side_effect = [
+            make_action(DecisionEngine.ACTION_RETRY),
+            make_action(DecisionEngine.ACTION_PROCEED),
+        ]
+
+        start = time.perf_counter()
+        result = asyncio.run(pipelined._aexecute_single_task(task, max_iterations=2))
+        elapsed = time.perf_counter() - start
+
+        assert result['status'] == 'completed'
+        assert result['iterations'] == 2
+        stats = result['pipeline_stats']
+        assert stats['speculated'] == 1
+        assert stats['adopted'] == 1
+        assert stats['cancelled'] == 0
+        assert stats['saved_seconds'] > SLOW_STEP_SECONDS / 2
+        # Sequential: 2 agent turns + 2 evaluations
+        assert elapsed < 3.5 * SLOW_STEP_SECONDS
+        assert len(pipelined.agent.prompts) == 2
+        assert pipelined.last_pipeline_stats.adopted == 1
+
+    def test_speculative_prompt_is_retry_prompt(self, pipelined, task):
+        """Test the speculative turn carries the previous attempt in its own session."""
+        pipelined.decision_engine.decide_next_action.side_effect = [
+            make_action(DecisionEngine.ACTION_RETRY),
+            make_action(DecisionEngine.ACTION_PROCEED),
+        ]
+
+        asyncio.run(pipelined._aexecute_single_task(task, max_iterations=2))
+
+        second_context = pipelined.prompt_generator.generate_prompt.call_args_list[1][0][1]
+        assert WORK_RESPONSE in second_context['context']
+        assert pipelined.agent.contexts[1]['session_id']
+        assert 'session_id' not in pipelined.agent.contexts[0]
+
+    def test_proceed_cancels_speculative_turn(self, pipelined, task):
+        """Test a PROCEED decision cancels the turn and closes its session."""
+        # Speculative turn still running when the decision lands
+        pipelined.agent.delays = [SLOW_STEP_SECONDS, 10 * SLOW_STEP_SECONDS]
+
+        result = asyncio.run(pipelined._aexecute_single_task(task, max_iterations=3))
+
+        assert result['status'] == 'completed'
+        assert result['iterations'] == 1
+        stats = result['pipeline_stats']
+        assert stats['speculated'] == 1
+        assert stats['cancelled'] == 1
+        assert stats['wasted_seconds'] > 0
+        assert pipelined.agent.cancelled == 1
+        # Iteration session + speculative session
+        assert pipelined.state_manager.complete_session_record.call_count == 2
+
+    def test_cancelled_turn_leaves_workspace_and_session(self, pipelined, task, workspace):
+        """Test a cancelled turn's partial edits and session never reach the agent."""
+        pipelined.agent.delays = [SLOW_STEP_SECONDS, 10 * SLOW_STEP_SECONDS]
+        pipelined.agent.session_id = 'persistent-session'
+
+        result = asyncio.run(pipelined._aexecute_single_task(task, max_iterations=3))
+
+        assert result['pipeline_stats']['cancelled'] == 1
+        speculative_workspace = Path(pipelined.agent.contexts[1]['workspace_path'])
+        assert speculative_workspace != workspace
+        assert not speculative_workspace.exists()
+        assert sorted(p.name for p in workspace.iterdir() if p.name != '.git') == [
+            'README.md', 'turn1.txt'
+        ]
+        assert pipelined.agent.session_id == 'persistent-session'
+        worktrees = subprocess.run(
+            ['git', '-C', str(workspace), 'worktree', 'list'],
+            capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        assert len(worktrees) == 1
+
+    def test_adopted_turn_edits_applied(self, pipelined, task, workspace):
+        """Test RETRY applies the speculative turn's edits to the workspace."""
+        pipelined.decision_engine.decide_next_action.side_effect = [
+            make_action(DecisionEngine.ACTION_RETRY),
+            make_action(DecisionEngine.ACTION_PROCEED),
+        ]
+
+        asyncio.run(pipelined._aexecute_single_task(task, max_iterations=2))
+
+        assert (workspace / 'turn1.txt').exists()
+        assert (workspace / 'turn2.txt').exists()
+        assert not Path(pipelined.agent.contexts[1]['workspace_path']).exists()
+
+    def test_disabled_without_git_workspace(self, task, tmp_path):
+        """Test pipelining needs a git workspace to isolate speculative edits."""
+        orch = make_orchestrator(task, pipelining=True)
+        orch.agent.workspace_path = tmp_path
+        try:
+            result = asyncio.run(orch._aexecute_single_task(task, max_iterations=2))
+        finally:
+            orch.shutdown()
+
+        assert 'pipeline_stats' not in result
+
+    def test_clarify_builds_fresh_prompt(self, pipelined, task):
+        """Test CLARIFY discards the RETRY-prompt turn and re-prompts."""
+        pipelined.decision_engine.decide_next_action.side_effect = [
+            make_action(DecisionEngine.ACTION_CLARIFY),
+            make_action(DecisionEngine.ACTION_PROCEED),
+        ]
+
+        result = asyncio.run(pipelined._aexecute_single_task(task, max_iterations=2))
+
+        assert result['iterations'] == 2
+        assert result['pipeline_stats']['adopted'] == 0
+        assert result['pipeline_stats']['cancelled'] == 1
+        # Iteration 2 prompt carries the clarification feedback, not the retry context
+        third_context = pipelined.prompt_generator.generate_prompt.call_args_list[2][0][1]
+        assert 'Issues to address' in third_context['context']
+
+    def test_last_iteration_not_speculated(self, pipelined, task):
+        """Test no turn is started beyond max_iterations."""
+        pipelined.decision_engine.decide_next_action.return_value = make_action(
+            DecisionEngine.ACTION_RETRY
+        )
+
+        result = asyncio.run(pipelined._aexecute_single_task(task, max_iterations=2))
+
+        assert result['status'] == 'max_iterations'
+        assert result['pipeline_stats']['speculated'] == 1
+        assert len(pipelined.agent.prompts) == 2
+
+    def test_disabled_for_thread_offload_agent(self, task):
+        """Test agents without a native asend_prompt run unpipelined."""
+        class ThreadAgent(AsyncAgent):
+            asend_prompt = AgentPlugin.asend_prompt
+
+            def send_prompt(self, prompt, context=None):
+                self.prompts.append(prompt)
+                return WORK_RESPONSE
+
+        orch = make_orchestrator(task, pipelining=True)
+        orch.agent = ThreadAgent()
+        try:
+            result = asyncio.run(orch._aexecute_single_task(task, max_iterations=2))
+        finally:
+            orch.shutdown()
+
+        assert result['status'] == 'completed'
+        assert 'pipeline_stats' not in result
+        assert len(orch.agent.prompts) == 1
+
+
+class TestAexecuteTask:
+    """Tests for aexecute_task and the sync/async bridge."""
+
+    def test_aexecute_task_runs_loop_on_event_loop(self, orchestrator):
+        """Test agent awaits happen on the caller's event loop thread."""
+        async def run():
+            result = await orchestrator.aexecute_task(1, max_iterations=2)
+            return result, threading.current_thread()
+
+        result, loop_thread = asyncio.run(run())
+
+        assert result['status'] == 'completed'
+        assert orchestrator.agent.threads == [loop_thread]
+
+    def test_sessions_run_concurrently(self, task):
+        """Test two orchestrators share one event loop without serializing."""
+        orchestrators = [make_orchestrator(task) for _ in range(2)]
+
+        async def run():
+            return await asyncio.gather(
+                *(orch.aexecute_task(1, max_iterations=1) for orch in orchestrators)
+            )
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        for orch in orchestrators:
+            orch.shutdown()
+
+        assert [r['status'] for r in results] == ['completed', 'completed']
+        # Serialized would be 2 sessions x 2 validator steps
+        assert elapsed < 4 * SLOW_STEP_SECONDS
+
+    def test_sync_execute_task_unchanged(self, orchestrator):
+        """Test plain execute_task still uses the synchronous loop."""
+        result = orchestrator.execute_task(1, max_iterations=1)
+
+        assert result['status'] == 'completed'
+        assert orchestrator.agent.threads[0] is threading.current_thread()
+
+
+
+class TestTracing:
+    """Tests for per-stage spans in both iteration loops."""
+
+    STAGES = {
+        'task', 'iteration', 'db.session_start', 'prompt.generate', 'agent.send_prompt',
+        'db.track_usage', 'validation.format', 'validation.quality', 'validation.confidence',
+        'db.record_interaction', 'decision', 'decision.apply', 'db.session_end',
+    }
+
+    @pytest.fixture
+    def traces(self):
+        """Install a recording tracer; yields the list of exported traces."""
+        exported = []
+
+        class Recorder(SpanExporter):
+            def export(self, spans):
+                exported.append(spans)
+
+        previous = set_tracer(Tracer(Recorder()))
+        yield exported
+        set_tracer(previous)
+
+    def test_sync_loop_spans(self, orchestrator, traces):
+        """Test execute_task exports one trace covering every stage."""
+        orchestrator.execute_task(1, max_iterations=1)
+
+        assert len(traces) == 1
+        names = {span.name for span in traces[0]}
+        assert self.STAGES <= names
+        root = traces[0][0]
+        assert root.attributes['task_id'] == 1
+        assert root.attributes['status'] == 'completed'
+
+    def test_async_loop_spans_nest_under_task(self, orchestrator, traces):
+        """Test aexecute_task spans nest under the task thread's root span."""
+        asyncio.run(orchestrator.aexecute_task(1, max_iterations=1))
+
+        spans = traces[0]
+        assert self.STAGES <= {span.name for span in spans}
+        root = next(span for span in spans if span.parent_span_id is None)
+        iteration = next(span for span in spans if span.name == 'iteration')
+        quality = next(span for span in spans if span.name == 'validation.quality')
+        assert iteration.parent_span_id == root.span_id
+        assert quality.parent_span_id == iteration.span_id
+        assert iteration.attributes['action'] == DecisionEngine.ACTION_PROCEED
@@ -2,11 +2,13 @@
 
 import pytest
 from datetime import datetime, UTC
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from src.core.exceptions import OrchestratorException
 from src.core.state import StateManager
-from src.orchestration.breakpoint_manager import BreakpointManager, BreakpointEvent
+from src.orchestration.breakpoint_manager import (
+    BreakpointManager, BreakpointEvent, compile_condition
+)
 
 
 @pytest.fixture
@@ -164,6 +166,65 @@ class TestConditionEvaluation:
         assert 'bad_condition' not in triggered
 
 
+class TestCompiledConditions:
+    """Test condition compilation and re-evaluation."""
+
+    def test_compile_condition_names(self):
+        """Test referenced names are collected once, in order."""
+        _, names = compile_condition("operation_type in ['UPDATE', 'DELETE'] and score < score_max")
+
+        assert names == ('operation_type', 'score', 'score_max')
+
+    @pytest.mark.parametrize('condition', [
+        "__import__('os').system('true')",
+        "value.__class__ == 1",
+        "[x for x in items]",
+        "lambda: 1",
+    ])
+    def test_compile_condition_rejects_unsafe(self, condition):
+        """Test calls, private attributes and comprehensions are rejected."""
+        with pytest.raises(ValueError, match='Invalid condition'):
+            compile_condition(condition)
+
+    def test_unchanged_inputs_not_reevaluated(self, manager):
+        """Test rules are only re-evaluated when referenced values change."""
+        context = {'confidence_score': 0.2, 'critical_task': True, 'task_id': 1}
+        manager.evaluate_breakpoint_conditions(context)
+
+        with patch.object(
+            manager, '_evaluate_conditions', wraps=manager._evaluate_conditions
+        ) as evaluate:
+            # Unreferenced key changed only
+            triggered = manager.evaluate_breakpoint_conditions({**context, 'task_id': 2})
+            assert evaluate.call_count == 0
+            assert 'confidence_too_low' in triggered
+
+            triggered = manager.evaluate_breakpoint_conditions(
+                {**context, 'confidence_score': 0.9}
+            )
+            assert evaluate.call_count > 0
+            assert 'confidence_too_low' not in triggered
+
+    def test_rule_threshold_overrides_context(self, manager):
+        """Test rule config values take precedence over context values."""
+        context = {'confidence_score': 0.2, 'critical_task': True, 'threshold': 0.1}
+
+        assert 'confidence_too_low' in manager.evaluate_breakpoint_conditions(context)
+
+    def test_changed_conditions_recompiled(self, manager):
+        """Test editing a rule's conditions takes effect."""
+        manager.add_custom_rule({
+            'type': 'custom_check',
+            'priority': 'high',
+            'conditions': ['custom_value == 42']
+        })
+        assert 'custom_check' in manager.evaluate_breakpoint_conditions({'custom_value': 42})
+
+        manager._rules['custom_check']['conditions'] = ['custom_value == 7']
+
+        assert 'custom_check' not in manager.evaluate_breakpoint_conditions({'custom_value': 42})
+
+
 class TestBreakpointTriggering:
     """Test triggering breakpoints."""
 
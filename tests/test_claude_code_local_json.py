@@ -4,14 +4,17 @@ Tests the JSON output format parsing, metadata extraction, and error handling
 for the headless Claude Code agent.
 """
 
+import asyncio
 import json
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
 
 import pytest
 
 from src.agents.claude_code_local import ClaudeCodeLocalAgent
+from src.llm.prompt_segments import SegmentedPrompt
 from src.plugins.exceptions import AgentException
 
 
@@ -352,6 +355,65 @@ class TestJSONParsing:
             session_id = args[session_id_index + 1]
             assert len(session_id) == 36  # UUID format: 8-4-4-4-12
 
+    def test_context_session_id_overrides_agent_session(self, agent):
+        """Test a per-call session_id in context wins over the agent's session."""
+        agent.session_id = 'agent-session-0000-0000-000000000000'
+        with patch.object(agent, '_run_claude') as mock_run:
+            mock_result = MagicMock()
+            mock_result.returncode = 0
+            mock_result.stdout = '{"type":"result","subtype":"success","result":"test"}'
+            mock_run.return_value = mock_result
+
+            agent.send_prompt("test", context={'session_id': 'call-session-0000-0000-000000000000'})
+
+            args = mock_run.call_args[0][0]
+            assert args[args.index('--session-id') + 1] == 'call-session-0000-0000-000000000000'
+        assert agent.session_id == 'agent-session-0000-0000-000000000000'
+
+    def test_segmented_prompt_prefix_sent_as_system_prompt(self, agent, success_json_response):
+        """Test a segmented prompt's stable prefix goes in the cached system prompt."""
+        prompt = SegmentedPrompt({'rules': 'RULES', 'project': 'PROJECT', 'task': 'TASK'})
+        with patch.object(agent, '_run_claude') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=json.dumps(success_json_response)
+            )
+
+            agent.send_prompt(prompt)
+
+            args = mock_run.call_args[0][0]
+            assert args[args.index('--append-system-prompt') + 1] == 'RULES\n\nPROJECT'
+            assert args[-1] == 'TASK'
+
+    def test_plain_prompt_not_split(self, agent):
+        """Test plain prompts and disabled prefix caching send the prompt as is."""
+        agent.cache_prompt_prefix = False
+        prompt = SegmentedPrompt({'rules': 'RULES', 'task': 'TASK'})
+        with patch.object(agent, '_run_claude') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout='{"type":"result","subtype":"success","result":"ok"}'
+            )
+
+            agent.send_prompt(prompt)
+
+            args = mock_run.call_args[0][0]
+            assert '--append-system-prompt' not in args
+            assert args[-1] == 'RULES\n\nTASK'
+            assert agent.get_last_metadata()['prefix_hash'] == prompt.prefix_hash
+
+    def test_extract_metadata_prefix_cache_read_ratio(self, agent, success_json_response):
+        """Test cache reads are accumulated per prompt prefix."""
+        first = agent._extract_metadata(success_json_response, prefix_hash='abc')
+        second = agent._extract_metadata(success_json_response, prefix_hash='abc')
+        plain = agent._extract_metadata(success_json_response)
+
+        assert first['prefix_reused'] is False
+        assert second['prefix_reused'] is True
+        assert second['prefix_cache_read_ratio'] == pytest.approx(
+            36391 / (9 + 12871 + 36391)
+        )
+        assert plain['prefix_hash'] is None
+        assert agent.get_prefix_cache_stats()['prefix_reuses'] == 1
+
     def test_dangerous_mode_flag_included(self, agent):
         """Test that --dangerously-skip-permissions flag is included."""
         with patch.object(agent, '_run_claude') as mock_run:
@@ -427,3 +489,76 @@ class TestJSONParsing:
             log_text = caplog.text
             assert 'Tokens:' in log_text
             assert 'Turns:' in log_text
+
+
+class TestAsyncSendPrompt:
+    """Test asend_prompt against a stand-in claude executable."""
+
+    @pytest.fixture
+    def fake_claude(self, tmp_path):
+        """Write a script that mimics `claude --print --output-format json`."""
+        script = tmp_path / 'fake_claude.py'
+        script.write_text(
+            "import json, sys, time\n"
+            "prompt = sys.argv[-1]\n"
+            "if prompt == 'hang':\n"
+            "    time.sleep(30)\n"
+            "if prompt == 'fail':\n"
+            "    sys.stderr.write('boom')\n"
+            "    sys.exit(3)\n"
+            "print(json.dumps({'type': 'result', 'subtype': 'success',\n"
+            "                  'result': 'echo: ' + prompt, 'num_turns': 1,\n"
+            "                  'usage': {'input_tokens': 5, 'output_tokens': 7}}))\n"
+        )
+        wrapper = tmp_path / 'claude'
+        wrapper.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+        wrapper.chmod(0o755)
+        return wrapper
+
+    @pytest.fixture
+    def agent(self, tmp_path, fake_claude):
+        """Agent pointed at the fake CLI."""
+        agent = ClaudeCodeLocalAgent()
+        agent.initialize({
+            'workspace_path': str(tmp_path),
+            'claude_command': str(fake_claude),
+            'response_timeout': 5,
+            'use_session_persistence': False
+        })
+        return agent
+
+    def test_asend_prompt_returns_result(self, agent):
+        """Test async path parses the CLI's JSON like send_prompt."""
+        response = asyncio.run(agent.asend_prompt('hello', context={'max_turns': 4}))
+
+        assert response == 'echo: hello'
+        assert agent.get_last_metadata()['output_tokens'] == 7
+
+    def test_asend_prompt_runs_concurrently(self, agent):
+        """Test several prompts can be awaited at once."""
+        async def send_all():
+            return await asyncio.gather(*(agent.asend_prompt(f'p{i}') for i in range(3)))
+
+        assert asyncio.run(send_all()) == ['echo: p0', 'echo: p1', 'echo: p2']
+
+    def test_asend_prompt_nonzero_exit(self, agent):
+        """Test CLI failures raise AgentException with stderr."""
+        with pytest.raises(AgentException) as exc_info:
+            asyncio.run(agent.asend_prompt('fail'))
+
+        assert exc_info.value.context_data['exit_code'] == 3
+        assert 'boom' in exc_info.value.context_data['stderr']
+
+    def test_asend_prompt_timeout_kills_process(self, agent):
+        """Test timeouts raise AgentException instead of waiting on the CLI."""
+        agent.response_timeout = 0.5
+
+        with pytest.raises(AgentException, match='Timeout'):
+            asyncio.run(agent.asend_prompt('hang'))
+
+    def test_asend_prompt_command_not_found(self, agent):
+        """Test a missing CLI is reported like the sync path."""
+        agent.claude_command = '/nonexistent/claude'
+
+        with pytest.raises(AgentException, match='not found'):
+            asyncio.run(agent.asend_prompt('hello'))
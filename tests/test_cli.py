@@ -298,6 +298,37 @@ class TestExecuteCommand:
         assert result.exit_code == 0
 
 
+    @patch('src.cli.Orchestrator')
+    @patch('src.cli._connect_daemon')
+    def test_execute_task_via_daemon(self, mock_connect, mock_orchestrator_class, runner, isolated_fs):
+        """Test a running daemon executes the task instead of a local orchestrator."""
+        mock_daemon = Mock()
+        mock_daemon.execute_task.return_value = {'status': 'completed', 'iterations': 2}
+        mock_connect.return_value = mock_daemon
+
+        result = runner.invoke(cli, ['task', 'execute', '1', '--max-iterations', '5'])
+
+        assert result.exit_code == 0
+        assert '(daemon)' in result.output
+        mock_daemon.execute_task.assert_called_once_with(1, max_iterations=5)
+        mock_orchestrator_class.assert_not_called()
+
+    @patch('src.cli.Orchestrator')
+    @patch('src.cli._connect_daemon')
+    def test_execute_task_no_daemon(self, mock_connect, mock_orchestrator_class, runner, isolated_fs):
+        """Test --no-daemon (and --stream) bypass a running daemon."""
+        mock_orch = Mock()
+        mock_orch.execute_task.return_value = {'status': 'completed', 'iterations': 1}
+        mock_orchestrator_class.return_value = mock_orch
+
+        for flag in ('--no-daemon', '--stream'):
+            result = runner.invoke(cli, ['task', 'execute', '1', flag])
+            assert result.exit_code == 0
+
+        mock_connect.assert_not_called()
+        assert mock_orch.execute_task.call_count == 2
+
+
 class TestRunCommand:
     """Test continuous run command."""
 
@@ -0,0 +1,111 @@
+"""Startup-time regression tests for the CLI.
+
+`obra --help` and other light commands must not pay for the orchestrator,
+the database layer or agent/LLM plugins. These tests run
+``python -X importtime -c "import src.cli"`` in a fresh interpreter and
+fail if a heavy module creeps back into the import graph.
+"""
+
+import functools
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.lazy_import import LazyImport, lazy_import
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules `import src.cli` must not load
+HEAVY_MODULES = [
+    'src.orchestrator',
+    'src.core.state',
+    'sqlalchemy',
+    'paramiko',
+    'requests',
+    'src.agents.claude_code_ssh',
+    'src.llm.local_interface',
+]
+
+# Cumulative import time budget for src.cli (was ~420ms before lazy imports)
+IMPORT_BUDGET_US = 200_000
+
+
+@functools.lru_cache(maxsize=None)
+def import_times(statement: str) -> dict:
+    """Run ``statement`` under -X importtime; return module -> cumulative us."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+class TestCliImportTime:
+    """Tests for the lazy import graph of src.cli."""
+
+    def test_heavy_modules_not_imported(self):
+        """Test the orchestrator, database and plugin modules stay unloaded."""
+        times = import_times('import src.cli')
+        loaded = [name for name in HEAVY_MODULES if name in times]
+        assert loaded == []
+
+    def test_import_within_budget(self):
+        """Test importing the CLI stays within the startup budget."""
+        times = import_times('import src.cli')
+        assert times['src.cli'] < IMPORT_BUDGET_US
+
+    def test_help_does_not_load_orchestrator(self):
+        """Test `obra --help` runs without importing the orchestrator."""
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import sys\n'
+             'from src.cli import cli\n'
+             'try:\n'
+             '    cli(["--help"])\n'
+             'except SystemExit:\n'
+             '    pass\n'
+             'print("src.orchestrator" in sys.modules, "sqlalchemy" in sys.modules)'],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == 'False False'
+
+
+class TestLazyImport:
+    """Tests for the LazyImport proxy."""
+
+    def test_resolves_on_first_use(self):
+        """Test the proxy imports on call and forwards attributes."""
+        proxy = lazy_import('collections', 'OrderedDict')
+
+        assert not proxy.is_resolved
+        assert proxy([('a', 1)])['a'] == 1
+        assert proxy.fromkeys('b') == {'b': None}
+        assert proxy.is_resolved
+
+    def test_missing_attribute_raises(self):
+        """Test a wrong import path fails on first use, not at definition."""
+        proxy = LazyImport('collections', 'DoesNotExist')
+
+        with pytest.raises(AttributeError):
+            proxy()
+
+    def test_patchable(self):
+        """Test unittest.mock.patch can replace a lazily imported CLI name."""
+        import src.cli
+
+        with patch('src.cli.Orchestrator') as mock_orchestrator:
+            assert src.cli.Orchestrator is mock_orchestrator
+
+        assert isinstance(src.cli.Orchestrator, LazyImport)
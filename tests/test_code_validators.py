@@ -11,11 +11,21 @@ Tests for:
 Part of TASK_2.5: Test PromptRuleEngine and validators
 """
 
+import ast
 import pytest
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 from src.llm.code_validators import (
+    CodeAnalyzer,
+    CodeRule,
     CodeViolation,
+    DocstringRule,
+    ParseCache,
+    StubRule,
+    analyze_code,
+    get_parse_cache,
+    validate_code_files,
     detect_stubs,
     detect_hardcoded_values,
     check_docstring_coverage,
@@ -478,3 +488,135 @@ class UndocumentedClass:
     # Should flag UndocumentedClass
     assert len(violations) >= 1
     assert any('UndocumentedClass' in v.message for v in violations)
+
+
+# ============================================================================
+# Tests: single-pass analysis engine
+# ============================================================================
+
+def test_parse_cache_reuses_tree_for_identical_source():
+    """Test ParseCache parses identical content only once."""
+    cache = ParseCache(max_entries=4)
+    code = "def f():\n    return 1\n"
+
+    with patch('src.llm.code_validators.ast.parse', wraps=ast.parse) as mock_parse:
+        first = cache.parse(code)
+        second = cache.parse(code)
+
+    assert first is second
+    assert mock_parse.call_count == 1
+    assert cache.get_stats()['hit_count'] == 1
+
+
+def test_parse_cache_caches_syntax_errors():
+    """Test ParseCache re-raises cached syntax errors without re-parsing."""
+    cache = ParseCache()
+
+    with patch('src.llm.code_validators.ast.parse', wraps=ast.parse) as mock_parse:
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                cache.parse("def broken(\n")
+
+    assert mock_parse.call_count == 1
+
+
+def test_parse_cache_raises_fresh_syntax_errors():
+    """Test each cache hit raises a new exception with the cached details."""
+    cache = ParseCache()
+    errors = []
+    for _ in range(2):
+        with pytest.raises(SyntaxError) as exc_info:
+            cache.parse("x = 1\nif True:\nprint(x)\n")
+        errors.append(exc_info.value)
+
+    first, second = errors
+    assert first is not second
+    assert type(first) is type(second) is IndentationError
+    assert (second.msg, second.lineno, second.offset, second.text) == \
+        (first.msg, first.lineno, first.offset, first.text)
+
+
+def test_parse_cache_evicts_least_recently_used():
+    """Test ParseCache stays within max_entries."""
+    cache = ParseCache(max_entries=2)
+    for i in range(5):
+        cache.parse(f"x = {i}\n")
+
+    assert cache.get_stats()['size'] == 2
+
+
+def test_analyze_code_single_parse_for_all_rules():
+    """Test analyze_code runs every rule from one parse."""
+    get_parse_cache().clear()
+    code = '''
+def stub_function():
+    pass
+
+def undocumented(x):
+    return x * 3.14159
+'''
+    with patch('src.llm.code_validators.ast.parse', wraps=ast.parse) as mock_parse:
+        results = analyze_code(code)
+
+    assert mock_parse.call_count == 1
+    assert len(results['stubs']) == 1
+    assert any(v.violation_type == 'magic_number' for v in results['hardcoded'])
+    assert len(results['docstrings']) == 2
+
+
+def test_analyze_code_custom_rule():
+    """Test custom rules only receive the node types they declare."""
+    class PrintRule(CodeRule):
+        category = 'prints'
+        node_types = (ast.Call,)
+
+        def check(self, node):
+            if getattr(node.func, 'id', None) == 'print':
+                self.report(node, 'print_call', 'print() call found')
+
+    results = analyze_code("print('hi')\nlen([])\n", rules=[PrintRule()])
+
+    assert list(results) == ['prints']
+    assert len(results['prints']) == 1
+    assert results['prints'][0].line == 1
+
+
+def test_code_analyzer_matches_individual_validators():
+    """Test combined traversal reports the same as individual validators."""
+    code = '''
+class Widget:
+    def render(self):
+        raise NotImplementedError()
+
+def helper():
+    """TODO: finish"""
+    return 42
+'''
+    rules = [StubRule(), DocstringRule()]
+    results = CodeAnalyzer(rules).run(ast.parse(code))
+
+    assert len(results['stubs']) == len(detect_stubs(code))
+    assert len(results['docstrings']) == len(check_docstring_coverage(code))
+
+
+def test_validate_code_files_serial_and_parallel_agree():
+    """Test validate_code_files gives identical results in both modes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for i in range(4):
+            path = Path(tmpdir) / f'module_{i}.py'
+            path.write_text(f'def stub_{i}():\n    pass\n')
+            paths.append(str(path))
+        test_dir = str(Path(tmpdir) / 'tests')
+
+        serial = validate_code_files(paths, test_dir, parallel=False)
+        parallel = validate_code_files(paths, test_dir, parallel=True, max_workers=2)
+
+    assert list(serial) == paths
+    for path in paths:
+        for category in ('stubs', 'hardcoded', 'docstrings', 'tests'):
+            assert (
+                [v.to_dict() for v in serial[path][category]] ==
+                [v.to_dict() for v in parallel[path][category]]
+            )
+        assert serial[path]['stubs'][0].violation_type == 'stub_function'
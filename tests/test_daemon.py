@@ -0,0 +1,221 @@
+"""Tests for the orchestrator daemon and its client."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.exceptions import DaemonException, TaskStateException
+from src.daemon import DaemonClient, OrchestratorDaemon, database_url_from_config
+
+
+@pytest.fixture
+def orchestrator():
+    """Initialized-orchestrator stand-in."""
+    orch = Mock()
+    orch.execute_task.return_value = {'status': 'completed', 'iterations': 2}
+    orch.execute_epic.return_value = {'stories_completed': 1, 'total_stories': 1, 'stories_failed': 0}
+    orch.get_status.return_value = {'state': 'initialized'}
+    orch.state_manager.get_task.return_value = SimpleNamespace(project_id=7, title='Auth epic')
+    return orch
+
+
+@pytest.fixture
+def config():
+    """Config stub using defaults."""
+    cfg = Mock()
+    cfg.get.side_effect = lambda key, default=None: default
+    return cfg
+
+
+def config_for(daemon):
+    """Client config pointing at ``daemon``'s socket with the default database."""
+    cfg = Mock()
+    cfg.get.side_effect = lambda key, default=None: (
+        str(daemon.socket_path) if key == 'daemon.socket_path' else default
+    )
+    return cfg
+
+
+@pytest.fixture
+def running_daemon(config, orchestrator, tmp_path):
+    """Daemon serving on a temporary socket."""
+    daemon = OrchestratorDaemon(config, socket_path=tmp_path / 'obra.sock', orchestrator=orchestrator)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    yield daemon
+
+    daemon.stop()
+    thread.join(timeout=5)
+    daemon.close()
+
+
+class TestDaemonRequests:
+    """Test commands sent through DaemonClient."""
+
+    def test_execute_task_reuses_orchestrator(self, running_daemon, orchestrator):
+        """Test consecutive commands run on the same initialized orchestrator."""
+        client = DaemonClient.from_config(config_for(running_daemon))
+
+        assert client.execute_task(3, max_iterations=4)['status'] == 'completed'
+        assert client.execute_task(4)['iterations'] == 2
+
+        assert orchestrator.execute_task.call_args_list[0].args == (3,)
+        assert orchestrator.execute_task.call_args_list[0].kwargs == {'max_iterations': 4}
+        assert client.ping()['commands_served'] == 2
+        orchestrator.initialize.assert_not_called()
+
+    def test_execute_epic_looks_up_project(self, running_daemon, orchestrator):
+        """Test the daemon resolves the epic's project before executing."""
+        client = DaemonClient.from_config(config_for(running_daemon))
+
+        result = client.execute_epic(12)
+
+        assert result['epic_title'] == 'Auth epic'
+        orchestrator.execute_epic.assert_called_once_with(
+            project_id=7, epic_id=12, max_iterations_per_story=10
+        )
+
+    def test_remote_error_keeps_context(self, running_daemon, orchestrator):
+        """Test orchestrator exceptions arrive with type, context and recovery."""
+        orchestrator.execute_task.side_effect = TaskStateException(
+            'Task 9 not found', context={'task_id': 9}, recovery='Check the task ID'
+        )
+        client = DaemonClient.from_config(config_for(running_daemon))
+
+        with pytest.raises(DaemonException) as exc_info:
+            client.execute_task(9)
+
+        assert str(exc_info.value) == 'Task 9 not found'
+        assert exc_info.value.context_data['remote_type'] == 'TaskStateException'
+        assert exc_info.value.context_data['task_id'] == 9
+        assert exc_info.value.recovery_suggestion == 'Check the task ID'
+
+    def test_unknown_command(self, running_daemon):
+        """Test unknown commands are rejected without closing the daemon."""
+        client = DaemonClient(running_daemon.socket_path)
+
+        with pytest.raises(DaemonException, match='Unknown daemon command'):
+            client.request('bogus')
+        assert client.is_running()
+
+    def test_status_answers_while_busy(self, running_daemon, orchestrator):
+        """Test ping/status are served while a task holds the work lock."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_task(task_id, max_iterations):
+            started.set()
+            release.wait(5)
+            return {'status': 'completed', 'iterations': 1}
+
+        orchestrator.execute_task.side_effect = slow_task
+        client = DaemonClient.from_config(config_for(running_daemon))
+        worker = threading.Thread(target=client.execute_task, args=(5,))
+        worker.start()
+        started.wait(5)
+
+        try:
+            status = client.status()
+            assert status['busy'] == 'task 5'
+            assert status['orchestrator'] == {'state': 'initialized'}
+        finally:
+            release.set()
+            worker.join(5)
+
+
+class TestDatabaseCheck:
+    """Test that clients only use a daemon serving their database."""
+
+    def test_relative_sqlite_url_resolved(self, tmp_path, monkeypatch):
+        """Test relative SQLite paths compare by the file they name."""
+        monkeypatch.chdir(tmp_path)
+        cfg = Mock()
+        cfg.get.side_effect = lambda key, default=None: (
+            'sqlite:///data/obra.db' if key == 'database.url' else default
+        )
+
+        assert database_url_from_config(cfg) == f"sqlite:///{tmp_path / 'data' / 'obra.db'}"
+
+    def test_other_database_refused(self, running_daemon, orchestrator):
+        """Test execute requests for another database are rejected."""
+        client = DaemonClient(running_daemon.socket_path, database_url='sqlite:////elsewhere.db')
+
+        assert client.is_running()
+        assert not client.serves_database()
+        with pytest.raises(DaemonException, match='serves') as exc_info:
+            client.execute_task(3)
+        with pytest.raises(DaemonException, match='serves'):
+            client.execute_epic(12)
+
+        assert exc_info.value.context_data['database_url'] == 'sqlite:////elsewhere.db'
+        orchestrator.execute_task.assert_not_called()
+        orchestrator.execute_epic.assert_not_called()
+
+    def test_same_database_used(self, running_daemon):
+        """Test a client with the daemon's config connects."""
+        assert DaemonClient.from_config(config_for(running_daemon)).serves_database()
+
+
+class TestDaemonLifecycle:
+    """Test start, shutdown and socket handling."""
+
+    def test_client_without_daemon(self, tmp_path):
+        """Test a missing daemon is reported, not hung on."""
+        client = DaemonClient(tmp_path / 'missing.sock')
+
+        assert not client.is_running()
+        with pytest.raises(DaemonException, match='not reachable'):
+            client.ping()
+
+    def test_shutdown_request_stops_serving(self, config, orchestrator, tmp_path):
+        """Test `obra daemon stop` ends serve_forever and removes the socket."""
+        daemon = OrchestratorDaemon(config, socket_path=tmp_path / 'obra.sock', orchestrator=orchestrator)
+        daemon.start()
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+
+        DaemonClient(daemon.socket_path).shutdown()
+        thread.join(timeout=5)
+        daemon.close()
+
+        assert not thread.is_alive()
+        assert not daemon.socket_path.exists()
+        orchestrator.shutdown.assert_called_once()
+
+    def test_second_daemon_refused(self, running_daemon, config, orchestrator):
+        """Test starting on a live socket fails instead of stealing it."""
+        other = OrchestratorDaemon(config, socket_path=running_daemon.socket_path, orchestrator=orchestrator)
+
+        with pytest.raises(DaemonException, match='already running'):
+            other.start()
+
+    def test_stale_socket_replaced(self, config, orchestrator, tmp_path):
+        """Test a socket file left by a crashed daemon is removed on start."""
+        socket_path = tmp_path / 'obra.sock'
+        socket_path.write_text('')
+        daemon = OrchestratorDaemon(config, socket_path=socket_path, orchestrator=orchestrator)
+
+        daemon.start()
+        try:
+            assert socket_path.is_socket()
+            assert (socket_path.stat().st_mode & 0o777) == 0o600
+        finally:
+            daemon.close()
+
+    def test_builds_orchestrator_once(self, config, tmp_path, monkeypatch):
+        """Test start() initializes an orchestrator when none is given."""
+        orch = Mock()
+        factory = Mock(return_value=orch)
+        monkeypatch.setattr('src.daemon.Orchestrator', factory)
+        daemon = OrchestratorDaemon(config, socket_path=tmp_path / 'obra.sock')
+
+        daemon.start()
+        daemon.close()
+
+        factory.assert_called_once_with(config=config)
+        orch.initialize.assert_called_once()
+        orch.shutdown.assert_called_once()
@@ -7,11 +7,27 @@ columns, incorrect types, and missing indexes.
 This would have caught: "table task has no column named requires_adr"
 """
 
+import importlib.util
 import pytest
 import sqlite3
 from pathlib import Path
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
 from src.core.state import StateManager
 
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / 'alembic' / 'versions'
+
+
+def load_migration(filename):
+    """Load an Alembic revision module from alembic/versions"""
+    spec = importlib.util.spec_from_file_location(filename[:-3], MIGRATIONS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 
 @pytest.fixture
 def db_connection(state_manager):
@@ -41,7 +57,7 @@ class TestDatabaseSchema:
         required_base = {
             'id', 'created_at', 'updated_at', 'project_id', 'parent_task_id',
             'title', 'description', 'status', 'assigned_to', 'priority',
-            'dependencies', 'context', 'result', 'task_metadata',
+            'context', 'result', 'task_metadata',
             'retry_count', 'max_retries', 'started_at', 'completed_at', 'is_deleted'
         }
 
@@ -114,6 +130,18 @@ class TestDatabaseSchema:
         missing = required_indexes - indexes
         assert not missing, f"Missing indexes on task table: {missing}"
 
+    def test_task_dependency_table_indexed_both_ways(self, db_connection):
+        """Verify dependency edges replace the task.dependencies JSON column"""
+        cursor = db_connection.cursor()
+        cursor.execute("SELECT name FROM pragma_table_info('task_dependency')")
+        columns = {row[0] for row in cursor.fetchall()}
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='task_dependency'")
+        indexes = {row[0] for row in cursor.fetchall()}
+
+        assert columns == {'task_id', 'depends_on_id'}
+        # Forward lookups use the primary key; reverse lookups need their own index
+        assert 'idx_task_dependency_reverse' in indexes
+
     def test_all_tables_exist(self, db_connection):
         """Verify all expected tables exist"""
         cursor = db_connection.cursor()
@@ -231,6 +259,61 @@ class TestMigrationVerification:
             pytest.fail(f"Migration 004 not applied: {e}")
 
 
+class TestTaskDependencyMigration:
+    """Run the task_dependency revision against a legacy schema"""
+
+    @pytest.fixture
+    def legacy_engine(self, tmp_path):
+        """SQLite database with task.dependencies JSON and FK enforcement on"""
+        engine = sa.create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+
+        @sa.event.listens_for(engine, 'connect')
+        def enable_foreign_keys(dbapi_connection, _):
+            dbapi_connection.execute('PRAGMA foreign_keys=ON')
+
+        with engine.begin() as conn:
+            conn.execute(sa.text(
+                'CREATE TABLE task (id INTEGER PRIMARY KEY, dependencies JSON)'
+            ))
+        yield engine
+        engine.dispose()
+
+    def test_upgrade_drops_dependencies_on_deleted_tasks(self, legacy_engine):
+        """Verify edges to missing tasks are skipped instead of failing the FK"""
+        migration = load_migration('8b2f4c6d1e93_add_task_dependency_table.py')
+        with legacy_engine.begin() as conn:
+            conn.execute(sa.text(
+                "INSERT INTO task (id, dependencies) VALUES "
+                "(1, NULL), (2, '[1, 99]'), (3, '[\"2\", 1, 1]')"
+            ))
+
+            with Operations.context(MigrationContext.configure(conn)):
+                migration.upgrade()
+
+            edges = conn.execute(sa.text(
+                'SELECT task_id, depends_on_id FROM task_dependency '
+                'ORDER BY task_id, depends_on_id'
+            )).all()
+
+        assert [tuple(edge) for edge in edges] == [(2, 1), (3, 1), (3, 2)]
+
+    def test_downgrade_restores_dependencies(self, legacy_engine):
+        """Verify a downgrade writes the edges back to task.dependencies"""
+        migration = load_migration('8b2f4c6d1e93_add_task_dependency_table.py')
+        with legacy_engine.begin() as conn:
+            conn.execute(sa.text(
+                "INSERT INTO task (id, dependencies) VALUES (1, NULL), (2, '[1]')"
+            ))
+
+            with Operations.context(MigrationContext.configure(conn)):
+                migration.upgrade()
+                migration.downgrade()
+
+            rows = conn.execute(sa.text('SELECT id, dependencies FROM task ORDER BY id')).all()
+
+        assert [tuple(row) for row in rows] == [(1, None), (2, '[1]')]
+
+
 class TestDatabaseConstraints:
     """Test database constraints and integrity"""
 
@@ -247,7 +330,7 @@ class TestDatabaseConstraints:
         assert retrieved_task.project_id == project.id
 
     def test_task_dependencies_json_field(self, state_manager):
-        """Verify dependencies field handles JSON correctly"""
+        """Verify dependencies list round-trips through task_dependency"""
         project = state_manager.create_project(name="Test", description="Test project", working_dir="/tmp")
 
         # Create tasks with dependencies
@@ -0,0 +1,146 @@
+"""Tests for DeliverableAssessor - deliverable-based success assessment.
+
+Tests cover:
+- In-memory syntax checks per language
+- Single read per file per assessment
+- Incremental assessment (unchanged files reused across iterations)
+- Parallel and serial syntax checking agree
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.models import TaskOutcome
+from src.orchestration.deliverable_assessor import (
+    DeliverableAssessor,
+    FileSnapshot,
+    check_syntax
+)
+
+
+GOOD_MODULE = '''"""Example module."""
+
+import os
+
+
+def join(base: str, name: str) -> str:
+    """Join two path parts."""
+    return os.path.join(base, name)
+''' + '\n' * 400
+
+
+@pytest.fixture
+def task():
+    """Task stub with an id."""
+    return Mock(id=7)
+
+
+def make_watcher(paths):
+    """FileWatcher stub reporting paths as created."""
+    watcher = Mock()
+    watcher.get_recent_changes.return_value = [
+        {'file_path': str(p), 'change_type': 'created'} for p in paths
+    ]
+    return watcher
+
+
+class TestCheckSyntax:
+    """Tests for check_syntax() on in-memory content."""
+
+    @pytest.mark.parametrize('path,content,expected', [
+        ('a.py', 'x = 1\n', True),
+        ('a.py', 'def broken(\n', False),
+        ('a.json', '{"a": 1}', True),
+        ('a.json', '{"a": ', False),
+        ('a.yaml', 'a: [1, 2]\n', True),
+        ('a.yaml', 'a: [1, 2\n', False),
+        ('a.txt', 'anything', True),
+        ('a.txt', None, False),
+    ])
+    def test_check_syntax(self, path, content, expected):
+        """Test per-language syntax checks."""
+        assert check_syntax(path, content) is expected
+
+
+class TestAssessDeliverables:
+    """Tests for assess_deliverables() pipeline."""
+
+    def test_valid_files_succeed(self, tmp_path, task):
+        """Test well-formed files produce a successful outcome."""
+        paths = [tmp_path / f'mod_{i}.py' for i in range(3)]
+        for path in paths:
+            path.write_text(GOOD_MODULE)
+
+        assessor = DeliverableAssessor(make_watcher(paths), parallel=False)
+        assessment = assessor.assess_deliverables(task)
+
+        assert assessment.outcome == TaskOutcome.SUCCESS_WITH_LIMITS
+        assert assessment.syntax_valid is True
+        assert len(assessment.files) == 3
+
+    def test_syntax_errors_excluded(self, tmp_path, task):
+        """Test files with syntax errors are excluded from deliverables."""
+        good = tmp_path / 'good.py'
+        bad = tmp_path / 'bad.json'
+        good.write_text(GOOD_MODULE)
+        bad.write_text('{"broken": ')
+
+        assessor = DeliverableAssessor(make_watcher([good, bad]), parallel=False)
+        assessment = assessor.assess_deliverables(task)
+
+        assert assessment.files == [str(good)]
+        assert assessment.syntax_valid is False
+
+    def test_each_file_read_once(self, tmp_path, task):
+        """Test syntax and quality checks share a single read per file."""
+        path = tmp_path / 'mod.py'
+        path.write_text(GOOD_MODULE)
+        assessor = DeliverableAssessor(make_watcher([path]), parallel=False)
+
+        with patch.object(FileSnapshot, 'load', wraps=FileSnapshot.load) as mock_load:
+            assessor.assess_deliverables(task)
+
+        assert mock_load.call_count == 1
+
+    def test_unchanged_files_reused_across_iterations(self, tmp_path, task):
+        """Test repeat assessments only re-check changed files."""
+        unchanged = tmp_path / 'unchanged.py'
+        changed = tmp_path / 'changed.py'
+        unchanged.write_text(GOOD_MODULE)
+        changed.write_text(GOOD_MODULE)
+        assessor = DeliverableAssessor(make_watcher([unchanged, changed]), parallel=False)
+
+        first = assessor.assess_deliverables(task)
+        changed.write_text('def broken(\n')
+        second = assessor.assess_deliverables(task)
+
+        assert assessor.stats == {'files_assessed': 3, 'files_reused': 1}
+        assert first.files == [str(unchanged), str(changed)]
+        assert second.files == [str(unchanged)]
+
+    def test_cache_is_per_task(self, tmp_path):
+        """Test results are not reused across different tasks."""
+        path = tmp_path / 'mod.py'
+        path.write_text(GOOD_MODULE)
+        assessor = DeliverableAssessor(make_watcher([path]), parallel=False)
+
+        assessor.assess_deliverables(Mock(id=1))
+        assessor.assess_deliverables(Mock(id=2))
+
+        assert assessor.stats['files_reused'] == 0
+
+    def test_parallel_matches_serial(self, tmp_path, task):
+        """Test process-pool syntax checks agree with serial checks."""
+        paths = []
+        for i in range(DeliverableAssessor.PARALLEL_MIN_FILES):
+            path = tmp_path / f'mod_{i}.py'
+            path.write_text(GOOD_MODULE if i % 2 else 'def broken(\n')
+            paths.append(path)
+
+        serial = DeliverableAssessor(make_watcher(paths), parallel=False)
+        parallel = DeliverableAssessor(make_watcher(paths), parallel=True, max_workers=2)
+
+        assert (
+            serial.assess_deliverables(task).to_dict()['files'] ==
+            parallel.assess_deliverables(task).to_dict()['files']
+        )
@@ -274,9 +274,7 @@ class TestIsTaskReady:
         """Test task with no dependencies is ready."""
         resolver_obj, mock_state = resolver
 
-        task = Mock(id=1, dependencies=None)
-        task.has_dependencies.return_value = False
-        mock_state.get_task.return_value = task
+        mock_state.get_dependency_statuses.return_value = {}
 
         assert resolver_obj.is_task_ready(1) is True
 
@@ -284,34 +282,20 @@ class TestIsTaskReady:
         """Test task ready when all dependencies completed."""
         resolver_obj, mock_state = resolver
 
-        task = Mock(id=3, dependencies=[1, 2])
-        task.has_dependencies.return_value = True
-        task.get_dependencies.return_value = [1, 2]
-
-        dep1 = Mock(id=1, status=TaskStatus.COMPLETED)
-        dep2 = Mock(id=2, status=TaskStatus.COMPLETED)
-
-        def get_task_side_effect(task_id):
-            return {1: dep1, 2: dep2, 3: task}[task_id]
-
-        mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.return_value = {
+            1: TaskStatus.COMPLETED,
+            2: TaskStatus.COMPLETED
+        }
 
         assert resolver_obj.is_task_ready(3) is True
+        mock_state.get_dependency_statuses.assert_called_once_with(3)
+        mock_state.get_task.assert_not_called()
 
     def test_task_not_ready_dependency_pending(self, resolver):
         """Test task not ready when dependency is pending."""
         resolver_obj, mock_state = resolver
 
-        task = Mock(id=2, dependencies=[1])
-        task.has_dependencies.return_value = True
-        task.get_dependencies.return_value = [1]
-
-        dep1 = Mock(id=1, status=TaskStatus.PENDING)
-
-        def get_task_side_effect(task_id):
-            return {1: dep1, 2: task}[task_id]
-
-        mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.return_value = {1: TaskStatus.PENDING}
 
         assert resolver_obj.is_task_ready(2) is False
 
@@ -319,16 +303,7 @@ class TestIsTaskReady:
         """Test task not ready when dependency is in progress."""
         resolver_obj, mock_state = resolver
 
-        task = Mock(id=2, dependencies=[1])
-        task.has_dependencies.return_value = True
-        task.get_dependencies.return_value = [1]
-
-        dep1 = Mock(id=1, status=TaskStatus.RUNNING)
-
-        def get_task_side_effect(task_id):
-            return {1: dep1, 2: task}[task_id]
-
-        mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.return_value = {1: TaskStatus.RUNNING}
 
         assert resolver_obj.is_task_ready(2) is False
 
@@ -336,16 +311,7 @@ class TestIsTaskReady:
         """Test task not ready when dependency failed and fail_on_dependency_error=True."""
         resolver_obj, mock_state = resolver
 
-        task = Mock(id=2, dependencies=[1])
-        task.has_dependencies.return_value = True
-        task.get_dependencies.return_value = [1]
-
-        dep1 = Mock(id=1, status=TaskStatus.FAILED)
-
-        def get_task_side_effect(task_id):
-            return {1: dep1, 2: task}[task_id]
-
-        mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.return_value = {1: TaskStatus.FAILED}
 
         assert resolver_obj.is_task_ready(2) is False
 
@@ -356,33 +322,23 @@ class TestIsTaskReady:
         config.get.return_value = {'fail_on_dependency_error': False}
         resolver_obj = DependencyResolver(mock_state, config)
 
-        task = Mock(id=2, dependencies=[1])
-        task.has_dependencies.return_value = True
-        task.get_dependencies.return_value = [1]
+        mock_state.get_dependency_statuses.return_value = {1: TaskStatus.COMPLETED}
 
-        dep1 = Mock(id=1, status=TaskStatus.COMPLETED)
+        assert resolver_obj.is_task_ready(2) is True
 
-        def get_task_side_effect(task_id):
-            return {1: dep1, 2: task}[task_id]
+    def test_task_not_ready_dependency_missing(self, resolver):
+        """Test task not ready when a dependency no longer exists."""
+        resolver_obj, mock_state = resolver
 
-        mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.return_value = {1: None}
 
-        assert resolver_obj.is_task_ready(2) is True
+        assert resolver_obj.is_task_ready(2) is False
 
     def test_task_not_ready_dependency_error(self, resolver):
         """Test task not ready when dependency check fails."""
         resolver_obj, mock_state = resolver
 
-        task = Mock(id=2, dependencies=[1])
-        task.has_dependencies.return_value = True
-        task.get_dependencies.return_value = [1]
-
-        def get_task_side_effect(task_id):
-            if task_id == 1:
-                raise Exception("Dependency not found")
-            return task
-
-        mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.side_effect = Exception("Database error")
 
         assert resolver_obj.is_task_ready(2) is False
 
@@ -400,13 +356,7 @@ class TestGetBlockedTasks:
         """Test when no tasks are blocked."""
         resolver_obj, mock_state = resolver
 
-        task1 = Mock(id=1, status=TaskStatus.PENDING, dependencies=None)
-        task1.has_dependencies.return_value = False
-
-        task2 = Mock(id=2, status=TaskStatus.COMPLETED, dependencies=None)
-        task2.has_dependencies.return_value = False
-
-        mock_state.get_tasks_by_project.return_value = [task1, task2]
+        mock_state.get_task_readiness.return_value = {1: True}
 
         blocked = resolver_obj.get_blocked_tasks(project_id=1)
 
@@ -416,45 +366,26 @@ class TestGetBlockedTasks:
         """Test identifying blocked tasks."""
         resolver_obj, mock_state = resolver
 
-        task1 = Mock(id=1, status=TaskStatus.COMPLETED, dependencies=None)
-        task1.has_dependencies.return_value = False
-
-        task2 = Mock(id=2, status=TaskStatus.PENDING, dependencies=[1])
-        task2.has_dependencies.return_value = True
-        task2.get_dependencies.return_value = [1]
-
-        task3 = Mock(id=3, status=TaskStatus.READY, dependencies=[2])
-        task3.has_dependencies.return_value = True
-        task3.get_dependencies.return_value = [2]
-
-        def get_task_side_effect(task_id):
-            return {1: task1, 2: task2, 3: task3}[task_id]
-
-        mock_state.get_tasks_by_project.return_value = [task1, task2, task3]
-        mock_state.get_task.side_effect = get_task_side_effect
+        # Task 2 depends on completed task 1, task 3 on pending task 2
+        mock_state.get_task_readiness.return_value = {2: True, 3: False}
 
         blocked = resolver_obj.get_blocked_tasks(project_id=1)
 
-        # Task 2 should be ready (depends on completed task 1)
-        # Task 3 should be blocked (depends on pending task 2)
         assert 3 in blocked
         assert 2 not in blocked
+        mock_state.get_task.assert_not_called()
 
-    def test_get_blocked_tasks_ignores_completed(self, resolver):
+    def test_get_blocked_tasks_only_pending_and_ready(self, resolver):
         """Test completed tasks are not considered blocked."""
         resolver_obj, mock_state = resolver
 
-        task1 = Mock(id=1, status=TaskStatus.COMPLETED, dependencies=[2])
-        task1.has_dependencies.return_value = True
+        mock_state.get_task_readiness.return_value = {}
 
-        task2 = Mock(id=2, status=TaskStatus.PENDING, dependencies=None)
-        task2.has_dependencies.return_value = False
-
-        mock_state.get_tasks_by_project.return_value = [task1, task2]
+        resolver_obj.get_blocked_tasks(project_id=1)
 
-        blocked = resolver_obj.get_blocked_tasks(project_id=1)
-
-        assert 1 not in blocked  # Completed tasks not checked
+        mock_state.get_task_readiness.assert_called_once_with(
+            1, statuses=[TaskStatus.PENDING, TaskStatus.READY]
+        )
 
 
 class TestGetExecutionOrder:
@@ -996,6 +927,11 @@ class TestDependencyResolverIntegration:
 
         mock_state.get_tasks_by_project.return_value = [task1, task2, task3]
         mock_state.get_task.side_effect = get_task_side_effect
+        mock_state.get_dependency_statuses.side_effect = lambda task_id: {
+            dep_id: get_task_side_effect(dep_id).status
+            for dep_id in get_task_side_effect(task_id).get_dependencies()
+        }
+        mock_state.get_task_readiness.return_value = {2: True, 3: False}
 
         # Task 2 should be ready (depends on completed task 1)
         assert resolver_obj.is_task_ready(2) is True
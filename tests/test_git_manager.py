@@ -544,3 +544,107 @@ class TestGitManagerIntegration:
 
         # Verify all git commands were called
         assert mock_run.call_count == 5
+
+
+@pytest.fixture
+def real_repo(git_config, mock_llm, mock_state_manager, tmp_path):
+    """GitManager on a real repository with one committed file."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+    (repo / 'app.py').write_text("a = 1\nb = 2\nc = 3\n")
+    subprocess.run(['git', '-C', str(repo), 'add', '-A'], check=True)
+    subprocess.run(
+        ['git'] + GitManager.WORKTREE_IDENTITY + ['-C', str(repo), 'commit', '-qm', 'init'],
+        check=True
+    )
+    manager = GitManager(git_config, mock_llm, mock_state_manager)
+    manager.initialize(str(repo))
+    return manager
+
+
+class TestWorktrees:
+    """Tests for worktree isolation and merging (real git)."""
+
+    def test_worktree_lifecycle(self, real_repo):
+        """Test create, commit and remove a detached worktree."""
+        path = real_repo.create_worktree()
+        assert (path / 'app.py').exists()
+
+        assert real_repo.commit_worktree(path, 'no changes') is None
+        (path / 'new.py').write_text("x = 1\n")
+        commit = real_repo.commit_worktree(path, 'add new.py')
+
+        assert commit == real_repo.get_commit('HEAD', path=path)
+        assert real_repo.get_status()['is_clean']
+
+        real_repo.remove_worktree(path)
+        assert not path.exists()
+
+    def test_three_way_merge_and_apply(self, real_repo):
+        """Test non-overlapping edits merge and land as uncommitted changes."""
+        base = real_repo.get_commit()
+        left, right, integration = (real_repo.create_worktree(base) for _ in range(3))
+        (left / 'app.py').write_text("a = 10\nb = 2\nc = 3\n")
+        (right / 'app.py').write_text("a = 1\nb = 2\nc = 30\n")
+        left_commit = real_repo.commit_worktree(left, 'left')
+        right_commit = real_repo.commit_worktree(right, 'right')
+
+        assert real_repo.merge_into_worktree(integration, left_commit, 'merge left') == []
+        assert real_repo.merge_into_worktree(integration, right_commit, 'merge right') == []
+        assert real_repo.apply_commit(real_repo.get_commit('HEAD', path=integration)) == []
+
+        assert (real_repo.project_dir / 'app.py').read_text() == "a = 10\nb = 2\nc = 30\n"
+        assert real_repo.get_commit() == base
+        for path in (left, right, integration):
+            real_repo.remove_worktree(path)
+
+    def test_merge_conflict_reported_and_aborted(self, real_repo):
+        """Test overlapping edits report conflicts and leave the worktree clean."""
+        base = real_repo.get_commit()
+        left, right = real_repo.create_worktree(base), real_repo.create_worktree(base)
+        (left / 'app.py').write_text("a = 10\nb = 2\nc = 3\n")
+        (right / 'app.py').write_text("a = 99\nb = 2\nc = 3\n")
+        real_repo.commit_worktree(left, 'left')
+        right_commit = real_repo.commit_worktree(right, 'right')
+
+        conflicts = real_repo.merge_into_worktree(left, right_commit, 'merge right')
+
+        assert conflicts == ['app.py']
+        assert (left / 'app.py').read_text() == "a = 10\nb = 2\nc = 3\n"
+        real_repo.remove_worktree(left)
+        real_repo.remove_worktree(right)
+
+    def test_fork_carries_working_tree_and_applies_back(self, real_repo):
+        """Test a fork starts from uncommitted state and only its own edits come back."""
+        project = real_repo.project_dir
+        (project / 'app.py').write_text("a = 10\nb = 2\nc = 3\n")
+        (project / 'notes.txt').write_text("draft\n")
+        head = real_repo.get_commit()
+
+        path, base = real_repo.fork_worktree()
+        assert (path / 'app.py').read_text() == "a = 10\nb = 2\nc = 3\n"
+        assert (path / 'notes.txt').read_text() == "draft\n"
+        (path / 'app.py').write_text("a = 10\nb = 2\nc = 30\n")
+        (path / 'notes.txt').unlink()
+        (path / 'new.py').write_text("x = 1\n")
+        # Fork edits stay out of the project until applied
+        assert (project / 'app.py').read_text() == "a = 10\nb = 2\nc = 3\n"
+
+        assert real_repo.apply_worktree_changes(path, base) is True
+        real_repo.remove_worktree(path)
+
+        assert (project / 'app.py').read_text() == "a = 10\nb = 2\nc = 30\n"
+        assert not (project / 'notes.txt').exists()
+        assert (project / 'new.py').read_text() == "x = 1\n"
+        assert real_repo.get_commit() == head
+
+    def test_discarded_fork_leaves_project_untouched(self, real_repo):
+        """Test removing a fork drops its edits."""
+        path, base = real_repo.fork_worktree()
+        (path / 'app.py').write_text("broken\n")
+
+        real_repo.remove_worktree(path)
+
+        assert (real_repo.project_dir / 'app.py').read_text() == "a = 1\nb = 2\nc = 3\n"
+        assert real_repo.get_status()['is_clean']
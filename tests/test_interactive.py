@@ -447,6 +447,46 @@ class TestErrorHandling:
         assert 'Failed to list projects' in captured.out
 
 
+class TestProfileCommand:
+    """Test /profile command."""
+
+    @pytest.fixture
+    def profiler(self, tmp_path, monkeypatch):
+        """Process-wide profiler writing to tmp_path."""
+        from src.monitoring import profiler as profiler_module
+        profiler = profiler_module.SamplingProfiler(interval_ms=1, output_dir=str(tmp_path))
+        monkeypatch.setattr(profiler_module, '_profiler_instance', profiler)
+        yield profiler
+        profiler.stop()
+
+    def test_profile_start_stop(self, interactive, profiler, capsys):
+        """Test start then stop prints the summary and file paths."""
+        interactive._execute_command('/profile start')
+        assert profiler.is_running
+
+        interactive._execute_command('/profile stop')
+
+        captured = capsys.readouterr()
+        assert 'Profiling started' in captured.out
+        assert 'Top functions by self time' in captured.out
+        assert 'Collapsed stacks:' in captured.out
+        assert not profiler.is_running
+
+    def test_profile_stop_when_idle(self, interactive, profiler, capsys):
+        """Test stop without start."""
+        interactive.cmd_profile(['stop'])
+
+        captured = capsys.readouterr()
+        assert 'not running' in captured.out
+
+    def test_profile_usage(self, interactive, profiler, capsys):
+        """Test unknown subcommand prints usage."""
+        interactive.cmd_profile(['bogus'])
+
+        captured = capsys.readouterr()
+        assert 'Usage: /profile start|stop|status' in captured.out
+
+
 class TestInteractiveLoop:
     """Test interactive loop functionality."""
 
@@ -1,7 +1,15 @@
 """Tests for JSON extraction utilities."""
 
 import pytest
-from src.utils.json_extractor import extract_json, validate_json_structure, ensure_json_keys
+from src.utils.json_extractor import (
+    JsonObjectScanner,
+    extract_json,
+    extract_json_from_stream,
+    ensure_json_keys,
+    iter_json_candidates,
+    iter_json_objects,
+    validate_json_structure,
+)
 
 
 class TestExtractJson:
@@ -122,6 +130,90 @@ class TestExtractJson:
         assert result == {"description": "Line 1\nLine 2\nLine 3"}
 
 
+class TestJsonScanner:
+    """Test the brace-depth candidate scanner and streaming extraction."""
+
+    TEXT = (
+        'Plan {not json {"a": "x\\"}{"}} then {"b": [1, {"c": 2}]}\n'
+        '```json\n{"d": "}"}\n```'
+    )
+
+    def test_braces_in_strings_ignored(self):
+        """Test braces and escaped quotes inside strings don't end an object."""
+        assert list(iter_json_candidates(self.TEXT)) == [
+            '{not json {"a": "x\\"}{"}}',
+            '{"b": [1, {"c": 2}]}',
+            '{"d": "}"}'
+        ]
+
+    def test_invalid_candidate_searched_for_nested_objects(self):
+        """Test prose in braces falls back to the objects it contains."""
+        assert list(iter_json_objects(self.TEXT)) == [
+            {'a': 'x"}{'}, {'b': [1, {'c': 2}]}, {'d': '}'}
+        ]
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7])
+    def test_chunked_input_matches_whole_text(self, size):
+        """Test any chunking (including split escapes) gives the same objects."""
+        chunks = [self.TEXT[i:i + size] for i in range(0, len(self.TEXT), size)]
+
+        assert list(iter_json_objects(iter(chunks))) == list(iter_json_objects(self.TEXT))
+
+    def test_unclosed_brace_before_object(self):
+        """Test an unmatched '{' in prose doesn't hide the objects after it."""
+        response = 'Use {{name} or {"key": "value"} here'
+
+        assert extract_json(response) == {'key': 'value'}
+
+    def test_stray_quote_in_prose_doesnt_hide_objects(self):
+        """Test a lone quote inside braces doesn't swallow the objects after it."""
+        assert extract_json('{ he said "hi } and then {"a":1}') == {'a': 1}
+        assert extract_json('{ "x } {"a": 1} " }') == {'a': 1}
+
+    @pytest.mark.parametrize('closing', ['', '}'])
+    def test_deeply_nested_prose(self, closing):
+        """Test thousands of nesting levels are passed over without recursion."""
+        depth = 5000
+        response = '{' * depth + '{"a": 1}' + closing * depth
+
+        assert list(iter_json_objects(response)) == [{'a': 1}]
+
+    def test_rejected_candidate_rescanned(self):
+        """Test reject() resumes the scan inside the candidate."""
+        scanner = JsonObjectScanner()
+        candidates = scanner.feed('{x {"a": 1} y} {"b": 2}')
+
+        assert next(candidates) == '{x {"a": 1} y}'
+        scanner.reject()
+        assert list(candidates) == ['{"a": 1}', '{"b": 2}']
+
+    def test_extract_json_required_keys(self):
+        """Test extraction skips objects without the expected keys."""
+        assert extract_json(self.TEXT, required_keys=['d']) == {'d': '}'}
+        assert extract_json(self.TEXT, required_keys=['missing']) is None
+
+    def test_long_partial_candidate_dropped(self):
+        """Test unfinished objects beyond the limit are not buffered."""
+        scanner = JsonObjectScanner(max_object_chars=10)
+
+        assert list(scanner.feed('{"key": "' + 'x' * 20)) == []
+        assert list(scanner.feed('"} {"a": 1}')) == ['{"a": 1}']
+
+    def test_stream_stops_at_first_match(self):
+        """Test the stream is not consumed past the matching object."""
+        consumed = []
+
+        def stream():
+            for chunk in ['Thinking {"step": 1}', ' {"is_valid": ', 'true}', ' more', ' text']:
+                consumed.append(chunk)
+                yield chunk
+
+        result = extract_json_from_stream(stream(), required_keys=['is_valid'])
+
+        assert result == {'is_valid': True}
+        assert consumed[-1] == 'true}'
+
+
 class TestValidateJsonStructure:
     """Test JSON structure validation."""
 
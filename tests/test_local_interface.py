@@ -8,8 +8,10 @@ This module tests the Ollama integration including:
 - Token counting
 - Health checks
 - Performance metrics
+- Async generation
 """
 
+import asyncio
 import json
 import pytest
 import time
@@ -17,6 +19,7 @@ from unittest.mock import Mock, patch, MagicMock
 from typing import Iterator
 
 from src.llm.local_interface import LocalLLMInterface
+from src.llm.prompt_segments import SegmentedPrompt
 from src.plugins.exceptions import (
     LLMConnectionException,
     LLMTimeoutException,
@@ -750,6 +753,32 @@ class TestMetrics:
         assert metrics['cache_misses'] >= 1
         assert metrics['cache_hit_rate'] >= 0.0
 
+    @patch('src.llm.local_interface.requests.post')
+    @patch('src.llm.local_interface.requests.get')
+    def test_metrics_prefix_reuse(self, mock_get, mock_post):
+        """Test segmented prompts sharing a prefix are counted as reuses."""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            'models': [{'name': 'test-model'}]
+        }
+
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {
+            'response': 'Test'
+        }
+
+        llm = LocalLLMInterface()
+        llm.initialize({'model': 'test-model'})
+
+        llm.generate(SegmentedPrompt({'system': 'S', 'task': 'task 1'}))
+        llm.generate(SegmentedPrompt({'system': 'S', 'task': 'task 2'}))
+        llm.generate("plain prompt")
+
+        metrics = llm.get_metrics()
+
+        assert metrics['prefix_reuses'] == 1
+        assert metrics['prefix_reuse_rate'] == 0.5
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -861,5 +890,67 @@ class TestIntegration:
         assert info['model_name'] == 'test-model'
 
 
+class TestAsyncGeneration:
+    """Test agenerate() with and without httpx."""
+
+    @pytest.fixture
+    def llm(self):
+        """Initialized interface (Ollama health/model checks mocked)."""
+        with patch('src.llm.local_interface.requests.get') as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {
+                'models': [{'name': 'test-model'}]
+            }
+            llm = LocalLLMInterface()
+            llm.initialize({'model': 'test-model', 'retry_attempts': 2})
+        return llm
+
+    @patch('src.llm.local_interface.requests.post')
+    def test_agenerate_falls_back_to_thread(self, mock_post, llm):
+        """Test agenerate uses generate() in a thread when httpx is missing."""
+        mock_post.return_value.json.return_value = {'response': 'Threaded response'}
+
+        with patch('src.llm.local_interface.HTTPX_AVAILABLE', False):
+            response = asyncio.run(llm.agenerate("Test prompt", max_tokens=50))
+
+        assert response == 'Threaded response'
+        payload = mock_post.call_args[1]['json']
+        assert payload['options']['num_predict'] == 50
+
+    def test_agenerate_with_httpx(self, llm):
+        """Test native async request, payload and metrics."""
+        httpx = pytest.importorskip('httpx')
+        seen = []
+
+        def handler(request):
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, json={'response': 'Async response'})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(llm, '_get_async_client', return_value=client):
+            response = asyncio.run(llm.agenerate("Test prompt", temperature=0.9))
+
+        assert response == 'Async response'
+        assert seen[0]['options']['temperature'] == 0.9
+        assert llm.metrics['calls'] == 1
+        assert llm.metrics['total_tokens'] > 0
+
+    def test_agenerate_httpx_timeout(self, llm):
+        """Test httpx timeouts map to LLMTimeoutException."""
+        httpx = pytest.importorskip('httpx')
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        llm.retry_manager = None
+        with patch.object(llm, '_get_async_client', return_value=client):
+            with pytest.raises(LLMTimeoutException):
+                asyncio.run(llm.agenerate("Test prompt"))
+
+        assert llm.metrics['timeouts'] == 1
+        assert llm.metrics['errors'] == 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,232 @@
+"""Tests for MetricsCollector - bucketed metrics and streaming percentiles.
+
+Tests cover:
+- LatencySketch accuracy and merging
+- Rolling-window aggregation from per-second buckets
+- Per-thread recording shards
+- Prometheus text exposition
+"""
+
+import random
+import threading
+
+import pytest
+
+from src.core.metrics import (
+    LatencySketch,
+    MetricsCollector,
+    SKETCH_RELATIVE_ACCURACY,
+    _format_value
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Fake clock for deterministic windows."""
+    return FakeClock()
+
+
+@pytest.fixture
+def collector(clock):
+    """Collector with a one-minute window."""
+    return MetricsCollector(window_minutes=1, clock=clock)
+
+
+class TestLatencySketch:
+    """Tests for LatencySketch quantile estimates."""
+
+    def test_empty_sketch(self):
+        """Test empty sketch reports zero."""
+        assert LatencySketch().quantile(0.95) == 0.0
+
+    def test_single_value_is_exact(self):
+        """Test estimates are clamped to the observed range."""
+        sketch = LatencySketch()
+        sketch.add(1234)
+        assert sketch.quantile(0.5) == 1234
+        assert sketch.quantile(0.99) == 1234
+
+    @pytest.mark.parametrize('q', [0.5, 0.95, 0.99])
+    def test_quantiles_within_relative_accuracy(self, q):
+        """Test estimates match sorted-list percentiles within tolerance."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(6, 1) for _ in range(5000)]
+        sketch = LatencySketch()
+        for value in values:
+            sketch.add(value)
+
+        exact = sorted(values)[int(len(values) * q)]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=SKETCH_RELATIVE_ACCURACY)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merged sketches equal one sketch over all values."""
+        combined, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+        for value in range(1, 1001):
+            combined.add(value)
+            (left if value % 2 else right).add(value)
+        left.merge(right)
+
+        assert left.count == combined.count
+        assert left.quantile(0.95) == combined.quantile(0.95)
+
+    def test_zero_values(self):
+        """Test non-positive values are counted without log errors."""
+        sketch = LatencySketch()
+        for value in (0, 0, 0, 10):
+            sketch.add(value)
+        assert sketch.quantile(0.5) == 0.0
+
+
+class TestRollingWindow:
+    """Tests for per-second bucket aggregation."""
+
+    def test_llm_metrics(self, collector):
+        """Test counts, success rate and provider breakdown."""
+        collector.record_llm_request('ollama', latency_ms=100, success=True)
+        collector.record_llm_request('ollama', latency_ms=300, success=False)
+        collector.record_llm_request('openai-codex', latency_ms=200, success=True)
+
+        metrics = collector.get_llm_metrics()
+
+        assert metrics['count'] == 3
+        assert metrics['success_rate'] == pytest.approx(2 / 3)
+        assert metrics['avg_latency'] == pytest.approx(200)
+        assert metrics['latency_p99'] == 300
+        assert metrics['by_provider'] == {
+            'ollama': {'count': 2, 'success_rate': 0.5},
+            'openai-codex': {'count': 1, 'success_rate': 1.0},
+        }
+
+    def test_agent_and_nl_metrics(self, collector):
+        """Test agent and NL command aggregates."""
+        collector.record_agent_execution('local', duration_s=2.0, success=True, files_modified=3)
+        collector.record_agent_execution('local', duration_s=4.0, success=True, files_modified=1)
+        collector.record_nl_command('QUERY', latency_ms=50, success=True)
+
+        agent = collector.get_agent_metrics()
+        nl = collector.get_nl_command_metrics()
+
+        assert agent['avg_duration'] == pytest.approx(3.0)
+        assert agent['total_files_modified'] == 4
+        assert nl['by_operation'] == {'QUERY': {'count': 1, 'success_rate': 1.0}}
+
+    def test_samples_expire_but_totals_persist(self, collector, clock):
+        """Test samples leave the window while startup totals remain."""
+        collector.record_nl_command('CREATE', latency_ms=10, success=True)
+        clock.advance(30)
+        collector.record_nl_command('QUERY', latency_ms=20, success=True)
+
+        clock.advance(45)
+
+        assert collector.get_nl_command_metrics()['count'] == 1
+        assert collector.total_nl_commands == 2
+
+        clock.advance(60)
+
+        assert collector.get_nl_command_metrics()['count'] == 0
+
+    def test_buckets_bounded_by_window(self, collector, clock):
+        """Test memory is bounded by window seconds, not sample count."""
+        for _ in range(300):
+            for _ in range(10):
+                collector.record_llm_request('ollama', latency_ms=100, success=True)
+            clock.advance(1)
+
+        shard = collector._shards[0]
+        assert len(shard.series['llm'].buckets) <= collector.window_seconds
+        assert collector.get_llm_metrics()['count'] <= 10 * collector.window_seconds
+
+    def test_read_reflects_new_writes(self, collector):
+        """Test cached window is invalidated by a write in the same second."""
+        collector.record_llm_request('ollama', latency_ms=100, success=True)
+        assert collector.get_llm_metrics()['count'] == 1
+
+        collector.record_llm_request('ollama', latency_ms=100, success=True)
+        assert collector.get_llm_metrics()['count'] == 2
+
+    def test_reset(self, collector):
+        """Test reset discards window and totals."""
+        collector.record_llm_request('ollama', latency_ms=100, success=True)
+        collector.reset()
+
+        assert collector.get_llm_metrics()['count'] == 0
+        assert collector.total_llm_requests == 0
+
+
+class TestThreadShards:
+    """Tests for per-thread recording shards."""
+
+    def test_concurrent_writers(self, collector):
+        """Test each thread records into its own shard without loss."""
+        def worker():
+            for _ in range(500):
+                collector.record_nl_command('QUERY', latency_ms=5, success=True)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert collector.get_nl_command_metrics()['count'] == 2000
+
+    def test_exited_thread_shards_retired(self, collector, clock):
+        """Test shards of finished threads are dropped once their window expires."""
+        thread = threading.Thread(
+            target=collector.record_llm_request,
+            args=('ollama', 100, True)
+        )
+        thread.start()
+        thread.join()
+        assert len(collector._shards) == 1
+
+        clock.advance(collector.window_seconds + 1)
+        collector.get_llm_metrics()
+
+        assert collector._shards == []
+        assert collector.total_llm_requests == 1
+
+
+class TestPrometheusExposition:
+    """Tests for to_prometheus() output."""
+
+    def test_exposition(self, collector):
+        """Test counters, summaries and health gauge are exported."""
+        collector.record_llm_request('ollama', latency_ms=100, success=True)
+        collector.record_llm_request('ollama', latency_ms=100, success=False)
+        collector.record_nl_command('QUE"RY', latency_ms=5, success=True)
+
+        text = collector.to_prometheus()
+
+        assert '# TYPE obra_llm_requests_total counter' in text
+        assert 'obra_llm_requests_total{provider="ollama",outcome="success"} 1' in text
+        assert 'obra_llm_latency_ms{quantile="0.95"} 100' in text
+        assert 'obra_llm_latency_ms_count 2' in text
+        assert 'obra_nl_commands_total{operation="QUE\\"RY",outcome="success"} 1' in text
+        assert 'obra_agent_duration_seconds{quantile="0.5"} NaN' in text
+        assert 'obra_health_status{status="unhealthy"} 1' in text
+        assert text.endswith('\n')
+
+    @pytest.mark.parametrize('value, expected', [
+        (float('inf'), '+Inf'),
+        (float('-inf'), '-Inf'),
+        (float('nan'), 'NaN'),
+        (3.0, '3'),
+        (0.25, '0.25'),
+    ])
+    def test_format_value(self, value, expected):
+        """Test special and integral values use exposition format."""
+        assert _format_value(value) == expected
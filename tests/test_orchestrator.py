@@ -112,6 +112,21 @@ class TestOrchestratorInitialization:
 
         assert orchestrator._state == OrchestratorState.INITIALIZED
 
+    def test_nl_components_built_on_first_use(self, test_config):
+        """Test initialize() defers the NL components until accessed."""
+        orchestrator = Orchestrator(config=test_config)
+        orchestrator.initialize()
+
+        assert orchestrator._nl_components_pending
+        assert orchestrator._intent_to_task_converter is None
+
+        converter = orchestrator.intent_to_task_converter
+
+        assert converter is not None
+        assert converter.state_manager is orchestrator.state_manager
+        assert orchestrator.nl_query_helper is not None
+        assert not orchestrator._nl_components_pending
+
     @pytest.mark.skip(reason="StateManager singleton prevents proper test isolation - URL validation is lenient")
     def test_initialize_failure(self, test_config):
         """Test initialization failure handling."""
@@ -0,0 +1,439 @@
+"""Tests for ParallelAgentCoordinator work-queue execution.
+
+Tests cover:
+- All subtasks run, not just the first max_parallel_agents
+- Concurrency bound and agent reuse
+- Dependency-driven dispatch across parallel groups
+- Failure propagation, timeouts and cancellation
+- Worktree and process isolation
+"""
+
+import os
+import subprocess
+import threading
+import time
+import warnings
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from src.orchestration.subtask import SubTask
+from src.utils.git_manager import GitConfig, GitManager
+
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore', DeprecationWarning)
+    from src.orchestration.parallel_agent_coordinator import ParallelAgentCoordinator
+
+pytestmark = pytest.mark.filterwarnings('ignore::DeprecationWarning')
+
+
+class RecordingAgent:
+    """Agent stub that records concurrency and per-subtask timing."""
+
+    created = []
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def __init__(self, delay=0.02, delays=None, fail_titles=(), block=None):
+        self.delay = delay
+        self.delays = delays or {}
+        self.fail_titles = set(fail_titles)
+        self.block = block
+        self.prompts = []
+        self.cleaned_up = False
+        RecordingAgent.created.append(self)
+
+    def initialize(self, config):
+        pass
+
+    def send_prompt(self, prompt, context=None):
+        with RecordingAgent.lock:
+            RecordingAgent.running += 1
+            RecordingAgent.peak = max(RecordingAgent.peak, RecordingAgent.running)
+        try:
+            self.prompts.append(prompt)
+            if self.block is not None and 'Blocking' in prompt:
+                self.block.wait(timeout=5)
+            title = prompt.split('\n', 1)[0][len('# Task: '):]
+            time.sleep(self.delays.get(title, self.delay))
+            if title in self.fail_titles:
+                raise RuntimeError(f"{title} failed")
+            return 'done'
+        finally:
+            with RecordingAgent.lock:
+                RecordingAgent.running -= 1
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+@pytest.fixture(autouse=True)
+def reset_agents():
+    """Reset class-level agent bookkeeping."""
+    RecordingAgent.created = []
+    RecordingAgent.running = 0
+    RecordingAgent.peak = 0
+    yield
+
+
+def make_subtask(subtask_id, dependencies=(), group=None, title=None, duration=10):
+    """Create a pending subtask."""
+    return SubTask(
+        subtask_id=subtask_id,
+        parent_task_id=100,
+        title=title or f"Step {subtask_id}",
+        description=f"Implement step {subtask_id}",
+        estimated_complexity=20.0,
+        estimated_duration_minutes=duration,
+        dependencies=list(dependencies),
+        parallel_group=group
+    )
+
+
+def make_coordinator(max_agents=2, timeout=10, **agent_kwargs):
+    """Coordinator whose factory builds RecordingAgents."""
+    state_manager = Mock()
+    coordinator = ParallelAgentCoordinator(
+        state_manager=state_manager,
+        agent_factory=lambda: RecordingAgent(**agent_kwargs),
+        config={'max_parallel_agents': max_agents, 'agent_timeout_seconds': timeout}
+    )
+    return coordinator, state_manager
+
+
+@pytest.fixture
+def parent_task():
+    """Parent task stub."""
+    return Mock(id=100, title='Parent')
+
+
+class TestWorkQueue:
+    """Tests for bounded, reusable agent pool."""
+
+    def test_runs_every_subtask_with_bounded_pool(self, parent_task):
+        """Test more subtasks than agents all complete on reused agents."""
+        coordinator, state_manager = make_coordinator(max_agents=2)
+        subtasks = [make_subtask(i, group=1) for i in range(1, 7)]
+
+        results = coordinator.execute_parallel(subtasks, parent_task)
+
+        assert [r['subtask_id'] for r in results] == [1, 2, 3, 4, 5, 6]
+        assert all(r['status'] == 'completed' for r in results)
+        assert all(st.status == 'completed' for st in subtasks)
+        assert RecordingAgent.peak <= 2
+        assert len(RecordingAgent.created) == 2
+        assert all(agent.cleaned_up for agent in RecordingAgent.created)
+
+        attempt = state_manager.log_parallel_attempt.call_args.kwargs['attempt_data']
+        assert attempt['num_agents'] == 2
+        assert attempt['max_concurrent_agents'] == 2
+        assert attempt['subtask_ids'] == [1, 2, 3, 4, 5, 6]
+
+    def test_dependent_starts_before_sibling_group_finishes(self, parent_task):
+        """Test dispatch follows dependencies, not group boundaries."""
+        coordinator, _ = make_coordinator(max_agents=2, delay=0.01, delays={'Slow': 0.3})
+        slow = make_subtask(1, group=1, title='Slow', duration=60)
+        fast = make_subtask(2, group=1, title='Fast')
+        follow_up = make_subtask(3, dependencies=[2], group=2, title='Follow up')
+        finished = {}
+        original = coordinator._execute_agent_for_subtask
+
+        def tracking(subtask, *args, **kwargs):
+            original(subtask, *args, **kwargs)
+            finished[subtask.subtask_id] = time.monotonic()
+
+        coordinator._execute_agent_for_subtask = tracking
+
+        results = coordinator.execute_parallel([slow, fast, follow_up], parent_task)
+
+        assert all(r['status'] == 'completed' for r in results)
+        assert finished[3] < finished[1]
+
+    def test_failed_dependency_cancels_dependents(self, parent_task):
+        """Test dependents of a failed subtask are cancelled, others still run."""
+        coordinator, _ = make_coordinator(max_agents=2, fail_titles=['Step 1'])
+        subtasks = [
+            make_subtask(1),
+            make_subtask(2, dependencies=[1]),
+            make_subtask(3, dependencies=[2]),
+            make_subtask(4)
+        ]
+
+        results = {r['subtask_id']: r for r in coordinator.execute_parallel(subtasks, parent_task)}
+
+        assert results[1]['status'] == 'failed'
+        assert results[2]['status'] == 'cancelled'
+        assert results[3]['status'] == 'cancelled'
+        assert results[4]['status'] == 'completed'
+
+    def test_dependency_cycle_reported(self, parent_task):
+        """Test cyclic subtasks are cancelled instead of hanging."""
+        coordinator, _ = make_coordinator()
+        subtasks = [make_subtask(1, dependencies=[2]), make_subtask(2, dependencies=[1])]
+
+        results = coordinator.execute_parallel(subtasks, parent_task)
+
+        assert all(r['status'] == 'cancelled' for r in results)
+        assert 'cycle' in results[0]['error']
+
+    def test_testing_subtask_runs_alone(self, parent_task):
+        """Test a testing subtask never overlaps other subtasks."""
+        coordinator, _ = make_coordinator(max_agents=3)
+        subtasks = [
+            make_subtask(1, group=1),
+            make_subtask(2, group=2),
+            make_subtask(3, group=3, title='Run test suite'),
+            make_subtask(4, group=4)
+        ]
+        overlaps = []
+        original = coordinator._execute_agent_for_subtask
+
+        def tracking(subtask, *args, **kwargs):
+            if 'test' in subtask.title.lower():
+                overlaps.append(RecordingAgent.running)
+            original(subtask, *args, **kwargs)
+
+        coordinator._execute_agent_for_subtask = tracking
+
+        results = coordinator.execute_parallel(subtasks, parent_task)
+
+        assert all(r['status'] == 'completed' for r in results)
+        assert overlaps == [0]
+
+
+class TestTimeoutAndCancellation:
+    """Tests for timeouts and cancel()."""
+
+    def test_timeout_retires_agent(self, parent_task):
+        """Test a stuck agent times out and a new agent takes its slot."""
+        release = threading.Event()
+        coordinator, _ = make_coordinator(max_agents=1, timeout=0.2, block=release)
+        subtasks = [make_subtask(1, title='Blocking'), make_subtask(2)]
+
+        try:
+            results = {r['subtask_id']: r for r in coordinator.execute_parallel(subtasks, parent_task)}
+        finally:
+            release.set()
+
+        assert results[1]['status'] == 'timeout'
+        assert results[2]['status'] == 'completed'
+        assert results[1]['agent_id'] != results[2]['agent_id']
+
+    def test_cancel_skips_queued_subtasks(self, parent_task):
+        """Test cancel() lets running agents finish and cancels the rest."""
+        release = threading.Event()
+        coordinator, _ = make_coordinator(max_agents=1, block=release)
+        subtasks = [make_subtask(1, title='Blocking'), make_subtask(2), make_subtask(3)]
+
+        def cancel_then_release():
+            time.sleep(0.1)
+            coordinator.cancel()
+            release.set()
+
+        canceller = threading.Thread(target=cancel_then_release)
+        canceller.start()
+        results = {r['subtask_id']: r for r in coordinator.execute_parallel(subtasks, parent_task)}
+        canceller.join()
+
+        assert results[1]['status'] == 'completed'
+        assert results[2]['status'] == 'cancelled'
+        assert results[3]['status'] == 'cancelled'
+        assert results[2]['error'] == 'Execution cancelled'
+
+    def test_cancel_before_start_not_lost(self, parent_task):
+        """Test cancel() issued before execution starts cancels that run only."""
+        coordinator, _ = make_coordinator(max_agents=1)
+        subtasks = [make_subtask(1), make_subtask(2)]
+
+        coordinator.cancel()
+        cancelled = coordinator.execute_parallel(subtasks, parent_task)
+        rerun = coordinator.execute_parallel(subtasks, parent_task)
+
+        assert [r['status'] for r in cancelled] == ['cancelled', 'cancelled']
+        assert [r['status'] for r in rerun] == ['completed', 'completed']
+
+
+class FileAgent:
+    """Agent that writes its subtask description into a file named by the title.
+
+    Returns the files it saw in its workspace before writing. Module-level so
+    it can be pickled for process isolation.
+    """
+
+    def initialize(self, config):
+        self.workspace = Path(config['workspace_path'])
+
+    def send_prompt(self, prompt, context=None):
+        filename = prompt.split('\n', 1)[0][len('# Task: '):]
+        content = prompt.split('## Description\n', 1)[1].split('\n', 1)[0]
+        seen = sorted(p.name for p in self.workspace.iterdir() if p.name != '.git')
+        (self.workspace / filename).write_text(content + '\n')
+        return {'seen': seen, 'pid': os.getpid()}
+
+    def cleanup(self):
+        pass
+
+
+class SleepingAgent:
+    """Agent that never answers in time."""
+
+    def send_prompt(self, prompt, context=None):
+        time.sleep(60)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Initialized GitManager on a repository with one commit."""
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+    (repo / 'README.md').write_text('project\n')
+    subprocess.run(['git', '-C', str(repo), 'add', '-A'], check=True)
+    subprocess.run(
+        ['git'] + GitManager.WORKTREE_IDENTITY + ['-C', str(repo), 'commit', '-qm', 'init'],
+        check=True
+    )
+    manager = GitManager(GitConfig(), Mock(), Mock())
+    manager.initialize(str(repo))
+    return manager
+
+
+def make_file_subtask(subtask_id, filename, content, dependencies=()):
+    """Subtask for FileAgent: title is the file, description the content."""
+    subtask = make_subtask(subtask_id, dependencies=dependencies, title=filename)
+    subtask.description = content
+    return subtask
+
+
+class TestIsolation:
+    """Tests for per-agent worktrees and agent processes."""
+
+    def test_worktrees_merged_into_project(self, git_repo, parent_task):
+        """Test each agent works in its own worktree and results are merged."""
+        coordinator = ParallelAgentCoordinator(
+            state_manager=Mock(),
+            agent_factory=FileAgent,
+            config={'max_parallel_agents': 2, 'workspace_isolation': 'worktree'},
+            git_manager=git_repo
+        )
+        subtasks = [
+            make_file_subtask(1, 'a.txt', 'alpha'),
+            make_file_subtask(2, 'b.txt', 'beta'),
+            make_file_subtask(3, 'c.txt', 'gamma', dependencies=[1])
+        ]
+
+        results = {r['subtask_id']: r for r in coordinator.execute_parallel(subtasks, parent_task)}
+
+        assert all(r['status'] == 'completed' for r in results.values())
+        # Dependent starts from the integrated work of its dependency
+        assert 'a.txt' in results[3]['result']['seen']
+
+        project = git_repo.project_dir
+        assert (project / 'a.txt').read_text() == 'alpha\n'
+        assert (project / 'c.txt').read_text() == 'gamma\n'
+        assert sorted(git_repo.get_status()['staged_files']) == ['a.txt', 'b.txt', 'c.txt']
+
+        report = coordinator.last_merge_report
+        assert sorted(report['merged_subtask_ids']) == [1, 2, 3]
+        assert report['conflicts'] == {}
+        worktrees = subprocess.run(
+            ['git', '-C', str(project), 'worktree', 'list'], capture_output=True, text=True
+        )
+        assert len(worktrees.stdout.splitlines()) == 1
+
+    def test_conflicting_subtasks_reported(self, git_repo, parent_task):
+        """Test a subtask whose changes conflict is reported, not merged."""
+        coordinator = ParallelAgentCoordinator(
+            state_manager=Mock(),
+            agent_factory=FileAgent,
+            config={'max_parallel_agents': 2, 'workspace_isolation': 'worktree'},
+            git_manager=git_repo
+        )
+        subtasks = [
+            make_file_subtask(1, 'shared.txt', 'from one'),
+            make_file_subtask(2, 'shared.txt', 'from two')
+        ]
+
+        results = coordinator.execute_parallel(subtasks, parent_task)
+
+        statuses = sorted(r['status'] for r in results)
+        assert statuses == ['completed', 'conflict']
+        conflicted = next(r for r in results if r['status'] == 'conflict')
+        assert conflicted['conflicts'] == ['shared.txt']
+        winner = next(r for r in results if r['status'] == 'completed')
+        expected = 'from one\n' if winner['subtask_id'] == 1 else 'from two\n'
+        assert (git_repo.project_dir / 'shared.txt').read_text() == expected
+        assert coordinator.last_merge_report['conflicts'] == {
+            conflicted['subtask_id']: ['shared.txt']
+        }
+
+    def test_failed_apply_recorded_in_merge_report(self, git_repo, parent_task, monkeypatch):
+        """Test a failing final apply keeps results and is reported."""
+        coordinator = ParallelAgentCoordinator(
+            state_manager=Mock(),
+            agent_factory=FileAgent,
+            config={'max_parallel_agents': 1, 'workspace_isolation': 'worktree'},
+            git_manager=git_repo
+        )
+
+        def fail_apply(commit):
+            raise RuntimeError('apply failed')
+
+        monkeypatch.setattr(git_repo, 'apply_commit', fail_apply)
+
+        results = coordinator.execute_parallel([make_file_subtask(1, 'a.txt', 'alpha')], parent_task)
+
+        assert results[0]['status'] == 'completed'
+        report = coordinator.last_merge_report
+        assert report['error'] == 'apply failed'
+        assert report['merged_subtask_ids'] == [1]
+
+    def test_worktree_requires_git_manager(self):
+        """Test worktree isolation cannot be enabled without GitManager."""
+        with pytest.raises(ValueError, match='git_manager'):
+            ParallelAgentCoordinator(
+                state_manager=Mock(),
+                agent_factory=FileAgent,
+                config={'workspace_isolation': 'worktree'}
+            )
+
+    def test_process_isolation_reuses_agent_process(self, git_repo, parent_task):
+        """Test agents run in a child process that serves several subtasks."""
+        coordinator = ParallelAgentCoordinator(
+            state_manager=Mock(),
+            agent_factory=FileAgent,
+            config={
+                'max_parallel_agents': 1,
+                'workspace_isolation': 'worktree',
+                'process_isolation': True
+            },
+            git_manager=git_repo
+        )
+        subtasks = [make_file_subtask(1, 'a.txt', 'alpha'), make_file_subtask(2, 'b.txt', 'beta')]
+
+        results = coordinator.execute_parallel(subtasks, parent_task)
+
+        pids = {r['result']['pid'] for r in results}
+        assert len(pids) == 1
+        assert os.getpid() not in pids
+        assert (git_repo.project_dir / 'b.txt').exists()
+
+    def test_process_isolation_kills_stuck_agent(self, parent_task):
+        """Test a timed-out agent process is terminated."""
+        coordinator = ParallelAgentCoordinator(
+            state_manager=Mock(),
+            agent_factory=SleepingAgent,
+            config={
+                'max_parallel_agents': 1,
+                'agent_timeout_seconds': 3,
+                'process_isolation': True
+            }
+        )
+
+        started = time.monotonic()
+        results = coordinator.execute_parallel([make_subtask(1)], parent_task)
+
+        assert results[0]['status'] == 'timeout'
+        assert time.monotonic() - started < 30
@@ -1,5 +1,6 @@
 """Tests for plugin system (interfaces, registry, exceptions)."""
 
+import asyncio
 import pytest
 from pathlib import Path
 
@@ -457,6 +458,54 @@ class TestLLMRegistry:
         assert 'abstract' in str(exc_info.value).lower()
 
 
+class TestLazyRegistration:
+    """Test import-path registration resolved on first get()."""
+
+    def test_lazy_agent_listed_before_import(self):
+        """Test a lazy agent is listed and resolved on get()."""
+        AgentRegistry.clear()
+        AgentRegistry.register_lazy('lazy-echo', 'tests.mocks.echo_agent:EchoAgent')
+
+        assert AgentRegistry.list() == ['lazy-echo']
+        assert AgentRegistry.is_registered('lazy-echo')
+        assert AgentRegistry.get('lazy-echo') is EchoAgent
+        assert AgentRegistry.list() == ['lazy-echo']
+
+    def test_explicit_registration_wins(self):
+        """Test register() replaces a pending lazy spec of the same name."""
+        AgentRegistry.register_lazy('lazy-agent', 'tests.mocks.echo_agent:EchoAgent')
+        AgentRegistry.register('lazy-agent', MockAgent)
+
+        assert AgentRegistry.get('lazy-agent') is MockAgent
+
+    def test_unimportable_spec_not_found(self):
+        """Test a broken spec surfaces as PluginNotFoundError."""
+        LLMRegistry.register_lazy('broken', 'tests.mocks.does_not_exist:LLM')
+
+        with pytest.raises(PluginNotFoundError):
+            LLMRegistry.get('broken')
+        assert 'broken' not in LLMRegistry.list()
+
+    def test_clear_drops_lazy_specs(self):
+        """Test clear() removes lazy registrations too."""
+        LLMRegistry.register_lazy('lazy-llm', 'tests.mocks.mock_llm:MockLLM')
+
+        LLMRegistry.clear()
+
+        assert LLMRegistry.list() == []
+
+    def test_discover_entry_points(self, monkeypatch):
+        """Test entry points register lazily without importing."""
+        monkeypatch.setattr(
+            'src.plugins.registry._entry_point_specs',
+            lambda group: {'ep-llm': 'tests.mocks.mock_llm:MockLLM'} if group == 'obra.llms' else {}
+        )
+
+        assert LLMRegistry.discover() == ['ep-llm']
+        assert AgentRegistry.discover() == []
+        assert LLMRegistry.get('ep-llm') is MockLLM
+
+
 class TestExceptionCoverage:
     """Tests to ensure all exception types are covered."""
 
@@ -567,6 +616,30 @@ class TestOptionalMethods:
         assert 'context_length' in info
         assert info['model_name'] == 'test-model'
 
+    def test_agent_asend_prompt_default(self):
+        """Test AgentPlugin.asend_prompt wraps send_prompt."""
+        agent = EchoAgent()
+        agent.initialize({})
+
+        assert asyncio.run(agent.asend_prompt("Hello world")) == "Echo: Hello world"
+
+    def test_agent_asend_prompt_propagates_errors(self):
+        """Test asend_prompt raises the agent's exception."""
+        agent = ErrorAgent()
+        agent.initialize({})
+
+        with pytest.raises(AgentException):
+            asyncio.run(agent.asend_prompt("Test"))
+
+    def test_llm_agenerate_default(self):
+        """Test LLMPlugin.agenerate wraps generate."""
+        llm = MockLLM()
+        llm.initialize({'model': 'test'})
+        llm.set_response("Async response")
+
+        assert asyncio.run(llm.agenerate("prompt", max_tokens=10)) == "Async response"
+        assert llm.call_count == 1
+
 
 class TestRegistryEdgeCases:
     """Test edge cases in registry system."""
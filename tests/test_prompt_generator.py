@@ -12,6 +12,7 @@ from src.llm.prompt_generator import (
     TemplateValidationError
 )
 from src.llm.local_interface import LocalLLMInterface
+from src.llm.prompt_segments import SegmentedPrompt
 from src.core.state import StateManager
 from src.core.models import PatternLearning
 
@@ -63,7 +64,13 @@ Description: {{ task_description }}
 - {{ file }}
 {% endfor %}
 {% endif %}
-'''
+''',
+            'segmented': {
+                'system': 'Complete the task below.',
+                'project': 'Project: {{ project_name }}',
+                'task': 'Task: {{ task_title }}',
+                'context': '{% if errors %}Errors: {{ errors | join(", ") }}{% endif %}'
+            }
         }
 
         template_file = tmpdir_path / 'prompt_templates.yaml'
@@ -396,6 +403,148 @@ def test_clear_cache(generator):
     assert generator.stats['cache_misses'] == 2
 
 
+def test_cache_is_bounded_lru(temp_template_dir, mock_llm):
+    """Test the prompt cache evicts the least recently used prompt."""
+    generator = PromptGenerator(
+        template_dir=str(temp_template_dir),
+        llm_interface=mock_llm,
+        config={'cache_size': 2}
+    )
+
+    generator.generate_prompt('simple', {'name': 'a'})
+    generator.generate_prompt('simple', {'name': 'b'})
+    generator.generate_prompt('simple', {'name': 'a'})  # a is now most recent
+    generator.generate_prompt('simple', {'name': 'c'})  # evicts b
+
+    stats = generator.get_stats()
+    assert stats['cache_entries'] == 2
+    assert stats['cache_evictions'] == 1
+
+    generator.generate_prompt('simple', {'name': 'a'})
+    assert generator.stats['cache_hits'] == 2
+    generator.generate_prompt('simple', {'name': 'b'})
+    assert generator.stats['cache_hits'] == 2
+
+
+def test_cache_key_for_large_variables(generator):
+    """Test large variables are referenced by the key, not serialized."""
+    context = 'x' * 100000
+    key = generator._make_cache_key('simple', {'name': context}, {})
+
+    assert key[2][1][0][1][1] is context
+    assert key == generator._make_cache_key('simple', {'name': 'x' * 100000}, {})
+    assert key != generator._make_cache_key('simple', {'name': 'x' * 99999 + 'y'}, {})
+
+
+@pytest.mark.parametrize('values', [
+    [True, 1, 1.0],
+    [{1: 'a'}, {'1': 'a'}],
+    [[1], (1,)],
+])
+def test_cache_distinguishes_equal_values_of_different_types(generator, values):
+    """Test values that compare equal but render differently aren't aliased."""
+    prompts = [generator.generate_prompt('simple', {'name': value}) for value in values]
+
+    assert prompts == [f'Hello {value}!' for value in values]
+    assert generator.stats['cache_hits'] == 0
+
+
+def test_cache_hash_collision_not_served(generator):
+    """Test variables with colliding hashes never share a cached prompt."""
+    class Colliding(str):
+        def __hash__(self):
+            return 42
+
+    first = generator.generate_prompt('simple', {'name': Colliding('a' * 1000)})
+    second = generator.generate_prompt('simple', {'name': Colliding('b' * 1000)})
+
+    assert 'b' * 1000 in second
+    assert first != second
+    assert generator.stats['cache_hits'] == 0
+
+
+def test_cache_key_includes_token_budget(generator):
+    """Test a prompt optimized for a budget isn't reused without one."""
+    content = 'word ' * 400
+    generator.generate_prompt('with_truncate', {'content': content}, max_tokens=10)
+    generator.generate_prompt('with_truncate', {'content': content})
+
+    assert generator.stats['cache_hits'] == 0
+
+
+def test_token_count_only_for_debug_logging(generator, mock_llm, caplog):
+    """Test rendering doesn't count tokens unless debug logging is on."""
+    caplog.set_level('INFO', logger='src.llm.prompt_generator')
+    generator.generate_prompt('simple', {'name': 'Alice'})
+    mock_llm.estimate_tokens.assert_not_called()
+
+    caplog.set_level('DEBUG', logger='src.llm.prompt_generator')
+    generator.generate_prompt('simple', {'name': 'Bob'})
+    mock_llm.estimate_tokens.assert_called_once()
+
+
+def test_bytecode_cache_on_disk(temp_template_dir, mock_llm, tmp_path):
+    """Test compiled templates are written to and reused from disk."""
+    cache_dir = tmp_path / 'bytecode'
+    config = {'bytecode_cache_dir': str(cache_dir)}
+
+    first = PromptGenerator(str(temp_template_dir), mock_llm, config=config)
+    first.generate_prompt('simple', {'name': 'Alice'})
+    assert len(list(cache_dir.iterdir())) == 1
+
+    second = PromptGenerator(str(temp_template_dir), mock_llm, config=config)
+    with patch.object(second.env, 'compile', wraps=second.env.compile) as compile_mock:
+        assert second.generate_prompt('simple', {'name': 'Bob'}) == 'Hello Bob!'
+    compile_mock.assert_not_called()
+
+
+def test_segmented_template_renders_stable_prefix_first(generator):
+    """Test segment templates render in order with a stable prefix."""
+    first = generator.generate_prompt(
+        'segmented', {'project_name': 'obra', 'task_title': 'A', 'errors': ['boom']}
+    )
+    second = generator.generate_prompt(
+        'segmented', {'project_name': 'obra', 'task_title': 'B', 'errors': []}
+    )
+
+    assert isinstance(first, SegmentedPrompt)
+    assert first == 'Complete the task below.\n\nProject: obra\n\nTask: A\n\nErrors: boom'
+    assert second == 'Complete the task below.\n\nProject: obra\n\nTask: B'
+    assert first.prefix_hash == second.prefix_hash
+    assert 'segmented' in generator.list_templates()
+    assert 'segmented/task' not in generator.list_templates()
+
+
+def test_segmented_template_unknown_segment(mock_llm, tmp_path):
+    """Test unknown segment names are rejected when templates load."""
+    with open(tmp_path / 'prompt_templates.yaml', 'w') as f:
+        yaml.dump({'bad': {'task': 'T', 'footer': 'F'}}, f)
+
+    with pytest.raises(PromptGeneratorException, match='unknown segments: footer'):
+        PromptGenerator(template_dir=str(tmp_path), llm_interface=mock_llm)
+
+
+def test_task_execution_template_prefix_stable_across_iterations(mock_llm):
+    """Test the shipped task_execution template keeps iteration context last."""
+    generator = PromptGenerator(template_dir='config', llm_interface=mock_llm)
+    variables = {
+        'project_name': 'obra', 'working_directory': '/work', 'task_id': 1,
+        'task_title': 'Add login', 'task_description': 'JWT login',
+        'instructions': 'Work in the directory: /work.'
+    }
+
+    first = generator.generate_prompt('task_execution', variables)
+    retry = generator.generate_prompt('task_execution', {
+        **variables,
+        'task_id': 2,
+        'recent_errors': [{'message': 'ImportError', 'timestamp': 'now'}]
+    })
+
+    assert first.prefix_hash == retry.prefix_hash
+    assert retry.segment('context').startswith('## Recent Errors')
+    assert retry.endswith('- ImportError (now)')
+
+
 # Test: Custom Filters
 
 def test_filter_truncate(generator):
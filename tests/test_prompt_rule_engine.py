@@ -8,12 +8,13 @@ Tests for:
 Part of TASK_2.5: Test PromptRuleEngine and validators
 """
 
+import json
 import pytest
 from pathlib import Path
 from typing import Dict, Any
 from src.llm.prompt_rule import PromptRule
 from src.llm.rule_validation_result import RuleValidationResult
-from src.llm.prompt_rule_engine import PromptRuleEngine
+from src.llm.prompt_rule_engine import PromptRuleEngine, RulePayload
 from src.core.state import StateManager
 
 
@@ -411,3 +412,56 @@ def test_engine_repr():
 
     assert 'PromptRuleEngine' in repr_str
     assert 'rules_loaded=True' in repr_str
+
+
+# ============================================================================
+# Tests: Precomputed payloads and validator dispatch
+# ============================================================================
+
+def test_rule_payload_precomputed_on_load():
+    """Test default domain combinations are serialized once per load."""
+    engine = PromptRuleEngine(rules_file_path='config/prompt_rules.yaml')
+    engine.load_rules_from_yaml()
+
+    domains = PromptRuleEngine.DEFAULT_DOMAINS['task_execution']
+    payload = engine.get_rule_payload(domains)
+
+    assert isinstance(payload, RulePayload)
+    assert payload is engine.get_rule_payload(list(domains))
+    expected = [rule for domain in domains for rule in engine.get_rules_for_domain(domain)]
+    assert list(payload.rules) == expected
+    assert [entry['id'] for entry in payload.entries] == [rule.id for rule in expected]
+    assert json.loads(payload.text) == list(payload.entries)
+    assert engine.get_statistics()['precomputed_payloads'] >= len(engine._rules_by_domain)
+
+
+def test_reload_swaps_snapshot():
+    """Test reloading publishes new payloads without mutating old ones."""
+    engine = PromptRuleEngine(rules_file_path='config/prompt_rules.yaml')
+    engine.load_rules_from_yaml()
+    old_payload = engine.get_rule_payload(['code_generation'])
+    old_rules = engine._rules
+
+    engine.reload_rules()
+
+    assert engine._rules is not old_rules
+    assert engine.get_rule_payload(['code_generation']) is not old_payload
+    assert len(old_payload) == len(engine.get_rules_for_domain('code_generation'))
+
+
+def test_validate_dispatches_by_validation_type():
+    """Test registered validators receive only rules of their type."""
+    engine = PromptRuleEngine(rules_file_path='config/prompt_rules.yaml')
+    engine.load_rules_from_yaml()
+    payload = engine.get_rule_payload(['code_generation', 'testing'])
+    validation_type = payload.rules[0].validation_type
+    seen = []
+    engine.register_validator(
+        validation_type,
+        lambda rule, response, result: seen.append(rule.validation_type)
+    )
+
+    result = engine.validate_response_against_rules({'content': 'x'}, payload)
+
+    assert seen == [validation_type] * len(payload.by_validation_type[validation_type])
+    assert len(result.checked_rules) == len(payload)
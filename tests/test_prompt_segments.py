@@ -0,0 +1,130 @@
+"""Tests for segmented prompts and prefix cache statistics."""
+
+import copy
+import pickle
+
+import pytest
+
+from src.llm.prompt_segments import PrefixCacheStats, SegmentedPrompt
+
+
+def make_prompt(task='Fix bug #1', context='Iteration 1'):
+    """Prompt with all segments, given out of order."""
+    return SegmentedPrompt({
+        'context': context,
+        'task': task,
+        'project': 'Project: obra',
+        'system': 'You are a coding agent.',
+        'rules': 'Rule: no stubs'
+    })
+
+
+# Test: Assembly
+
+def test_segments_assembled_in_order():
+    """Test segments are joined stable-first regardless of input order."""
+    prompt = make_prompt()
+
+    assert prompt == (
+        'You are a coding agent.\n\nRule: no stubs\n\nProject: obra'
+        '\n\nFix bug #1\n\nIteration 1'
+    )
+    assert [name for name, _ in prompt.segments] == [
+        'system', 'rules', 'project', 'task', 'context'
+    ]
+
+
+def test_empty_segments_skipped():
+    """Test empty or whitespace-only segments leave no blank sections."""
+    prompt = SegmentedPrompt({'system': 'S', 'rules': '  \n', 'task': 'T', 'context': None})
+
+    assert prompt == 'S\n\nT'
+    assert prompt.segment('rules') == ''
+
+
+def test_unknown_segment_raises():
+    """Test segment names are validated."""
+    with pytest.raises(ValueError, match='Unknown prompt segments: footer'):
+        SegmentedPrompt({'task': 'T', 'footer': 'F'})
+
+
+# Test: Prefix
+
+def test_prefix_stable_across_tasks_and_context():
+    """Test only system/rules/project segments affect the prefix hash."""
+    first = make_prompt()
+    second = make_prompt(task='Add tests', context='Iteration 7')
+
+    assert first.prefix == 'You are a coding agent.\n\nRule: no stubs\n\nProject: obra'
+    assert first.suffix == 'Fix bug #1\n\nIteration 1'
+    assert first.prefix_hash == second.prefix_hash
+    assert len(first.prefix_hash) == 16
+
+
+def test_prefix_changes_with_rules():
+    """Test a different rule set produces a different prefix hash."""
+    base = make_prompt()
+    changed = SegmentedPrompt({**dict(base.segments), 'rules': 'Rule: add docs'})
+
+    assert changed.prefix_hash != base.prefix_hash
+
+
+def test_no_prefix_segments():
+    """Test a prompt without stable segments has no prefix."""
+    prompt = SegmentedPrompt({'task': 'T'})
+
+    assert prompt.prefix == ''
+    assert prompt.prefix_hash == ''
+
+
+def test_with_segment_keeps_prefix():
+    """Test adding context returns a new prompt with the same prefix."""
+    base = make_prompt()
+    extended = base.with_segment('context', '[EPIC CONTEXT]\nAuth epic', prepend=True)
+
+    assert isinstance(extended, SegmentedPrompt)
+    assert extended.prefix_hash == base.prefix_hash
+    assert extended.segment('context') == '[EPIC CONTEXT]\nAuth epic\n\nIteration 1'
+    assert base.segment('context') == 'Iteration 1'
+
+
+def test_copy_and_pickle_keep_segments():
+    """Test copies rebuild the prompt from its segments."""
+    prompt = make_prompt()
+
+    for clone in (copy.copy(prompt), pickle.loads(pickle.dumps(prompt))):
+        assert clone == prompt
+        assert clone.prefix_hash == prompt.prefix_hash
+        assert clone.segments == prompt.segments
+
+
+# Test: PrefixCacheStats
+
+def test_prefix_cache_stats_reuse_and_ratio():
+    """Test reuse counts consecutive prompts and ratios are per prefix."""
+    stats = PrefixCacheStats()
+
+    first = stats.record('aaa', input_tokens=1000, cache_read_tokens=0)
+    second = stats.record('aaa', input_tokens=1000, cache_read_tokens=800)
+    other = stats.record('bbb', input_tokens=500, cache_read_tokens=0)
+
+    assert first['reused'] is False
+    assert second['reused'] is True
+    assert second['cache_read_ratio'] == pytest.approx(0.4)
+    assert other['reused'] is False
+
+    report = stats.report()
+    assert report['prompts'] == 3
+    assert report['prefix_reuses'] == 1
+    assert report['prefix_reuse_rate'] == pytest.approx(1 / 3)
+    assert report['cache_read_ratio'] == pytest.approx(800 / 2500)
+    assert report['prefixes']['aaa']['prompts'] == 2
+
+
+def test_prefix_cache_stats_bounded():
+    """Test only the most recent prefixes keep counters."""
+    stats = PrefixCacheStats(max_prefixes=2)
+    for prefix_hash in ('a', 'b', 'c'):
+        stats.record(prefix_hash)
+
+    assert list(stats.report()['prefixes']) == ['b', 'c']
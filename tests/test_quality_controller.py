@@ -1,9 +1,12 @@
 """Tests for QualityController - multi-stage quality validation."""
 
+import threading
+
 import pytest
 from datetime import datetime, UTC, timedelta
 from unittest.mock import Mock
 
+from src.core.exceptions import DatabaseException
 from src.core.state import StateManager
 from src.core.models import Task
 from src.orchestration.quality_controller import QualityController, QualityResult
@@ -666,8 +669,7 @@ class TestQualityTrends:
                 stage_scores={},
                 passes_gate=True
             )
-            controller._validation_history[task.project_id] = \
-                controller._validation_history.get(task.project_id, []) + [result]
+            controller._record_result(task, result)
 
         trends = controller.get_quality_trends(task.project_id, days=30)
 
@@ -683,8 +685,7 @@ class TestQualityTrends:
                 stage_scores={},
                 passes_gate=True
             )
-            controller._validation_history[task.project_id] = \
-                controller._validation_history.get(task.project_id, []) + [result]
+            controller._record_result(task, result)
 
         trends = controller.get_quality_trends(task.project_id, days=30)
 
@@ -699,8 +700,7 @@ class TestQualityTrends:
                 stage_scores={},
                 passes_gate=True
             )
-            controller._validation_history[task.project_id] = \
-                controller._validation_history.get(task.project_id, []) + [result]
+            controller._record_result(task, result)
 
         trends = controller.get_quality_trends(task.project_id, days=30)
 
@@ -733,8 +733,7 @@ class TestQualityReport:
                 passes_gate=(i % 2 == 0),
                 improvements=['Add tests', 'Improve documentation']
             )
-            controller._validation_history[task.project_id] = \
-                controller._validation_history.get(task.project_id, []) + [result]
+            controller._record_result(task, result)
 
         report = controller.generate_quality_report(task.project_id)
 
@@ -744,6 +743,152 @@ class TestQualityReport:
         assert len(report['common_issues']) > 0
 
 
+class TestPersistentHistory:
+    """Test persisted quality history and bounded in-memory cache."""
+
+    def test_history_survives_new_controller(self, state_manager, task):
+        """Test trends and reports are read back from the database."""
+        first = QualityController(state_manager)
+        for score in [0.6, 0.65, 0.7, 0.75, 0.8, 0.85]:
+            first._record_result(task, QualityResult(
+                overall_score=score,
+                stage_scores={QualityController.STAGE_SYNTAX: 1.0},
+                passes_gate=score >= 0.7,
+                improvements=['Add tests']
+            ))
+
+        second = QualityController(state_manager)
+        trends = second.get_quality_trends(task.project_id, days=30)
+        report = second.generate_quality_report(task.project_id)
+
+        assert trends['count'] == 6
+        assert trends['trend'] == 'improving'
+        assert trends['recent_scores'] == pytest.approx([0.6, 0.65, 0.7, 0.75, 0.8, 0.85])
+        assert report['total_validations'] == 6
+        assert report['gate_pass_rate'] == pytest.approx(4 / 6)
+        assert report['average_scores'][QualityController.STAGE_SYNTAX] == pytest.approx(1.0)
+        assert report['average_scores'][QualityController.STAGE_TESTING] == 0.0
+        assert report['common_issues'] == ['Add tests']
+
+    def test_trends_exclude_old_results(self, controller, task):
+        """Test trend window filters by timestamp."""
+        controller._record_result(task, QualityResult(
+            overall_score=0.2,
+            stage_scores={},
+            passes_gate=False,
+            timestamp=datetime.now(UTC) - timedelta(days=60)
+        ))
+        controller._record_result(task, QualityResult(
+            overall_score=0.9, stage_scores={}, passes_gate=True
+        ))
+
+        trends = controller.get_quality_trends(task.project_id, days=30)
+
+        assert trends['count'] == 1
+        assert trends['average_score'] == pytest.approx(0.9)
+
+    def test_memory_cache_is_bounded(self, state_manager, task):
+        """Test in-memory history keeps only the most recent results."""
+        controller = QualityController(state_manager, {'history_cache_size': 3})
+        for i in range(10):
+            controller._record_result(task, QualityResult(
+                overall_score=i / 10, stage_scores={}, passes_gate=False
+            ))
+
+        assert len(controller._validation_history[task.project_id]) == 3
+        assert controller.generate_quality_report(task.project_id)['total_validations'] == 10
+
+    def test_falls_back_to_memory_when_persistence_fails(self, task):
+        """Test trends still work when the quality tables are missing."""
+        broken_state = Mock()
+        broken_state.record_quality_result.side_effect = DatabaseException(
+            operation='record_quality_result',
+            details='(sqlite3.OperationalError) no such table: quality_result'
+        )
+        controller = QualityController(broken_state)
+
+        for score in [0.85, 0.8, 0.75, 0.7, 0.65, 0.6]:
+            controller._record_result(task, QualityResult(
+                overall_score=score, stage_scores={}, passes_gate=True
+            ))
+
+        trends = controller.get_quality_trends(task.project_id, days=30)
+
+        assert trends['trend'] == 'declining'
+        broken_state.record_quality_result.assert_called_once()
+        broken_state.get_quality_trend_stats.assert_not_called()
+
+    def test_transient_persistence_failure_keeps_persisting(self, task):
+        """Test one failed write doesn't stop later results being persisted."""
+        state = Mock()
+        state.record_quality_result.side_effect = [
+            DatabaseException(
+                operation='record_quality_result',
+                details='(sqlite3.OperationalError) database is locked'
+            ),
+            None,
+            None
+        ]
+        controller = QualityController(state)
+
+        for score in [0.9, 0.8, 0.7]:
+            controller._record_result(task, QualityResult(
+                overall_score=score, stage_scores={}, passes_gate=True
+            ))
+
+        assert state.record_quality_result.call_count == 3
+        assert controller._persist_history is True
+        assert len(controller._validation_history[task.project_id]) == 3
+
+    def test_long_issues_sharing_prefix_persist(self, controller, task):
+        """Test issues identical after truncation are counted once."""
+        prefix = 'x' * 500
+        controller._record_result(task, QualityResult(
+            overall_score=0.5, stage_scores={}, passes_gate=False,
+            improvements=[prefix + 'a', prefix + 'b']
+        ))
+
+        report = QualityController(controller.state_manager).generate_quality_report(
+            task.project_id
+        )
+
+        assert report['total_validations'] == 1
+        assert report['common_issues'] == [prefix]
+
+    def test_db_io_runs_outside_controller_lock(self, task):
+        """Test persistence and queries don't hold the controller lock."""
+        state = Mock()
+        controller = QualityController(state)
+
+        def probe(*args, **kwargs):
+            # RLock is reentrant, so try it from another thread
+            acquired = []
+
+            def try_lock():
+                if controller._lock.acquire(blocking=False):
+                    acquired.append(True)
+                    controller._lock.release()
+
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+            assert acquired == [True]
+            return {'count': 0, 'total': 0}
+
+        state.record_quality_result.side_effect = probe
+        state.get_quality_trend_stats.side_effect = probe
+        state.get_quality_report_stats.side_effect = probe
+
+        controller._record_result(task, QualityResult(
+            overall_score=0.5, stage_scores={}, passes_gate=False
+        ))
+        controller.get_quality_trends(task.project_id)
+        controller.generate_quality_report(task.project_id)
+
+        assert controller._persist_history is True
+        state.get_quality_trend_stats.assert_called_once()
+        state.get_quality_report_stats.assert_called_once()
+
 class TestHelperMethods:
     """Test helper methods."""
 
@@ -811,3 +956,89 @@ class TestEdgeCases:
         # Should still validate (without task-specific checks)
         assert result is not None
         assert 0.0 <= result.overall_score <= 1.0
+
+
+class TestStagedPipeline:
+    """Test early-exit pipeline, lazy M9 context and stage timings."""
+
+    POOR_OUTPUT = 'def add(a, b):\n    pass  # TODO'
+
+    def test_runs_all_stages_by_default(self, controller, task):
+        """Test early exit is opt-in and all stages run by default."""
+        result = controller.validate_output(self.POOR_OUTPUT, task, {'language': 'python'})
+
+        assert set(result.stage_scores) == {
+            QualityController.STAGE_SYNTAX,
+            QualityController.STAGE_REQUIREMENTS,
+            QualityController.STAGE_QUALITY,
+            QualityController.STAGE_TESTING
+        }
+        assert 'skipped_stages' not in result.metadata
+
+    def test_early_exit_on_decided_failure(self, state_manager, task):
+        """Test remaining stages are skipped once the gate cannot pass."""
+        controller = QualityController(state_manager, {'early_exit': True})
+        controller._validate_stage_3_quality = Mock()
+        controller._validate_stage_4_testing = Mock()
+
+        result = controller.validate_output(self.POOR_OUTPUT, task, {'language': 'python'})
+
+        assert result.passes_gate is False
+        assert result.metadata['skipped_stages'] == [
+            QualityController.STAGE_QUALITY,
+            QualityController.STAGE_TESTING
+        ]
+        lower, upper = result.metadata['score_bounds']
+        assert result.overall_score == lower
+        assert upper < controller._minimum_score
+        controller._validate_stage_3_quality.assert_not_called()
+        controller._validate_stage_4_testing.assert_not_called()
+        # No suggestions for stages that never ran
+        assert not any('test file' in s.lower() for s in result.improvements)
+
+    def test_early_exit_on_decided_pass(self, state_manager, task):
+        """Test remaining stages are skipped once the gate cannot fail."""
+        config = {
+            'early_exit': True,
+            'minimum_score': 0.5,
+            'stage_order': [QualityController.STAGE_SYNTAX, QualityController.STAGE_QUALITY,
+                            QualityController.STAGE_REQUIREMENTS, QualityController.STAGE_TESTING],
+            'weight_syntax': 0.6
+        }
+        controller = QualityController(state_manager, config)
+
+        result = controller.validate_output('x = compute_total(values)', task, {'language': 'python'})
+
+        assert result.passes_gate is True
+        assert QualityController.STAGE_SYNTAX in result.stage_scores
+        assert QualityController.STAGE_TESTING in result.metadata['skipped_stages']
+
+    def test_blocking_stage_minimum_fails_gate(self, state_manager, task):
+        """Test a blocking stage below its minimum fails the gate."""
+        config = {'early_exit': True, 'blocking_stage_minimum': 0.9}
+        controller = QualityController(state_manager, config)
+
+        result = controller.validate_output(self.POOR_OUTPUT, task, {'language': 'python'})
+
+        assert result.passes_gate is False
+        assert result.metadata['blocking_failed'] is True
+        assert list(result.stage_scores) == [QualityController.STAGE_SYNTAX]
+
+    def test_unstructured_validation_skips_m9_context(self, controller, task):
+        """Test M9 context is not gathered when no step needs it."""
+        controller._gather_m9_context = Mock(return_value={})
+
+        controller.validate_output(self.POOR_OUTPUT, task, {'language': 'python'})
+
+        controller._gather_m9_context.assert_not_called()
+
+    def test_stage_timings_recorded(self, controller, task):
+        """Test per-stage timing histograms are collected."""
+        controller.validate_output(self.POOR_OUTPUT, task, {'language': 'python'})
+        controller.validate_output(self.POOR_OUTPUT, task, {'language': 'python'})
+
+        timings = controller.get_stage_timings()
+
+        assert timings[QualityController.STAGE_SYNTAX]['count'] == 2
+        assert sum(timings[QualityController.STAGE_TESTING]['buckets'].values()) == 2
+        assert timings[QualityController.STAGE_QUALITY]['mean_ms'] >= 0.0
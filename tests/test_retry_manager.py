@@ -10,6 +10,7 @@ Tests cover:
 - Thread safety
 """
 
+import asyncio
 import pytest
 import time
 from unittest.mock import Mock, patch
@@ -208,6 +209,50 @@ class TestRetryManager:
         assert result == "result"
         mock_func.assert_called_with("arg1", "arg2", kwarg1="value1", kwarg2="value2")
 
+    def test_aexecute_success_after_retries(self):
+        """Test coroutine retried until it succeeds."""
+        config = RetryConfig(max_attempts=3, base_delay=0.01, jitter=0.0)
+        retry_manager = RetryManager(config)
+        outcomes = [ConnectionError("Connection failed"), ConnectionError("Connection failed"), "success"]
+
+        async def flaky(value):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return f"{outcome}:{value}"
+
+        result = asyncio.run(retry_manager.aexecute(flaky, "x"))
+
+        assert result == "success:x"
+        assert outcomes == []
+
+    def test_aexecute_non_retryable_error(self):
+        """Test non-retryable error from a coroutine raised immediately."""
+        retry_manager = RetryManager()
+        calls = []
+
+        async def broken():
+            calls.append(1)
+            raise ValueError("Invalid input")
+
+        with pytest.raises(ValueError, match="Invalid input"):
+            asyncio.run(retry_manager.aexecute(broken))
+
+        assert len(calls) == 1
+
+    def test_aexecute_exhausted_retries(self):
+        """Test RetryExhaustedError after all coroutine attempts fail."""
+        config = RetryConfig(max_attempts=2, base_delay=0.01, jitter=0.0)
+        retry_manager = RetryManager(config)
+
+        async def down():
+            raise ConnectionError("Connection failed")
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            asyncio.run(retry_manager.aexecute(down))
+
+        assert len(exc_info.value.attempts) == 2
+
     def test_decorator_success(self):
         """Test retry decorator on successful function."""
         retry_manager = RetryManager()
@@ -0,0 +1,167 @@
+"""Tests for scheduling policies and makespan simulation."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.orchestration.scheduling_policy import (
+    DEFAULT_TASK_DURATION,
+    CriticalPathPolicy,
+    PriorityPolicy,
+    SchedulingPolicy,
+    TaskGraph,
+    compare_policies,
+    create_scheduling_policy,
+    simulate_schedule
+)
+
+
+@pytest.fixture
+def wide_graph():
+    """One long chain (1 -> 2 -> 3) next to three short, high-priority tasks.
+
+    Priority ordering starts the short tasks first and delays the chain;
+    critical-path ordering starts the chain immediately.
+    """
+    return TaskGraph(
+        dependencies={1: [], 2: [1], 3: [2], 4: [], 5: [], 6: []},
+        durations={1: 10, 2: 10, 3: 10, 4: 10, 5: 10, 6: 10},
+        priorities={1: 1, 2: 1, 3: 1, 4: 9, 5: 9, 6: 9}
+    )
+
+
+def make_task(task_id, dependencies=(), priority=5):
+    """Task stub exposing the attributes TaskGraph reads."""
+    task = Mock(id=task_id, priority=priority)
+    task.get_dependencies.return_value = list(dependencies)
+    return task
+
+
+def make_estimate(estimated, actual=None):
+    """ComplexityEstimate stub."""
+    return Mock(estimated_duration_minutes=estimated, actual_duration_minutes=actual)
+
+
+class TestTaskGraph:
+    """Tests for TaskGraph construction and upward ranks."""
+
+    def test_upward_ranks(self, wide_graph):
+        """Test rank is the longest duration-weighted path to a sink."""
+        ranks = wide_graph.upward_ranks()
+
+        assert ranks[1] == 30
+        assert ranks[2] == 20
+        assert ranks[3] == 10
+        assert ranks[4] == 10
+
+    def test_upward_ranks_diamond(self):
+        """Test rank follows the heavier branch of a diamond."""
+        graph = TaskGraph(
+            dependencies={1: [], 2: [1], 3: [1], 4: [2, 3]},
+            durations={1: 1, 2: 5, 3: 2, 4: 1}
+        )
+
+        assert graph.upward_ranks()[1] == 7
+
+    def test_from_tasks_uses_estimates(self):
+        """Test durations prefer actual over estimated minutes."""
+        tasks = [make_task(1), make_task(2, [1]), make_task(3, [1])]
+        estimates = {1: make_estimate(30, actual=45), 2: make_estimate(15)}
+
+        graph = TaskGraph.from_tasks(tasks, estimates)
+
+        assert graph.durations[1] == 45
+        assert graph.durations[2] == 15
+        # Unestimated task gets the mean of the estimated ones
+        assert graph.durations[3] == 30
+        assert graph.dependencies == {1: [], 2: [1], 3: [1]}
+
+    def test_from_tasks_without_estimates(self):
+        """Test unit durations when nothing was estimated."""
+        graph = TaskGraph.from_tasks([make_task(1), make_task(2, [1])])
+
+        assert graph.upward_ranks()[1] == 2 * DEFAULT_TASK_DURATION
+
+    def test_from_project(self):
+        """Test snapshot pulls tasks and estimates from the state manager."""
+        state_manager = Mock()
+        state_manager.get_tasks_by_project.return_value = [make_task(1)]
+        state_manager.get_project_complexity_estimates.return_value = {1: make_estimate(20)}
+
+        graph = TaskGraph.from_project(state_manager, project_id=7)
+
+        state_manager.get_tasks_by_project.assert_called_once_with(7)
+        assert graph.durations == {1: 20}
+
+
+class TestPolicies:
+    """Tests for policy keys and the factory."""
+
+    def test_priority_policy_key(self):
+        """Test higher priority sorts first."""
+        policy = PriorityPolicy()
+
+        assert policy.priority_key(1, 8, None) < policy.priority_key(2, 3, None)
+
+    def test_critical_path_policy_key(self, wide_graph):
+        """Test longer remaining chain sorts first regardless of priority."""
+        policy = CriticalPathPolicy()
+
+        assert policy.priority_key(1, 1, wide_graph) < policy.priority_key(4, 9, wide_graph)
+
+    def test_policy_base_is_abstract(self):
+        """Test policies must implement priority_key."""
+        with pytest.raises(TypeError):
+            SchedulingPolicy()
+
+    @pytest.mark.parametrize('name,cls', [
+        ('priority', PriorityPolicy),
+        ('critical_path', CriticalPathPolicy),
+    ])
+    def test_create_scheduling_policy(self, name, cls):
+        """Test factory returns the named policy."""
+        assert isinstance(create_scheduling_policy(name), cls)
+
+    def test_create_unknown_policy(self):
+        """Test unknown policy names are rejected."""
+        with pytest.raises(ValueError, match='Unknown scheduling policy'):
+            create_scheduling_policy('random')
+
+
+class TestSimulation:
+    """Tests for makespan simulation."""
+
+    def test_single_worker_makespan_is_total_work(self, wide_graph):
+        """Test one worker always takes the sum of durations."""
+        result = simulate_schedule(wide_graph, PriorityPolicy(), workers=1)
+
+        assert result.makespan == 60
+        assert len(result.order) == 6
+
+    def test_critical_path_shortens_makespan(self, wide_graph):
+        """Test critical-path ordering beats priority on a wide DAG."""
+        results = compare_policies(wide_graph, workers=2)
+
+        assert results['priority'].makespan == 40
+        assert results['critical_path'].makespan == 30
+        assert results['critical_path'].order[0] == 1
+
+    def test_dependencies_respected(self, wide_graph):
+        """Test no task starts before its dependencies finish."""
+        result = simulate_schedule(wide_graph, CriticalPathPolicy(), workers=4)
+
+        for task_id, deps in wide_graph.dependencies.items():
+            for dep_id in deps:
+                finished = result.start_times[dep_id] + wide_graph.duration(dep_id)
+                assert result.start_times[task_id] >= finished
+
+    def test_cycle_rejected(self):
+        """Test cyclic graphs cannot be simulated."""
+        graph = TaskGraph(dependencies={1: [2], 2: [1], 3: []})
+
+        with pytest.raises(ValueError, match='cycle'):
+            simulate_schedule(graph, PriorityPolicy())
+
+    def test_invalid_workers(self, wide_graph):
+        """Test worker count must be positive."""
+        with pytest.raises(ValueError):
+            simulate_schedule(wide_graph, PriorityPolicy(), workers=0)
@@ -2,7 +2,7 @@
 
 import pytest
 from src.core.state import StateManager
-from core.models import TaskStatus, TaskType
+from src.core.models import TaskStatus, TaskType
 
 
 class TestTaskUpdate:
@@ -123,7 +123,7 @@ class TestTaskDelete:
 
         # Task still exists in database but marked as deleted
         # Note: get_task() filters out soft-deleted tasks, so we query directly
-        from core.models import Task
+        from src.core.models import Task
         session = state._get_session()
         task = session.query(Task).filter(Task.id == task_id).first()
 
@@ -321,3 +321,140 @@ class TestTaskTypeFiltering:
         assert all(t.task_type == TaskType.EPIC for t in completed_epics)
         assert all(t.status == TaskStatus.COMPLETED for t in completed_epics)
         assert any(t.id == ids['epic_id'] for t in completed_epics)
+
+
+class TestTaskDependencies:
+    """Test task_dependency edges and set-based readiness queries (M9)."""
+
+    @pytest.fixture
+    def chain(self, state_manager):
+        """Create tasks a <- b <- c, with d depending on a and b."""
+        project = state_manager.create_project(
+            name="Dependency Project",
+            description="Test",
+            working_dir="/tmp/test"
+        )
+
+        def create(title, dependencies=None):
+            return state_manager.create_task(
+                project_id=project.id,
+                task_data={
+                    'title': title,
+                    'description': title,
+                    'dependencies': dependencies or []
+                }
+            ).id
+
+        a = create('a')
+        b = create('b', [a])
+        c = create('c', [b])
+        d = create('d', [b, a])
+        return state_manager, project.id, (a, b, c, d)
+
+    def test_dependencies_stored_as_edges(self, chain):
+        """Test dependency lists round-trip through the edge table."""
+        state, _, (a, b, c, d) = chain
+
+        task = state.get_task(d)
+
+        assert task.get_dependencies() == [a, b]
+        assert task.to_dict()['dependencies'] == [a, b]
+        assert [t.id for t in state.get_task_dependencies(d)] == [a, b]
+
+    def test_get_dependent_tasks(self, chain):
+        """Test reverse lookup of dependents."""
+        state, _, (a, b, c, d) = chain
+
+        assert [t.id for t in state.get_dependent_tasks(a)] == [b, d]
+        assert [t.id for t in state.get_dependent_tasks(b)] == [c, d]
+        assert state.get_dependent_tasks(c) == []
+
+    def test_add_remove_and_update_dependencies(self, chain):
+        """Test edges follow add/remove/update operations."""
+        state, _, (a, b, c, d) = chain
+
+        state.add_task_dependency(c, a)
+        assert state.get_task(c).get_dependencies() == [a, b]
+
+        state.remove_task_dependency(c, b)
+        assert state.get_task(c).get_dependencies() == [a]
+
+        state.update_task(c, {'dependencies': [b]})
+        assert state.get_task(c).get_dependencies() == [b]
+        assert [t.id for t in state.get_dependent_tasks(a)] == [b, d]
+
+    def test_get_dependency_statuses(self, chain):
+        """Test statuses of dependencies come back in one mapping."""
+        state, _, (a, b, c, d) = chain
+        state.update_task_status(a, TaskStatus.COMPLETED)
+
+        assert state.get_dependency_statuses(d) == {
+            a: TaskStatus.COMPLETED,
+            b: TaskStatus.PENDING
+        }
+
+    def test_get_task_readiness(self, chain):
+        """Test project-wide readiness from a single query."""
+        state, project_id, (a, b, c, d) = chain
+
+        assert state.get_task_readiness(project_id) == {
+            a: True, b: False, c: False, d: False
+        }
+
+        state.update_task_status(a, TaskStatus.COMPLETED)
+        readiness = state.get_task_readiness(
+            project_id, statuses=[TaskStatus.PENDING, TaskStatus.READY]
+        )
+
+        assert readiness == {b: True, c: False, d: False}
+
+    def test_deleted_dependency_blocks(self, chain):
+        """Test a soft-deleted dependency counts as unmet."""
+        state, project_id, (a, b, c, d) = chain
+        state.update_task_status(b, TaskStatus.COMPLETED)
+        state.delete_task(b, soft=True)
+
+        assert state.get_dependency_statuses(c) == {b: None}
+        assert state.get_task_readiness(project_id)[c] is False
+
+    def test_legacy_json_dependencies_migrated_on_startup(self, tmp_path):
+        """Test edges from a pre-edge-table database survive create_all()."""
+        from sqlalchemy import text
+
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        StateManager.reset_instance()
+        state = StateManager.get_instance(url)
+        project = state.create_project(name="Legacy", description="Test", working_dir="/tmp/test")
+        ids = [
+            state.create_task(project.id, {'title': t, 'description': t}).id
+            for t in ('a', 'b', 'c')
+        ]
+        engine = state._engine
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE task ADD COLUMN dependencies JSON"))
+            conn.execute(
+                text("UPDATE task SET dependencies = :deps WHERE id = :id"),
+                [
+                    {'id': ids[1], 'deps': f'[{ids[0]}]'},
+                    {'id': ids[2], 'deps': f'[{ids[0]}, {ids[1]}, 999]'}
+                ]
+            )
+        state.close()
+        StateManager.reset_instance()
+
+        state = StateManager.get_instance(url)
+        try:
+            assert state.get_task(ids[1]).dependencies == [ids[0]]
+            assert state.get_task(ids[2]).dependencies == [ids[0], ids[1]]
+            with state._engine.connect() as conn:
+                remaining = conn.execute(
+                    text("SELECT COUNT(*) FROM task WHERE dependencies IS NOT NULL")
+                ).scalar()
+            assert remaining == 0
+
+            # Later startups find nothing left to copy
+            state._migrate_legacy_dependencies()
+            assert state.get_task(ids[2]).dependencies == [ids[0], ids[1]]
+        finally:
+            state.close()
+            StateManager.reset_instance()
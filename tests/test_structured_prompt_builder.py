@@ -107,6 +107,39 @@ def test_build_task_execution_prompt_without_rules(builder_without_rules):
     assert '"rules": []' in prompt  # Empty rules when no rule engine
 
 
+def test_task_execution_prompt_segments(builder_with_rules):
+    """Test rules and project info form a prefix that survives task and context changes."""
+    first = builder_with_rules.build_task_execution_prompt(
+        task_data={'task_id': 1, 'title': 'Login', 'description': 'Add login'},
+        context={'project_id': 1, 'working_directory': '/work', 'files': ['auth.py']}
+    )
+    second = builder_with_rules.build_task_execution_prompt(
+        task_data={'task_id': 2, 'title': 'Logout', 'description': 'Add logout'},
+        context={'project_id': 1, 'working_directory': '/work', 'files': ['session.py'],
+                 'previous_errors': ['timeout']}
+    )
+
+    assert [name for name, _ in first.segments] == ['rules', 'project', 'task', 'context']
+    assert first.prefix.startswith('<RULES>')
+    assert '"working_directory": "/work"' in first.prefix
+    assert 'auth.py' not in first.prefix
+    assert first.segment('context').startswith('<CONTEXT>')
+    assert first.prefix_hash == second.prefix_hash
+
+
+def test_rules_block_reuses_payload_text(builder_with_rules):
+    """Test the <RULES> block splices in the pre-rendered rules unchanged."""
+    domains = ['code_generation', 'testing']
+    metadata = builder_with_rules._inject_rules({'prompt_type': 'task_execution'},
+                                                'task_execution', domains)
+    payload = builder_with_rules.rule_engine.get_rule_payload(domains)
+
+    block = builder_with_rules._format_rules_block(metadata, domains)
+
+    assert len(payload) > 0
+    assert block == builder_with_rules._format_json_block('RULES', metadata)
+
+
 def test_build_task_execution_prompt_with_optional_fields(builder_with_rules):
     """Test building task execution prompt with optional fields."""
     task_data = {
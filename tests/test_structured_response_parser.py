@@ -381,6 +381,15 @@ This is just plain text without proper tags.
     assert 'status' in result['metadata'] or result['is_valid'] is False
 
 
+def test_fallback_skips_braces_in_prose(parser):
+    """Test untagged JSON is found after prose containing braces."""
+    response = 'Used {placeholders} in config.\n{"status": "completed", "note": "a } b"}'
+
+    metadata = parser._extract_json_fallback(response)
+
+    assert metadata == {'status': 'completed', 'note': 'a } b'}
+
+
 def test_handle_empty_response(parser):
     """Test handling empty response."""
     response = ""
@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 from src.core.exceptions import TaskDependencyException, TaskStateException
 from src.core.models import Task, TaskStatus
 from src.core.state import StateManager
+from src.orchestration.scheduling_policy import CriticalPathPolicy
 from src.orchestration.task_scheduler import TaskScheduler
 
 
@@ -181,6 +182,71 @@ class TestPriorityOrdering:
         next_task = scheduler.get_next_task(project.id)
         assert next_task is None
 
+    def test_critical_path_policy_prefers_long_chain(self, state_manager, project):
+        """Test critical-path policy picks the chain head over higher priority."""
+        scheduler = TaskScheduler(state_manager, policy=CriticalPathPolicy())
+        chain_head = create_task_for_scheduler(
+            state_manager, project.id, "Chain head", "Starts a long chain", priority=2
+        )
+        standalone = create_task_for_scheduler(
+            state_manager, project.id, "Standalone", "No dependents", priority=9
+        )
+        scheduler.schedule_task(chain_head)
+        scheduler.schedule_task(standalone)
+
+        # Dependents added after the head was queued still lengthen its chain
+        previous = chain_head
+        for i in range(2):
+            previous = create_task_for_scheduler(
+                state_manager, project.id, f"Chain {i}", "Chained",
+                dependencies=[previous.id]
+            )
+            scheduler.schedule_task(previous)
+
+        next_task = scheduler.get_next_task(project.id)
+        assert next_task.id == chain_head.id
+
+    def test_critical_path_policy_weights_by_estimates(self, state_manager, project):
+        """Test ComplexityEstimate durations decide between equal chains."""
+        scheduler = TaskScheduler(state_manager, policy=CriticalPathPolicy())
+        short = create_task_for_scheduler(state_manager, project.id, "Short", "Quick")
+        long = create_task_for_scheduler(state_manager, project.id, "Long", "Slow")
+        for task, minutes in ((short, 10), (long, 120)):
+            state_manager.log_complexity_estimate(
+                task_id=task.id,
+                estimate_data={
+                    'estimated_tokens': 1000,
+                    'estimated_loc': 50,
+                    'estimated_files': 1,
+                    'estimated_duration_minutes': minutes,
+                    'overall_complexity_score': 50,
+                    'heuristic_score': 50,
+                    'should_decompose': False
+                }
+            )
+
+        scheduler.schedule_task(short)
+        scheduler.schedule_task(long)
+
+        assert scheduler.get_next_task(project.id).id == long.id
+
+    def test_reprioritize_fetches_tasks_in_one_batch(self, state_manager, project):
+        """Test re-keying the ready queue doesn't query tasks one by one."""
+        scheduler = TaskScheduler(state_manager, policy=CriticalPathPolicy())
+        for i in range(3):
+            scheduler.schedule_task(create_task_for_scheduler(
+                state_manager, project.id, f"Task {i}", "Queued"
+            ))
+        scheduler._stale_queues.add(project.id)
+
+        with patch.object(state_manager, 'get_task', wraps=state_manager.get_task) as get_task, \
+                patch.object(state_manager, 'get_tasks_by_ids',
+                             wraps=state_manager.get_tasks_by_ids) as get_tasks_by_ids:
+            scheduler._reprioritize(project.id)
+
+        get_tasks_by_ids.assert_called_once()
+        get_task.assert_not_called()
+
 
 class TestDependencyResolution:
     """Test dependency resolution and topological sorting."""